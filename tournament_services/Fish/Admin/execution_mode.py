@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class ExecutionMode(Enum):
+    """
+    This is an enumeration noting how the games of a tournament round are run. SEQUENTIAL runs the games one after
+    another, THREAD runs them in a pool of threads (which suits remote players, whose games mostly wait on the network)
+    and PROCESS runs them in a pool of processes (which suits local players, whose games mostly search on the CPU, but
+    requires the players to be picklable).
+    """
+    SEQUENTIAL = 'sequential'
+    THREAD = 'thread'
+    PROCESS = 'process'
@@ -0,0 +1,131 @@
+import json
+from typing import Dict, List, TextIO
+
+from Fish.Admin.kicked_player_type import KickedPlayerType
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.state_serializer import serialize_state
+from Fish.Common.representations.types import Action, Coordinate
+
+"""
+A Posn is [Natural, Natural]
+INTERP: A position of the remote protocol, the row and column of a tile, which is the tile at the double-height
+coordinate (2 * column + row % 2, row).
+
+A GameEventJSON is one of:
+- {"event": "start", "state": StateJSON}
+- {"event": "place", "color": String, "position": Posn}
+- {"event": "move", "color": String, "action": [Posn, Posn]}
+- {"event": "skip", "color": String}
+- {"event": "kick", "color": String, "reason": String, "phase": String}
+- {"event": "phase", "phase": String}
+- {"event": "end", "winners": [String, ...], "scores": {String: Natural, ...}}
+INTERP: Something that happened in a game run by a referee, in the order it happened. A game starts with the state the
+referee was given or created, with every player it assigned a color to, before any player is told its color. Players
+place penguins, move penguins from the first to the second position of an action, or have their turn skipped when they
+cannot move. A kicked player is removed with the value of its KickedPlayerType as reason and the value of the
+GamePhase it was kicked in. The phase of the game changes to the value of a GamePhase, and the game ends with the
+colors of the winners and the fish of the players that were not kicked. Colors are PlayerColor values.
+"""
+Posn = List[int]
+GameEventJSON = Dict
+
+
+def to_posn(pos: Coordinate) -> Posn:
+    """
+    Purpose: Convert a double-height coordinate to a Posn
+    Signature: Coordinate -> Posn
+    """
+    x, y = pos
+    return [y, x // 2]
+
+
+def from_posn(posn: Posn) -> Coordinate:
+    """
+    Purpose: Convert a Posn to a double-height coordinate
+    Signature: Posn -> Coordinate
+    """
+    row, column = posn
+    return 2 * column + row % 2, row
+
+
+class GameLog(object):
+    """
+    Class that writes the events of a game (see GameEventJSON) to a text stream as they happen, one JSON object per line
+    without spaces, so that a log only grows and can be read while a game runs. Every event is written as soon as it is
+    recorded and the stream is flushed at the end of every game, so a log holds at most one line in memory no matter
+    how many games are written to the same stream. The stream is not closed by the log.
+
+    The games of a stream are written one after another, each starting with its start event, and can be replayed with
+    GameReplay.
+    """
+
+    def __init__(self, stream: TextIO):
+        """
+        Purpose: Initialize a log that writes to an open text stream
+        Signature: TextIO -> GameLog
+        :param stream: Stream to write the events to, such as a file opened for appending
+        """
+        self.stream = stream
+
+    def start(self, state: FishGameState) -> None:
+        """
+        Purpose: Record the start of a game
+        Signature: FishGameState -> Void
+        :param state: State the game starts from, which is not copied or changed
+        """
+        self._write({"event": "start", "state": serialize_state(state)})
+
+    def place(self, color: PlayerColor, pos: Coordinate) -> None:
+        """
+        Purpose: Record a penguin placed by a player
+        Signature: PlayerColor Coordinate -> Void
+        """
+        self._write({"event": "place", "color": color.value, "position": to_posn(pos)})
+
+    def move(self, color: PlayerColor, action: Action) -> None:
+        """
+        Purpose: Record a penguin moved by a player
+        Signature: PlayerColor Action -> Void
+        """
+        self._write({"event": "move", "color": color.value, "action": [to_posn(action[0]), to_posn(action[1])]})
+
+    def skip(self, color: PlayerColor) -> None:
+        """
+        Purpose: Record the turn of a player who cannot move being skipped
+        Signature: PlayerColor -> Void
+        """
+        self._write({"event": "skip", "color": color.value})
+
+    def kick(self, color: PlayerColor, reason: KickedPlayerType, game_phase: GamePhase) -> None:
+        """
+        Purpose: Record a player being kicked from the game
+        Signature: PlayerColor KickedPlayerType GamePhase -> Void
+        """
+        self._write({"event": "kick", "color": color.value, "reason": reason.value, "phase": game_phase.value})
+
+    def phase(self, game_phase: GamePhase) -> None:
+        """
+        Purpose: Record the phase of the game changing
+        Signature: GamePhase -> Void
+        """
+        self._write({"event": "phase", "phase": game_phase.value})
+
+    def end(self, winners: List[PlayerColor], scores: Dict[PlayerColor, int]) -> None:
+        """
+        Purpose: Record the end of a game and flush the stream
+        Signature: [PlayerColor] Dictionary[PlayerColor, Int] -> Void
+        :param winners: Colors of the winners
+        :param scores: Fish of every player that was not kicked
+        """
+        self._write({"event": "end", "winners": [color.value for color in winners],
+                     "scores": {color.value: fish for color, fish in scores.items()}})
+        self.stream.flush()
+
+    def _write(self, event: GameEventJSON) -> None:
+        """
+        Purpose: Write one event as a line of the stream
+        Signature: GameEventJSON -> Void
+        """
+        self.stream.write(json.dumps(event, separators=(',', ':')) + '\n')
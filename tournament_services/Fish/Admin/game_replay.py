@@ -0,0 +1,139 @@
+import json
+from typing import Iterator, List, Optional, TextIO, Type
+
+from Fish.Admin.game_log import GameEventJSON, from_posn
+from Fish.Common.representations.compact_game_state import CompactFishState
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.state_serializer import parse_state
+
+
+class GameReplay(object):
+    """
+    A GameReplay is {
+    events: [GameEventJSON],
+    board_class: Class,
+    checkpoint_interval: Integer,
+    checkpoints: [Maybe[CompactFishState]]
+    }
+    INTERP: The events of one game written by a GameLog, starting with its start event, from which the state of the
+    game after any event can be rebuilt. board_class is FishBoardModel or a subclass of it to create the boards of the
+    states with.
+
+    The events are applied with the same checked methods of FishGameState the referee played the game with, so a log
+    that does not follow the rules (such as a move of a player whose turn it is not) raises the error of the state. To
+    rebuild states quickly, every event is applied once when the replay is created and the state after every
+    checkpoint_interval-th event is kept as a CompactFishState, so a state is rebuilt from the nearest checkpoint before
+    it with fewer than checkpoint_interval events. As a FishGameState needs at least 2 players, a state with fewer
+    players left cannot be rebuilt from a CompactFishState, so its checkpoint is None and the checkpoint before it is
+    used instead.
+    """
+
+    # A game of up to 4 players on a 5x5 board takes a few dozen events
+    CHECKPOINT_INTERVAL = 8
+
+    def __init__(self, events: List[GameEventJSON], board_class: Type[FishBoardModel] = FishBoardModel,
+                 checkpoint_interval: int = CHECKPOINT_INTERVAL):
+        """
+        Purpose: Initialize a replay of a game and check its events
+        Signature: [GameEventJSON] Class Int -> GameReplay
+        :param events: The events of the game, starting with its start event
+        :param board_class: FishBoardModel or a subclass of it to create the boards of the states with
+        :param checkpoint_interval: Amount of events between the kept states
+        """
+        if not events or events[0]['event'] != 'start':
+            raise ValueError('A game must begin with a start event')
+        if checkpoint_interval <= 0:
+            raise ValueError('Checkpoint interval must be > 0')
+        self.events = events
+        self.board_class = board_class
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints: List[Optional[CompactFishState]] = []
+        state = self._create_start_state()
+        for index, event in enumerate(events):
+            if index > 0:
+                self._apply_event(state, event)
+            if index % checkpoint_interval == 0:
+                enough_players = len(state.get_player_order()) >= 2
+                self.checkpoints.append(CompactFishState.from_state(state) if enough_players else None)
+
+    @classmethod
+    def read(cls, stream: TextIO, board_class: Type[FishBoardModel] = FishBoardModel) -> Iterator['GameReplay']:
+        """
+        Purpose: Read the games of a log one at a time, so that only the events of one game are in memory at once
+        Signature: TextIO Class -> Iterator[GameReplay]
+        :param stream: Stream with the lines written by a GameLog
+        :param board_class: FishBoardModel or a subclass of it to create the boards of the states with
+        :return: A replay of every game in the order they were written, including a last game that has not ended
+        """
+        events = []
+        for line in stream:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            if event['event'] == 'start' and events:
+                yield cls(events, board_class)
+                events = []
+            events.append(event)
+        if events:
+            yield cls(events, board_class)
+
+    def get_state(self, index: Optional[int] = None) -> FishGameState:
+        """
+        Purpose: Rebuild the state of the game right after an event
+        Signature: Maybe[Int] -> FishGameState
+        :param index: Position of the event in events, where 0 is the start of the game, or None for the last event
+        :return: A new state, which can be changed without changing the replay
+        """
+        if index is None:
+            index = len(self.events) - 1
+        if not 0 <= index < len(self.events):
+            raise ValueError('Event index must be between 0 and {}'.format(len(self.events) - 1))
+        checkpoint = index // self.checkpoint_interval
+        while self.checkpoints[checkpoint] is None:
+            checkpoint -= 1
+        state = self.checkpoints[checkpoint].to_state(self.board_class)
+        for event in self.events[checkpoint * self.checkpoint_interval + 1:index + 1]:
+            self._apply_event(state, event)
+        return state
+
+    def has_ended(self) -> bool:
+        """
+        Purpose: Check if the game was logged until its end
+        Signature: Void -> Bool
+        """
+        return self.events[-1]['event'] == 'end'
+
+    def _create_start_state(self) -> FishGameState:
+        """
+        Purpose: Create the state of the start event, in the penguin placing phase
+        Signature: Void -> FishGameState
+        """
+        state = parse_state(self.events[0]['state'], self.board_class)
+        state.set_game_phase(GamePhase.PLACE_PENGUINS)
+        return state
+
+    @staticmethod
+    def _apply_event(state: FishGameState, event: GameEventJSON) -> None:
+        """
+        Purpose: Apply an event after the start of a game to a state
+        Signature: FishGameState GameEventJSON -> Void
+        """
+        kind = event['event']
+        if kind == 'place':
+            state.place_penguin(PlayerColor(event['color']), from_posn(event['position']))
+        elif kind == 'move':
+            move_from, move_to = event['action']
+            state.move_penguin(PlayerColor(event['color']), from_posn(move_from), from_posn(move_to))
+        elif kind == 'skip':
+            if state.get_current_turn() != PlayerColor(event['color']):
+                raise ValueError('Cannot skip the turn of {}, it is not their turn'.format(event['color']))
+            state.increase_turn()
+        elif kind == 'kick':
+            state.remove_color_from_game(PlayerColor(event['color']))
+        elif kind == 'phase':
+            state.set_game_phase(GamePhase(event['phase']))
+        elif kind != 'end':
+            raise ValueError('Unknown event {}'.format(kind))
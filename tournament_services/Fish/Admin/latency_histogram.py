@@ -0,0 +1,112 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from Fish.Admin.player_call import PlayerCall
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.state_serializer import StateJSON
+
+"""
+The upper bounds in seconds of the buckets of a LatencyHistogram. They get closer together towards the 10 second call
+timeout of the remote player proxies, so that players that come close to it stand out.
+"""
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.01, 0.1, 0.5, 1.0, 2.0, 5.0, 8.0, 10.0)
+
+
+class SlowCall(NamedTuple):
+    """
+    A SlowCall is (PlayerColor, PlayerCall, Number, Maybe[StateJSON])
+    INTERPRETATION: A call to a player that took a long time: the color of the player, the call, the seconds it took and
+    the state the player was asked to place or move a penguin in (None for the calls about colors).
+    """
+    color: PlayerColor
+    call: PlayerCall
+    seconds: float
+    state: Optional[StateJSON]
+
+
+class LatencyHistogram(object):
+    """
+    A LatencyHistogram is {
+    counts: [Integer],
+    count: Integer,
+    total_seconds: Number,
+    max_seconds: Number
+    }
+    INTERP: How long a number of calls took. counts[i] is the amount of calls that took at most LATENCY_BUCKETS[i]
+    seconds and longer than the bound before it, and the last count is the amount of calls that took longer than
+    every bound. count is the amount of calls, total_seconds the seconds they took together and max_seconds the
+    seconds the slowest one took. Histograms of different games can be merged, as they share their buckets.
+    """
+
+    def __init__(self):
+        """
+        Purpose: Initialize a histogram without any calls
+        Signature: Void -> LatencyHistogram
+        """
+        self.counts: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Purpose: Add a call to the histogram
+        Signature: Number -> Void
+        :param seconds: How long the call took
+        """
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS) and seconds > LATENCY_BUCKETS[bucket]:
+            bucket += 1
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """
+        Purpose: Add the calls of another histogram to this one
+        Signature: LatencyHistogram -> Void
+        """
+        self.counts = [count + other_count for count, other_count in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+
+    def get_mean_seconds(self) -> float:
+        """
+        Purpose: Get the average seconds a call took
+        Signature: Void -> Number
+        :return: The average seconds, or 0 if there were no calls
+        """
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def get_percentile(self, fraction: float) -> float:
+        """
+        Purpose: Estimate how long the calls took at a percentile, as the upper bound of the bucket the percentile
+                 falls in, which is never more than the slowest call
+        Signature: Number -> Number
+        :param fraction: The percentile as a fraction between 0 and 1, such as 0.95
+        :return: The seconds at most that fraction of calls took, or 0 if there were no calls
+        """
+        if not 0 <= fraction <= 1:
+            raise ValueError('Fraction must be between 0 and 1')
+        needed = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts[:-1]):
+            seen += count
+            if count and seen >= needed:
+                return min(LATENCY_BUCKETS[bucket], self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self) -> Dict:
+        """
+        Purpose: Convert the histogram into a dictionary of plain values that can be logged or serialized to JSON,
+                 with the buckets keyed by their upper bound
+        Signature: Void -> Dictionary
+        """
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ['inf']
+        return {
+            'count': self.count,
+            'mean_seconds': self.get_mean_seconds(),
+            'max_seconds': self.max_seconds,
+            'buckets': dict(zip(bounds, self.counts)),
+        }
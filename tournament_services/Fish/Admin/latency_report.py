@@ -0,0 +1,119 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from Fish.Admin.latency_histogram import LatencyHistogram, SlowCall
+from Fish.Admin.player_call import PlayerCall
+from Fish.Admin.referee import LogicalPlayer, Referee
+from Fish.Common.representations.game_state import FishGameStateFactory
+
+
+class PlayerSlowCall(NamedTuple):
+    """
+    A PlayerSlowCall is (Int, Int, SlowCall)
+    INTERPRETATION: A slow call to a player in a tournament, with the round it happened in and the age of the player,
+    which identifies the player across games (see LogicalPlayer).
+    """
+    round: int
+    age: int
+    call: SlowCall
+
+
+class LatencyReport(object):
+    """
+    A LatencyReport is {
+    histograms: Dictionary[Int, Dictionary[PlayerCall, LatencyHistogram]],
+    slow_calls: [PlayerSlowCall]
+    }
+    INTERP: How long the players of a tournament took to respond to their referees, collected from the latencies and
+    slow calls of every referee (see Referee) after each round. histograms holds the merged latencies of every player
+    by age and PlayerCall, and slow_calls the slow calls of every game in the order they were added.
+
+    The referee of a game assigns the colors of DEFAULT_COLOR_ORDER to its players in the order of their allocation,
+    which is how the colors in a referee are matched with the ages of the players.
+    """
+
+    def __init__(self):
+        """
+        Purpose: Initialize an empty report
+        Signature: Void -> LatencyReport
+        """
+        self.histograms: Dict[int, Dict[PlayerCall, LatencyHistogram]] = dict()
+        self.slow_calls: List[PlayerSlowCall] = []
+
+    def add_round(self, round_number: int, allocations: List[List[LogicalPlayer]],
+                  referees: Dict[int, Referee]) -> None:
+        """
+        Purpose: Add the latencies of every game of a round
+        Signature: Int [[LogicalPlayer]] Dictionary[Int, Referee] -> Void
+        :param round_number: The number of the round
+        :param allocations: The players of every game of the round
+        :param referees: The referees that ran the games, keyed by the index of their allocation
+        """
+        for table, referee in referees.items():
+            self.add_game(round_number, allocations[table], referee)
+
+    def add_game(self, round_number: int, allocation: List[LogicalPlayer], referee: Referee) -> None:
+        """
+        Purpose: Add the latencies of one game
+        Signature: Int [LogicalPlayer] Referee -> Void
+        :param round_number: The number of the round the game was played in
+        :param allocation: The players of the game, in the order they were given to the referee
+        :param referee: The referee that ran the game
+        """
+        color_order = FishGameStateFactory.DEFAULT_COLOR_ORDER
+        for color, histograms in referee.latencies.items():
+            _, age = allocation[color_order.index(color)]
+            player_histograms = self.histograms.setdefault(age, dict())
+            for call, histogram in histograms.items():
+                if call not in player_histograms:
+                    player_histograms[call] = LatencyHistogram()
+                player_histograms[call].merge(histogram)
+        for slow_call in referee.slow_calls:
+            _, age = allocation[color_order.index(slow_call.color)]
+            self.slow_calls.append(PlayerSlowCall(round_number, age, slow_call))
+
+    def get_histogram(self, age: int, call: Optional[PlayerCall] = None) -> LatencyHistogram:
+        """
+        Purpose: Get the latencies of a player for one kind of call or for all of their calls
+        Signature: Int Maybe[PlayerCall] -> LatencyHistogram
+        :param age: Age of the player
+        :param call: The kind of call, or None for all calls
+        :return: A new histogram with the calls, which is empty if the player made no such calls
+        """
+        merged = LatencyHistogram()
+        for player_call, histogram in self.histograms.get(age, dict()).items():
+            if call is None or call == player_call:
+                merged.merge(histogram)
+        return merged
+
+    def get_slowest_players(self, amount: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Purpose: Find the players whose slowest call took the longest
+        Signature: Maybe[Int] -> [(Int, Number)]
+        :param amount: How many players to return, or None for every player
+        :return: The ages of the players with the seconds of their slowest call, slowest first
+        """
+        slowest = sorted(((age, self.get_histogram(age).max_seconds) for age in self.histograms),
+                         key=lambda player: (-player[1], player[0]))
+        return slowest if amount is None else slowest[:amount]
+
+    def format(self) -> str:
+        """
+        Purpose: Format the report as a table of the latencies of every player for every kind of call, slowest
+                 players first, followed by the slow calls
+        Signature: Void -> String
+        """
+        row_format = '{:>5} {:>26} {:>7} {:>9} {:>9} {:>9}'
+        lines = [row_format.format('age', 'call', 'calls', 'mean', 'p95', 'max')]
+        for age, _ in self.get_slowest_players():
+            for call in PlayerCall:
+                histogram = self.histograms[age].get(call)
+                if histogram is not None:
+                    lines.append(row_format.format(age, call.value, histogram.count,
+                                                   '{:.4f}'.format(histogram.get_mean_seconds()),
+                                                   '{:.4f}'.format(histogram.get_percentile(0.95)),
+                                                   '{:.4f}'.format(histogram.max_seconds)))
+        for slow_call in self.slow_calls:
+            lines.append('round {} age {} {} took {:.3f}s in state {}'.format(
+                slow_call.round, slow_call.age, slow_call.call.call.value, slow_call.call.seconds,
+                slow_call.call.state))
+        return '\n'.join(lines)
@@ -3,10 +3,10 @@ from collections import OrderedDict
 from typing import Tuple, List, Dict, Optional
 
 from Fish.Admin.kicked_player_type import KickedPlayerType
+from Fish.Admin.latency_report import LatencyReport
 from Fish.Admin.manager_interface import ManagerInterface
 from Fish.Admin.referee import LogicalPlayer, Referee
-from Fish.Common.representations.enumerations.game_phase import GamePhase
-from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Admin.round_executor import RoundExecutor
 
 
 class Manager(ManagerInterface):
@@ -16,9 +16,11 @@ class Manager(ManagerInterface):
     active and non-eliminated players in a game. The entered is the list of logical players that originally entered. The rounds_active
     keeps track of the referee objects representing games in a current round. The last_round_winners keeps track of the winners of the last
     round in order to compare them to the current round's winners to determine if the game is over. The round keeps track of the
-    current round.
+    current round. The round_executor runs the games of each round, one after another or concurrently depending on its
+    mode, and keeps a report of how long each round took. The latency_report collects how long the players took to
+    respond in every game, so that slow players and the states that made them slow can be found after the tournament.
     """
-    def __init__(self, player_pool: List[LogicalPlayer]):
+    def __init__(self, player_pool: List[LogicalPlayer], round_executor: Optional[RoundExecutor] = None):
         self.messages = {}
         self.player_pool = player_pool
         self.entered = player_pool
@@ -28,6 +30,8 @@ class Manager(ManagerInterface):
         self.round = 0
         self.round_winners = []
         self.last_round = False
+        self.round_executor = round_executor if round_executor is not None else RoundExecutor()
+        self.latency_report = LatencyReport()
         if len(player_pool) < 2:
             raise ValueError('Cannot have less than 2 players in pool')
 
@@ -48,6 +52,7 @@ class Manager(ManagerInterface):
             self.round += 1
             player_allocations = self.assign_players(self.player_pool)
             self.rounds_active = self._create_round(player_allocations)
+            self.latency_report.add_round(self.round, player_allocations, self.rounds_active)
             self.round_winners, cheaters = self.get_winners_and_cheaters()
             self.cheaters.extend(cheaters)
             if self.round_winners == self.last_round_winners:
@@ -145,22 +150,12 @@ class Manager(ManagerInterface):
                 missing_losers.append(player)
         return missing_losers
 
-    @staticmethod
-    def _create_round(allocations):
+    def _create_round(self, allocations):
         """
         Purpose: Creates and runs the round of the Fish game given player allocations. Creates multiple games,
-        initializes them, and runs the games in order to get the winners/results.
+        initializes them, and runs the games with the round executor in order to get the winners/results.
         Signature: List[List[LogicalPlayers]] -> Dict[Referee]
         :param allocations: The determined player allocations for a single game
-        :return rounds: Dictionary of referees that have finished each game
+        :return rounds: Dictionary of referees that have finished each game, keyed by the index of their allocation
         """
-        rounds = {}
-        for i in range(len(allocations)):
-            new_ref = Referee()
-            state = FishGameStateFactory().create_game_state_with_num_fish(row=5, col=5, num_fish=2,
-                                                                           player_colors=FishGameStateFactory.DEFAULT_COLOR_ORDER[:len(allocations[i])])
-            new_ref.initialize_and_run_from_game_state(allocations[i], state)
-            rounds[i] = new_ref
-            if new_ref.current_game_state.get_game_phase() != GamePhase.END_GAME:
-                raise ValueError("Game has not reached the end.")
-        return rounds
+        return self.round_executor.run_round(allocations)
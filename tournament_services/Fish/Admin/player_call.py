@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class PlayerCall(Enum):
+    """
+    This is an enumeration of the calls a referee makes to a player, which the referee times separately. Players are
+    assigned their color and shown the colors of the other players before the game, and asked to place penguins in
+    the placement phase and to move penguins in the movement phase.
+    """
+    ASSIGN_COLOR = 'assign color'
+    SHOW_OTHER_PLAYERS_COLORS = 'show other players colors'
+    PLACE_PENGUIN = 'place penguin'
+    MOVE_PENGUIN = 'move penguin'
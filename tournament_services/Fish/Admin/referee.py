@@ -1,15 +1,20 @@
 import copy
+import time
 from collections import OrderedDict
-from typing import Tuple, List, Dict, Optional
+from typing import Any, Callable, Tuple, List, Dict, Optional
 
+from Fish.Admin.game_log import GameLog
 from Fish.Admin.kicked_player_type import KickedPlayerType
+from Fish.Admin.latency_histogram import LatencyHistogram, SlowCall
+from Fish.Admin.player_call import PlayerCall
 from Fish.Admin.runtime_error import FishRuntimeException, NotWellFormedReturnValue, PlayerInternalException
-from Fish.Common.game_tree import FishGameTree
 from Fish.Common.player_interface import PlayerInterface
 from Fish.Common.representations.enumerations.game_phase import GamePhase
 from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
 from Fish.Common.representations.game_state import FishGameStateFactory, FishGameState
+from Fish.Common.representations.game_state_view import FishGameStateView
 from Fish.Common.representations.game_state_error import PenguinMovementError, PenguinPlacementError
+from Fish.Common.representations.state_serializer import serialize_state
 from Fish.Common.representations.types import Coordinate, Action, coordinate_type_check, action_type_check
 
 """
@@ -35,10 +40,8 @@ class Referee(object):
 
     the current_game_state variable notes what the current game state of a game is. Before a referee has a game, this
     variable is None, representing that no game has been started. This will be updated, when the referee performs actions
-    in the game.
-
-    the current_game_tree represents a tree keep tracking of the current game state once the movement phase of the game
-    has begun. this is used for rule checking and for keeping track of the current game state as well.
+    in the game. The state checks the rules itself, so the referee plays every turn on it directly, also to find out
+    whether the game is over or a player has to skip their turn.
 
     kicked players is a dictionary representing which players have been kicked for misbehavior from the game. we keep
     track of "cheating" players, those which have made a bad logical move such placement on a square with another
@@ -53,23 +56,47 @@ class Referee(object):
 
     Finally, the winners variable keeps track of a list of colors representing the winners of the game.
 
+    Players are asked for placements and moves with a copy of the current game state, so that they cannot change the
+    game. Players that accept it (see PlayerInterface.accepts_state_view) are given a read-only view of the state
+    instead, which saves copying the whole state on every turn, unless state_views is turned off.
+
+    Every call to a player is timed, whether it returns or raises, and kept in the latencies of the player by color and
+    PlayerCall as a LatencyHistogram. Calls that take at least slow_call_seconds are also kept in slow_calls together
+    with the state the player was asked about, so that players that come close to the call timeout of remote players
+    can be found with the states that made them slow. Kicked players keep their latencies.
+
+    If the referee is given a game_log, everything that changes the game is written to it as it happens: the start
+    state with every player that was assigned a color, every placement, move and skipped turn, every kick with its
+    reason, every change of phase and the winners, so that any state of the game can be rebuilt with GameReplay.
+
     The component contains one public method initialize and run game, with which a tournament manager or someone else
     could spin up a referee and run a game using. The rest of the methods build on one another with an initial board
     set up method and then the phases being run in a series of rounds which each contain turns. At the end, the winners
     and kicked players are reported.
     """
 
-    def __init__(self):
+    # Half of the 10 second call timeout of the remote player proxies
+    SLOW_CALL_SECONDS = 5.0
+
+    def __init__(self, state_views: bool = True, slow_call_seconds: float = SLOW_CALL_SECONDS,
+                 game_log: Optional[GameLog] = None):
         """
         Purpose: Initialize a referee instance that could run games. This creates a referee without a game initially,
         which can then be assigned a game using initialize_and_run_game(). This sets reasonable defaults
         for variables that can then be overridden later on for an actual game.
-        Signature: Void -> Void
-        """
+        Signature: Bool Number Maybe[GameLog] -> Void
+        :param state_views: Whether players that accept read-only views of the state are given one instead of a copy
+        :param slow_call_seconds: Seconds from which a call to a player is kept in slow_calls
+        :param game_log: Log to write the events of the game to, or None to not log the game
+        """
+        self.state_views = state_views
+        self.slow_call_seconds = slow_call_seconds
+        self.game_log = game_log
+        self.latencies: Dict[PlayerColor, Dict[PlayerCall, LatencyHistogram]] = dict()
+        self.slow_calls: List[SlowCall] = []
         self.players: OrderedDict[PlayerColor, PlayerInterface] = OrderedDict()
         self.amount_penguins_per_player: int = 0
         self.current_game_state: Optional[FishGameState] = None
-        self.current_game_tree: Optional[FishGameTree] = None
         self.kicked_players: Dict[KickedPlayerType, List[PlayerColor]] = {KickedPlayerType.CHEATING: [],
                                                                           KickedPlayerType.FAILING: []}
         self.winners: List[PlayerColor]
@@ -90,7 +117,6 @@ class Referee(object):
             raise ValueError("Must provide state that is in penguin placement state.")
         self.current_game_state = state
         self._init_board(state.get_board().rows, state.get_board().columns, players)
-        self.current_game_state = state
         self._run_placement_phase()
         if not self.current_game_state.get_game_phase() == GamePhase.END_GAME:
             self._run_movement_phase()
@@ -135,10 +161,9 @@ class Referee(object):
                 break
         if players_left:
             # Set phase to movement and move until nobody can
-            self.current_game_state.set_game_phase(GamePhase.MOVE_PENGUINS)
-            self.current_game_tree = FishGameTree(copy.deepcopy(self.current_game_state))
+            self._set_game_phase(GamePhase.MOVE_PENGUINS)
         else:
-            self.current_game_state.set_game_phase(GamePhase.END_GAME)
+            self._set_game_phase(GamePhase.END_GAME)
 
     def _run_movement_phase(self):
         """
@@ -154,15 +179,26 @@ class Referee(object):
             can_any_move = self.current_game_state.can_any_player_move()
 
         # set the game to end_game
-        self.current_game_state.set_game_phase(GamePhase.END_GAME)
+        self._set_game_phase(GamePhase.END_GAME)
+
+    def _set_game_phase(self, game_phase: GamePhase):
+        """
+        Purpose: Change the phase of the game and log the change
+        Signature: GamePhase -> Void
+        """
+        self.current_game_state.set_game_phase(game_phase)
+        if self.game_log is not None:
+            self.game_log.phase(game_phase)
 
     def _init_board(self, rows: int, cols: int, players: List[LogicalPlayer]):
         """
         Purpose: Initialize a game board state for a number of players. This notes the turn of players, how many
-        penguins each player can place and encodes that in the game state. The board created will have a random amount
-        of fish on each tile and will have no holes. This uses the DEFAULT_COLOR_ORDER array that we have created
-        which specifies that the turn order of players for a game will be 'red', 'white', 'brown', 'black' with all
-        used for a for player game and only N where N is the number of players used for a game with less players.
+        penguins each player can place and encodes that in the game state. Unless the referee was given a state, the
+        board created will have a random amount of fish on each tile and will have no holes. The state is created
+        before the players are told their colors, so that players who do not respond are kicked from it. This uses the
+        DEFAULT_COLOR_ORDER array that we have created which specifies that the turn order of players for a game will
+        be 'red', 'white', 'brown', 'black' with all used for a for player game and only N where N is the number of
+        players used for a game with less players.
         Signature: Int Int List[LogicalPlayer] -> Void
         :param rows: How many rows this game board will have
         :param cols: How many columns this game board will have
@@ -173,10 +209,13 @@ class Referee(object):
         for idx, (player, _) in enumerate(players):
             color = FishGameStateFactory.DEFAULT_COLOR_ORDER[idx]
             self.players[color] = player
+        if self.current_game_state is None:
+            self.current_game_state = FishGameStateFactory.create_game_state_with_dimensions(rows, cols,
+                                                                                             list(self.players.keys()))
+        if self.game_log is not None:
+            self.game_log.start(self.current_game_state)
         self._init_players()
         self.amount_penguins_per_player = 6 - len(self.players)
-        self.current_game_state = FishGameStateFactory.create_game_state_with_dimensions(rows, cols,
-                                                                                         list(self.players.keys()))
 
     def _init_players(self):
         """
@@ -185,7 +224,7 @@ class Referee(object):
         """
         player_colors_to_kick = []
         for color, player in self.players.items():
-            response = player.assign_color(color)
+            response = self._call_player(color, PlayerCall.ASSIGN_COLOR, player.assign_color, color)
             if not response:
                 player_colors_to_kick.append(color)
 
@@ -202,7 +241,8 @@ class Referee(object):
         for color, player in self.players.items():
             colors = list(self.players.keys())
             colors.remove(color)
-            response = player.show_other_players_colors(colors)
+            response = self._call_player(color, PlayerCall.SHOW_OTHER_PLAYERS_COLORS,
+                                         player.show_other_players_colors, colors)
             if not response:
                 player_colors_to_kick.append(color)
 
@@ -211,18 +251,16 @@ class Referee(object):
 
     def _add_kicked_player(self, color: PlayerColor, game_phase: GamePhase, cheating: bool=True):
         """
-        Purpose: Remove kicked player from game and note why player was kicked. This updates all parts of the game
-        (game tree/state).
-        Signature: PlayerColor, bool -> Void
+        Purpose: Remove kicked player from game and note why player was kicked. This removes the penguins of the
+        player from the game state.
+        Signature: PlayerColor, GamePhase, bool -> Void
         """
         self.current_game_state.remove_color_from_game(color)
-        if game_phase == GamePhase.MOVE_PENGUINS:
-            self.current_game_tree = FishGameTree(copy.deepcopy(self.current_game_state))
         del self.players[color]
-        if cheating:
-            self.kicked_players[KickedPlayerType.CHEATING].append(color)
-        else:
-            self.kicked_players[KickedPlayerType.FAILING].append(color)
+        kicked_type = KickedPlayerType.CHEATING if cheating else KickedPlayerType.FAILING
+        self.kicked_players[kicked_type].append(color)
+        if self.game_log is not None:
+            self.game_log.kick(color, kicked_type, game_phase)
 
     def _run_placement_round(self):
         """
@@ -246,6 +284,8 @@ class Referee(object):
         try:
             placement_pos = self._check_player_runtime_error(turn, GamePhase.PLACE_PENGUINS)
             self.current_game_state.place_penguin(turn, placement_pos)
+            if self.game_log is not None:
+                self.game_log.place(turn, placement_pos)
         except PenguinPlacementError:
             self._add_kicked_player(turn, GamePhase.PLACE_PENGUINS, cheating=True)
         except FishRuntimeException as e:
@@ -260,11 +300,14 @@ class Referee(object):
         Signature: PlayerColor GamePhase -> Boolean
         """
         try:
+            player = self.players[turn]
             if game_phase == GamePhase.PLACE_PENGUINS:
-                player_return_val = self.players[turn].player_place_penguin(copy.deepcopy(self.current_game_state))
+                player_return_val = self._call_player(turn, PlayerCall.PLACE_PENGUIN, player.player_place_penguin,
+                                                      self._get_state_for_player(player))
                 is_well_formed = coordinate_type_check(player_return_val)
             else:
-                player_return_val = self.players[turn].player_move_penguin(copy.deepcopy(self.current_game_state))
+                player_return_val = self._call_player(turn, PlayerCall.MOVE_PENGUIN, player.player_move_penguin,
+                                                      self._get_state_for_player(player))
                 is_well_formed = action_type_check(player_return_val)
             if not is_well_formed:
                 raise NotWellFormedReturnValue
@@ -272,6 +315,49 @@ class Referee(object):
             raise PlayerInternalException
         return player_return_val
 
+    def _call_player(self, color: PlayerColor, call: PlayerCall, method: Callable, *args) -> Any:
+        """
+        Purpose: Call a method of a player and record how long it took in the latencies of the player, also when it
+        raises an error
+        Signature: PlayerColor PlayerCall (X ... -> Y) X ... -> Y
+        :param color: Color of the player
+        :param call: Which call is made
+        :param method: The method of the player to call
+        :param args: The arguments of the call, which are prepared before the timing starts
+        :return: What the player returned
+        """
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._record_latency(color, call, time.perf_counter() - start)
+
+    def _record_latency(self, color: PlayerColor, call: PlayerCall, seconds: float) -> None:
+        """
+        Purpose: Add a call to the latencies of a player, and to the slow calls with the current state if it took at
+        least slow_call_seconds
+        Signature: PlayerColor PlayerCall Number -> Void
+        """
+        histograms = self.latencies.setdefault(color, dict())
+        if call not in histograms:
+            histograms[call] = LatencyHistogram()
+        histograms[call].record(seconds)
+        if seconds >= self.slow_call_seconds:
+            state = None
+            if call in (PlayerCall.PLACE_PENGUIN, PlayerCall.MOVE_PENGUIN):
+                state = serialize_state(self.current_game_state)
+            self.slow_calls.append(SlowCall(color, call, seconds, state))
+
+    def _get_state_for_player(self, player: PlayerInterface):
+        """
+        Purpose: Get the current game state to give to a player, as a read-only view if the player accepts one and as
+        a copy otherwise, so that the player cannot change the game
+        Signature: PlayerInterface -> FishGameState or FishGameStateView
+        """
+        if self.state_views and player.accepts_state_view():
+            return FishGameStateView(self.current_game_state)
+        return copy.deepcopy(self.current_game_state)
+
     def _run_movement_round(self):
         """
         Purpose: Runs a whole movement round for a game, which is when each player moves a penguin
@@ -292,17 +378,19 @@ class Referee(object):
         Signature: Void -> Void
         """
         turn = self.current_game_state.get_current_turn()
-        if not self.current_game_tree.is_end_game_state():
-            if not self.current_game_tree.get_children_moves():
+        if self.current_game_state.can_any_player_move():
+            if not self.current_game_state.can_player_move(turn):
                 # Only thing that happens is that turn changes
                 self.current_game_state.increase_turn()
-                self.current_game_tree = list(self.current_game_tree.generate_direct_children())[0]
+                if self.game_log is not None:
+                    self.game_log.skip(turn)
             else:
                 try:
                     action = self._check_player_runtime_error(turn, GamePhase.MOVE_PENGUINS)
                     move_from_pos, move_to_pos = action
                     self.current_game_state.move_penguin(turn, move_from_pos, move_to_pos)
-                    self.current_game_tree = self.current_game_tree.validate_and_compute_node(action)
+                    if self.game_log is not None:
+                        self.game_log.move(turn, action)
                 except PenguinMovementError:
                     self._add_kicked_player(turn, GamePhase.MOVE_PENGUINS, cheating=True)
                 except FishRuntimeException:
@@ -340,6 +428,9 @@ class Referee(object):
             self._add_kicked_player(color, self.current_game_state.get_game_phase(), False)
 
             # TODO Tell tourney manager/observers of winners when implemented
+        if self.game_log is not None:
+            self.game_log.end(self.winners, {color: self.current_game_state.get_fish_for_player(color)
+                                             for color in self.players})
 
     def _report_kicked_players(self):
         """
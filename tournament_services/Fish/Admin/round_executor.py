@@ -0,0 +1,178 @@
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Admin.game_log import GameLog
+from Fish.Admin.referee import LogicalPlayer, Referee
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.game_state import FishGameStateFactory
+
+
+class RoundReport(NamedTuple):
+    """
+    A RoundReport is (Number, Number, Int, Dictionary[Int, Exception])
+    INTERPRETATION: How a round of games went: the wall time in seconds the whole round took, the sum of the seconds
+    each game that finished took, the amount of games in the round and the errors of the games that failed keyed by
+    their table index. When games run concurrently the wall time is less than the summed game time.
+    """
+    wall_time: float
+    game_time: float
+    games: int
+    failures: Dict[int, Exception]
+
+
+def _run_game(allocation: List[LogicalPlayer], rows: int, columns: int, num_fish: int,
+              log_path: Optional[str] = None) -> Tuple[List[LogicalPlayer], Referee, float]:
+    """
+    Purpose: Run one game of a round with a new referee, possibly in another thread or process
+    Signature: List[LogicalPlayer] Int Int Int Maybe[String] -> (List[LogicalPlayer], Referee, Number)
+    :param allocation: The players of the game, in the order they play
+    :param rows: Amount of rows of the board
+    :param columns: Amount of columns of the board
+    :param num_fish: Amount of fish on every tile
+    :param log_path: File to append the events of the game to (see GameLog), or None to not log the game
+    :return: The players, the referee that ran the game and the seconds the game took. The players are returned with
+             the referee so that the players of a game run in another process can be matched with the originals.
+    """
+    start = time.perf_counter()
+    state = FishGameStateFactory.create_game_state_with_num_fish(
+        row=rows, col=columns, num_fish=num_fish,
+        player_colors=FishGameStateFactory.DEFAULT_COLOR_ORDER[:len(allocation)])
+    if log_path is None:
+        referee = Referee()
+        referee.initialize_and_run_from_game_state(allocation, state)
+    else:
+        with open(log_path, 'a') as stream:
+            referee = Referee(game_log=GameLog(stream))
+            referee.initialize_and_run_from_game_state(allocation, state)
+        # the log is closed with its file and cannot be sent back from another process
+        referee.game_log = None
+    if referee.current_game_state.get_game_phase() != GamePhase.END_GAME:
+        raise ValueError("Game has not reached the end.")
+    return allocation, referee, time.perf_counter() - start
+
+
+class RoundExecutor(object):
+    """
+    Class that runs the games of a tournament round, one referee per table, either one after another or concurrently
+    in a pool of threads or processes (see ExecutionMode). The finished referees are keyed by the index of their table
+    in the allocations no matter in which order the games finish, so the results of a round do not depend on the mode.
+
+    Failures are isolated per game: if a referee raises an error (or its game does not reach the end), the other games
+    still finish, and the table gets a referee without players or winners, so none of its players advance. The errors
+    are kept in the report of the round.
+
+    In PROCESS mode the referee of a game is sent back from its process together with the players, which are then
+    replaced with the original players, so that the manager can match the winners with its player pool. What the
+    players remember of the game is not sent back.
+
+    If the executor is given a log directory, every game is logged (see GameLog) to its own file in it, named after the
+    round and table of the game, so that games that run concurrently never write to the same file and each file can be
+    replayed with GameReplay. Rounds are numbered from 1 in the order the executor runs them.
+    """
+
+    def __init__(self, mode: ExecutionMode = ExecutionMode.SEQUENTIAL, max_workers: Optional[int] = None,
+                 rows: int = 5, columns: int = 5, num_fish: int = 2, log_directory: Optional[str] = None):
+        """
+        Purpose: Initialize a round executor
+        Signature: ExecutionMode Maybe[Int] Int Int Int Maybe[String] -> RoundExecutor
+        :param mode: How the games of a round are run
+        :param max_workers: Max amount of threads or processes to run games in, or None for the default of the pool
+        :param rows: Amount of rows of the board of every game
+        :param columns: Amount of columns of the board of every game
+        :param num_fish: Amount of fish on every tile of every game
+        :param log_directory: Directory to write a log of every game to, which is created if needed, or None to not
+                              log the games
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError('Amount of workers must be > 0')
+        self.mode = mode
+        self.max_workers = max_workers
+        self.rows = rows
+        self.columns = columns
+        self.num_fish = num_fish
+        self.log_directory = log_directory
+        if log_directory is not None:
+            os.makedirs(log_directory, exist_ok=True)
+        self.reports: List[RoundReport] = []
+
+    def run_round(self, allocations: List[List[LogicalPlayer]]) -> Dict[int, Referee]:
+        """
+        Purpose: Run a game for every allocation of players and collect the referees that ran them
+        Signature: List[List[LogicalPlayer]] -> Dict[Int, Referee]
+        :param allocations: The players of every game of the round
+        :return: The referee of every game, keyed by the index of its allocation
+        """
+        start = time.perf_counter()
+        results: Dict[int, Tuple[List[LogicalPlayer], Referee, float]] = dict()
+        failures: Dict[int, Exception] = dict()
+        if self.mode == ExecutionMode.SEQUENTIAL:
+            for table, allocation in enumerate(allocations):
+                try:
+                    results[table] = _run_game(allocation, self.rows, self.columns, self.num_fish,
+                                               self.get_log_path(table))
+                except Exception as e:  # a failing game must not stop the other games
+                    failures[table] = e
+        else:
+            with self._create_pool() as pool:
+                futures = {table: pool.submit(_run_game, allocation, self.rows, self.columns, self.num_fish,
+                                              self.get_log_path(table))
+                           for table, allocation in enumerate(allocations)}
+                for table, future in futures.items():
+                    try:
+                        results[table] = future.result()
+                    except Exception as e:  # a failing game must not stop the other games
+                        failures[table] = e
+
+        rounds = dict()
+        for table, allocation in enumerate(allocations):
+            if table in results:
+                game_players, referee, _ = results[table]
+                if game_players is not allocation:
+                    self._restore_players(referee, game_players, allocation)
+            else:
+                referee = Referee()
+                referee.winners = []
+            rounds[table] = referee
+        game_time = sum(seconds for _, _, seconds in results.values())
+        self.reports.append(RoundReport(time.perf_counter() - start, game_time, len(allocations), failures))
+        return rounds
+
+    def get_log_path(self, table: int, round_number: Optional[int] = None) -> Optional[str]:
+        """
+        Purpose: Get the file the game of a table is logged to
+        Signature: Int Maybe[Int] -> Maybe[String]
+        :param table: Index of the table in the allocations of the round
+        :param round_number: Number of the round, or None for the round that runs next
+        :return: The path of the file, or None if the executor does not log games
+        """
+        if self.log_directory is None:
+            return None
+        if round_number is None:
+            round_number = len(self.reports) + 1
+        return os.path.join(self.log_directory, 'round-{}-table-{}.jsonl'.format(round_number, table))
+
+    def _create_pool(self) -> Executor:
+        """
+        Purpose: Create the pool of threads or processes the games of a round are run in
+        Signature: Void -> Executor
+        """
+        if self.mode == ExecutionMode.PROCESS:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    @staticmethod
+    def _restore_players(referee: Referee, game_players: List[LogicalPlayer], allocation: List[LogicalPlayer]) -> None:
+        """
+        Purpose: Replace the copies of the players in a referee that was sent back from another process with the
+                 original players
+        Signature: Referee List[LogicalPlayer] List[LogicalPlayer] -> Void
+        :param referee: The referee sent back from the process
+        :param game_players: The copies of the players sent back with the referee, in the order of the allocation
+        :param allocation: The original players of the game
+        """
+        originals = {id(copied): player for (copied, _), (player, _) in zip(game_players, allocation)}
+        referee.players = OrderedDict((color, originals[id(player)]) for color, player in referee.players.items())
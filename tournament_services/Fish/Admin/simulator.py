@@ -0,0 +1,254 @@
+import copy
+import itertools
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Common.representations.bitboard_fish_board import BitboardFishBoardModel
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameState, FishGameStateFactory
+from Fish.Common.representations.game_state_view import FishGameStateView
+from Fish.Player.strategy import FishBasicStrategy
+
+
+class GameResult(NamedTuple):
+    """
+    A GameResult is (List[Int], List[Int], List[Int], List[Number], Maybe[Int])
+    INTERPRETATION: How a simulated game went for each seat, in the order the seats played: the fish each seat
+    collected, the seats with the most fish (more than one for a draw), the amount of moves each seat made and the
+    seconds each seat spent finding those moves. If a seat forfeited the game by raising an error or choosing a
+    placement or move that breaks the rules, forfeit is that seat, the game stops there and every other seat wins.
+    """
+    fish: List[int]
+    winners: List[int]
+    moves: List[int]
+    move_time: List[float]
+    forfeit: Optional[int] = None
+
+
+class PairReport(NamedTuple):
+    """
+    A PairReport is (String, String, Int, Int, Int, Int, Number, Number, Number, Number, Int, Int)
+    INTERPRETATION: The results of the games between a pair of strategies, named first and second: the amount of games
+    played, how many of them each strategy won outright and how many were drawn, the average fish each strategy
+    collected per game, the average seconds each strategy spent finding a move and how many games each strategy
+    forfeited, which count as won by the other strategy.
+    """
+    first: str
+    second: str
+    games: int
+    first_wins: int
+    second_wins: int
+    draws: int
+    first_fish: float
+    second_fish: float
+    first_move_time: float
+    second_move_time: float
+    first_forfeits: int = 0
+    second_forfeits: int = 0
+
+    @property
+    def first_win_rate(self) -> float:
+        return self.first_wins / self.games if self.games else 0.0
+
+    @property
+    def second_win_rate(self) -> float:
+        return self.second_wins / self.games if self.games else 0.0
+
+
+def play_game(strategies: List[FishBasicStrategy], rows: int, columns: int, holes: int, seed: int,
+              board_class: Type[FishBoardModel] = BitboardFishBoardModel) -> GameResult:
+    """
+    Purpose: Play a whole game between strategies without a referee or players. The strategies are given a read-only
+             view of the one state of the game, which is changed in place, and a player who cannot move is skipped.
+             The game is played on a FishGameState rather than a CompactFishState, as the strategies search with the
+             undoable moves and Zobrist hashes of a FishGameState and the state checks the rules for every move. A
+             seat whose strategy raises an error or breaks the rules forfeits the game (see GameResult).
+    Signature: List[FishBasicStrategy] Int Int Int Int Class -> GameResult
+    :param strategies: The strategy of every seat, in the order the seats play
+    :param rows: Amount of rows of the board
+    :param columns: Amount of columns of the board
+    :param holes: Amount of holes on the board
+    :param seed: Seed of the random board, so that the same seed gives the same board
+    :param board_class: FishBoardModel or a subclass of it to create the board with
+    :return: How the game went for every seat
+    """
+    rng = random.Random(seed)
+    coords_with_holes = set(rng.sample(board_class.create_coords(rows, columns), holes))
+    board = board_class.create_with_holes(rows, columns, coords_with_holes, 0, rng=rng)
+    colors = FishGameStateFactory.DEFAULT_COLOR_ORDER[:len(strategies)]
+    state = FishGameState(board, list(colors))
+    view = FishGameStateView(state)
+    seats = {color: seat for seat, color in enumerate(colors)}
+    moves = [0] * len(strategies)
+    move_time = [0.0] * len(strategies)
+
+    for _ in range((6 - len(strategies)) * len(strategies)):
+        color = state.get_current_turn()
+        try:
+            state.place_penguin(color, strategies[seats[color]].find_next_placement(view))
+        except Exception:  # a strategy under evaluation may fail in any way, which must not stop the other games
+            return _forfeit_result(state, seats[color], moves, move_time)
+    state.set_game_phase(GamePhase.MOVE_PENGUINS)
+    while state.can_any_player_move():
+        color = state.get_current_turn()
+        if not state.can_player_move(color):
+            state.increase_turn()
+            continue
+        seat = seats[color]
+        start = time.perf_counter()
+        try:
+            action = strategies[seat].find_next_move(view)
+            move_time[seat] += time.perf_counter() - start
+            moves[seat] += 1
+            state.move_penguin(color, *action)
+        except Exception:  # a strategy under evaluation may fail in any way, which must not stop the other games
+            return _forfeit_result(state, seat, moves, move_time)
+    state.set_game_phase(GamePhase.END_GAME)
+
+    fish = [state.get_fish_for_player(color) for color in colors]
+    winners = [seat for seat, amount in enumerate(fish) if amount == max(fish)]
+    return GameResult(fish, winners, moves, move_time)
+
+
+def _forfeit_result(state: FishGameState, seat: int, moves: List[int], move_time: List[float]) -> GameResult:
+    """
+    Purpose: Get the result of a game that a seat forfeited, which every other seat wins
+    Signature: FishGameState Int List[Int] List[Number] -> GameResult
+    :param state: The state of the game when the seat forfeited
+    :param seat: The seat that forfeited
+    :param moves: The amount of moves each seat made
+    :param move_time: The seconds each seat spent finding its moves
+    """
+    fish = [state.get_fish_for_player(color) for color in state.get_player_order()]
+    return GameResult(fish, [other for other in range(len(fish)) if other != seat], moves, move_time, seat)
+
+
+def _play_pair_game(task: Tuple[int, FishBasicStrategy, FishBasicStrategy, int, bool, int, int, int, Type]
+                    ) -> Tuple[int, GameResult]:
+    """
+    Purpose: Play one game of a pair of strategies, possibly in another thread or process, with the seats of the
+             strategies swapped when asked. The strategies keep the state of their searches in themselves, so the
+             game is played with copies of them, which lets games share strategies in any mode and makes every game
+             start from the same strategies no matter which games were played before it. Copies that start worker
+             processes (such as FishMCTSStrategy) are closed once the game is over.
+    Signature: (Int, FishBasicStrategy, FishBasicStrategy, Int, Bool, Int, Int, Int, Class) -> (Int, GameResult)
+    :return: The index of the pair and how the game went for the first and second strategy, in that order
+    """
+    pair, first, second, seed, swapped, rows, columns, holes, board_class = task
+    strategies = copy.deepcopy([second, first] if swapped else [first, second])
+    try:
+        result = play_game(strategies, rows, columns, holes, seed, board_class)
+    finally:
+        for strategy in strategies:
+            close = getattr(strategy, 'close', None)
+            if close is not None:
+                close()
+    if swapped:
+        result = GameResult(result.fish[::-1], sorted(1 - seat for seat in result.winners),
+                            result.moves[::-1], result.move_time[::-1],
+                            None if result.forfeit is None else 1 - result.forfeit)
+    return pair, result
+
+
+class Simulator(object):
+    """
+    Class that evaluates strategies against each other by playing many whole games between every pair of them (see
+    play_game), spread over a pool of processes (see ExecutionMode), and reporting the win rates, average fish and
+    move times of each pair.
+
+    The boards are random but come from seeds, so that the same seed plays the same games. Every board is played twice
+    by a pair, once with each strategy moving first, so that moving first does not favor either of them.
+    """
+
+    def __init__(self, mode: ExecutionMode = ExecutionMode.PROCESS, max_workers: Optional[int] = None,
+                 rows: int = 5, columns: int = 5, holes: int = 0,
+                 board_class: Type[FishBoardModel] = BitboardFishBoardModel):
+        """
+        Purpose: Initialize a simulator
+        Signature: ExecutionMode Maybe[Int] Int Int Int Class -> Simulator
+        :param mode: How the games are run. THREAD mode does not play games at the same time, as they do not wait on
+                     anything. Every game is played with its own copies of the strategies, so they are never shared
+                     between threads.
+        :param max_workers: Max amount of threads or processes to run games in, or None for the default of the pool
+        :param rows: Amount of rows of the board of every game
+        :param columns: Amount of columns of the board of every game
+        :param holes: Amount of random holes on the board of every game
+        :param board_class: FishBoardModel or a subclass of it to create the boards with
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError('Amount of workers must be > 0')
+        # a two player game needs a tile for each of the 8 penguins
+        if rows * columns - holes < 8 or holes < 0:
+            raise ValueError('Board needs at least 8 tiles that are not holes')
+        self.mode = mode
+        self.max_workers = max_workers
+        self.rows = rows
+        self.columns = columns
+        self.holes = holes
+        self.board_class = board_class
+
+    def run(self, strategies: Dict[str, FishBasicStrategy], games: int, seed: int = 0) -> List[PairReport]:
+        """
+        Purpose: Play games between every pair of different strategies and report how each pair went
+        Signature: Dict[String, FishBasicStrategy] Int Int -> List[PairReport]
+        :param strategies: The strategies to evaluate by name, which must be picklable in PROCESS mode
+        :param games: Amount of games every pair plays, rounded up to an even amount so that every board is played
+                      with both strategies moving first
+        :param seed: Seed of the first board, the other boards have the seeds after it
+        :return: A report for every pair, in the order of the names
+        """
+        if games <= 0:
+            raise ValueError('Amount of games must be > 0')
+        pairs = list(itertools.combinations(strategies.items(), 2))
+        tasks = [(pair, first, second, seed + game // 2, game % 2 == 1, self.rows, self.columns, self.holes,
+                  self.board_class)
+                 for pair, ((_, first), (_, second)) in enumerate(pairs)
+                 for game in range(games + games % 2)]
+        results: List[List[GameResult]] = [[] for _ in pairs]
+        if self.mode == ExecutionMode.SEQUENTIAL:
+            for pair, result in map(_play_pair_game, tasks):
+                results[pair].append(result)
+        else:
+            with self._create_pool() as pool:
+                workers = self.max_workers or os.cpu_count() or 1
+                # games are short, so they are sent to the workers in chunks to spend less time sending them
+                for pair, result in pool.map(_play_pair_game, tasks, chunksize=max(1, len(tasks) // (workers * 4))):
+                    results[pair].append(result)
+        return [self._report(first_name, second_name, pair_results)
+                for ((first_name, _), (second_name, _)), pair_results in zip(pairs, results)]
+
+    def _create_pool(self) -> Executor:
+        """
+        Purpose: Create the pool of threads or processes the games are run in
+        Signature: Void -> Executor
+        """
+        if self.mode == ExecutionMode.PROCESS:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    @staticmethod
+    def _report(first: str, second: str, results: List[GameResult]) -> PairReport:
+        """
+        Purpose: Summarize the games of a pair of strategies
+        Signature: String String List[GameResult] -> PairReport
+        :param first: Name of the first strategy
+        :param second: Name of the second strategy
+        :param results: The games of the pair, with the first strategy in the first seat
+        """
+        games = len(results)
+        first_wins = sum(1 for result in results if result.winners == [0])
+        second_wins = sum(1 for result in results if result.winners == [1])
+        moves = [sum(result.moves[seat] for result in results) for seat in range(2)]
+        move_time = [sum(result.move_time[seat] for result in results) for seat in range(2)]
+        return PairReport(first, second, games, first_wins, second_wins, games - first_wins - second_wins,
+                          sum(result.fish[0] for result in results) / games,
+                          sum(result.fish[1] for result in results) / games,
+                          move_time[0] / moves[0] if moves[0] else 0.0,
+                          move_time[1] / moves[1] if moves[1] else 0.0,
+                          sum(1 for result in results if result.forfeit == 0),
+                          sum(1 for result in results if result.forfeit == 1))
@@ -0,0 +1,214 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+# relative path importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Admin.game_log import GameLog, from_posn, to_posn
+from Fish.Admin.game_replay import GameReplay
+from Fish.Admin.kicked_player_type import KickedPlayerType
+from Fish.Admin.referee import Referee
+from Fish.Admin.round_executor import RoundExecutor
+from Fish.Common.representations.bitboard_fish_board import BitboardFishBoardModel
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Common.representations.game_state_error import PenguinMovementError
+from Fish.Common.representations.state_serializer import serialize_state
+from Fish.Player.player import BasicPlayer
+
+
+class GameLogTests(unittest.TestCase):
+    """
+    This is a class that will run different tests to unit-test the game log and its replay
+    """
+
+    @staticmethod
+    def run_logged_game(players, rows=4, columns=5):
+        """
+        Purpose: Run a game with a referee that logs it to a string stream
+        Signature: List[LogicalPlayer] Int Int -> (Referee, StringIO)
+        """
+        stream = io.StringIO()
+        referee = Referee(game_log=GameLog(stream))
+        state = FishGameStateFactory.create_game_state_with_num_fish(
+            row=rows, col=columns, num_fish=2, player_colors=FishGameStateFactory.DEFAULT_COLOR_ORDER[:len(players)])
+        referee.initialize_and_run_from_game_state(players, state)
+        stream.seek(0)
+        return referee, stream
+
+    def assert_same_state(self, expected, actual):
+        """
+        Purpose: Check that two states have the same board, players, turn and phase
+        Signature: FishGameState FishGameState -> Void
+        """
+        self.assertEqual(serialize_state(expected), serialize_state(actual))
+        self.assertEqual(expected.get_player_order(), actual.get_player_order())
+        self.assertEqual(expected.get_game_phase(), actual.get_game_phase())
+        self.assertEqual(expected.get_zobrist_hash(), actual.get_zobrist_hash())
+
+    def test_posn(self):
+        """
+        Purpose: Test converting between coordinates and the [row, column] positions of the log
+        Signature: Void -> Void
+        """
+        self.assertEqual([1, 2], to_posn((5, 1)))
+        self.assertEqual((5, 1), from_posn([1, 2]))
+        self.assertEqual((4, 2), from_posn(to_posn((4, 2))))
+
+    def test_events(self):
+        """
+        Purpose: Test that every event is one JSON line without spaces
+        Signature: Void -> Void
+        """
+        stream = io.StringIO()
+        log = GameLog(stream)
+        log.place(PlayerColor.RED, (5, 1))
+        log.move(PlayerColor.WHITE, ((0, 0), (1, 1)))
+        log.skip(PlayerColor.RED)
+        log.kick(PlayerColor.BLACK, KickedPlayerType.FAILING, GamePhase.MOVE_PENGUINS)
+        log.phase(GamePhase.END_GAME)
+        log.end([PlayerColor.RED], {PlayerColor.RED: 3, PlayerColor.WHITE: 1})
+        lines = stream.getvalue().splitlines()
+        self.assertEqual('{"event":"place","color":"red","position":[1,2]}', lines[0])
+        self.assertEqual({"event": "move", "color": "white", "action": [[0, 0], [1, 0]]}, json.loads(lines[1]))
+        self.assertEqual({"event": "skip", "color": "red"}, json.loads(lines[2]))
+        self.assertEqual({"event": "kick", "color": "black", "reason": "failing", "phase": "penguin moving"},
+                         json.loads(lines[3]))
+        self.assertEqual({"event": "phase", "phase": "endgame"}, json.loads(lines[4]))
+        self.assertEqual({"event": "end", "winners": ["red"], "scores": {"red": 3, "white": 1}}, json.loads(lines[5]))
+
+    def test_replay_game(self):
+        """
+        Purpose: Test that replaying a logged game ends in the final state of the referee, with the same winners
+        Signature: Void -> Void
+        """
+        referee, stream = GameLogTests.run_logged_game([(BasicPlayer(), 1), (BasicPlayer(), 2), (BasicPlayer(), 3)])
+        replays = list(GameReplay.read(stream))
+        self.assertEqual(1, len(replays))
+        replay = replays[0]
+        self.assertTrue(replay.has_ended())
+        self.assertEqual(['start'] + ['place'] * 9 + ['phase'],
+                         [event['event'] for event in replay.events[:11]])
+        self.assert_same_state(referee.current_game_state, replay.get_state())
+        self.assertEqual([color.value for color in referee.winners], replay.events[-1]['winners'])
+        self.assertEqual(GamePhase.PLACE_PENGUINS, replay.get_state(0).get_game_phase())
+        self.assertEqual([[0, 0]], serialize_state(replay.get_state(1))['players'][-1]['places'])
+
+    def test_checkpoints(self):
+        """
+        Purpose: Test that the state after every event is the same when rebuilt from checkpoints, also with a board
+                 class other than the default, and that states from a replay can be changed without changing it
+        Signature: Void -> Void
+        """
+        _, stream = GameLogTests.run_logged_game([(BasicPlayer(), 1), (BasicPlayer(), 2)], 5, 5)
+        events = list(map(json.loads, stream))
+        every_event = GameReplay(events, checkpoint_interval=1)
+        self.assertEqual(len(events), len(every_event.checkpoints))
+        for replay in [GameReplay(events), GameReplay(events, checkpoint_interval=100),
+                       GameReplay(events, BitboardFishBoardModel, 3)]:
+            for index in range(len(events)):
+                self.assert_same_state(every_event.get_state(index), replay.get_state(index))
+        state = every_event.get_state(1)
+        state.remove_color_from_game(PlayerColor.RED)
+        self.assertEqual([PlayerColor.RED, PlayerColor.WHITE], every_event.get_state(1).get_player_order())
+        with self.assertRaises(ValueError):
+            every_event.get_state(len(events))
+
+    def test_kicks(self):
+        """
+        Purpose: Test that players kicked before, during and after playing are logged with their reason and removed
+                 from the replayed state
+        Signature: Void -> Void
+        """
+        silent_player = BasicPlayer()
+        silent_player.assign_color = MagicMock(return_value=False)
+        cheating_player = BasicPlayer()
+        cheating_player.player_move_penguin = MagicMock(return_value=((-1, -1), (0, 0)))
+        referee, stream = GameLogTests.run_logged_game([(BasicPlayer(), 1), (silent_player, 2),
+                                                        (cheating_player, 3)])
+        replay = next(GameReplay.read(stream))
+        kicks = [event for event in replay.events if event['event'] == 'kick']
+        self.assertEqual([{"event": "kick", "color": "white", "reason": "failing", "phase": "penguin placing"},
+                          {"event": "kick", "color": "brown", "reason": "cheating", "phase": "penguin moving"}],
+                         kicks)
+        self.assertEqual('kick', replay.events[1]['event'])
+        self.assertEqual(['red', 'white', 'brown'],
+                         [player['color'] for player in replay.events[0]['state']['players']])
+        self.assertEqual([PlayerColor.RED, PlayerColor.BROWN], replay.get_state(1).get_player_order())
+        self.assert_same_state(referee.current_game_state, replay.get_state())
+
+    def test_no_players_left(self):
+        """
+        Purpose: Test replaying a game in which every player was kicked
+        Signature: Void -> Void
+        """
+        cheating_player = BasicPlayer()
+        cheating_player.player_place_penguin = MagicMock(return_value=(-1, -1))
+        _, stream = GameLogTests.run_logged_game([(cheating_player, 1), (cheating_player, 2)])
+        replay = next(GameReplay.read(stream))
+        self.assertEqual(['start', 'kick', 'kick', 'phase', 'end'], [event['event'] for event in replay.events])
+        self.assertEqual([], replay.get_state().get_player_order())
+        self.assertEqual([], replay.events[-1]['winners'])
+
+    def test_read_several_games(self):
+        """
+        Purpose: Test reading games written one after another to the same stream, where the last one has not ended
+        Signature: Void -> Void
+        """
+        _, first = GameLogTests.run_logged_game([(BasicPlayer(), 1), (BasicPlayer(), 2)])
+        _, second = GameLogTests.run_logged_game([(BasicPlayer(), 1), (BasicPlayer(), 2), (BasicPlayer(), 3)])
+        unfinished = second.getvalue().splitlines()[:5]
+        replays = list(GameReplay.read(io.StringIO(first.getvalue() + second.getvalue() + '\n'.join(unfinished))))
+        self.assertEqual([True, True, False], [replay.has_ended() for replay in replays])
+        self.assertEqual(4, len(replays[2].events[1:]))
+
+    def test_invalid_log(self):
+        """
+        Purpose: Test that logs that do not start a game or do not follow the rules cannot be replayed
+        Signature: Void -> Void
+        """
+        _, stream = GameLogTests.run_logged_game([(BasicPlayer(), 1), (BasicPlayer(), 2)])
+        events = list(map(json.loads, stream))
+        with self.assertRaises(ValueError):
+            GameReplay(events[1:])
+        with self.assertRaises(ValueError):
+            GameReplay(events, checkpoint_interval=0)
+        first_move = next(index for index, event in enumerate(events) if event['event'] == 'move')
+        with self.assertRaises(PenguinMovementError):
+            GameReplay(events[:first_move] + [dict(events[first_move], action=[[0, 0], [0, 0]])])
+        with self.assertRaises(ValueError):
+            GameReplay(events[:1] + [{"event": "unknown"}])
+
+    def test_round_executor_logs(self):
+        """
+        Purpose: Test that a round executor logs every game of every round to its own file, also in other processes
+        Signature: Void -> Void
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            log_directory = os.path.join(directory, 'games')
+            for mode in [ExecutionMode.SEQUENTIAL, ExecutionMode.PROCESS]:
+                executor = RoundExecutor(mode, max_workers=2, log_directory=log_directory)
+                self.assertEqual(os.path.join(log_directory, 'round-1-table-0.jsonl'), executor.get_log_path(0))
+                allocations = [[(BasicPlayer(), table * 2 + i) for i in range(2)] for table in range(2)]
+                rounds = executor.run_round(allocations)
+                for table, referee in rounds.items():
+                    self.assertIsNone(referee.game_log)
+                    with open(executor.get_log_path(table, 1)) as stream:
+                        replays = list(GameReplay.read(stream))
+                    self.assert_same_state(referee.current_game_state, replays[-1].get_state())
+                self.assertEqual(os.path.join(log_directory, 'round-2-table-1.jsonl'), executor.get_log_path(1))
+            # the second executor appended its games to the files of the first
+            with open(os.path.join(log_directory, 'round-1-table-1.jsonl')) as stream:
+                self.assertEqual(2, len(list(GameReplay.read(stream))))
+        self.assertIsNone(RoundExecutor().get_log_path(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import unittest
+
+# relative path importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Admin.latency_histogram import LATENCY_BUCKETS, LatencyHistogram
+
+
+class LatencyHistogramTests(unittest.TestCase):
+    """
+    This is a class that will run different tests to unit-test our latency histograms
+    """
+
+    def test_record(self):
+        """
+        Purpose: Test that calls go in the bucket of the smallest bound they do not exceed, or the last bucket
+        Signature: Void -> Void
+        """
+        histogram = LatencyHistogram()
+        for seconds in [0.0005, 0.001, 0.05, 9.5, 12]:
+            histogram.record(seconds)
+        self.assertEqual([2, 0, 1, 0, 0, 0, 0, 0, 1, 1], histogram.counts)
+        self.assertEqual(len(LATENCY_BUCKETS) + 1, len(histogram.counts))
+        self.assertEqual(5, histogram.count)
+        self.assertEqual(12, histogram.max_seconds)
+        self.assertAlmostEqual(21.5515 / 5, histogram.get_mean_seconds())
+
+    def test_percentile(self):
+        """
+        Purpose: Test estimating percentiles from the buckets, capped by the slowest call
+        Signature: Void -> Void
+        """
+        histogram = LatencyHistogram()
+        self.assertEqual(0, histogram.get_percentile(0.95))
+        self.assertEqual(0, histogram.get_mean_seconds())
+        for _ in range(19):
+            histogram.record(0.005)
+        histogram.record(3)
+        self.assertEqual(0.01, histogram.get_percentile(0.5))
+        self.assertEqual(0.01, histogram.get_percentile(0.95))
+        self.assertEqual(3, histogram.get_percentile(1))
+        histogram.record(20)
+        self.assertEqual(20, histogram.get_percentile(1))
+        with self.assertRaises(ValueError):
+            histogram.get_percentile(1.5)
+
+    def test_merge(self):
+        """
+        Purpose: Test merging the calls of two histograms
+        Signature: Void -> Void
+        """
+        histogram = LatencyHistogram()
+        histogram.record(0.2)
+        other = LatencyHistogram()
+        other.record(0.3)
+        other.record(6)
+        histogram.merge(other)
+        self.assertEqual(3, histogram.count)
+        self.assertEqual(2, histogram.counts[3])
+        self.assertEqual(6, histogram.max_seconds)
+        self.assertAlmostEqual(6.5, histogram.total_seconds)
+        self.assertEqual({'count': 3, 'max_seconds': 6}, {key: histogram.to_dict()[key]
+                                                          for key in ['count', 'max_seconds']})
+        self.assertEqual(1, histogram.to_dict()['buckets']['8.0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
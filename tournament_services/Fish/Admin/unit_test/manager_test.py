@@ -1,10 +1,12 @@
 import os
 import sys
+import time
 import unittest
 from unittest.mock import MagicMock
 
 # relative path importing
 from Fish.Admin.manager import Manager
+from Fish.Admin.player_call import PlayerCall
 from Fish.Player.player import BasicPlayer
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
@@ -132,6 +134,32 @@ class ManagerTests(unittest.TestCase):
         # Checks if minimum amount of rounds has passed
         self.assertTrue(manager.round >= 2)
 
+    def test_latency_report(self):
+        """
+        Purpose: Test that the manager collects the latencies of every player of every round by age, with the slow
+        calls of the slowest player
+        Signature: Void -> Void
+        """
+        player_list = [(BasicPlayer(), i) for i in range(5)]
+        slow_player = player_list[3][0]
+        find_move = slow_player.player_move_penguin
+
+        def slow_move(state):
+            time.sleep(0.01)
+            return find_move(state)
+        slow_player.player_move_penguin = slow_move
+        manager = Manager(player_list)
+        manager.run_tournament()
+        report = manager.latency_report
+        self.assertEqual({0, 1, 2, 3, 4}, set(report.histograms))
+        self.assertEqual(3, report.get_slowest_players(1)[0][0])
+        rounds_played = report.get_histogram(3, PlayerCall.ASSIGN_COLOR).count
+        self.assertGreater(rounds_played, 0)
+        histogram = report.get_histogram(3)
+        self.assertEqual(histogram.count, sum(report.get_histogram(3, call).count for call in PlayerCall))
+        self.assertEqual([], report.slow_calls)
+        self.assertIn('move penguin', report.format())
+
     def test_is_tournament_over_duplicate_round_winners(self):
         """
         Purpose: Checks to determine if a tournament has reached the end condition.
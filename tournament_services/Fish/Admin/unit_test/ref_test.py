@@ -1,20 +1,40 @@
 import os
 import sys
-import copy
+import time
 import unittest
 from unittest.mock import MagicMock
 
 # relative path importing
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
 
+from Fish.Admin.player_call import PlayerCall
 from Fish.Admin.referee import Referee
-from Fish.Common.game_tree import FishGameTree
 from Fish.Common.representations.enumerations.game_phase import GamePhase
 from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.game_state_view import FishGameStateView
 from Fish.Player.player import BasicPlayer
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.strategy_interface import StrategyInterface
 from Fish.Admin.kicked_player_type import KickedPlayerType
 
 
+class PhaseChangingStrategy(StrategyInterface):
+    """
+    A strategy that finds the same placements and moves as a basic strategy, but ends the game in the state it is given
+    """
+
+    def find_next_placement(self, state):
+        placement = FishBasicStrategy(1).find_next_placement(state)
+        state.set_game_phase(GamePhase.END_GAME)
+        return placement
+
+    def find_next_move(self, state):
+        action = FishBasicStrategy(1).find_next_move(state)
+        state.set_game_phase(GamePhase.END_GAME)
+        return action
+
+
 class RefTests(unittest.TestCase):
     """
     This is a class that will run different tests to unit-test our referee
@@ -178,7 +198,6 @@ class RefTests(unittest.TestCase):
 
         # Set player color to black, they can not go and will be skipped
         ref.current_game_state.set_turn(PlayerColor.BLACK)
-        ref.current_game_tree = FishGameTree(copy.deepcopy(ref.current_game_state))
 
         initial_pengs = ref.current_game_state.get_penguins_for_player(player_color=PlayerColor.BLACK)
         ref._run_movement_turn()
@@ -186,6 +205,7 @@ class RefTests(unittest.TestCase):
         moved_pengs = ref.current_game_state.get_penguins_for_player(player_color=PlayerColor.BLACK)
         self.assertEqual(initial_pengs, moved_pengs)
         self.assertEqual(0, ref.current_game_state.get_fish_for_player(player_color=PlayerColor.BLACK))
+        self.assertEqual(PlayerColor.RED, ref.current_game_state.get_current_turn())
 
     def test_run_movement_turn_invalid(self):
         """
@@ -351,6 +371,82 @@ class RefTests(unittest.TestCase):
         self.assertEqual([], ref.winners)
         self.assertListEqual([PlayerColor.RED, PlayerColor.WHITE], ref.kicked_players[KickedPlayerType.CHEATING])
 
+    def test_state_views(self):
+        """
+        Test that players that accept state views are given one, and other players a copy of the state
+        """
+        ref = self.set_up_game_phases(5, 5)
+        trusted_player = BasicPlayer()
+        untrusted_player = BasicPlayer()
+        untrusted_player.accepts_state_view = MagicMock(return_value=False)
+
+        view = ref._get_state_for_player(trusted_player)
+        self.assertIsInstance(view, FishGameStateView)
+        state_copy = ref._get_state_for_player(untrusted_player)
+        self.assertIsInstance(state_copy, FishGameState)
+        self.assertIsNot(ref.current_game_state, state_copy)
+
+        ref.state_views = False
+        self.assertIsInstance(ref._get_state_for_player(trusted_player), FishGameState)
+
+    def test_player_changing_state_view(self):
+        """
+        Test that a player that tries to change the state view it is given is kicked and the game is not changed
+        """
+        cheating_player = BasicPlayer()
+        cheating_player.player_place_penguin = MagicMock(
+            side_effect=lambda state: state.place_penguin(state.get_current_turn(), (0, 0)))
+        ref = self.set_up_game_phases(5, 5, num_players=3, bad_player_obj=cheating_player)
+
+        ref._run_placement_turn()
+
+        self.assertEqual([PlayerColor.RED], ref.kicked_players[KickedPlayerType.FAILING])
+        self.assertEqual(PlayerColor.WHITE, ref.current_game_state.get_current_turn())
+        self.assertIsNone(ref.current_game_state.get_penguin_color_at_pos((0, 0)))
+
+    def test_player_with_strategy_changing_state(self):
+        """
+        Test that a player whose strategy changes the state it is given gets a copy of the state and is not kicked
+        """
+        players = [(BasicPlayer(strategy=PhaseChangingStrategy()), 1), (BasicPlayer(), 2)]
+        ref = Referee()
+        ref.initialize_and_run_game(4, 4, players)
+        self.assertEqual([], ref.kicked_players[KickedPlayerType.FAILING])
+        self.assertGreater(ref.current_game_state.get_fish_for_player(PlayerColor.RED), 0)
+
+    def test_latencies(self):
+        """
+        Test that every call to a player is timed, including calls that raise, and that slow calls are kept with the
+        state the player was asked about
+        """
+        slow_player = BasicPlayer()
+        find_move = slow_player.player_move_penguin
+
+        def slow_move(state):
+            time.sleep(0.02)
+            return find_move(state)
+        slow_player.player_move_penguin = slow_move
+        players = [(slow_player, 1), (RefTests.bad_player_exception_placement, 2), (BasicPlayer(), 3)]
+        ref = Referee(slow_call_seconds=0.01)
+        ref.initialize_and_run_game(5, 5, players)
+
+        latencies = ref.latencies[PlayerColor.RED]
+        self.assertEqual(1, latencies[PlayerCall.ASSIGN_COLOR].count)
+        self.assertEqual(1, latencies[PlayerCall.SHOW_OTHER_PLAYERS_COLORS].count)
+        self.assertEqual(3, latencies[PlayerCall.PLACE_PENGUIN].count)
+        move_calls = latencies[PlayerCall.MOVE_PENGUIN].count
+        self.assertGreater(move_calls, 0)
+        self.assertGreaterEqual(latencies[PlayerCall.MOVE_PENGUIN].max_seconds, 0.02)
+        # the player that raised while placing was kicked, but its call was still timed
+        self.assertEqual(1, ref.latencies[PlayerColor.WHITE][PlayerCall.PLACE_PENGUIN].count)
+        self.assertNotIn(PlayerCall.MOVE_PENGUIN, ref.latencies[PlayerColor.WHITE])
+
+        slow_moves = [call for call in ref.slow_calls if call.color == PlayerColor.RED]
+        self.assertEqual(move_calls, len(slow_moves))
+        self.assertTrue(all(call.call == PlayerCall.MOVE_PENGUIN and call.seconds >= 0.02 for call in slow_moves))
+        self.assertEqual('red', slow_moves[0].state['players'][0]['color'])
+        self.assertEqual(5, len(slow_moves[0].state['board']))
+
     def test_run_larger_game(self):
         """
         Tests running a larger more non-trivial game
@@ -0,0 +1,102 @@
+import os
+import sys
+import unittest
+
+# relative path importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Admin.manager import Manager
+from Fish.Admin.round_executor import RoundExecutor
+from Fish.Player.player import BasicPlayer
+
+
+class CrashingPlayer(BasicPlayer):
+    """
+    A player that makes the referee of its game crash, as the referee does not expect assign_color to raise
+    """
+
+    def assign_color(self, color):
+        raise RuntimeError('Boom')
+
+
+class RoundExecutorTests(unittest.TestCase):
+    """
+    This is a class that will run different tests to unit-test our round executor
+    """
+
+    @staticmethod
+    def create_allocations(tables, players_per_table=3):
+        """
+        Purpose: Create allocations of basic players for a number of tables
+        Signature: Int Int -> List[List[LogicalPlayer]]
+        """
+        return [[(BasicPlayer(), table * players_per_table + i) for i in range(players_per_table)]
+                for table in range(tables)]
+
+    @staticmethod
+    def get_winners(rounds):
+        """
+        Purpose: Get the ages of the winners of every table of a round
+        Signature: Dict[Int, Referee] -> Dict[Int, List[Int]]
+        """
+        return {table: [referee.players[color] for color in referee.winners] for table, referee in rounds.items()}
+
+    def test_invalid_workers(self):
+        """
+        Purpose: Test that a pool needs at least one worker
+        Signature: Void -> Void
+        """
+        with self.assertRaises(ValueError):
+            RoundExecutor(ExecutionMode.THREAD, max_workers=0)
+
+    def test_modes_same_results(self):
+        """
+        Purpose: Test that every mode gives the same winners for every table, with the original players
+        Signature: Void -> Void
+        """
+        allocations = RoundExecutorTests.create_allocations(3)
+        expected = RoundExecutorTests.get_winners(RoundExecutor().run_round(allocations))
+        self.assertEqual([0, 1, 2], sorted(expected.keys()))
+        for mode in [ExecutionMode.THREAD, ExecutionMode.PROCESS]:
+            rounds = RoundExecutor(mode, max_workers=2).run_round(allocations)
+            self.assertEqual(expected, RoundExecutorTests.get_winners(rounds))
+            players = [player for allocation in allocations for player, _ in allocation]
+            for referee in rounds.values():
+                for player in referee.players.values():
+                    self.assertTrue(any(player is original for original in players))
+
+    def test_failure_isolated(self):
+        """
+        Purpose: Test that a game whose referee crashes does not stop the other games, and that none of its players win
+        Signature: Void -> Void
+        """
+        for mode in [ExecutionMode.SEQUENTIAL, ExecutionMode.THREAD]:
+            allocations = RoundExecutorTests.create_allocations(3)
+            allocations[1][0] = (CrashingPlayer(), allocations[1][0][1])
+            executor = RoundExecutor(mode)
+            rounds = executor.run_round(allocations)
+            self.assertEqual([], rounds[1].winners)
+            self.assertNotEqual([], rounds[0].winners)
+            self.assertNotEqual([], rounds[2].winners)
+            report = executor.reports[-1]
+            self.assertEqual(3, report.games)
+            self.assertEqual([1], list(report.failures.keys()))
+            self.assertIsInstance(report.failures[1], RuntimeError)
+            self.assertGreater(report.game_time, 0)
+
+    def test_manager_with_threads(self):
+        """
+        Purpose: Test running a tournament with the games of each round run in threads, with one report per round
+        Signature: Void -> Void
+        """
+        player_list = [(BasicPlayer(), i) for i in range(9)]
+        manager = Manager(player_list, RoundExecutor(ExecutionMode.THREAD))
+        manager.run_tournament()
+        self.assertTrue(manager.round >= 2)
+        self.assertEqual(manager.round, len(manager.round_executor.reports))
+        self.assertTrue(len(player_list) >= len(manager.player_pool))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import copy
+import os
+import random
+import sys
+import unittest
+
+# relative path importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Admin.simulator import Simulator, play_game
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Player.iterative_deepening_strategy import FishIterativeDeepeningStrategy
+from Fish.Player.parallel_strategy import FishRootParallelStrategy
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.unit_test import strategy_test
+
+
+class IllegalMoveStrategy(FishBasicStrategy):
+    """
+    A strategy that places its penguins like a basic strategy but then moves a penguin onto itself, which breaks the
+    rules
+    """
+
+    def find_next_move(self, state):
+        penguin = state.get_penguins_for_player(state.get_current_turn())[0]
+        return penguin, penguin
+
+
+class SimulatorTests(unittest.TestCase):
+    """
+    This is a class that will run different tests to unit-test our batch simulator
+    """
+
+    strategies = {'maximin': FishBasicStrategy(1), 'alpha-beta': FishBasicStrategy(2, use_alpha_beta=True)}
+
+    def test_play_game(self):
+        """
+        Test that a game with the same seed is played the same on either board, and every seat moves
+        """
+        strategies = [FishBasicStrategy(1), FishBasicStrategy(1)]
+        result = play_game(strategies, 4, 4, 2, seed=3)
+        self.assertEqual(result, play_game(strategies, 4, 4, 2, seed=3)._replace(move_time=result.move_time))
+        self.assertEqual(result.fish, play_game(strategies, 4, 4, 2, seed=3, board_class=FishBoardModel).fish)
+        self.assertEqual([seat for seat in range(2) if result.fish[seat] == max(result.fish)], result.winners)
+        self.assertTrue(all(moves > 0 for moves in result.moves))
+
+    def test_run_sequential(self):
+        """
+        Test that every board is played with both strategies moving first, and the report adds up
+        """
+        simulator = Simulator(ExecutionMode.SEQUENTIAL, rows=4, columns=4, holes=3)
+        reports = simulator.run(self.strategies, games=5, seed=7)
+        self.assertEqual(1, len(reports))
+        report = reports[0]
+        self.assertEqual(('maximin', 'alpha-beta', 6), (report.first, report.second, report.games))
+        self.assertEqual(report.games, report.first_wins + report.second_wins + report.draws)
+        self.assertEqual(report.first_wins / 6, report.first_win_rate)
+        self.assertGreater(report.first_fish + report.second_fish, 0)
+        self.assertGreater(report.second_move_time, 0)
+
+    def test_run_same_in_every_mode(self):
+        """
+        Test that running the games in processes gives the same results as running them one after another
+        """
+        results = []
+        for mode in [ExecutionMode.SEQUENTIAL, ExecutionMode.PROCESS]:
+            report = Simulator(mode, max_workers=2, rows=4, columns=4).run(self.strategies, games=4)[0]
+            results.append(report[:8])
+        self.assertEqual(results[0], results[1])
+
+    def test_forfeit(self):
+        """
+        Test that a strategy that breaks the rules forfeits its games without stopping the other games
+        """
+        strategies = [FishBasicStrategy(1), IllegalMoveStrategy(1)]
+        result = play_game(strategies, 4, 4, 0, seed=1)
+        self.assertEqual((1, [0], [1, 1]), (result.forfeit, result.winners, result.moves))
+        self.assertIsNone(play_game(strategies[:1] * 2, 4, 4, 0, seed=1).forfeit)
+        report = Simulator(ExecutionMode.SEQUENTIAL, rows=4, columns=4).run(
+            {'basic': FishBasicStrategy(1), 'illegal': IllegalMoveStrategy(1)}, games=4)[0]
+        self.assertEqual((4, 0, 0, 4), (report.first_wins, report.second_wins, report.first_forfeits,
+                                        report.second_forfeits))
+
+    def test_run_threads_with_shared_strategies(self):
+        """
+        Test that games running in threads at the same time do not share the state of the searches of their strategies
+        """
+        strategies = {'deepening': FishIterativeDeepeningStrategy(0.01), 'alpha-beta': FishBasicStrategy(1, True)}
+        report = Simulator(ExecutionMode.THREAD, max_workers=8, rows=4, columns=4).run(strategies, games=16)[0]
+        self.assertEqual(16, report.games)
+        self.assertEqual((0, 0), (report.first_forfeits, report.second_forfeits))
+
+    def test_run_with_worker_processes(self):
+        """
+        Test that strategies that started their worker processes can be copied for every game, and that the copies
+        do not keep worker processes of their own
+        """
+        with FishRootParallelStrategy(1, workers=1) as parallel:
+            state = strategy_test.StrategyTest.create_random_move_state(random.Random(0), 4, 4, 2)
+            parallel.find_next_move(state)
+            report = Simulator(ExecutionMode.SEQUENTIAL, rows=4, columns=4).run(
+                {'parallel': parallel, 'basic': FishBasicStrategy(1)}, games=2)[0]
+            self.assertEqual(2, report.games)
+            self.assertIsNotNone(parallel._executor)
+            self.assertIsNone(copy.deepcopy(parallel)._executor)
+
+    def test_invalid_simulator(self):
+        """
+        Test that a simulator cannot be created for a board without room for the penguins, or without workers
+        """
+        with self.assertRaises(ValueError):
+            Simulator(rows=3, columns=3, holes=2)
+        with self.assertRaises(ValueError):
+            Simulator(max_workers=0)
+        with self.assertRaises(ValueError):
+            Simulator(ExecutionMode.SEQUENTIAL).run(self.strategies, games=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
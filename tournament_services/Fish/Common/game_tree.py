@@ -1,10 +1,12 @@
-from typing import List, Callable, Any
+from typing import List, Callable, Any, Optional
 
 from Fish.Common.representations.enumerations.game_phase import GamePhase
 from Fish.Common.representations.game_state import FishGameState
 import copy
 
 from Fish.Common.representations.types import Coordinate, Action
+from Fish.Common.search_activity import SearchActivity
+from Fish.Common.search_stats import SearchStats
 
 class FishGameTree(object):
     """
@@ -13,7 +15,8 @@ class FishGameTree(object):
         possible_moves: [Action],
         depth: int,
         parent_action: Action | None,
-        end_game_state: Boolean
+        end_game_state: Boolean,
+        stats: SearchStats | None
     }
     INTERP: This represents a tree of all possible game states in a particular Fish game starting from a particular
     state where players can move a penguin.
@@ -38,6 +41,10 @@ class FishGameTree(object):
     Finally, the end_game_state variable notes whether this node we are at is an end game state, which means a state
     where no players can make further moves.
 
+    The stats parameter is where a search that walks the tree records the time spent finding the actions of the nodes
+    and copying their states (see SearchStats). The children of a node share its stats. Trees without stats do not
+    time anything.
+
     NOTE on Generation:
 
     The functions which start with generate_... in this class use a generator, which is a concept for lazy computation.
@@ -50,20 +57,25 @@ class FishGameTree(object):
     """
 
     def __init__(self, state: FishGameState, depth: int = 0,
-                 parent_action: Action = None):
+                 parent_action: Action = None, stats: Optional[SearchStats] = None):
         """
         Purpose: Initialize a game state tree. Has a certain state and turn color plus all
                  of the turns for a certain player, also controls information about the other nodes
                  it may be related to
-        Signature: FishGameState PlayerColor -> FishGameTree
+        Signature: FishGameState PlayerColor Int Maybe[Action] Maybe[SearchStats] -> FishGameTree
         :param state: the state that we are initializing this tree with
         :param depth: How deep in the tree this node of the tree is
         :param parent_action: What action was taken by the parent to get to this node
+        :param stats: Stats of the search walking the tree, or None to not time anything
         """
         if not state.get_game_phase() == GamePhase.MOVE_PENGUINS:
             raise ValueError('Must be in moving penguins phase')
         self.state: FishGameState = state
-        self.possible_moves: List[Action] = self.find_actions()
+        self.stats = stats
+        if stats is None:
+            self.possible_moves: List[Action] = self.find_actions()
+        else:
+            self.possible_moves = stats.time(SearchActivity.MOVE_GENERATION, self.find_actions)
         self.depth: int = depth
         self.parent_action = parent_action
         self.end_game_state = False
@@ -128,8 +140,8 @@ class FishGameTree(object):
             if self.get_children_moves():
                 for action in self.get_children_moves():
                     from_pos, to_pos = action
-                    new_state = self.create_moved_state(self.state, from_pos, to_pos)
-                    new_tree = FishGameTree(new_state, self.depth + 1, action)
+                    new_state = self._create_child_state(from_pos, to_pos)
+                    new_tree = FishGameTree(new_state, self.depth + 1, action, self.stats)
                     yield new_tree
             else:
                 new_tree = self._create_next_color_child()
@@ -144,9 +156,12 @@ class FishGameTree(object):
         :return: A new tree with the next player in the order's color but with everything else
                  the same
         """
-        state_copy = self.get_state()
+        if self.stats is None:
+            state_copy = self.get_state()
+        else:
+            state_copy = self.stats.time(SearchActivity.COPY, self.get_state)
         state_copy.increase_turn()
-        new_tree = FishGameTree(state_copy, depth=self.get_depth() + 1)
+        new_tree = FishGameTree(state_copy, depth=self.get_depth() + 1, stats=self.stats)
         return new_tree
 
     def get_children_moves(self):
@@ -213,7 +228,7 @@ class FishGameTree(object):
         """
         if action in self.possible_moves:
             from_position, to_position = action
-            applied_state = self.create_moved_state(self.state, from_position, to_position)
+            applied_state = self._create_child_state(from_position, to_position)
         else:
             raise ValueError('This move cannot be made')
         return applied_state
@@ -227,7 +242,7 @@ class FishGameTree(object):
                        new tree.
         """
         new_state = self.validate_and_apply_action(action)
-        return FishGameTree(new_state, self.depth + 1, action)
+        return FishGameTree(new_state, self.depth + 1, action, self.stats)
 
     @staticmethod
     def create_moved_state(state: FishGameState, from_pos: Coordinate, to_pos: Coordinate) -> FishGameState:
@@ -243,6 +258,20 @@ class FishGameTree(object):
         state_copy.move_penguin(state_copy.get_current_turn(), from_pos, to_pos)
         return state_copy
 
+    def _create_child_state(self, from_pos: Coordinate, to_pos: Coordinate) -> FishGameState:
+        """
+        Purpose: Create the state of a child of this tree like create_moved_state, timing the copy and the move
+                 separately if the tree has stats
+        Signature: Coordinate Coordinate -> FishGameState
+        :param from_pos: Coordinate we are moving penguin from
+        :param to_pos: Coordinate we are moving penguin to
+        """
+        if self.stats is None:
+            return self.create_moved_state(self.state, from_pos, to_pos)
+        state_copy = self.stats.time(SearchActivity.COPY, copy.deepcopy, self.state)
+        self.stats.time(SearchActivity.APPLY, state_copy.move_penguin, state_copy.get_current_turn(), from_pos, to_pos)
+        return state_copy
+
     def find_actions(self) -> List[Action]:
         """
         Purpose: Find the list of possible actions for a given state (i.e. movement of penguiin
@@ -250,11 +279,23 @@ class FishGameTree(object):
         Signature: Void -> [Action]
         :return: List of actions for a given state, used to initialize actions for a given state
         """
-        penguin_posns = self.state.get_penguins_for_player(self.state.get_current_turn())
+        return FishGameTree.find_actions_for_state(self.state)
+
+    @staticmethod
+    def find_actions_for_state(state: FishGameState) -> List[Action]:
+        """
+        Purpose: Find the list of possible actions for the player whose turn it is in a state without creating a
+                 tree for it. Searches that change a single state in place with FishGameState.apply_move and
+                 FishGameState.undo_move use this to walk the game tree without copying states.
+        Signature: FishGameState -> [Action]
+        :param state: State in the moving penguins phase that we are finding actions for
+        :return: List of actions for the player whose turn it is, which is empty if that player cannot move
+        """
+        penguin_posns = state.get_penguins_for_player(state.get_current_turn())
         action_list: List[Action] = []
         if penguin_posns:
             for posn in penguin_posns:
-                move_to_places = self.state.find_valid_moves_from_pos(posn)
+                move_to_places = state.find_valid_moves_from_pos(posn)
                 for place in move_to_places:
                     action = posn, place
                     action_list.append(action)
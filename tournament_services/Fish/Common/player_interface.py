@@ -41,7 +41,8 @@ class PlayerInterface(object):
         :param state: A copy of the state which contains the info needed for the player
                       about the board and about the players and their penguins on the board.
                       This gives the player enough information to find a coordinate to place a penguin.
-                      Modifying this state will not modify the actual state of the game.
+                      Modifying this state will not modify the actual state of the game. Players that
+                      accept state views are given a read-only FishGameStateView instead.
         :return: A player coordinate for where the given player wants to place their next penguin
         """
         raise NotImplemented
@@ -54,7 +55,8 @@ class PlayerInterface(object):
         :param state: A copy of the state which contains the info needed for the player
                       about the board and about the players and their penguins on the board.
                       This gives the player enough information to find a coordinate to move a penguin.
-                      Modifying this state will not modify the actual state of the game.
+                      Modifying this state will not modify the actual state of the game. Players that
+                      accept state views are given a read-only FishGameStateView instead.
         :return: An Action which is a tuple of coordinates representing a move of a penguin
                  from one position to another that the player is returning to the referee
         """
@@ -70,6 +72,16 @@ class PlayerInterface(object):
         """
         raise NotImplemented
 
+    def accepts_state_view(self) -> bool:
+        """
+        Purpose: Tell the referee whether this player can be given a read-only view of the state of the game (see
+                 FishGameStateView) instead of a copy when it is asked to place or move a penguin. A view is not
+                 copied, but it cannot be changed and only shows the state of the game during that call. Players
+                 that keep or change the state they are given, such as the player proxies, need a copy.
+        Signature: Void -> Bool
+        """
+        return False
+
     def start(self) -> bool:
         raise NotImplemented
 
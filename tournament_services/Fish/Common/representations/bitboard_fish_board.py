@@ -0,0 +1,377 @@
+import copy
+from functools import lru_cache
+from typing import Container, Dict, List, Optional, Set, Tuple, Iterable
+
+from Fish.Common.representations.enumerations.directions_enum import HexDirection
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.fish_tile import FishTile
+from Fish.Common.representations.types import Coordinate
+
+"""
+A CellMask is a non-negative Integer
+INTERPRETATION: A set of cells of a board with a certain amount of rows and columns, where the cell at coordinate
+(x, y) is in the set if bit number y * columns + x // 2 of the integer is set. Every row of the double-height coordinate
+system uses either only even or only odd x values, so x // 2 is the column of a coordinate.
+"""
+CellMask = int
+
+"""
+A Ray is (String, CellMask, [Coordinate], Boolean)
+INTERPRETATION: The cells in a straight line from a cell in one direction until the edge of the board, without the cell
+itself. The String is the name of the HexDirection, the CellMask contains all cells of the line and the list has them in
+order starting next to the cell. The Boolean is whether the bit numbers of the cells increase along the line, which
+is the case for the directions that go down the board.
+"""
+Ray = Tuple[str, CellMask, List[Coordinate], bool]
+
+
+class _BoardGeometry(object):
+    """
+    A _BoardGeometry is {
+    coords: [Coordinate],
+    coord_set: Set[Coordinate],
+    coords_sorted_by_row: [Coordinate],
+    index_of: Dictionary[Coordinate, Int],
+    rays: [[Ray]],
+    indexed_rays: [[((Coordinate, Int), ...)]],
+    board_mask: CellMask,
+    even_rows_mask: CellMask,
+    odd_rows_mask: CellMask,
+    first_column_mask: CellMask,
+    last_column_mask: CellMask
+    }
+    INTERP: Everything about a board that only depends on its amount of rows and columns and not on its tiles. coords
+    are the coordinates of the board in the order of FishBoardModel.create_coords, coord_set and coords_sorted_by_row
+    hold the same coordinates as a set and row by row, index_of maps each coordinate to its bit number, and rays holds
+    the rays in every HexDirection for every bit number, and indexed_rays the coordinates of the same rays paired with
+    their bit numbers. The masks hold all cells of the board, the cells of its even and odd rows and the cells of its
+    first and last columns, which are used to find the neighbors of many cells at once. Boards with the same dimensions
+    share the same geometry, so it is only computed once.
+    """
+
+    def __init__(self, rows: int, columns: int):
+        """
+        Purpose: Compute the geometry of a board with a certain amount of rows and columns
+        Signature: Int Int -> _BoardGeometry
+        """
+        self.coords: List[Coordinate] = FishBoardModel.create_coords(rows, columns)
+        self.coord_set: Set[Coordinate] = set(self.coords)
+        self.coords_sorted_by_row: List[Coordinate] = FishBoardModel.sort_coords_by_row(self.coords)
+        self.index_of: Dict[Coordinate, int] = {(x, y): y * columns + x // 2 for x, y in self.coords}
+        self.rays: List[List[Ray]] = [[] for _ in self.coords]
+        self.indexed_rays: List[List[Tuple[Tuple[Coordinate, int], ...]]] = [[] for _ in self.coords]
+        for coord, index in self.index_of.items():
+            for direction in HexDirection:
+                dx, dy = direction.value
+                line = []
+                mask = 0
+                x, y = coord[0] + dx, coord[1] + dy
+                while (x, y) in self.index_of:
+                    line.append((x, y))
+                    mask |= 1 << self.index_of[(x, y)]
+                    x, y = x + dx, y + dy
+                self.rays[index].append((direction.name, mask, line, dy > 0))
+                self.indexed_rays[index].append(tuple((cell, self.index_of[cell]) for cell in line))
+        self.board_mask: CellMask = (1 << len(self.coords)) - 1
+        row_mask = (1 << columns) - 1
+        self.even_rows_mask: CellMask = sum(row_mask << y * columns for y in range(0, rows, 2))
+        self.odd_rows_mask: CellMask = self.board_mask & ~self.even_rows_mask
+        self.first_column_mask: CellMask = sum(1 << y * columns for y in range(rows))
+        self.last_column_mask: CellMask = self.first_column_mask << columns - 1
+
+
+@lru_cache(maxsize=None)
+def _get_geometry(rows: int, columns: int) -> _BoardGeometry:
+    """
+    Purpose: Get the shared geometry for boards with a certain amount of rows and columns
+    Signature: Int Int -> _BoardGeometry
+    """
+    return _BoardGeometry(rows, columns)
+
+
+class BitboardFishBoardModel(FishBoardModel):
+    """
+    A BitboardFishBoardModel is {
+    rows: Integer
+    columns: Integer
+    coords: [Coordinate]
+    tiles: [Maybe[FishTile]]
+    tile_mask: CellMask
+    }
+    INTERP: A FishBoardModel with the same coordinates and the same public methods, which stores its tiles in a list
+    indexed by bit number (see CellMask) instead of a dictionary, and keeps the set of cells that still have a tile as
+    the integer tile_mask. Boards of any size are supported, as Python integers have no fixed width.
+
+    The straight lines from every cell in every direction are computed once for each size of board (see Ray). Finding
+    how far a line goes is then done with bit operations instead of looking up one tile at a time: the cells that
+    stop a line are the cells of its ray without a tile, and the line ends just before the first of those, which is
+    the lowest set bit of the blockers for lines going down the board and the highest set bit for lines going up.
+    find_straight_line_positions can additionally be given a mask of cells (such as the cells with penguins on them)
+    that stop the lines too.
+    """
+
+    def __init__(self, rows: int, columns: int):
+        """
+        Purpose: Initialize a Fish board without any tiles
+        Signature: Int Int -> BitboardFishBoardModel
+        :param rows: Amount of rows in the Fish board
+        :param columns: Amount of columns in the Fish board
+        """
+        if rows <= 0 or columns <= 0:
+            raise ValueError("Amount of rows and columns needs to be > 0")
+        self.rows: int = rows
+        self.columns: int = columns
+        self._geometry: _BoardGeometry = _get_geometry(rows, columns)
+        self.coords: List[Coordinate] = self._geometry.coords
+        self.coord_set: Set[Coordinate] = self._geometry.coord_set
+        self._coords_sorted_by_row: List[Coordinate] = self._geometry.coords_sorted_by_row
+        self.tiles: List[Optional[FishTile]] = [None] * len(self.coords)
+        self.tile_mask: CellMask = 0
+
+    @classmethod
+    def from_board(cls, board: FishBoardModel) -> 'BitboardFishBoardModel':
+        """
+        Purpose: Create a bitboard with copies of the tiles of another board
+        Signature: FishBoardModel -> BitboardFishBoardModel
+        :param board: The board whose dimensions and tiles are copied
+        """
+        rows, columns = board.get_dimensions()
+        bitboard = cls(rows, columns)
+        for coord in board.get_tile_coords():
+            tile = board.get_tile_at_coord(*coord)
+            if tile:
+                bitboard._set_tile(coord, FishTile(tile.num_fish))
+        return bitboard
+
+    def __deepcopy__(self, memo) -> 'BitboardFishBoardModel':
+        """
+        Purpose: Copy the board and its tiles, but share the geometry (which never changes) with the copy
+        Signature: Dict -> BitboardFishBoardModel
+        """
+        board_copy = type(self).__new__(type(self))
+        memo[id(self)] = board_copy
+        board_copy.__dict__.update(self.__dict__)
+        board_copy.tiles = copy.deepcopy(self.tiles, memo)
+        return board_copy
+
+    def __getstate__(self) -> Dict:
+        """
+        Purpose: Get the state of the board to pickle, leaving out the geometry which is shared by all boards of the
+                 same size in a process
+        Signature: Void -> Dict
+        """
+        state = dict(self.__dict__)
+        for derived in ('_geometry', 'coords', 'coord_set', '_coords_sorted_by_row'):
+            state.pop(derived, None)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Purpose: Restore a pickled board, using the geometry of its size in this process
+        Signature: Dict -> Void
+        """
+        self.__dict__.update(state)
+        self._geometry = _get_geometry(self.rows, self.columns)
+        self.coords = self._geometry.coords
+        self.coord_set = self._geometry.coord_set
+        self._coords_sorted_by_row = self._geometry.coords_sorted_by_row
+
+    def _index(self, coordinate: Coordinate) -> int:
+        """
+        Purpose: Get the bit number of a coordinate on the board
+        Signature: Coordinate -> Int
+        :return: The bit number, raises ValueError if the coordinate is not on the board
+        """
+        index = self._geometry.index_of.get(coordinate)
+        if index is None:
+            raise ValueError('column, row must be inside of the board coordinates')
+        return index
+
+    def _check_xy_position(self, coordinate: Coordinate, inside_board=True) -> None:
+        """
+        Purpose: Check to make sure properties of column,row position hold (inside board), see FishBoardModel
+        Signature: Coordinate Bool -> Void
+        """
+        if inside_board:
+            self._index(coordinate)
+
+    def _set_tile(self, coord: Coordinate, tile: FishTile) -> None:
+        """
+        Purpose: Put a tile at a coordinate on the board, used when creating a board and when restoring tiles
+        Signature: Coordinate FishTile -> Void
+        """
+        index = self._index(coord)
+        self.tiles[index] = tile
+        self.tile_mask |= 1 << index
+
+    def get_tile_at_coord(self, x: int, y: int) -> Optional[FishTile]:
+        """
+        Purpose: Retrieve a fish tile at a specific coordinate
+        Signature: Int Int -> FishTile
+        :return: (Tile/None) returns the Tile at that coordinate or None if no tile there
+        """
+        return self.tiles[self._index((x, y))]
+
+    def remove_tile(self, x: int, y: int) -> Optional[FishTile]:
+        """
+        Purpose: Remove a tile from the board at a certain x and y coordinate
+        Signature: Int Int -> Maybe[FishTile]
+        :return: Maybe[FishTile] returns the Tile that has been removed or None if no tile present there
+        """
+        index = self._index((x, y))
+        tile = self.tiles[index]
+        if tile:
+            self.tiles[index] = None
+            self.tile_mask &= ~(1 << index)
+        return tile
+
+    def get_tiles(self) -> List[Tuple[Coordinate, FishTile]]:
+        """
+        Purpose: Get the tiles on the board with their coordinates, leaving out the holes. Bit numbers go row by
+                 row, so the coordinate of a bit number is at that index of the coordinates sorted by row.
+        Signature: Void -> [(Coordinate, FishTile)]
+        """
+        coords = self._coords_sorted_by_row
+        return [(coords[index], tile) for index, tile in enumerate(self.tiles) if tile]
+
+    def get_fish_rows(self) -> List[List[int]]:
+        """
+        Purpose: Get the amount of fish on each tile row by row, with 0 for holes, see FishBoardModel. The bit
+                 numbers of the cells go row by row, so each row is a slice of the tiles.
+        Signature: Void -> [[Int]]
+        """
+        return [[tile.num_fish if tile else 0 for tile in self.tiles[y * self.columns:(y + 1) * self.columns]]
+                for y in range(self.rows)]
+
+    def find_neighbor_in_direction(self, x: int, y: int,
+                                   direction: HexDirection) -> Tuple[Optional[FishTile], Coordinate]:
+        """
+        Purpose: Get neighbor in certain direction from a hexagon grid
+        Signature: Int Int HexDirection -> Maybe[FishTile] Coordinate
+        :return: Maybe[FishTile] Coordinate = a tuple containing the tile of a neighbor plus their x and y coordinates
+        """
+        neighbor_coords = (x + direction[0]), (y + direction[1])
+        index = self._geometry.index_of.get(neighbor_coords)
+        neighbor = self.tiles[index] if index is not None else None
+        return neighbor, neighbor_coords
+
+    def get_coords_mask(self, coords: Iterable[Coordinate]) -> CellMask:
+        """
+        Purpose: Get the set of cells at some coordinates on the board as a mask
+        Signature: [Coordinate] -> CellMask
+        :param coords: Coordinates on the board, such as the positions of penguins
+        """
+        mask = 0
+        for coord in coords:
+            mask |= 1 << self._index(coord)
+        return mask
+
+    def find_straight_line_positions(self, x: int, y: int,
+                                     blocked_mask: CellMask = 0) -> Dict[HexDirection, List[Coordinate]]:
+        """
+        Purpose: Find all positions reachable via straight lines from a given position
+        Signature: Int Int CellMask -> Dict[HexDirection, List[Coordinate]]
+        :param x: (int) = The x value that we want straight line positions from
+        :param y: (int) = The y value that we want straight line positions from
+        :param blocked_mask: Cells that stop a straight line like holes do, such as cells with penguins on them
+        :return: array of positions that can be reached in a straight line in a dictionary that has keys
+                 that are the direction of the line
+        """
+        index = self._index((x, y))
+        rays = self._geometry.rays[index]
+        if not self.tile_mask >> index & 1:
+            return {name: [] for name, _, _, _ in rays}
+        open_mask = self.tile_mask & ~blocked_mask
+        overall_pos_dict = dict()
+        for name, ray_mask, line, increasing in rays:
+            blockers = ray_mask & ~open_mask
+            if not blockers:
+                overall_pos_dict[name] = list(line)
+                continue
+            if increasing:
+                reachable = ray_mask & ((blockers & -blockers) - 1)
+            else:
+                reachable = ray_mask & ~((1 << blockers.bit_length()) - 1)
+            overall_pos_dict[name] = line[:bin(reachable).count('1')]
+        return overall_pos_dict
+
+    def find_reachable_positions(self, x: int, y: int, blocked: Container[Coordinate]) -> List[Coordinate]:
+        """
+        Purpose: Find all positions reachable via straight lines from a given position in one list, where the lines
+                 stop at holes and at the blocked coordinates, see FishBoardModel. Only a few cells are blocked (the
+                 penguins), so walking the rays and looking up their tiles by bit number is faster than building a
+                 mask of the blocked cells for the bit operations of find_straight_line_positions.
+        Signature: Int Int Container[Coordinate] -> [Coordinate]
+        """
+        index = self._index((x, y))
+        tiles = self.tiles
+        positions: List[Coordinate] = []
+        if tiles[index] is None:
+            return positions
+        for ray in self._geometry.indexed_rays[index]:
+            for coord, ray_index in ray:
+                if tiles[ray_index] is None or coord in blocked:
+                    break
+                positions.append(coord)
+        return positions
+
+    def find_regions(self) -> List[Set[Coordinate]]:
+        """
+        Purpose: Split the tiles of the board into connected regions, see FishBoardModel. Each region is grown from one
+                 of its cells by adding the neighbors of all of its cells at once with bit operations until it stops
+                 growing, so growing a region takes as many steps as the region is wide instead of one per tile.
+        Signature: Void -> [Set[Coordinate]]
+        """
+        coords = self._coords_sorted_by_row
+        regions = []
+        unvisited = self.tile_mask
+        while unvisited:
+            region = unvisited & -unvisited
+            while True:
+                grown = region | self._find_neighbors_mask(region) & self.tile_mask
+                if grown == region:
+                    break
+                region = grown
+            unvisited &= ~region
+            regions.append({coords[index] for index in range(region.bit_length()) if region >> index & 1})
+        return regions
+
+    def connects(self, coords: Iterable[Coordinate], other_coords: Iterable[Coordinate]) -> bool:
+        """
+        Purpose: Check whether any tile at some coordinates is in the same region as any tile at some other
+                 coordinates, see FishBoardModel. Grows the regions of the coordinates with bit operations like
+                 find_regions, and stops as soon as they reach one of the other coordinates.
+        Signature: [Coordinate] [Coordinate] -> Boolean
+        """
+        targets = self.get_coords_mask(other_coords)
+        region = self.get_coords_mask(coords) & self.tile_mask
+        while not region & targets:
+            grown = region | self._find_neighbors_mask(region) & self.tile_mask
+            if grown == region:
+                return False
+            region = grown
+        return True
+
+    def _find_neighbors_mask(self, mask: CellMask) -> CellMask:
+        """
+        Purpose: Find the cells next to any cell of a set of cells, whether they have a tile or not. Going north or
+                 south moves two rows, and going diagonally moves one row, staying in the same column or moving one
+                 column over depending on whether the row is even or odd, as odd rows are shifted to the right.
+        Signature: CellMask -> CellMask
+        :param mask: The set of cells
+        :return: The cells neighboring any cell of the set in some HexDirection
+        """
+        geometry = self._geometry
+        columns = self.columns
+        even = mask & geometry.even_rows_mask
+        odd = mask & geometry.odd_rows_mask
+        even_not_first = even & ~geometry.first_column_mask
+        odd_not_last = odd & ~geometry.last_column_mask
+        neighbors = mask << 2 * columns | mask >> 2 * columns
+        # diagonal neighbors in the same column: southeast and northeast of even rows, southwest and northwest of odd
+        neighbors |= mask << columns | mask >> columns
+        # southwest and northwest of even rows are one column to the left
+        neighbors |= even_not_first << columns - 1 | even_not_first >> columns + 1
+        # southeast and northeast of odd rows are one column to the right
+        neighbors |= odd_not_last << columns + 1 | odd_not_last >> columns - 1
+        return neighbors & geometry.board_mask
@@ -0,0 +1,266 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
+
+from Fish.Common.representations.enumerations.directions_enum import HexDirection
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameState, FishGameStateFactory
+from Fish.Common.representations.types import Action, Coordinate
+
+"""
+A CellIndex is a non-negative Integer
+INTERPRETATION: The cell at coordinate (x, y) of a board with a certain amount of columns, numbered y * columns + x // 2
+like the bit numbers of a CellMask (see bitboard_fish_board.py), so the cells are numbered row by row.
+
+A CellTable is ([Coordinate], Dictionary[Coordinate, CellIndex], [[(CellIndex, ...)]])
+INTERPRETATION: Everything a CompactFishState needs to know about a board with a certain amount of rows and columns:
+the coordinate of every cell index, the cell index of every coordinate, and for every cell index the cells in a
+straight line from it in every HexDirection until the edge of the board, in the order of HexDirection and starting
+next to the cell.
+"""
+CellIndex = int
+CellTable = Tuple[List[Coordinate], Dict[Coordinate, CellIndex], List[List[Tuple[CellIndex, ...]]]]
+
+
+class CompactFishState(object):
+    """
+    A CompactFishState is {
+    rows: Integer,
+    columns: Integer,
+    fish: bytes,
+    colors: (PlayerColor, ...),
+    penguins: ((CellIndex, ...), ...),
+    scores: (Integer, ...),
+    turn: Integer,
+    phase: GamePhase
+    }
+    INTERP: A Fish game state for searches that keep many states at once or send them to other processes. fish holds the
+    amount of fish on every cell of the board by CellIndex, where 0 is a hole. colors are the players in the order they
+    play, and penguins and scores hold the cell indices of the penguins (in the order of
+    FishGameState.get_penguins_for_player) and the fish of the player at the same position. turn is the position of the
+    player whose turn it is in colors.
+
+    A FishGameState is made of a board with a FishTile object per tile, a PlayerInfo object per player and several
+    dictionaries, which take several kilobytes per state. A CompactFishState is one object without a __dict__ that
+    shares its colors and its cell table (see CellTable) with every other state of the same game, so it takes a few
+    hundred bytes and pickles to a third or less of the size of a FishGameState. It is never changed: apply_move returns
+    a new state, which copies the fish but shares the tuples of the players that did not move. States are equal and hash
+    the same when all of their fields are equal, so they can be used as keys of dictionaries.
+
+    from_state and to_state convert between FishGameState and CompactFishState. A state converted back has the same
+    board, players, turn, phase and Zobrist hash, and the moves found for a CompactFishState are found in the same
+    order as FishGameTree.find_actions_for_state.
+    """
+
+    __slots__ = ('rows', 'columns', 'fish', 'colors', 'penguins', 'scores', 'turn', 'phase')
+
+    def __init__(self, rows: int, columns: int, fish: bytes, colors: Tuple[PlayerColor, ...],
+                 penguins: Tuple[Tuple[CellIndex, ...], ...], scores: Tuple[int, ...], turn: int,
+                 phase: GamePhase = GamePhase.MOVE_PENGUINS):
+        """
+        Purpose: Initialize a compact state from its fields, which are not checked
+        Signature: Int Int Bytes (PlayerColor, ...) ((CellIndex, ...), ...) (Int, ...) Int GamePhase
+                   -> CompactFishState
+        """
+        self.rows = rows
+        self.columns = columns
+        self.fish = fish
+        self.colors = colors
+        self.penguins = penguins
+        self.scores = scores
+        self.turn = turn
+        self.phase = phase
+
+    @classmethod
+    def from_state(cls, state: FishGameState) -> 'CompactFishState':
+        """
+        Purpose: Convert a state (or a FishGameStateView) into a compact state
+        Signature: FishGameState -> CompactFishState
+        :param state: The state to convert, which is not copied or changed
+        """
+        fish_rows = state.get_fish_rows()
+        rows, columns = len(fish_rows), len(fish_rows[0])
+        _, index_of, _ = _get_cell_table(rows, columns)
+        colors = tuple(state.get_player_order())
+        return cls(rows, columns, bytes(fish for row in fish_rows for fish in row), colors,
+                   tuple(tuple(index_of[pos] for pos in state.get_penguins_for_player(color)) for color in colors),
+                   tuple(state.get_fish_for_player(color) for color in colors),
+                   colors.index(state.get_current_turn()), state.get_game_phase())
+
+    def to_state(self, board_class: Type[FishBoardModel] = FishBoardModel) -> FishGameState:
+        """
+        Purpose: Convert this state into a FishGameState
+        Signature: Class -> FishGameState
+        :param board_class: FishBoardModel or a subclass of it to create the board with
+        """
+        columns = self.columns
+        fish_rows = [list(self.fish[y * columns:(y + 1) * columns]) for y in range(self.rows)]
+        board = board_class.create_with_fish_rows(fish_rows)
+        coords, _, _ = _get_cell_table(self.rows, columns)
+        player_info = [(color, [coords[index] for index in penguins], score)
+                       for color, penguins, score in zip(self.colors, self.penguins, self.scores)]
+        state = FishGameStateFactory.create_move_penguins_state(board, player_info, self.colors[self.turn],
+                                                               check_penguin_amount=False)
+        state.set_game_phase(self.phase)
+        return state
+
+    def get_player_order(self) -> List[PlayerColor]:
+        """
+        Purpose: Get the colors of the players in the order they play
+        Signature: Void -> [PlayerColor]
+        """
+        return list(self.colors)
+
+    def get_current_turn(self) -> PlayerColor:
+        """
+        Purpose: Get the color of the player whose turn it is
+        Signature: Void -> PlayerColor
+        """
+        return self.colors[self.turn]
+
+    def get_game_phase(self) -> GamePhase:
+        """
+        Purpose: Get the phase of the game
+        Signature: Void -> GamePhase
+        """
+        return self.phase
+
+    def get_fish_for_player(self, color: PlayerColor) -> Optional[int]:
+        """
+        Purpose: Get the amount of fish of a player
+        Signature: PlayerColor -> Maybe[Int]
+        :return: The amount of fish of the player, or None if no player of that color is in the game
+        """
+        if color not in self.colors:
+            return None
+        return self.scores[self.colors.index(color)]
+
+    def get_penguins_for_player(self, color: PlayerColor) -> Optional[List[Coordinate]]:
+        """
+        Purpose: Get the positions of the penguins of a player
+        Signature: PlayerColor -> Maybe[[Coordinate]]
+        :return: The positions of the penguins of the player, or None if no player of that color is in the game
+        """
+        if color not in self.colors:
+            return None
+        coords, _, _ = _get_cell_table(self.rows, self.columns)
+        return [coords[index] for index in self.penguins[self.colors.index(color)]]
+
+    def get_fish_at_pos(self, pos: Coordinate) -> int:
+        """
+        Purpose: Get the amount of fish on the tile at a position
+        Signature: Coordinate -> Int
+        :return: The amount of fish on the tile, or 0 if the position is a hole or is not on the board
+        """
+        index = _get_cell_table(self.rows, self.columns)[1].get(pos)
+        return 0 if index is None else self.fish[index]
+
+    def find_actions(self) -> List[Action]:
+        """
+        Purpose: Find the moves of the player whose turn it is, in the same order as
+                 FishGameTree.find_actions_for_state
+        Signature: Void -> [Action]
+        :return: The moves of the player whose turn it is, which is empty if that player cannot move
+        """
+        coords = _get_cell_table(self.rows, self.columns)[0]
+        return [(coords[from_index], coords[to_index]) for from_index, to_index in self._find_index_moves(self.turn)]
+
+    def can_any_player_move(self) -> bool:
+        """
+        Purpose: Check if any player can move a penguin
+        Signature: Void -> Bool
+        """
+        return any(self._find_index_moves(player) for player in range(len(self.colors)))
+
+    def can_player_move(self, color: PlayerColor) -> bool:
+        """
+        Purpose: Check if a player can move any of their penguins
+        Signature: PlayerColor -> Bool
+        """
+        return bool(self._find_index_moves(self.colors.index(color)))
+
+    def apply_move(self, action: Optional[Action]) -> 'CompactFishState':
+        """
+        Purpose: Make a move for the player whose turn it is, collecting the fish of the tile the penguin leaves and
+                 giving the turn to the next player. Like FishGameState.apply_move, the move is not checked.
+        Signature: Maybe[Action] -> CompactFishState
+        :param action: Move to make, or None to skip the turn of a player who cannot move
+        :return: The state after the move, as this state is not changed
+        """
+        next_turn = (self.turn + 1) % len(self.colors)
+        if action is None:
+            return CompactFishState(self.rows, self.columns, self.fish, self.colors, self.penguins, self.scores,
+                                    next_turn, self.phase)
+        index_of = _get_cell_table(self.rows, self.columns)[1]
+        from_index, to_index = index_of[action[0]], index_of[action[1]]
+        turn = self.turn
+        fish = bytearray(self.fish)
+        fish[from_index] = 0
+        player_penguins = tuple(to_index if index == from_index else index for index in self.penguins[turn])
+        penguins = self.penguins[:turn] + (player_penguins,) + self.penguins[turn + 1:]
+        scores = self.scores[:turn] + (self.scores[turn] + self.fish[from_index],) + self.scores[turn + 1:]
+        return CompactFishState(self.rows, self.columns, bytes(fish), self.colors, penguins, scores, next_turn,
+                                self.phase)
+
+    def _find_index_moves(self, player: int) -> List[Tuple[CellIndex, CellIndex]]:
+        """
+        Purpose: Find the moves of the penguins of a player as pairs of cell indices. A line stops before a hole or
+                 a penguin of any player.
+        Signature: Int -> [(CellIndex, CellIndex)]
+        :param player: Position of the player in colors
+        """
+        rays = _get_cell_table(self.rows, self.columns)[2]
+        fish = self.fish
+        occupied = {index for penguins in self.penguins for index in penguins}
+        moves = []
+        for from_index in self.penguins[player]:
+            for ray in rays[from_index]:
+                for to_index in ray:
+                    if not fish[to_index] or to_index in occupied:
+                        break
+                    moves.append((from_index, to_index))
+        return moves
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CompactFishState) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __reduce__(self):
+        """
+        Purpose: Pickle a state as the arguments of its constructor, which is smaller than the names and values of
+                 its slots
+        """
+        return CompactFishState, self._key()
+
+    def _key(self) -> Tuple:
+        """
+        Purpose: Get the fields of this state in the order of the arguments of the constructor
+        Signature: Void -> (Int, Int, Bytes, (PlayerColor, ...), ((CellIndex, ...), ...), (Int, ...), Int, GamePhase)
+        """
+        return self.rows, self.columns, self.fish, self.colors, self.penguins, self.scores, self.turn, self.phase
+
+
+@lru_cache(maxsize=None)
+def _get_cell_table(rows: int, columns: int) -> CellTable:
+    """
+    Purpose: Get the shared cell table for boards with a certain amount of rows and columns
+    Signature: Int Int -> CellTable
+    """
+    coords = FishBoardModel.sort_coords_by_row(FishBoardModel.create_coords(rows, columns))
+    index_of = {coord: index for index, coord in enumerate(coords)}
+    rays = []
+    for x, y in coords:
+        cell_rays = []
+        for direction in HexDirection:
+            dx, dy = direction.value
+            ray = []
+            pos = (x + dx, y + dy)
+            while pos in index_of:
+                ray.append(index_of[pos])
+                pos = (pos[0] + dx, pos[1] + dy)
+            cell_rays.append(tuple(ray))
+        rays.append(cell_rays)
+    return coords, index_of, rays
@@ -1,10 +1,21 @@
+import copy
 import random
-from typing import Dict, List, Set, Tuple, Optional
+from functools import lru_cache
+from typing import Container, Dict, Iterable, List, Set, Tuple, Optional
 
 from Fish.Common.representations.fish_tile import FishTile
 from Fish.Common.representations.enumerations.directions_enum import HexDirection
 from Fish.Common.representations.types import Coordinate
 
+"""
+A RayTable is Dictionary[Coordinate, [(String, (Coordinate, ...))]]
+INTERPRETATION: For every coordinate of a board, the straight line in every HexDirection (in the order of the
+enumeration) from that coordinate until the edge of the board, without the coordinate itself, as the name of the
+direction and the coordinates of the line in order starting next to the coordinate. It only depends on the amount of
+rows and columns of the board, so it holds whatever tiles the board has.
+"""
+RayTable = Dict[Coordinate, List[Tuple[str, Tuple[Coordinate, ...]]]]
+
 
 class FishBoardModel(object):
     """
@@ -13,6 +24,7 @@ class FishBoardModel(object):
     columns: Integer
     board_map: Dictionary[Coordinate, FishTile]
     coords: [Coordinate]
+    coord_set: Set[Coordinate]
     }
     INTERP: This is a model of a board for the game Fish. rows and columns are positive integers representing the number
     of rows and columns in a FishBoard model.
@@ -28,7 +40,10 @@ class FishBoardModel(object):
     south west from the original tile, the y value will increase by 1. More explanation is included in Fish/Planning/double_height.pdf
 
     coords represent a list of all the possible coordinates on the board in our Double Height coordinate system, though not all
-    coordinates need to have a tile on them.
+    coordinates need to have a tile on them. coord_set contains the same coordinates, so that checking whether a coordinate
+    is on the board takes constant time. Neither ever changes after the board is created, and neither do the straight
+    lines from every coordinate (see RayTable), so finding the lines from a coordinate only has to check the tiles on
+    lines that were computed once for boards of the same size.
     board_map represents a mapping between our coordinate system and the actual tiles in the game. If no mapping exists at that
     coordinate, then there will be no corresponding FishTile there, which is referred to as a hole
     a valid mapping would consist of a coordinate contained in our coords variable on one end of the mapping and a tile object
@@ -49,7 +64,41 @@ class FishBoardModel(object):
         self.rows: int = rows
         self.columns: int = columns
         self.board_map: Dict[Coordinate, FishTile] = dict()
-        self.coords: List[Coordinate] = self.create_coords(rows, columns)
+        # coordinates never change after creation, so membership checks, the row order and the straight lines from
+        # every coordinate are computed once for every size of board and shared by the boards of that size
+        self.coords, self.coord_set, self._coords_sorted_by_row = _get_coordinates(rows, columns)
+        self._rays: RayTable = _get_rays(rows, columns)
+
+    def __deepcopy__(self, memo) -> 'FishBoardModel':
+        """
+        Purpose: Copy the board and its tiles, but share the coordinates (which never change) with the copy
+        Signature: Dict -> FishBoardModel
+        """
+        board_copy = type(self).__new__(type(self))
+        memo[id(self)] = board_copy
+        board_copy.__dict__.update(self.__dict__)
+        board_copy.board_map = copy.deepcopy(self.board_map, memo)
+        return board_copy
+
+    def __getstate__(self) -> Dict:
+        """
+        Purpose: Get the state of the board to pickle, leaving out the coordinates which are recomputed from the
+                 amount of rows and columns when unpickling, so that boards sent to other processes stay small
+        Signature: Void -> Dict
+        """
+        state = dict(self.__dict__)
+        for derived in ('coords', 'coord_set', '_coords_sorted_by_row', '_rays'):
+            state.pop(derived, None)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Purpose: Restore a pickled board, recomputing its coordinates
+        Signature: Dict -> Void
+        """
+        self.__dict__.update(state)
+        self.coords, self.coord_set, self._coords_sorted_by_row = _get_coordinates(self.rows, self.columns)
+        self._rays = _get_rays(self.rows, self.columns)
 
     @staticmethod
     def create_coords(rows: int, cols: int) -> List[Coordinate]:
@@ -84,11 +133,29 @@ class FishBoardModel(object):
         :param coords_to_fish: List of tuples that contain coordinates and how many fish they have. If amount of fish is
                                0 or coordinate not specified, there are no fish at that position
         """
-        board = FishBoardModel(rows, cols)
+        board = cls(rows, cols)
         for coord, fish in coords_to_fish:
             board._check_xy_position(coord)
             if fish != 0:
-                board.board_map[coord] = FishTile(fish)
+                board._set_tile(coord, FishTile(fish))
+        return board
+
+    @classmethod
+    def create_with_fish_rows(cls, fish_rows: List[List[int]]):
+        """
+        Purpose: Create a board from the amount of fish on each tile row by row, the Board format of the remote
+                 protocol. Rows can be shorter than the longest row, which have holes at the end. The coordinates are
+                 computed from the position in the rows, so they are not checked.
+        Signature: [[Int]] -> FishBoardModel
+        :param fish_rows: Rows of amounts of fish, where 0 is a hole
+        :return: A board with as many rows as given and as many columns as the longest row
+        """
+        board = cls(len(fish_rows), max(len(row) for row in fish_rows))
+        for y, row in enumerate(fish_rows):
+            offset = y % 2
+            for column, fish in enumerate(row):
+                if fish != 0:
+                    board._set_tile((2 * column + offset, y), FishTile(fish))
         return board
 
     @classmethod
@@ -103,24 +170,27 @@ class FishBoardModel(object):
         """
         if amount_fish <= 0:
             raise ValueError("Amount of fish must be > 0")
-        board = FishBoardModel(rows, cols)
+        board = cls(rows, cols)
         for coord in board.coords:
-            board.board_map[coord] = FishTile(num_fish=amount_fish)
+            board._set_tile(coord, FishTile(num_fish=amount_fish))
         return board
 
     @classmethod
     def create_with_holes(cls, rows: int, cols: int, coords_with_holes: Set[Coordinate], 
-                          one_fish_tiles: int):
+                          one_fish_tiles: int, rng: Optional[random.Random] = None):
         """
         Purpose: Create a board with holes in certain places and a certain amount of 1-fish tiles
-        Signature: Int Int Set((Int, Int)) Int -> FishBoard
+        Signature: Int Int Set((Int, Int)) Int Maybe[Random] -> FishBoard
         :param rows: (Int) Amount of rows on the board
         :param cols: (Int) Amount of cols on the board
         :param coords_with_holes: (Set (Int, Int)) Set of the specific coordinates we want holes in the board
         :param one_fish_tiles: (Int) How many one fish tiles we want to place
+        :param rng: (Random) Random number generator for the fish of the other tiles, so that the same seed gives the
+                    same board. The shared generator of the random module is used if it is not given.
         :return: (FishBoard) A board with holes in the specific places and a min number of 1 fish tiles
         """
-        board = FishBoardModel(rows, cols)
+        rng = rng or random
+        board = cls(rows, cols)
         board._check_holes(coords_with_holes)
         board._check_minimum_tiles(coords_with_holes, one_fish_tiles)
         amount_one_fish_tiles_placed = 0
@@ -129,10 +199,10 @@ class FishBoardModel(object):
             if amount_one_fish_tiles_placed < one_fish_tiles:
                 fish_on_tile = 1
             else:
-                fish_on_tile = random.randint(1, FishTile.MAX_AMOUNT_FISH)
+                fish_on_tile = rng.randint(1, FishTile.MAX_AMOUNT_FISH)
             # check set of places with holes in specific places
             if coord not in coords_with_holes:
-                board.board_map[coord] = FishTile(num_fish=fish_on_tile)
+                board._set_tile(coord, FishTile(num_fish=fish_on_tile))
                 amount_one_fish_tiles_placed += 1
         return board
 
@@ -143,10 +213,9 @@ class FishBoardModel(object):
         :param coords_with_holes: Set representing the coordinates with holes in them
         :return: raises ValueError if the holes would not be on the board
         """
-        coord_set = set(self.coords)
         for coord in coords_with_holes:
             column, row = coord
-            if coord not in coord_set:
+            if coord not in self.coord_set:
                 raise ValueError('Specified hole {},{} cannot be created with given board dimensions'.format(column, row))
 
     def _check_minimum_tiles(self, coords_with_holes: Set[Coordinate], one_fish_tiles: int) -> None:
@@ -174,7 +243,7 @@ class FishBoardModel(object):
                              sometimes we don't want to to have flexibility to check neighbors that are outside the
                              board
         """
-        if coordinate not in self.coords and inside_board:
+        if inside_board and coordinate not in self.coord_set:
             raise ValueError('column, row must be inside of the board coordinates')
 
     def find_neighbor_in_direction(self, x: int, y: int, direction: HexDirection) -> Tuple[Optional[FishTile], Coordinate]:
@@ -201,35 +270,42 @@ class FishBoardModel(object):
         :return: array of positions that can be reached in a straight line in a dictionary that has keys
                  that are the direction of the line
         """
+        # make sure it is in board for starting position
+        self._check_xy_position((x, y))
+        board_map = self.board_map
+        on_tile = (x, y) in board_map
         overall_pos_dict: Dict[HexDirection, List[Coordinate]] = dict()
-
-        for direction in HexDirection:
-            # find straight lines from all directions
-            dir_pos_list = self._find_direction_line_positions(x, y, direction.value)
-            # concat all lists of coords together
-            overall_pos_dict[direction.name] = dir_pos_list
+        for direction_name, ray in self._rays[(x, y)]:
+            pos_list = []
+            if on_tile:
+                for coord in ray:
+                    if coord not in board_map:
+                        break
+                    pos_list.append(coord)
+            overall_pos_dict[direction_name] = pos_list
         return overall_pos_dict
 
-    def _find_direction_line_positions(self, x: int, y: int, direction: HexDirection) -> List[Coordinate]:
+    def find_reachable_positions(self, x: int, y: int, blocked: Container[Coordinate]) -> List[Coordinate]:
         """
-        Purpose: Helper functions to find positions reachable in one direction for a give position
-        Signature: Int Int HexDirection -> [Coordinate]
-        :param x: (int) x coordinate that we are finding the straight line from
-        :param y: (int) y coordinate that we are finding the straight line from
-        :param direction: (HexDirection) = direction that we are find the straight line from
-        :return: [Coordinate] = list of coordinates that are reachable in a certain direction
+        Purpose: Find all positions reachable via straight lines from a given position in one list, where the lines
+                 stop at holes and at the blocked coordinates, such as the positions of penguins
+        Signature: Int Int Container[Coordinate] -> [Coordinate]
+        :param x: The x value that we want reachable positions from
+        :param y: The y value that we want reachable positions from
+        :param blocked: Coordinates that stop a straight line like holes do
+        :return: The reachable positions, line by line in the order of HexDirection
         """
-        # make sure it is in board for starting position
         self._check_xy_position((x, y))
-        current_tile = self.board_map.get((x, y), None)
-        pos_list = []
-        while current_tile:
-            # check to see if there is a neighbor one step in the new direction that we are going
-            current_tile, new_coords = self.find_neighbor_in_direction(x, y, direction)
-            if current_tile:
-                pos_list.append(new_coords)
-                x, y = new_coords
-        return pos_list
+        board_map = self.board_map
+        positions: List[Coordinate] = []
+        if (x, y) not in board_map:
+            return positions
+        for _, ray in self._rays[(x, y)]:
+            for coord in ray:
+                if coord not in board_map or coord in blocked:
+                    break
+                positions.append(coord)
+        return positions
 
     def remove_tile(self, x: int, y: int) -> Optional[FishTile]:
         """
@@ -245,6 +321,27 @@ class FishBoardModel(object):
             del self.board_map[(x, y)]
         return tile
 
+    def restore_tile(self, x: int, y: int, tile: FishTile) -> None:
+        """
+        Purpose: Put a tile that was removed from the board back at its x and y coordinate
+        Signature: Int Int FishTile -> Void
+        :param x: (Int) x coordinate to put the tile back at
+        :param y: (Int) y coordinate to put the tile back at
+        :param tile: The tile that was removed from that coordinate
+        """
+        if self.get_tile_at_coord(x, y):
+            raise ValueError('There is already a tile at {}'.format((x, y)))
+        self._set_tile((x, y), tile)
+
+    def _set_tile(self, coord: Coordinate, tile: FishTile) -> None:
+        """
+        Purpose: Put a tile at a coordinate on the board, used when creating a board and when restoring tiles
+        Signature: Coordinate FishTile -> Void
+        :param coord: Coordinate on the board to put the tile at
+        :param tile: Tile to put there
+        """
+        self.board_map[coord] = tile
+
     def get_tile_at_coord(self, x: int, y: int) -> Optional[FishTile]:
         """
         Purpose: Retrieve a fish tile at a specific coordinate
@@ -266,7 +363,8 @@ class FishBoardModel(object):
 
     def get_tile_coords(self) -> List[Coordinate]:
         """
-        Purpose: Return all of the coordinates for the given fish board
+        Purpose: Return all of the coordinates for the given fish board. The list is shared by all boards of the
+                 same size, so it must not be changed.
         Signature: Void -> [Coordinate]
         :return: List of all of the tile coordinates represented as a tuple for the board
         """
@@ -274,10 +372,121 @@ class FishBoardModel(object):
 
     def get_coords_sorted_by_row(self):
         """
-        Purpose: Returns the sorted coordinates of a board row by row
+        Purpose: Returns the sorted coordinates of a board row by row. They are sorted once for every size of board,
+                 so the list that is returned must not be changed.
         Signature: Void -> List[Coordinate]
         :returns: A sorted list of coordinates, going row by row
         """
+        return self._coords_sorted_by_row
+
+    def get_tiles(self) -> List[Tuple[Coordinate, FishTile]]:
+        """
+        Purpose: Get the tiles on the board with their coordinates, leaving out the holes
+        Signature: Void -> [(Coordinate, FishTile)]
+        """
+        return list(self.board_map.items())
+
+    def get_fish_rows(self) -> List[List[int]]:
+        """
+        Purpose: Get the amount of fish on each tile row by row, with 0 for holes, which is the Board format of the
+                 remote protocol (see create_with_fish_rows). Reads the tiles directly, so it does not copy the board.
+        Signature: Void -> [[Int]]
+        """
+        board_map = self.board_map
+        fish_rows = []
+        for y in range(self.rows):
+            tiles = [board_map.get((2 * column + y % 2, y)) for column in range(self.columns)]
+            fish_rows.append([tile.num_fish if tile else 0 for tile in tiles])
+        return fish_rows
+
+    def find_regions(self) -> List[Set[Coordinate]]:
+        """
+        Purpose: Split the tiles of the board into regions, which are the groups of tiles connected through neighbors
+                 in any HexDirection. Every straight line only goes through neighboring tiles, so a penguin can never
+                 leave the region it is in, and holes that split the board split it into regions for good.
+        Signature: Void -> [Set[Coordinate]]
+        :return: The coordinates of the tiles of each region, leaving out the holes
+        """
+        unvisited = {coord for coord, _ in self.get_tiles()}
+        regions = []
+        while unvisited:
+            start = unvisited.pop()
+            region = {start}
+            frontier = [start]
+            while frontier:
+                x, y = frontier.pop()
+                for direction in HexDirection:
+                    neighbor, neighbor_coords = self.find_neighbor_in_direction(x, y, direction.value)
+                    if neighbor and neighbor_coords in unvisited:
+                        unvisited.remove(neighbor_coords)
+                        region.add(neighbor_coords)
+                        frontier.append(neighbor_coords)
+            regions.append(region)
+        return regions
+
+    def connects(self, coords: Iterable[Coordinate], other_coords: Iterable[Coordinate]) -> bool:
+        """
+        Purpose: Check whether any tile at some coordinates is in the same region (see find_regions) as any tile at
+                 some other coordinates, such as the tiles under the penguins of two players. Stops as soon as it
+                 finds a connection instead of finding the whole regions.
+        Signature: [Coordinate] [Coordinate] -> Boolean
+        :param coords: Coordinates to start from, where holes are left out
+        :param other_coords: Coordinates to look for
+        :return: Whether a path over neighboring tiles leads from one of the coordinates to one of the others
+        """
+        targets = set(other_coords)
+        visited = {coord for coord in coords if self.get_tile_at_coord(*coord)}
+        frontier = list(visited)
+        while frontier:
+            x, y = frontier.pop()
+            if (x, y) in targets:
+                return True
+            for direction in HexDirection:
+                neighbor, neighbor_coords = self.find_neighbor_in_direction(x, y, direction.value)
+                if neighbor and neighbor_coords not in visited:
+                    visited.add(neighbor_coords)
+                    frontier.append(neighbor_coords)
+        return False
+
+    @staticmethod
+    def sort_coords_by_row(coords: List[Coordinate]) -> List[Coordinate]:
+        """
+        Purpose: Sort coordinates row by row
+        Signature: List[Coordinate] -> List[Coordinate]
+        :param coords: The coordinates to sort
+        :returns: A sorted list of the coordinates, going row by row
+        """
         # Tuple means sort by the y coordinate first, x coordinate second
-        return sorted(self.coords, key=lambda coord: (coord[1], coord[0]))
+        return sorted(coords, key=lambda coord: (coord[1], coord[0]))
+
+
+@lru_cache(maxsize=None)
+def _get_coordinates(rows: int, columns: int) -> Tuple[List[Coordinate], Set[Coordinate], List[Coordinate]]:
+    """
+    Purpose: Get the coordinates shared by boards with a certain amount of rows and columns, in the order of
+             create_coords, as a set and sorted by row
+    Signature: Int Int -> ([Coordinate], Set[Coordinate], [Coordinate])
+    """
+    coords = FishBoardModel.create_coords(rows, columns)
+    return coords, set(coords), FishBoardModel.sort_coords_by_row(coords)
+
 
+@lru_cache(maxsize=None)
+def _get_rays(rows: int, columns: int) -> RayTable:
+    """
+    Purpose: Get the straight lines shared by boards with a certain amount of rows and columns, see RayTable
+    Signature: Int Int -> RayTable
+    """
+    coord_set = _get_coordinates(rows, columns)[1]
+    rays: RayTable = dict()
+    for x, y in coord_set:
+        rays[(x, y)] = []
+        for direction in HexDirection:
+            dx, dy = direction.value
+            line = []
+            line_x, line_y = x + dx, y + dy
+            while (line_x, line_y) in coord_set:
+                line.append((line_x, line_y))
+                line_x, line_y = line_x + dx, line_y + dy
+            rays[(x, y)].append((direction.name, tuple(line)))
+    return rays
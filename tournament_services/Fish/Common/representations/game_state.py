@@ -1,14 +1,17 @@
 import copy
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional
 
 from Fish.Common.representations.game_state_error import PenguinPlacementError, PenguinMovementError
-from Fish.Common.representations.types import Coordinate
+from Fish.Common.representations.types import Coordinate, Action
 
+from Fish.Common.representations.enumerations.directions_enum import HexDirection
 from Fish.Common.representations.enumerations.game_phase import GamePhase
 from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
 
 from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.move_record import MoveRecord
 from Fish.Common.representations.player_info import PlayerInfo
+from Fish.Common.representations.zobrist import ZobristHash, tile_key, penguin_key, score_key, turn_key
 
 """
 A PlayerOrder is a list containing values from the PlayerColor enumeration
@@ -50,6 +53,19 @@ class FishGameState(object):
     Finally, The GameState contains a Turn, which is a PlayerColor object that represents the color of the player whose turn
     it currently is, tracked using the PlayerOrder variable.
 
+    The GameState also keeps an occupancy map from every coordinate with a penguin on it to the color of that penguin,
+    updated whenever penguins are placed, moved or removed, so that checking whether a penguin stops a move does not
+    need to go through the penguins of every player.
+
+    Finally, the GameState caches the valid moves of each penguin once they have been found. A move only changes the
+    moves of the penguins that could reach its destination tile, since a penguin now stands there. The tile it left
+    stopped straight lines before the move (it had a penguin on it) and still does after (it is a hole). So a move only
+    drops the cached moves that contain its destination, together with those of the penguin that moved. Placing a
+    penguin drops the cached moves that contain its position, and removing a player drops the whole cache.
+
+    The GameState also keeps the Zobrist hash (see zobrist.py) of its tiles, penguins, scores and turn up to date
+    whenever it changes, so that searches can recognize states they have already seen in constant time.
+
     """
 
     def __init__(self, board: FishBoardModel, player_colors: List[PlayerColor]):
@@ -64,10 +80,31 @@ class FishGameState(object):
         """
         self._game_board: FishBoardModel = board
         self._players: Dict[PlayerColor, PlayerInfo] = dict()
+        self._penguin_colors: Dict[Coordinate, PlayerColor] = dict()
+        self._move_cache: Dict[Coordinate, Tuple[Coordinate, ...]] = dict()
         self._game_phase: GamePhase = GamePhase.PLACE_PENGUINS
         self.initialize_players(player_colors)
         self._player_order = player_colors
         self._turn = self._player_order[0]
+        self._zobrist_hash: ZobristHash = self.compute_zobrist_hash()
+
+    def __getstate__(self) -> Dict:
+        """
+        Purpose: Get the state to pickle, leaving out the cached moves of the penguins, which are found again when
+                 they are needed, so that states sent to other processes stay small
+        Signature: Void -> Dict
+        """
+        state = dict(self.__dict__)
+        state.pop('_move_cache', None)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Purpose: Restore a pickled state with an empty move cache
+        Signature: Dict -> Void
+        """
+        self.__dict__.update(state)
+        self._move_cache = dict()
 
     def initialize_players(self, player_colors: List[PlayerColor]) -> None:
         """
@@ -98,6 +135,13 @@ class FishGameState(object):
         if color not in self._player_order:
             raise ValueError('Color must be in game')
         # Remove from player info, update turn to next player and remove from order
+        player = self._players[color]
+        for penguin_pos in player.get_penguin_posns():
+            self._zobrist_hash ^= penguin_key(penguin_pos, color)
+            del self._penguin_colors[penguin_pos]
+        # penguins that are taken off the board no longer stop any straight lines
+        self._move_cache.clear()
+        self._zobrist_hash ^= score_key(color, player.get_fish())
         del self._players[color]
         if self.get_current_turn() == color:
             self.increase_turn()
@@ -111,6 +155,36 @@ class FishGameState(object):
         """
         return copy.deepcopy(self._game_board)
 
+    def get_fish_rows(self) -> List[List[int]]:
+        """
+        Purpose: Get the amount of fish on each tile of the board row by row without copying the board, see
+                 FishBoardModel.get_fish_rows
+        Signature: Void -> [[Int]]
+        """
+        return self._game_board.get_fish_rows()
+
+    def find_regions(self) -> List[Set[Coordinate]]:
+        """
+        Purpose: Split the tiles of the board into connected regions without copying the board, see
+                 FishBoardModel.find_regions
+        Signature: Void -> [Set[Coordinate]]
+        """
+        return self._game_board.find_regions()
+
+    def are_penguins_separated(self) -> bool:
+        """
+        Purpose: Check whether the holes have split the board so that no region (see FishBoardModel.find_regions)
+                 holds penguins of more than one player, which means no player can get in the way of another anymore
+        Signature: Void -> Boolean
+        """
+        colors = self._player_order
+        for index, color in enumerate(colors[:-1]):
+            other_penguins = [penguin_pos for other_color in colors[index + 1:]
+                              for penguin_pos in self._players[other_color].get_penguin_posns()]
+            if self._game_board.connects(self._players[color].get_penguin_posns(), other_penguins):
+                return False
+        return True
+
     def get_player_order(self) -> List[PlayerColor]:
         """
         Purpose: Return a list of the players order for a game state
@@ -135,6 +209,7 @@ class FishGameState(object):
         if color not in self._player_order:
             raise ValueError('Cant set turn to a player not in the game')
         else:
+            self._zobrist_hash ^= turn_key(self._turn) ^ turn_key(color)
             self._turn = color
 
     def get_penguins_for_player(self, player_color) -> Optional[List[Coordinate]]:
@@ -188,7 +263,9 @@ class FishGameState(object):
         """
         if fish_amount < 0:
             raise ValueError('Fish amount must be positive')
-        self._players[color].add_fish(fish_amount)
+        player = self._players[color]
+        self._zobrist_hash ^= score_key(color, player.get_fish()) ^ score_key(color, player.get_fish() + fish_amount)
+        player.add_fish(fish_amount)
 
     def check_penguin_amount(self, amount_players: int,
                              placed_penguins: Dict[PlayerColor, List[Coordinate]], should_all_be_placed: bool) -> None:
@@ -249,7 +326,9 @@ class FishGameState(object):
             player_index += 1
         else:
             player_index = 0
-        self._turn = self._player_order[player_index]
+        next_turn = self._player_order[player_index]
+        self._zobrist_hash ^= turn_key(self._turn) ^ turn_key(next_turn)
+        self._turn = next_turn
 
     def place_penguin(self, color: PlayerColor, place_pos: Coordinate, increase_turn: bool = True) -> None:
         """
@@ -275,6 +354,9 @@ class FishGameState(object):
                                         '{}, there is already a penguin there'.format(place_pos))
         # place on board
         self._players[color].place_new_penguin(place_pos)
+        self._penguin_colors[place_pos] = color
+        self._invalidate_moves_through(place_pos)
+        self._zobrist_hash ^= penguin_key(place_pos, color)
         if increase_turn:
             self.increase_turn()
 
@@ -290,7 +372,7 @@ class FishGameState(object):
         self._enforce_turn(color)
         self._enforce_game_phase(GamePhase.MOVE_PENGUINS)
         # check if player has penguin at position
-        if not self._players[color].has_penguin_at_pos(penguin_pos):
+        if self._penguin_colors.get(penguin_pos) != color:
             raise PenguinMovementError('Cannot move penguin because no penguin for player {} at '
                              'initial position {}'.format(color, penguin_pos))
         # check if player can move to tile that they want to
@@ -298,10 +380,95 @@ class FishGameState(object):
             raise PenguinMovementError('That is not a valid move to move '
                                        'your penguin to position {}'.format(move_to_pos))
         self._players[color].move_penguin_at_pos(penguin_pos, move_to_pos)
-        self.add_fish_to_player(color, self._game_board.get_tile_at_coord(*penguin_pos).num_fish)
+        del self._penguin_colors[penguin_pos]
+        self._penguin_colors[move_to_pos] = color
+        self._move_cache.pop(penguin_pos, None)
+        self._invalidate_moves_through(move_to_pos)
+        self._zobrist_hash ^= penguin_key(penguin_pos, color) ^ penguin_key(move_to_pos, color)
+        num_fish = self._game_board.get_tile_at_coord(*penguin_pos).num_fish
+        self.add_fish_to_player(color, num_fish)
         self._game_board.remove_tile(*penguin_pos)
+        self._zobrist_hash ^= tile_key(penguin_pos, num_fish)
         self.increase_turn()
 
+    def apply_move(self, action: Optional[Action]) -> MoveRecord:
+        """
+        Purpose: Make a move for the player whose turn it is by changing this state in place instead of copying it,
+                 and record what changed so that undo_move can take the move back. Unlike move_penguin this does not
+                 check that the move is valid, so it is meant for searches that only make moves they found to be
+                 valid in this state.
+        Signature: Maybe[Action] -> MoveRecord
+        :param action: Move to make for the player whose turn it is, or None to skip the turn of a player who
+                       cannot move
+        :return: Record of the move which must be passed to undo_move before any other move made after it is undone
+        """
+        color = self._turn
+        previous_hash = self._zobrist_hash
+        previous_move_cache = self._move_cache
+        removed_tile = None
+        fish_gained = 0
+        if action is not None:
+            from_pos, to_pos = action
+            player = self._players[color]
+            player.move_penguin_at_pos(from_pos, to_pos)
+            del self._penguin_colors[from_pos]
+            self._penguin_colors[to_pos] = color
+            # the cache from before the move is kept for undo_move, as moves found after it may stop at to_pos
+            self._move_cache = dict(previous_move_cache)
+            self._move_cache.pop(from_pos, None)
+            self._invalidate_moves_through(to_pos)
+            removed_tile = self._game_board.remove_tile(*from_pos)
+            fish_gained = removed_tile.num_fish
+            self._zobrist_hash ^= (penguin_key(from_pos, color) ^ penguin_key(to_pos, color)
+                                   ^ tile_key(from_pos, fish_gained)
+                                   ^ score_key(color, player.get_fish())
+                                   ^ score_key(color, player.get_fish() + fish_gained))
+            player.add_fish(fish_gained)
+        self.increase_turn()
+        return MoveRecord(action, removed_tile, fish_gained, color, previous_hash, previous_move_cache)
+
+    def undo_move(self, record: MoveRecord) -> None:
+        """
+        Purpose: Take back a move made with apply_move, putting this state back the way it was before the move
+        Signature: MoveRecord -> Void
+        :param record: Record returned by apply_move for the last move made on this state that was not undone yet
+        """
+        if record.action is not None:
+            from_pos, to_pos = record.action
+            player = self._players[record.previous_turn]
+            player.move_penguin_at_pos(to_pos, from_pos)
+            del self._penguin_colors[to_pos]
+            self._penguin_colors[from_pos] = record.previous_turn
+            player.remove_fish(record.fish_gained)
+            self._game_board.restore_tile(*from_pos, record.removed_tile)
+        self._turn = record.previous_turn
+        self._zobrist_hash = record.previous_hash
+        self._move_cache = record.previous_move_cache
+
+    def get_zobrist_hash(self) -> ZobristHash:
+        """
+        Purpose: Get the Zobrist hash of this state, which is kept up to date as the state changes
+        Signature: Void -> ZobristHash
+        :return: Hash of the tiles, penguins, scores and turn of this state
+        """
+        return self._zobrist_hash
+
+    def compute_zobrist_hash(self) -> ZobristHash:
+        """
+        Purpose: Compute the Zobrist hash of this state from scratch, rather than from the hash kept up to date
+                 as the state changes
+        Signature: Void -> ZobristHash
+        :return: Hash of the tiles, penguins, scores and turn of this state
+        """
+        zobrist_hash = turn_key(self._turn)
+        for coord, tile in self._game_board.get_tiles():
+            zobrist_hash ^= tile_key(coord, tile.num_fish)
+        for color, player in self._players.items():
+            zobrist_hash ^= score_key(color, player.get_fish())
+            for penguin_pos in player.get_penguin_posns():
+                zobrist_hash ^= penguin_key(penguin_pos, color)
+        return zobrist_hash
+
     #TODO maybe add a game over method using this
     def can_any_player_move(self) -> bool:
         """
@@ -309,14 +476,53 @@ class FishGameState(object):
         Signature: Void -> Boolean
         :return: boolean representing which player can move an avatar
         """
-        can_move = False
-        for player in self._players.values():
-            for penguin_pos in player.get_penguin_posns():
-                moves = self.find_valid_moves_from_pos(penguin_pos)
-                if moves:
-                    can_move = True
-                    break
-        return can_move
+        return any(self._can_penguin_move(penguin_pos) for penguin_pos in self._penguin_colors)
+
+    def can_player_move(self, color: PlayerColor) -> bool:
+        """
+        Purpose: Check if a player can move any of their penguins, without finding all of their moves
+        Signature: PlayerColor -> Boolean
+        :param color: Color of the player
+        :return: Whether any penguin of the player has a valid move
+        """
+        player = self._players.get(color)
+        return bool(player) and any(self._can_penguin_move(penguin_pos) for penguin_pos in player.get_penguin_posns())
+
+    def _can_penguin_move(self, pos: Coordinate) -> bool:
+        """
+        Purpose: Check if the penguin at a position can move, which is the case if any of its neighbors is a tile
+                 without a penguin on it, as then it can at least move to that neighbor
+        Signature: Coordinate -> Boolean
+        :param pos: Position of the penguin
+        :return: Whether the penguin has any valid move
+        """
+        moves = self._move_cache.get(pos)
+        if moves is not None:
+            return bool(moves)
+        for direction in HexDirection:
+            neighbor, neighbor_pos = self._game_board.find_neighbor_in_direction(*pos, direction.value)
+            if neighbor and neighbor_pos not in self._penguin_colors:
+                return True
+        return False
+
+    def get_fish_at_pos(self, pos: Coordinate) -> int:
+        """
+        Purpose: Get the amount of fish on the tile at a position without copying the board
+        Signature: Coordinate -> Int
+        :param pos: Position on the board
+        :return: The amount of fish on the tile at the position, or 0 if there is a hole there
+        """
+        tile = self._game_board.get_tile_at_coord(*pos)
+        return tile.num_fish if tile else 0
+
+    def get_penguin_color_at_pos(self, pos: Coordinate) -> Optional[PlayerColor]:
+        """
+        Purpose: Get the color of the penguin at a position
+        Signature: Coordinate -> Maybe[PlayerColor]
+        :param pos: Position we are checking for a penguin
+        :return: The color of the player whose penguin is at the position, or None if there is no penguin there
+        """
+        return self._penguin_colors.get(pos)
 
     def _is_penguin_at_pos(self, pos: Coordinate) -> bool:
         """
@@ -325,11 +531,7 @@ class FishGameState(object):
         :param pos: Position we are are checking for a player penguin
         :return: Boolean representing whether any player has a penguin at a given position
         """
-        penguin_at_pos = False
-        for player in self._players.values():
-            if player.has_penguin_at_pos(pos):
-                penguin_at_pos = True
-        return penguin_at_pos
+        return pos in self._penguin_colors
 
     def find_valid_moves_from_pos(self, pos: Coordinate) -> List[Coordinate]:
         """
@@ -339,27 +541,24 @@ class FishGameState(object):
         :return: A list of possible valid moves from a coordinate, where valid moves mean straight lines get stopped
                  by penguins
         """
-        lines = self._game_board.find_straight_line_positions(*pos)
-        moves: List[Coordinate] = []
-        for direction, straight_line in lines.items():
-            straight_line = self._stop_straight_line_at_penguin(straight_line)
-            moves += straight_line
+        cached_moves = self._move_cache.get(pos)
+        if cached_moves is not None:
+            return list(cached_moves)
+        moves = self._game_board.find_reachable_positions(*pos, self._penguin_colors)
+        if pos in self._penguin_colors:
+            self._move_cache[pos] = tuple(moves)
         return moves
 
-    def _stop_straight_line_at_penguin(self, line: List[Coordinate]) -> List[Coordinate]:
+    def _invalidate_moves_through(self, pos: Coordinate) -> None:
         """
-        Purpose: Change a straight line to only return all straight lines from a penguin
-        Signature: List<Coordinate> -> List<Coordinate>
-        :param line: Straight line of points in a certain direction
-        :return: line edited if a penguin was in a list of straight line coordinates to not include anything past
-        that penguin
+        Purpose: Drop the cached moves of every penguin that could move to a position, after a penguin was put there
+        Signature: Coordinate -> Void
+        :param pos: Position that a penguin was just placed or moved to
         """
-        penguin_stop: int = len(line)
-        for i, coordinate in enumerate(line):
-            if self._is_penguin_at_pos(coordinate):
-                penguin_stop = i
-                break
-        return line[:penguin_stop]
+        stale_positions = [penguin_pos for penguin_pos, moves in self._move_cache.items() if pos in moves]
+        for penguin_pos in stale_positions:
+            del self._move_cache[penguin_pos]
+        self._move_cache.pop(pos, None)
 
 
 class FishGameStateFactory(object):
@@ -0,0 +1,199 @@
+import copy
+import copyreg
+from typing import Dict, List, Optional, Set
+
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.game_state_error import GameStateError
+from Fish.Common.representations.types import Coordinate
+from Fish.Common.representations.zobrist import ZobristHash
+
+
+class ReadOnlyStateError(GameStateError):
+    """
+    This is an error class representing an attempt to change a game state through a read-only view of it
+    """
+    pass
+
+
+class FishGameStateView(object):
+    """
+    A FishGameStateView is {
+    state: FishGameState
+    }
+    INTERP: A read-only view of a game state, which the referee can give to a trusted player instead of a copy of the
+    state. It has the same methods to read the state as a FishGameState, which read the state it views without copying
+    it, and every method that would change the state raises a ReadOnlyStateError. Lists that are returned are copies.
+
+    Copying a view (with copy.deepcopy, as FishGameTree does for every child) or pickling it gives a copy of the state
+    itself, which can be changed as usual. So a player only pays for a copy of the state when it needs one.
+
+    A view shows the state as it is: once the referee goes on with the game the view shows the new state, so a player
+    must copy the state to keep it past the call the view was given to.
+    """
+
+    def __init__(self, state: FishGameState):
+        """
+        Purpose: Create a read-only view of a game state
+        Signature: FishGameState -> FishGameStateView
+        :param state: The state to view, which is not copied
+        """
+        self._state = state
+
+    def __deepcopy__(self, memo: Dict) -> FishGameState:
+        """
+        Purpose: Copy the state that is viewed, which gives a state that can be changed
+        Signature: Dict -> FishGameState
+        """
+        return copy.deepcopy(self._state, memo)
+
+    def __reduce_ex__(self, protocol):
+        """
+        Purpose: Pickle the state that is viewed, so that a view sent to another process arrives as a state
+        Signature: Int -> Tuple
+        """
+        reduced = self._state.__reduce_ex__(protocol)
+        if reduced[0] is copyreg.__newobj__:
+            # pickle only creates an object with __newobj__ for the class of the object it is pickling
+            return (reduced[1][0].__new__,) + reduced[1:]
+        return reduced
+
+    def get_board(self) -> FishBoardModel:
+        """
+        Purpose: Get a copy of the board of the viewed state, which can be changed without changing the state
+        Signature: Void -> FishBoardModel
+        """
+        return self._state.get_board()
+
+    def get_fish_rows(self) -> List[List[int]]:
+        """
+        Purpose: Get a new list of the amount of fish on each tile of the board row by row
+        Signature: Void -> [[Int]]
+        """
+        return self._state.get_fish_rows()
+
+    def find_regions(self) -> List[Set[Coordinate]]:
+        """
+        Purpose: Split the tiles of the board into connected regions, see FishBoardModel.find_regions
+        Signature: Void -> [Set[Coordinate]]
+        """
+        return self._state.find_regions()
+
+    def are_penguins_separated(self) -> bool:
+        """
+        Purpose: Check whether no region of the board holds penguins of more than one player
+        Signature: Void -> Boolean
+        """
+        return self._state.are_penguins_separated()
+
+    def get_player_order(self) -> List[PlayerColor]:
+        """
+        Purpose: Get a copy of the order of the players, as the state returns the list it keeps
+        Signature: Void -> [PlayerColor]
+        """
+        return list(self._state.get_player_order())
+
+    def get_current_turn(self) -> PlayerColor:
+        """
+        Purpose: Get the color of the player whose turn it is
+        Signature: Void -> PlayerColor
+        """
+        return self._state.get_current_turn()
+
+    def get_penguins_for_player(self, player_color: PlayerColor) -> Optional[List[Coordinate]]:
+        """
+        Purpose: Get a copy of the positions of the penguins of a player, or None if there is no player of that color
+        Signature: PlayerColor -> Maybe[[Coordinate]]
+        """
+        return self._state.get_penguins_for_player(player_color)
+
+    def get_fish_for_player(self, player_color: PlayerColor) -> Optional[int]:
+        """
+        Purpose: Get the amount of fish of a player, or None if there is no player of that color
+        Signature: PlayerColor -> Maybe[Int]
+        """
+        return self._state.get_fish_for_player(player_color)
+
+    def get_game_phase(self) -> GamePhase:
+        """
+        Purpose: Get the phase of the game
+        Signature: Void -> GamePhase
+        """
+        return self._state.get_game_phase()
+
+    def get_zobrist_hash(self) -> ZobristHash:
+        """
+        Purpose: Get the Zobrist hash the state keeps up to date
+        Signature: Void -> ZobristHash
+        """
+        return self._state.get_zobrist_hash()
+
+    def compute_zobrist_hash(self) -> ZobristHash:
+        """
+        Purpose: Compute the Zobrist hash of the state from scratch
+        Signature: Void -> ZobristHash
+        """
+        return self._state.compute_zobrist_hash()
+
+    def can_any_player_move(self) -> bool:
+        """
+        Purpose: Check if any player can move a penguin
+        Signature: Void -> Boolean
+        """
+        return self._state.can_any_player_move()
+
+    def can_player_move(self, color: PlayerColor) -> bool:
+        """
+        Purpose: Check if a player can move any of their penguins
+        Signature: PlayerColor -> Boolean
+        """
+        return self._state.can_player_move(color)
+
+    def get_fish_at_pos(self, pos: Coordinate) -> int:
+        """
+        Purpose: Get the amount of fish on the tile at a position
+        Signature: Coordinate -> Int
+        """
+        return self._state.get_fish_at_pos(pos)
+
+    def get_penguin_color_at_pos(self, pos: Coordinate) -> Optional[PlayerColor]:
+        """
+        Purpose: Get the color of the penguin at a position, or None if there is no penguin there
+        Signature: Coordinate -> Maybe[PlayerColor]
+        """
+        return self._state.get_penguin_color_at_pos(pos)
+
+    def find_valid_moves_from_pos(self, pos: Coordinate) -> List[Coordinate]:
+        """
+        Purpose: Get a new list of the positions a penguin at a position can move to
+        Signature: Coordinate -> [Coordinate]
+        """
+        return self._state.find_valid_moves_from_pos(pos)
+
+    def check_penguin_amount(self, amount_players: int, placed_penguins: Dict[PlayerColor, List[Coordinate]],
+                             should_all_be_placed: bool) -> None:
+        """
+        Purpose: Check lists of penguins that are going to be created, see FishGameState.check_penguin_amount
+        Signature: Int Dict[PlayerColor, [Coordinate]] Boolean -> Void
+        """
+        self._state.check_penguin_amount(amount_players, placed_penguins, should_all_be_placed)
+
+    def _read_only(self, *args, **kwargs):
+        """
+        Purpose: Refuse to change the viewed state
+        Signature: Any... -> Void
+        """
+        raise ReadOnlyStateError('Cannot change a game state through a read-only view, copy it first')
+
+    initialize_players = _read_only
+    remove_color_from_game = _read_only
+    set_turn = _read_only
+    set_game_phase = _read_only
+    add_fish_to_player = _read_only
+    increase_turn = _read_only
+    place_penguin = _read_only
+    move_penguin = _read_only
+    apply_move = _read_only
+    undo_move = _read_only
@@ -0,0 +1,31 @@
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_tile import FishTile
+from Fish.Common.representations.types import Action, Coordinate
+from Fish.Common.representations.zobrist import ZobristHash
+
+
+class MoveRecord(NamedTuple):
+    """
+    A MoveRecord is {
+    Action: Maybe[Action],
+    RemovedTile: Maybe[FishTile],
+    FishGained: Int,
+    PreviousTurn: PlayerColor,
+    PreviousHash: ZobristHash,
+    PreviousMoveCache: Dictionary[Coordinate, (Coordinate, ...)]
+    }
+    INTERPRETATION: Everything FishGameState.apply_move changed about a state, so that FishGameState.undo_move can put
+    the state back exactly the way it was. Action is the move that was made, or None if the player whose turn it was
+    could not move and their turn was skipped. RemovedTile is the tile the penguin moved off of (None for a skipped
+    turn), FishGained is the amount of fish on that tile, PreviousTurn is the player whose turn it was, who made the
+    move, PreviousHash is the Zobrist hash of the state before the move and PreviousMoveCache is the cache of valid
+    penguin moves the state had before the move.
+    """
+    action: Optional[Action]
+    removed_tile: Optional[FishTile]
+    fish_gained: int
+    previous_turn: PlayerColor
+    previous_hash: ZobristHash
+    previous_move_cache: Dict[Coordinate, Tuple[Coordinate, ...]]
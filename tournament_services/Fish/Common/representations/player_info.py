@@ -1,4 +1,3 @@
-import copy
 from typing import List
 
 from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
@@ -57,13 +56,22 @@ class PlayerInfo(object):
         """
         self._num_fish += fish_amnt
 
+    def remove_fish(self, fish_amnt: int) -> None:
+        """
+        Purpose: Take back fish that were added to the fish total, for when a move is undone
+        Signature: Int -> None
+        :param fish_amnt: Amount of fish that are being taken away from the fish total
+        """
+        self._num_fish -= fish_amnt
+
     def get_penguin_posns(self) -> List[Coordinate]:
         """
         Purpose: Return the list of penguin positions for a player
         Signature: Void -> List<Coordinate>
-        :return: List of positions for a given player
+        :return: List of positions for a given player, which is a copy so that changing it does not move penguins.
+                 Coordinates are immutable tuples, so copying the list itself is enough.
         """
-        return copy.deepcopy(self._penguin_posns)
+        return list(self._penguin_posns)
 
     def place_new_penguin(self, pos: Coordinate) -> None:
         """
@@ -0,0 +1,76 @@
+from typing import Dict, List, Type
+
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameState, FishGameStateFactory
+
+"""
+A BoardJSON is [[Natural, ...], ...]
+INTERP: The Board of the remote protocol, the amount of fish on every tile row by row where 0 is a hole. Row i holds
+the tiles at the double-height coordinates (2 * j + i % 2, i) for every column j.
+
+A PlayerJSON is {"color": String, "score": Natural, "places": [[Natural, Natural], ...]}
+INTERP: A player of the remote protocol, with the positions of its penguins as [row, column] Posns.
+
+A StateJSON is {"players": [PlayerJSON, ...], "board": BoardJSON}
+INTERP: The State of the remote protocol, where the players are in the order they play starting with the player whose
+turn it is.
+
+The serializers read the board and players of a state without copying them, and the parsers build the board row by row
+without checking every coordinate, as the coordinates follow from the position in the rows. Both produce the same
+JSON and states as the conversions of TestHarnessTransformationHelper, which use them.
+"""
+BoardJSON = List[List[int]]
+PlayerJSON = Dict
+StateJSON = Dict
+
+
+def serialize_board(board: FishBoardModel) -> BoardJSON:
+    """
+    Purpose: Serialize a board to the Board format of the remote protocol
+    Signature: FishBoardModel -> BoardJSON
+    :param board: The board to serialize, which is not copied or changed
+    """
+    return board.get_fish_rows()
+
+
+def serialize_state(state: FishGameState) -> StateJSON:
+    """
+    Purpose: Serialize a state to the State format of the remote protocol
+    Signature: FishGameState -> StateJSON
+    :param state: The state to serialize, which is not copied or changed
+    """
+    order = state.get_player_order()
+    turn_index = order.index(state.get_current_turn())
+    players = [{
+        "color": color.value,
+        "score": state.get_fish_for_player(color),
+        "places": [[y, x // 2] for x, y in state.get_penguins_for_player(color)]
+    } for color in order[turn_index:] + order[:turn_index]]
+    return {"players": players, "board": state.get_fish_rows()}
+
+
+def parse_board(board_json: BoardJSON, board_class: Type[FishBoardModel] = FishBoardModel) -> FishBoardModel:
+    """
+    Purpose: Parse a board in the Board format of the remote protocol
+    Signature: BoardJSON Class -> FishBoardModel
+    :param board_json: The rows of the board
+    :param board_class: FishBoardModel or a subclass of it to create the board with
+    """
+    return board_class.create_with_fish_rows(board_json)
+
+
+def parse_state(state_json: StateJSON, board_class: Type[FishBoardModel] = FishBoardModel) -> FishGameState:
+    """
+    Purpose: Parse a state in the State format of the remote protocol into a state in the penguin moving phase, with
+             the turn of the first player. The amount of penguins of the players is not checked.
+    Signature: StateJSON Class -> FishGameState
+    :param state_json: The players and board of the state
+    :param board_class: FishBoardModel or a subclass of it to create the board with
+    """
+    board = parse_board(state_json['board'], board_class)
+    player_info = [(PlayerColor(player['color']),
+                    [(2 * column + row % 2, row) for row, column in player['places']],
+                    player['score'])
+                   for player in state_json['players']]
+    return FishGameStateFactory.create_move_penguins_state(board, player_info, check_penguin_amount=False)
@@ -0,0 +1,73 @@
+import hashlib
+from functools import lru_cache
+
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.types import Coordinate
+
+"""
+A ZobristHash is a 64 bit Integer
+INTERPRETATION: Identifies a Fish game state by XOR-ing together one random 64 bit key for each feature of the state:
+every tile left on the board (with its amount of fish), every penguin (with its color), the score of every player and
+whose turn it is. Two states with the same features have the same hash no matter which moves led to them, and a state
+that changes one feature can update its hash by XOR-ing out the key of the old feature and XOR-ing in the key of
+the new one.
+
+The keys are derived from a hash of the feature instead of a random number generator, so that the same feature has
+the same key in every process. This allows hashes to be compared between processes, for example between a server and
+a client.
+"""
+ZobristHash = int
+
+
+@lru_cache(maxsize=None)
+def _feature_key(*feature) -> ZobristHash:
+    """
+    Purpose: Create the random 64 bit key for a feature of a state
+    Signature: Any... -> ZobristHash
+    :param feature: Values describing the feature, which must have a stable repr
+    :return: A 64 bit key that is the same for the same feature in any process
+    """
+    digest = hashlib.blake2b(repr(feature).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def tile_key(coord: Coordinate, num_fish: int) -> ZobristHash:
+    """
+    Purpose: Get the key for a tile with an amount of fish being at a coordinate on the board
+    Signature: Coordinate Int -> ZobristHash
+    """
+    return _feature_key('tile', coord[0], coord[1], num_fish)
+
+
+def penguin_key(coord: Coordinate, color: PlayerColor) -> ZobristHash:
+    """
+    Purpose: Get the key for a penguin of a color being at a coordinate on the board
+    Signature: Coordinate PlayerColor -> ZobristHash
+    """
+    return _feature_key('penguin', coord[0], coord[1], color.value)
+
+
+def score_key(color: PlayerColor, num_fish: int) -> ZobristHash:
+    """
+    Purpose: Get the key for a player of a color having collected an amount of fish
+    Signature: PlayerColor Int -> ZobristHash
+    """
+    return _feature_key('score', color.value, num_fish)
+
+
+def turn_key(color: PlayerColor) -> ZobristHash:
+    """
+    Purpose: Get the key for it being the turn of the player of a color
+    Signature: PlayerColor -> ZobristHash
+    """
+    return _feature_key('turn', color.value)
+
+
+def maximizing_player_key(color: PlayerColor) -> ZobristHash:
+    """
+    Purpose: Get the key for a search that maximizes the fish of the player of a color. This is not part of the hash of
+             a state, but searches on behalf of different players can combine it with the hash of a state so that
+             their results are kept apart.
+    Signature: PlayerColor -> ZobristHash
+    """
+    return _feature_key('maximizing', color.value)
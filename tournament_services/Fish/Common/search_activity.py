@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class SearchActivity(Enum):
+    """
+    This is an enumeration of what a search of the game tree spends its time on, which SearchStats keeps the time of.
+    MOVE_GENERATION is finding the actions of a node, COPY is copying states to create the children of a FishGameTree,
+    APPLY is making (and for the alpha-beta search taking back) the move to a child, and EVALUATION is scoring the
+    leaves of the search and asking the endgame solver for the scores of a node.
+    """
+    MOVE_GENERATION = 'move generation'
+    COPY = 'copy'
+    APPLY = 'apply'
+    EVALUATION = 'evaluation'
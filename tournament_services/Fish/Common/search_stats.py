@@ -0,0 +1,115 @@
+import time
+from typing import Any, Callable, Dict
+
+from Fish.Common.search_activity import SearchActivity
+
+
+class SearchStats(object):
+    """
+    A SearchStats is {
+    nodes: Integer,
+    expanded: Integer,
+    leaves: Integer,
+    cutoffs: Integer,
+    table_cutoffs: Integer,
+    solved: Integer,
+    max_ply: Integer,
+    completed_depth: Integer,
+    branching: Dictionary[Integer, Integer],
+    seconds: Dictionary[SearchActivity, Number],
+    total_seconds: Number
+    }
+    INTERP: What a search of the game tree did while finding one move, so that a slow move can be explained. nodes is
+    the amount of nodes visited below the root, of which expanded had their children searched and leaves were scored
+    at the depth limit or the end of the game. cutoffs is the amount of nodes whose remaining children were pruned by
+    alpha-beta, table_cutoffs the nodes whose result was taken from the transposition table and solved the nodes
+    scored by the endgame solver. max_ply is how many moves below the root the deepest node visited is, and
+    completed_depth is how many plies below the root the search that found the move looked. branching maps an amount
+    of children to the amount of expanded nodes with that many children, where a skipped turn is one child.
+
+    seconds holds the time spent on each SearchActivity and total_seconds the time of the whole search, the rest of
+    which is spent in the search itself (ordering moves, the transposition table and the recursion). Timing every
+    activity slows the search down a little, so the times are best compared to each other rather than to searches
+    without stats. Strategies only collect stats when they are asked to, and otherwise do not time anything.
+    """
+
+    def __init__(self):
+        """
+        Purpose: Initialize empty stats for a new search
+        Signature: Void -> SearchStats
+        """
+        self.nodes = 0
+        self.expanded = 0
+        self.leaves = 0
+        self.cutoffs = 0
+        self.table_cutoffs = 0
+        self.solved = 0
+        self.max_ply = 0
+        self.completed_depth = 0
+        self.branching: Dict[int, int] = dict()
+        self.seconds: Dict[SearchActivity, float] = {activity: 0.0 for activity in SearchActivity}
+        self.total_seconds = 0.0
+
+    def record_node(self, ply: int) -> None:
+        """
+        Purpose: Count a node visited by the search
+        Signature: Int -> Void
+        :param ply: How many moves the node is below the root
+        """
+        self.nodes += 1
+        if ply > self.max_ply:
+            self.max_ply = ply
+
+    def record_expansion(self, children: int) -> None:
+        """
+        Purpose: Count a node whose children are searched
+        Signature: Int -> Void
+        :param children: Amount of children of the node
+        """
+        self.expanded += 1
+        self.branching[children] = self.branching.get(children, 0) + 1
+
+    def time(self, activity: SearchActivity, func: Callable, *args) -> Any:
+        """
+        Purpose: Call a function and add the time it took to the time spent on an activity
+        Signature: SearchActivity (X ... -> Y) X ... -> Y
+        :param activity: What the function does for the search
+        :param func: Function to call
+        :param args: Arguments to call the function with
+        :return: The result of the function
+        """
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.seconds[activity] += time.perf_counter() - start
+
+    def get_average_branching_factor(self) -> float:
+        """
+        Purpose: Get the average amount of children of the expanded nodes
+        Signature: Void -> Number
+        :return: The average branching factor, or 0 if no node was expanded
+        """
+        if not self.expanded:
+            return 0.0
+        return sum(children * amount for children, amount in self.branching.items()) / self.expanded
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Purpose: Convert the stats into a dictionary of plain values that can be logged or serialized to JSON
+        Signature: Void -> Dictionary[String, Any]
+        """
+        return {
+            'nodes': self.nodes,
+            'expanded': self.expanded,
+            'leaves': self.leaves,
+            'cutoffs': self.cutoffs,
+            'table_cutoffs': self.table_cutoffs,
+            'solved': self.solved,
+            'max_ply': self.max_ply,
+            'completed_depth': self.completed_depth,
+            'average_branching_factor': self.get_average_branching_factor(),
+            'branching': {str(children): amount for children, amount in sorted(self.branching.items())},
+            'seconds': {activity.value: seconds for activity, seconds in self.seconds.items()},
+            'total_seconds': self.total_seconds,
+        }
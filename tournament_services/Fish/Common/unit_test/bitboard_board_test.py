@@ -0,0 +1,188 @@
+import copy
+import pickle
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+import unittest
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.bitboard_fish_board import BitboardFishBoardModel
+from Fish.Common.representations.enumerations.directions_enum import HexDirection
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.fish_tile import FishTile
+from Fish.Common.representations.game_state import FishGameStateFactory
+
+
+class BitboardFishBoardModelTest(unittest.TestCase):
+
+    @staticmethod
+    def create_random_boards(rng, rows, cols):
+        """
+        Purpose: Create a dictionary board and a bitboard with the same random tiles and holes
+        Signature: Random Int Int -> (FishBoardModel, BitboardFishBoardModel)
+        """
+        coords_to_fish = [(coord, rng.choice([0, 1, 2, 3, 4, 5])) for coord in FishBoardModel.create_coords(rows, cols)]
+        return (FishBoardModel.create_with_coords_to_fish(rows, cols, coords_to_fish),
+                BitboardFishBoardModel.create_with_coords_to_fish(rows, cols, coords_to_fish))
+
+    def test_invalid_row_col(self):
+        """
+        Purpose: Test that a bitboard needs a positive amount of rows and columns
+        Signature: Void -> Void
+        """
+        with self.assertRaises(ValueError):
+            BitboardFishBoardModel(0, 1)
+        with self.assertRaises(TypeError):
+            BitboardFishBoardModel("string", 1)
+
+    def test_same_as_dict_board(self):
+        """
+        Purpose: Test that a bitboard has the same tiles and straight lines as a dictionary board, including boards
+        of 16x16 and larger
+        Signature: Void -> Void
+        """
+        rng = random.Random(5)
+        for rows, cols in [(1, 1), (3, 2), (4, 5), (16, 16), (20, 9)]:
+            board, bitboard = BitboardFishBoardModelTest.create_random_boards(rng, rows, cols)
+            self.assertEqual(board.get_tile_coords(), bitboard.get_tile_coords())
+            for coord in board.get_tile_coords():
+                tile = board.get_tile_at_coord(*coord)
+                bit_tile = bitboard.get_tile_at_coord(*coord)
+                self.assertEqual(tile.num_fish if tile else None, bit_tile.num_fish if bit_tile else None)
+                self.assertEqual(board.find_straight_line_positions(*coord),
+                                 bitboard.find_straight_line_positions(*coord))
+                blocked = set(rng.sample(board.get_tile_coords(), len(board.get_tile_coords()) // 4))
+                self.assertEqual(board.find_reachable_positions(*coord, blocked),
+                                 bitboard.find_reachable_positions(*coord, blocked))
+                for direction in HexDirection:
+                    neighbor, neighbor_coord = board.find_neighbor_in_direction(*coord, direction.value)
+                    bit_neighbor, bit_neighbor_coord = bitboard.find_neighbor_in_direction(*coord, direction.value)
+                    self.assertEqual(neighbor_coord, bit_neighbor_coord)
+                    self.assertEqual(neighbor is None, bit_neighbor is None)
+
+    def test_remove_and_restore_tile(self):
+        """
+        Purpose: Test that removing a tile stops the straight lines going through it and restoring it undoes that
+        Signature: Void -> Void
+        """
+        bitboard = BitboardFishBoardModel.create_with_same_fish_amount(6, 3, 2)
+        self.assertEqual([(0, 2), (0, 4)], bitboard.find_straight_line_positions(0, 0)['SOUTH'])
+        tile = bitboard.remove_tile(0, 2)
+        self.assertEqual(2, tile.num_fish)
+        self.assertIsNone(bitboard.get_tile_at_coord(0, 2))
+        self.assertIsNone(bitboard.remove_tile(0, 2))
+        self.assertEqual([], bitboard.find_straight_line_positions(0, 0)['SOUTH'])
+        self.assertEqual([], bitboard.find_straight_line_positions(0, 2)['SOUTH'])
+        bitboard.restore_tile(0, 2, tile)
+        self.assertEqual([(0, 2), (0, 4)], bitboard.find_straight_line_positions(0, 0)['SOUTH'])
+        with self.assertRaises(ValueError):
+            bitboard.remove_tile(10, 0)
+        with self.assertRaises(ValueError):
+            bitboard.get_tile_at_coord(1, 0)
+
+    def test_blocked_mask(self):
+        """
+        Purpose: Test that cells in a blocked mask stop straight lines like holes do
+        Signature: Void -> Void
+        """
+        bitboard = BitboardFishBoardModel.create_with_same_fish_amount(6, 3, 2)
+        blocked_mask = bitboard.get_coords_mask([(0, 4), (2, 0)])
+        lines = bitboard.find_straight_line_positions(0, 0, blocked_mask)
+        self.assertEqual([(0, 2)], lines['SOUTH'])
+        self.assertEqual([(1, 1), (2, 2), (3, 3), (4, 4), (5, 5)], lines['SOUTHEAST'])
+        lines = bitboard.find_straight_line_positions(4, 4, blocked_mask)
+        self.assertEqual([(3, 3), (2, 2), (1, 1), (0, 0)], lines['NORTHWEST'])
+        self.assertEqual([(4, 2), (4, 0)], lines['NORTH'])
+
+    def test_deepcopy(self):
+        """
+        Purpose: Test that a copy of a bitboard has its own tiles
+        Signature: Void -> Void
+        """
+        bitboard = BitboardFishBoardModel.create_with_same_fish_amount(4, 3, 2)
+        board_copy = copy.deepcopy(bitboard)
+        board_copy.remove_tile(0, 0)
+        board_copy.get_tile_at_coord(2, 0).num_fish = 4
+        self.assertEqual(2, bitboard.get_tile_at_coord(0, 0).num_fish)
+        self.assertEqual(2, bitboard.get_tile_at_coord(2, 0).num_fish)
+        self.assertIsInstance(board_copy, BitboardFishBoardModel)
+
+    def test_pickle(self):
+        """
+        Purpose: Test that a pickled bitboard is restored with its tiles and finds the same straight lines
+        Signature: Void -> Void
+        """
+        bitboard = BitboardFishBoardModel.create_with_coords_to_fish(4, 3, [((0, 0), 3), ((2, 2), 0)])
+        board_copy = pickle.loads(pickle.dumps(bitboard))
+        self.assertEqual(bitboard.tile_mask, board_copy.tile_mask)
+        self.assertEqual(3, board_copy.get_tile_at_coord(0, 0).num_fish)
+        self.assertEqual(bitboard.find_straight_line_positions(1, 1), board_copy.find_straight_line_positions(1, 1))
+
+    def test_from_board(self):
+        """
+        Purpose: Test converting a dictionary board with holes to a bitboard
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_coords_to_fish(2, 2, [((0, 0), 3), ((2, 0), 0), ((1, 1), 1)])
+        bitboard = BitboardFishBoardModel.from_board(board)
+        self.assertEqual(3, bitboard.get_tile_at_coord(0, 0).num_fish)
+        self.assertIsNone(bitboard.get_tile_at_coord(2, 0))
+        self.assertIsNot(board.get_tile_at_coord(0, 0), bitboard.get_tile_at_coord(0, 0))
+        self.assertEqual(FishTile(1).num_fish, bitboard.get_tile_at_coord(1, 1).num_fish)
+
+    def test_fish_rows_and_tiles(self):
+        """
+        Purpose: Test that a bitboard has the same fish rows and tiles as a dictionary board, and is created from
+                 fish rows with the same tiles
+        Signature: Void -> Void
+        """
+        rng = random.Random(7)
+        coords_to_fish = [(coord, rng.randint(0, 5)) for coord in FishBoardModel.create_coords(5, 4)]
+        board = FishBoardModel.create_with_coords_to_fish(5, 4, coords_to_fish)
+        bitboard = BitboardFishBoardModel.create_with_coords_to_fish(5, 4, coords_to_fish)
+        self.assertEqual(board.get_fish_rows(), bitboard.get_fish_rows())
+        self.assertEqual(sorted((coord, tile.num_fish) for coord, tile in board.get_tiles()),
+                         sorted((coord, tile.num_fish) for coord, tile in bitboard.get_tiles()))
+        from_rows = BitboardFishBoardModel.create_with_fish_rows(board.get_fish_rows())
+        self.assertEqual(bitboard.tile_mask, from_rows.tile_mask)
+
+    def test_regions_same_as_dict_board(self):
+        """
+        Purpose: Test that the bitboard finds the same regions and connections as the dictionary board on random
+                 boards with many holes, including boards with a single row or column
+        Signature: Void -> Void
+        """
+        rng = random.Random(4)
+        for rows, cols in [(1, 6), (6, 1), (4, 4), (7, 5), (8, 9)]:
+            for _ in range(10):
+                dict_board, bitboard = self.create_random_boards(rng, rows, cols)
+                self.assertEqual(sorted(sorted(region) for region in dict_board.find_regions()),
+                                 sorted(sorted(region) for region in bitboard.find_regions()))
+                coords = dict_board.get_tile_coords()
+                starts, targets = rng.sample(coords, 2), rng.sample(coords, 2)
+                self.assertEqual(dict_board.connects(starts, targets), bitboard.connects(starts, targets))
+
+    def test_game_state_moves(self):
+        """
+        Purpose: Test that a game state using a bitboard finds the same moves as one using a dictionary board
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(4, 5, 3)
+        board.remove_tile(2, 2)
+        penguins = [(PlayerColor.RED, [(0, 0), (0, 2), (1, 1), (1, 3)], 0),
+                    (PlayerColor.WHITE, [(4, 0), (4, 2), (5, 3), (5, 1)], 0)]
+        state = FishGameStateFactory.create_move_penguins_state(board, penguins)
+        bit_state = FishGameStateFactory.create_move_penguins_state(BitboardFishBoardModel.from_board(board),
+                                                                    penguins)
+        self.assertEqual(FishGameTree(state).get_children_moves(), FishGameTree(bit_state).get_children_moves())
+        bit_state.move_penguin(PlayerColor.RED, (1, 1), (2, 0))
+        self.assertIsNone(bit_state.get_board().get_tile_at_coord(1, 1))
+        self.assertEqual(3, bit_state.get_fish_for_player(PlayerColor.RED))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,6 @@
+import random
+import copy
+import pickle
 import sys
 import os
 
@@ -61,6 +64,16 @@ class FishBoardModelTest(unittest.TestCase):
                 amount_one_fish += 1
         self.assertGreaterEqual(amount_one_fish, 1)
 
+    def test_holes_with_seeded_rng(self):
+        """
+        Purpose: Test that creating boards with generators seeded the same gives the same fish
+        Signature: Void -> Void
+        """
+        first = FishBoardModel.create_with_holes(6, 6, {(0, 0), (3, 1)}, 2, rng=random.Random(5))
+        second = FishBoardModel.create_with_holes(6, 6, {(0, 0), (3, 1)}, 2, rng=random.Random(5))
+        self.assertEqual(first.get_fish_rows(), second.get_fish_rows())
+        self.assertEqual(0, first.get_fish_rows()[1][1])
+
     def test_invalid_not_enough_tiles(self):
         """
         Purpose:Test that error is thrown when you don't have enough tiles available to satisfy the minimum
@@ -122,6 +135,30 @@ class FishBoardModelTest(unittest.TestCase):
                      'SOUTH': [(1, 3)]}
         self.assertDictEqual(test_dict, positions)
 
+    def test_reachable_positions_blocked(self):
+        """
+        Purpose: Test finding the reachable positions in one list, where blocked coordinates stop the lines like holes
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_holes(4, 2, {(0, 0)}, 1)
+        self.assertEqual([(2, 2), (3, 3), (2, 0), (0, 2), (1, 3)], model.find_reachable_positions(1, 1, set()))
+        self.assertEqual([(2, 2), (0, 2)], model.find_reachable_positions(1, 1, {(3, 3), (2, 0), (1, 3)}))
+        self.assertEqual([], model.find_reachable_positions(0, 0, set()))
+        with self.assertRaises(ValueError):
+            model.find_reachable_positions(10, 0, set())
+
+    def test_rays_shared(self):
+        """
+        Purpose: Test that boards of the same size share their straight lines, which hold whatever tiles they have
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_same_fish_amount(4, 2, 2)
+        holes = FishBoardModel.create_with_holes(4, 2, {(0, 0), (0, 2), (2, 2)}, 1)
+        self.assertIs(model._rays, holes._rays)
+        self.assertIsNot(model._rays, FishBoardModel(2, 4)._rays)
+        self.assertEqual([(2, 2), (3, 3)], model.find_straight_line_positions(1, 1)['SOUTHEAST'])
+        self.assertEqual([], holes.find_straight_line_positions(1, 1)['SOUTHEAST'])
+
     def test_invalid_reachable_pos(self):
         """
         Purpose: Test trying to find reachable tiles from a position off the board
@@ -163,6 +200,52 @@ class FishBoardModelTest(unittest.TestCase):
         self.assertIsNone(model.get_tile_at_coord(0, 0))
         self.assertIsNone(model.remove_tile(0, 0))
 
+    def test_restore_tile(self):
+        """
+        Purpose: Test putting a removed tile back on the board, and not being able to put it on top of another tile
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_same_fish_amount(4, 3, 2)
+        tile = model.remove_tile(0, 0)
+        model.restore_tile(0, 0, tile)
+        self.assertIs(tile, model.get_tile_at_coord(0, 0))
+        with self.assertRaises(ValueError):
+            model.restore_tile(0, 0, tile)
+        with self.assertRaises(ValueError):
+            model.restore_tile(10, 0, tile)
+
+    def test_deepcopy(self):
+        """
+        Purpose: Test that a copy of a board has its own tiles but the same coordinates
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_same_fish_amount(4, 3, 2)
+        model_copy = copy.deepcopy(model)
+        model_copy.remove_tile(0, 0)
+        model_copy.get_tile_at_coord(2, 0).num_fish = 4
+        self.assertEqual(2, model.get_tile_at_coord(0, 0).num_fish)
+        self.assertEqual(2, model.get_tile_at_coord(2, 0).num_fish)
+        self.assertEqual(model.get_tile_coords(), model_copy.get_tile_coords())
+        with self.assertRaises(ValueError):
+            model_copy.get_tile_at_coord(1, 0)
+
+    def test_pickle(self):
+        """
+        Purpose: Test that a pickled board is restored with its tiles and coordinates
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_coords_to_fish(4, 3, [((0, 0), 3), ((2, 0), 0), ((1, 1), 1)])
+        self.assertNotIn('coords', model.__getstate__())
+        self.assertNotIn('_rays', model.__getstate__())
+        model_copy = pickle.loads(pickle.dumps(model))
+        self.assertEqual(model.get_tile_coords(), model_copy.get_tile_coords())
+        self.assertEqual(model.find_straight_line_positions(1, 1), model_copy.find_straight_line_positions(1, 1))
+        self.assertEqual(model.get_coords_sorted_by_row(), model_copy.get_coords_sorted_by_row())
+        self.assertEqual(3, model_copy.get_tile_at_coord(0, 0).num_fish)
+        self.assertIsNone(model_copy.get_tile_at_coord(2, 0))
+        with self.assertRaises(ValueError):
+            model_copy.get_tile_at_coord(1, 0)
+
     def test_sort_iterator(self):
         """
         Purpose: Test sorting a board's valid coordinates by the y value and then the x value
@@ -170,6 +253,68 @@ class FishBoardModelTest(unittest.TestCase):
         """
         model = FishBoardModel.create_with_same_fish_amount(4, 3, 2)
         sorted_coord = model.get_coords_sorted_by_row()
+        self.assertEqual([(0, 0), (2, 0), (4, 0), (1, 1), (3, 1), (5, 1)], sorted_coord[:6])
+        self.assertEqual(sorted(model.get_tile_coords()), sorted(sorted_coord))
+
+    def test_create_with_fish_rows(self):
+        """
+        Purpose: Test creating a board from rows of fish, where 0 and the end of shorter rows are holes
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_fish_rows([[1, 0, 3], [4], [5, 2]])
+        self.assertEqual((3, 3), model.get_dimensions())
+        self.assertEqual(1, model.get_tile_at_coord(0, 0).num_fish)
+        self.assertIsNone(model.get_tile_at_coord(2, 0))
+        self.assertEqual(4, model.get_tile_at_coord(1, 1).num_fish)
+        self.assertIsNone(model.get_tile_at_coord(3, 1))
+        self.assertEqual(2, model.get_tile_at_coord(2, 2).num_fish)
+        with self.assertRaises(ValueError):
+            FishBoardModel.create_with_fish_rows([[1, 6]])
+
+    def test_get_fish_rows(self):
+        """
+        Purpose: Test getting the fish of a board row by row, with 0 for holes
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_coords_to_fish(3, 2, [((0, 0), 3), ((2, 0), 0), ((1, 1), 1), ((2, 2), 5)])
+        self.assertEqual([[3, 0], [1, 0], [0, 5]], model.get_fish_rows())
+        model_copy = FishBoardModel.create_with_fish_rows(model.get_fish_rows())
+        self.assertEqual(model.get_fish_rows(), model_copy.get_fish_rows())
+
+    def test_get_tiles(self):
+        """
+        Purpose: Test getting the tiles of a board without its holes
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_coords_to_fish(2, 2, [((0, 0), 3), ((2, 0), 0), ((1, 1), 1)])
+        self.assertEqual([((0, 0), 3), ((1, 1), 1)],
+                         sorted((coord, tile.num_fish) for coord, tile in model.get_tiles()))
+
+    def test_find_regions(self):
+        """
+        Purpose: Test splitting a board into regions once a column of holes cuts it in two
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_same_fish_amount(3, 3, 2)
+        self.assertEqual([set(model.get_tile_coords())], model.find_regions())
+        for coord in [(2, 0), (3, 1), (2, 2)]:
+            model.remove_tile(*coord)
+        self.assertEqual([[(0, 0), (0, 2), (1, 1)], [(4, 0), (4, 2), (5, 1)]],
+                         sorted(sorted(region) for region in model.find_regions()))
+        self.assertEqual([], FishBoardModel(2, 2).find_regions())
+
+    def test_connects(self):
+        """
+        Purpose: Test checking whether tiles are in the same region, where holes connect nothing
+        Signature: Void -> Void
+        """
+        model = FishBoardModel.create_with_same_fish_amount(3, 3, 2)
+        for coord in [(2, 0), (3, 1), (2, 2)]:
+            model.remove_tile(*coord)
+        self.assertTrue(model.connects([(0, 0)], [(0, 2), (4, 0)]))
+        self.assertFalse(model.connects([(0, 0), (1, 1)], [(4, 0), (5, 1)]))
+        self.assertFalse(model.connects([(2, 0)], [(0, 0)]))
+
 
 if __name__ == '__main__':
     unittest.main()
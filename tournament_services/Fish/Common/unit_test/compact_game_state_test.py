@@ -0,0 +1,120 @@
+import pickle
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+import unittest
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.bitboard_fish_board import BitboardFishBoardModel
+from Fish.Common.representations.compact_game_state import CompactFishState
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Common.representations.game_state_view import FishGameStateView
+from Fish.Player.unit_test import strategy_test
+
+
+class CompactGameStateTest(unittest.TestCase):
+
+    def setUp(self):
+        board = FishBoardModel.create_with_fish_rows([[1, 2, 3], [4, 5, 0], [2, 2, 1]])
+        self.state = FishGameStateFactory.create_move_penguins_state(
+            board, [(PlayerColor.RED, [(0, 0), (3, 1)], 3), (PlayerColor.WHITE, [(4, 2)], 1)],
+            turn=PlayerColor.WHITE, check_penguin_amount=False)
+
+    def test_from_state(self):
+        """
+        Purpose: Test converting a state into a compact state, with cells numbered row by row
+        Signature: Void -> Void
+        """
+        compact = CompactFishState.from_state(self.state)
+        self.assertEqual(bytes([1, 2, 3, 4, 5, 0, 2, 2, 1]), compact.fish)
+        self.assertEqual(((0, 4), (8,)), compact.penguins)
+        self.assertEqual((3, 1), compact.scores)
+        self.assertEqual(PlayerColor.WHITE, compact.get_current_turn())
+        self.assertEqual([PlayerColor.RED, PlayerColor.WHITE], compact.get_player_order())
+        self.assertEqual([(0, 0), (3, 1)], compact.get_penguins_for_player(PlayerColor.RED))
+        self.assertEqual(3, compact.get_fish_for_player(PlayerColor.RED))
+        self.assertIsNone(compact.get_fish_for_player(PlayerColor.BLACK))
+        self.assertEqual(5, compact.get_fish_at_pos((3, 1)))
+        self.assertEqual(0, compact.get_fish_at_pos((5, 1)))
+        self.assertEqual(0, compact.get_fish_at_pos((10, 10)))
+        self.assertEqual(compact, CompactFishState.from_state(FishGameStateView(self.state)))
+        with self.assertRaises(AttributeError):
+            compact.extra = 1
+
+    def test_to_state(self):
+        """
+        Purpose: Test that a compact state converts back into a state with the same board, players, turn, phase and
+                 Zobrist hash, with any kind of board
+        Signature: Void -> Void
+        """
+        self.state.set_game_phase(GamePhase.END_GAME)
+        compact = CompactFishState.from_state(self.state)
+        for board_class in [FishBoardModel, BitboardFishBoardModel]:
+            state = compact.to_state(board_class)
+            self.assertIsInstance(state.get_board(), board_class)
+            self.assertEqual(self.state.get_fish_rows(), state.get_fish_rows())
+            self.assertEqual(self.state.get_zobrist_hash(), state.get_zobrist_hash())
+            self.assertEqual(GamePhase.END_GAME, state.get_game_phase())
+            self.assertEqual(compact, CompactFishState.from_state(state))
+
+    def test_apply_move(self):
+        """
+        Purpose: Test that applying a move gives a new state with the fish of the tile left behind, and leaves the
+                 state it was applied to unchanged
+        Signature: Void -> Void
+        """
+        compact = CompactFishState.from_state(self.state)
+        moved = compact.apply_move(((4, 2), (2, 2)))
+        self.assertEqual(((0, 4), (7,)), moved.penguins)
+        self.assertEqual((3, 2), moved.scores)
+        self.assertEqual(0, moved.get_fish_at_pos((4, 2)))
+        self.assertEqual(PlayerColor.RED, moved.get_current_turn())
+        self.assertIs(compact.penguins[0], moved.penguins[0])
+        self.assertEqual(((0, 4), (8,)), compact.penguins)
+        skipped = compact.apply_move(None)
+        self.assertEqual(PlayerColor.RED, skipped.get_current_turn())
+        self.assertEqual(compact.fish, skipped.fish)
+        self.assertNotEqual(compact, skipped)
+
+    def test_same_as_state(self):
+        """
+        Purpose: Test that compact states find the same moves in the same order as FishGameTree and follow the same
+                 states as FishGameState.apply_move over random games
+        Signature: Void -> Void
+        """
+        rng = random.Random(3)
+        for _ in range(10):
+            state = strategy_test.StrategyTest.create_random_move_state(rng, 5, 5, rng.choice([2, 3]))
+            compact = CompactFishState.from_state(state)
+            while state.can_any_player_move():
+                self.assertTrue(compact.can_any_player_move())
+                actions = FishGameTree.find_actions_for_state(state)
+                self.assertEqual(actions, compact.find_actions())
+                self.assertEqual(bool(actions), compact.can_player_move(state.get_current_turn()))
+                action = rng.choice(actions) if actions else None
+                state.apply_move(action)
+                compact = compact.apply_move(action)
+                self.assertEqual(CompactFishState.from_state(state), compact)
+            self.assertFalse(compact.can_any_player_move())
+
+    def test_hash_and_pickle(self):
+        """
+        Purpose: Test that equal compact states hash the same and survive pickling, which is smaller than pickling
+                 the state
+        Signature: Void -> Void
+        """
+        compact = CompactFishState.from_state(self.state)
+        other = CompactFishState.from_state(CompactFishState.from_state(self.state).to_state())
+        self.assertEqual({compact: 1}[other], 1)
+        data = pickle.dumps(compact)
+        self.assertEqual(compact, pickle.loads(data))
+        self.assertLess(len(data), len(pickle.dumps(self.state)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,6 @@
+import copy
+import pickle
+import random
 import sys
 import os
 
@@ -5,8 +8,10 @@ from Fish.Common.representations.game_state_error import PenguinMovementError, P
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
 
+from Fish.Common.game_tree import FishGameTree
 from Fish.Common.representations.game_state import PlayerColor, FishGameStateFactory
 from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.enumerations.game_phase import GamePhase
 
 
 import unittest
@@ -160,6 +165,85 @@ class GameStateTest(unittest.TestCase):
         )
         self.assertEqual(False, game_state_holes.can_any_player_move())
 
+    def test_if_players_can_move_blocked_by_penguins(self):
+        """
+        Purpose: Test that a penguin whose neighbors are all holes or other penguins cannot move
+        Signature: Void -> Void
+        """
+        test_board = FishBoardModel.create_with_same_fish_amount(3, 2, 3)
+        test_board.remove_tile(2, 2)
+        test_board.remove_tile(2, 0)
+        game_state = FishGameStateFactory.create_place_penguins_state(
+            test_board, [(PlayerColor.BLACK, [(0, 0), (0, 2)]), (PlayerColor.BROWN, [(1, 1)])]
+        )
+        self.assertEqual(False, game_state.can_any_player_move())
+        test_board = FishBoardModel.create_with_same_fish_amount(3, 2, 3)
+        test_board.remove_tile(2, 2)
+        game_state = FishGameStateFactory.create_place_penguins_state(
+            test_board, [(PlayerColor.BLACK, [(0, 0), (0, 2)]), (PlayerColor.BROWN, [(1, 1)])]
+        )
+        self.assertEqual(True, game_state.can_any_player_move())
+
+    def test_can_player_move(self):
+        """
+        Purpose: Test checking whether a single player can move, when only another player can
+        Signature: Void -> Void
+        """
+        test_board = FishBoardModel.create_with_same_fish_amount(3, 2, 3)
+        test_board.remove_tile(2, 2)
+        game_state = FishGameStateFactory.create_place_penguins_state(
+            test_board, [(PlayerColor.BLACK, [(0, 0), (0, 2)]), (PlayerColor.BROWN, [(1, 1)])]
+        )
+        self.assertFalse(game_state.can_player_move(PlayerColor.BLACK))
+        self.assertTrue(game_state.can_player_move(PlayerColor.BROWN))
+        self.assertFalse(game_state.can_player_move(PlayerColor.RED))
+        game_state.remove_color_from_game(PlayerColor.BROWN)
+        self.assertTrue(game_state.can_player_move(PlayerColor.BLACK))
+
+    def test_are_penguins_separated(self):
+        """
+        Purpose: Test that the penguins of the players are separated once holes split the board between them
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(3, 3, 2)
+        players = [(PlayerColor.RED, [(0, 0), (1, 1)], 0), (PlayerColor.WHITE, [(4, 0), (5, 1)], 0)]
+        game_state = FishGameStateFactory.create_move_penguins_state(board, players, check_penguin_amount=False)
+        self.assertFalse(game_state.are_penguins_separated())
+        board = FishBoardModel.create_with_holes(3, 3, {(2, 0), (2, 2)}, 0)
+        game_state = FishGameStateFactory.create_move_penguins_state(board, players, check_penguin_amount=False)
+        self.assertTrue(game_state.are_penguins_separated())
+        game_state = FishGameStateFactory.create_move_penguins_state(
+            board, players + [(PlayerColor.BROWN, [(0, 2)], 0)], check_penguin_amount=False)
+        self.assertFalse(game_state.are_penguins_separated())
+        game_state.remove_color_from_game(PlayerColor.RED)
+        self.assertTrue(game_state.are_penguins_separated())
+
+    def test_penguin_color_at_pos(self):
+        """
+        Purpose: Test that the color of the penguin at a position follows placing, moving, undoing moves and removing
+        players
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(4, 5, 3)
+        game_state = FishGameStateFactory.create_move_penguins_state(
+            board, [(PlayerColor.RED, GameStateTest.test_board_valid_col1, 0),
+                    (PlayerColor.WHITE, GameStateTest.test_board_valid_col3, 0)]
+        )
+        self.assertEqual(PlayerColor.RED, game_state.get_penguin_color_at_pos((1, 3)))
+        self.assertEqual(PlayerColor.WHITE, game_state.get_penguin_color_at_pos((5, 1)))
+        self.assertIsNone(game_state.get_penguin_color_at_pos((2, 2)))
+        game_state.move_penguin(PlayerColor.RED, (1, 3), (2, 2))
+        self.assertIsNone(game_state.get_penguin_color_at_pos((1, 3)))
+        self.assertEqual(PlayerColor.RED, game_state.get_penguin_color_at_pos((2, 2)))
+        record = game_state.apply_move(((5, 1), (6, 0)))
+        self.assertEqual(PlayerColor.WHITE, game_state.get_penguin_color_at_pos((6, 0)))
+        game_state.undo_move(record)
+        self.assertIsNone(game_state.get_penguin_color_at_pos((6, 0)))
+        self.assertEqual(PlayerColor.WHITE, game_state.get_penguin_color_at_pos((5, 1)))
+        game_state.remove_color_from_game(PlayerColor.WHITE)
+        self.assertIsNone(game_state.get_penguin_color_at_pos((5, 1)))
+        self.assertEqual(PlayerColor.RED, game_state.get_penguin_color_at_pos((2, 2)))
+
     def test_get_fish(self):
         """
         Purpose: Test getting a player's fish before and after they move on a board
@@ -285,6 +369,170 @@ class GameStateTest(unittest.TestCase):
         order_after = game_state.get_player_order()
         self.assertEqual([PlayerColor.BROWN], order_after)
 
+    def test_zobrist_hash_incremental(self):
+        """
+        Purpose: Tests that the Zobrist hash kept up to date by placing, moving, changing turns and removing players
+        is the same as the hash computed from scratch
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(4, 5, 3)
+        game_state = FishGameStateFactory.create_place_penguins_state(
+            board, [(PlayerColor.RED, []), (PlayerColor.WHITE, []), (PlayerColor.BROWN, [])]
+        )
+        self.assertEqual(game_state.compute_zobrist_hash(), game_state.get_zobrist_hash())
+        for place_pos in [(0, 0), (2, 0), (4, 0), (1, 1), (3, 1), (5, 1)]:
+            game_state.place_penguin(game_state.get_current_turn(), place_pos)
+            self.assertEqual(game_state.compute_zobrist_hash(), game_state.get_zobrist_hash())
+        game_state.set_game_phase(GamePhase.MOVE_PENGUINS)
+        game_state.move_penguin(PlayerColor.RED, (0, 0), (0, 2))
+        self.assertEqual(game_state.compute_zobrist_hash(), game_state.get_zobrist_hash())
+        game_state.increase_turn()
+        self.assertEqual(game_state.compute_zobrist_hash(), game_state.get_zobrist_hash())
+        game_state.remove_color_from_game(PlayerColor.BROWN)
+        self.assertEqual(game_state.compute_zobrist_hash(), game_state.get_zobrist_hash())
+        game_state.set_turn(PlayerColor.WHITE)
+        game_state.add_fish_to_player(PlayerColor.WHITE, 4)
+        self.assertEqual(game_state.compute_zobrist_hash(), game_state.get_zobrist_hash())
+
+    def test_zobrist_hash_transposition(self):
+        """
+        Purpose: Tests that reaching the same state through a different order of moves gives the same hash, and that
+        states with different scores or turns have different hashes
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(4, 5, 3)
+        first_state = FishGameStateFactory.create_move_penguins_state(
+            board, [(PlayerColor.RED, GameStateTest.test_board_valid_col1, 0),
+                    (PlayerColor.WHITE, GameStateTest.test_board_valid_col3, 0)]
+        )
+        second_state = copy.deepcopy(first_state)
+        self.assertEqual(first_state.get_zobrist_hash(), second_state.get_zobrist_hash())
+        first_state.move_penguin(PlayerColor.RED, (1, 3), (2, 2))
+        first_state.move_penguin(PlayerColor.WHITE, (5, 1), (6, 0))
+        first_state.move_penguin(PlayerColor.RED, (1, 1), (2, 0))
+        second_state.move_penguin(PlayerColor.RED, (1, 1), (2, 0))
+        second_state.move_penguin(PlayerColor.WHITE, (5, 1), (6, 0))
+        second_state.move_penguin(PlayerColor.RED, (1, 3), (2, 2))
+        self.assertEqual(first_state.get_zobrist_hash(), second_state.get_zobrist_hash())
+        second_state.increase_turn()
+        self.assertNotEqual(first_state.get_zobrist_hash(), second_state.get_zobrist_hash())
+        second_state.increase_turn()
+        second_state.add_fish_to_player(PlayerColor.WHITE, 1)
+        self.assertNotEqual(first_state.get_zobrist_hash(), second_state.get_zobrist_hash())
+
+    def test_apply_and_undo_move(self):
+        """
+        Purpose: Tests that applying a move changes the state the same way move_penguin does, and that undoing the moves
+        puts the state back the way it was
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(4, 5, 3)
+        game_state = FishGameStateFactory.create_move_penguins_state(
+            board, [(PlayerColor.RED, GameStateTest.test_board_valid_col1, 0),
+                    (PlayerColor.WHITE, GameStateTest.test_board_valid_col3, 0)]
+        )
+        original_state = copy.deepcopy(game_state)
+        moved_state = copy.deepcopy(game_state)
+        first_record = game_state.apply_move(((1, 3), (2, 2)))
+        second_record = game_state.apply_move(((5, 1), (6, 0)))
+        moved_state.move_penguin(PlayerColor.RED, (1, 3), (2, 2))
+        moved_state.move_penguin(PlayerColor.WHITE, (5, 1), (6, 0))
+        self.assertEqual(3, first_record.fish_gained)
+        self.assertEqual(PlayerColor.RED, first_record.previous_turn)
+        for state in [game_state, moved_state]:
+            self.assertIsNone(state.get_board().get_tile_at_coord(1, 3))
+            self.assertEqual(3, state.get_fish_for_player(PlayerColor.RED))
+            self.assertIn((2, 2), state.get_penguins_for_player(PlayerColor.RED))
+            self.assertEqual(PlayerColor.RED, state.get_current_turn())
+        self.assertEqual(moved_state.get_zobrist_hash(), game_state.get_zobrist_hash())
+        self.assertEqual(game_state.compute_zobrist_hash(), game_state.get_zobrist_hash())
+        game_state.undo_move(second_record)
+        game_state.undo_move(first_record)
+        self.assertEqual(3, game_state.get_board().get_tile_at_coord(1, 3).num_fish)
+        self.assertEqual(0, game_state.get_fish_for_player(PlayerColor.RED))
+        self.assertEqual(original_state.get_penguins_for_player(PlayerColor.RED),
+                         game_state.get_penguins_for_player(PlayerColor.RED))
+        self.assertEqual(original_state.get_penguins_for_player(PlayerColor.WHITE),
+                         game_state.get_penguins_for_player(PlayerColor.WHITE))
+        self.assertEqual(PlayerColor.RED, game_state.get_current_turn())
+        self.assertEqual(original_state.get_zobrist_hash(), game_state.get_zobrist_hash())
+
+    def test_apply_and_undo_skipped_turn(self):
+        """
+        Purpose: Tests that applying no move skips the turn of the current player and undoing it gives the turn back
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(4, 5, 3)
+        game_state = FishGameStateFactory.create_move_penguins_state(
+            board, [(PlayerColor.RED, GameStateTest.test_board_valid_col1, 0),
+                    (PlayerColor.WHITE, GameStateTest.test_board_valid_col3, 0)]
+        )
+        original_hash = game_state.get_zobrist_hash()
+        record = game_state.apply_move(None)
+        self.assertIsNone(record.removed_tile)
+        self.assertEqual(PlayerColor.WHITE, game_state.get_current_turn())
+        self.assertEqual(game_state.compute_zobrist_hash(), game_state.get_zobrist_hash())
+        game_state.undo_move(record)
+        self.assertEqual(PlayerColor.RED, game_state.get_current_turn())
+        self.assertEqual(original_hash, game_state.get_zobrist_hash())
+
+    def test_pickle(self):
+        """
+        Purpose: Tests that a pickled state leaves out its move cache and is restored with the same penguins, moves
+        and hash
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(4, 5, 3)
+        game_state = FishGameStateFactory.create_move_penguins_state(
+            board, [(PlayerColor.RED, GameStateTest.test_board_valid_col1, 0),
+                    (PlayerColor.WHITE, GameStateTest.test_board_valid_col3, 0)]
+        )
+        moves = game_state.find_valid_moves_from_pos((1, 3))
+        self.assertNotIn('_move_cache', game_state.__getstate__())
+        state_copy = pickle.loads(pickle.dumps(game_state))
+        self.assertEqual(moves, state_copy.find_valid_moves_from_pos((1, 3)))
+        self.assertEqual(PlayerColor.RED, state_copy.get_penguin_color_at_pos((1, 3)))
+        self.assertEqual(game_state.get_zobrist_hash(), state_copy.get_zobrist_hash())
+        state_copy.apply_move(((1, 3), (2, 2)))
+        self.assertEqual(state_copy.compute_zobrist_hash(), state_copy.get_zobrist_hash())
+        self.assertIsNotNone(game_state.get_board().get_tile_at_coord(1, 3))
+
+    def test_move_cache_matches_fresh_moves(self):
+        """
+        Purpose: Tests that the cached valid moves of every penguin stay the same as the moves found from scratch
+        while playing random games with move_penguin, apply_move and undo_move
+        Signature: Void -> Void
+        """
+        rng = random.Random(8)
+        for _ in range(5):
+            board = FishBoardModel.create_with_same_fish_amount(5, 4, 2)
+            tiles = board.get_tile_coords()[:]
+            rng.shuffle(tiles)
+            game_state = FishGameStateFactory.create_move_penguins_state(
+                board, [(PlayerColor.RED, tiles[:3], 0), (PlayerColor.WHITE, tiles[3:6], 0),
+                        (PlayerColor.BROWN, tiles[6:9], 0)]
+            )
+            records = []
+            while game_state.can_any_player_move():
+                fresh_state = copy.deepcopy(game_state)
+                fresh_state._move_cache.clear()
+                actions = FishGameTree.find_actions_for_state(game_state)
+                self.assertEqual(FishGameTree.find_actions_for_state(fresh_state), actions)
+                if not actions:
+                    records.append(game_state.apply_move(None))
+                elif rng.random() < 0.5:
+                    records.append(game_state.apply_move(rng.choice(actions)))
+                else:
+                    game_state.move_penguin(game_state.get_current_turn(), *rng.choice(actions))
+                    records = []
+            for record in reversed(records):
+                game_state.undo_move(record)
+                fresh_state = copy.deepcopy(game_state)
+                fresh_state._move_cache.clear()
+                for penguin in game_state.get_penguins_for_player(game_state.get_current_turn()):
+                    self.assertEqual(fresh_state.find_valid_moves_from_pos(penguin),
+                                     game_state.find_valid_moves_from_pos(penguin))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,115 @@
+import copy
+import pickle
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+import unittest
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameState, FishGameStateFactory
+from Fish.Common.representations.game_state_view import FishGameStateView, ReadOnlyStateError
+from Fish.Player.strategy import FishBasicStrategy
+
+
+class GameStateViewTest(unittest.TestCase):
+    """
+    Test cases for read-only views of a game state
+    """
+
+    @staticmethod
+    def create_state():
+        """
+        Purpose: Create a small state in the penguin moving phase
+        Signature: Void -> FishGameState
+        """
+        board = FishBoardModel.create_with_same_fish_amount(4, 3, 2)
+        return FishGameStateFactory.create_move_penguins_state(
+            board, [(PlayerColor.RED, [(0, 0), (2, 0), (4, 0), (1, 1)], 3),
+                    (PlayerColor.WHITE, [(3, 1), (5, 1), (0, 2), (2, 2)], 1)])
+
+    def test_read(self):
+        """
+        Purpose: Test that a view reads the same as the state it views
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        view = FishGameStateView(state)
+        self.assertEqual(state.get_player_order(), view.get_player_order())
+        self.assertEqual(PlayerColor.RED, view.get_current_turn())
+        self.assertEqual(state.get_penguins_for_player(PlayerColor.WHITE),
+                         view.get_penguins_for_player(PlayerColor.WHITE))
+        self.assertEqual(3, view.get_fish_for_player(PlayerColor.RED))
+        self.assertEqual(state.get_game_phase(), view.get_game_phase())
+        self.assertEqual(state.get_fish_rows(), view.get_fish_rows())
+        self.assertEqual(state.get_zobrist_hash(), view.get_zobrist_hash())
+        self.assertEqual(state.find_valid_moves_from_pos((1, 1)), view.find_valid_moves_from_pos((1, 1)))
+        self.assertEqual(PlayerColor.WHITE, view.get_penguin_color_at_pos((3, 1)))
+
+    def test_view_follows_state(self):
+        """
+        Purpose: Test that a view shows the state as it is changed, and that its player order is a copy
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        view = FishGameStateView(state)
+        view.get_player_order().clear()
+        state.move_penguin(PlayerColor.RED, (1, 1), (1, 3))
+        self.assertEqual(PlayerColor.WHITE, view.get_current_turn())
+        self.assertEqual(5, view.get_fish_for_player(PlayerColor.RED))
+        self.assertEqual(2, len(view.get_player_order()))
+
+    def test_mutators_raise(self):
+        """
+        Purpose: Test that every way of changing the state through a view fails and leaves the state unchanged
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        hash_before = state.get_zobrist_hash()
+        view = FishGameStateView(state)
+        calls = [lambda: view.move_penguin(PlayerColor.RED, (1, 1), (1, 3)),
+                 lambda: view.apply_move(((1, 1), (1, 3))),
+                 lambda: view.undo_move(None),
+                 lambda: view.set_turn(PlayerColor.WHITE),
+                 lambda: view.increase_turn(),
+                 lambda: view.add_fish_to_player(PlayerColor.RED, 2),
+                 lambda: view.remove_color_from_game(PlayerColor.WHITE),
+                 lambda: view.place_penguin(PlayerColor.RED, (1, 3))]
+        for call in calls:
+            with self.assertRaises(ReadOnlyStateError):
+                call()
+        self.assertEqual(hash_before, state.get_zobrist_hash())
+        self.assertEqual(PlayerColor.RED, state.get_current_turn())
+
+    def test_copies_are_states(self):
+        """
+        Purpose: Test that copying or pickling a view gives a state that can be changed without changing the original
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        view = FishGameStateView(state)
+        for state_copy in [copy.deepcopy(view), pickle.loads(pickle.dumps(view))]:
+            self.assertIsInstance(state_copy, FishGameState)
+            self.assertEqual(state.get_zobrist_hash(), state_copy.get_zobrist_hash())
+            state_copy.move_penguin(PlayerColor.RED, (1, 1), (1, 3))
+            self.assertEqual(3, state.get_fish_for_player(PlayerColor.RED))
+
+    def test_game_tree_and_strategy(self):
+        """
+        Purpose: Test that a game tree and the strategy work on a view the same as on the state
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        view = FishGameStateView(state)
+        self.assertEqual(FishGameTree(state).get_children_moves(), FishGameTree(view).get_children_moves())
+        for use_alpha_beta in [False, True]:
+            strategy = FishBasicStrategy(2, use_alpha_beta=use_alpha_beta)
+            self.assertEqual(strategy.find_next_move(state), strategy.find_next_move(view))
+        self.assertEqual(self.create_state().get_zobrist_hash(), state.get_zobrist_hash())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,8 @@ from Fish.Common.representations.enumerations.player_color_enum import PlayerCol
 from Fish.Common.representations.game_state import FishBoardModel, FishGameStateFactory
 from Fish.Common.game_tree import FishGameTree
 from Fish.Common.representations.types import Action
+from Fish.Common.search_activity import SearchActivity
+from Fish.Common.search_stats import SearchStats
 
 
 class GameTreeTest(unittest.TestCase):
@@ -248,6 +250,23 @@ class GameTreeTest(unittest.TestCase):
         self.assertEqual(1, len(list(stuck_tree.generate_direct_children())))
         self.assertEqual(PlayerColor.BLACK, list(stuck_tree.generate_direct_children())[0].get_turn_color())
 
+    def test_tree_stats(self):
+        """
+        Purpose: Test that the children of a tree with stats share them and time finding their actions and copying
+                 their states, while trees without stats have none
+        Signature: Void -> Void
+        """
+        self.assertIsNone(GameTreeTest.create_small_tree().stats)
+        stats = SearchStats()
+        tree = FishGameTree(GameTreeTest.create_small_tree().state, stats=stats)
+        children = list(tree.generate_direct_children())
+        child = tree.validate_and_compute_node(tree.get_children_moves()[0])
+        self.assertTrue(all(other.stats is stats for other in children + [child]))
+        self.assertGreater(stats.seconds[SearchActivity.MOVE_GENERATION], 0)
+        self.assertGreater(stats.seconds[SearchActivity.COPY], 0)
+        self.assertGreater(stats.seconds[SearchActivity.APPLY], 0)
+        self.assertEqual(0, stats.seconds[SearchActivity.EVALUATION])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,61 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+import unittest
+from Fish.Common.search_activity import SearchActivity
+from Fish.Common.search_stats import SearchStats
+
+
+class SearchStatsTest(unittest.TestCase):
+
+    def test_record_nodes(self):
+        """
+        Purpose: Test counting nodes, the deepest ply and the branching factors of expanded nodes
+        Signature: Void -> Void
+        """
+        stats = SearchStats()
+        self.assertEqual(0, stats.get_average_branching_factor())
+        for ply in [0, 1, 3, 2]:
+            stats.record_node(ply)
+        for children in [2, 4, 4]:
+            stats.record_expansion(children)
+        self.assertEqual(4, stats.nodes)
+        self.assertEqual(3, stats.max_ply)
+        self.assertEqual(3, stats.expanded)
+        self.assertEqual({2: 1, 4: 2}, stats.branching)
+        self.assertAlmostEqual(10 / 3, stats.get_average_branching_factor())
+
+    def test_time(self):
+        """
+        Purpose: Test that timing a function returns its result and adds its time to the activity, even if it raises
+        Signature: Void -> Void
+        """
+        stats = SearchStats()
+        self.assertEqual(3, stats.time(SearchActivity.EVALUATION, max, 1, 3))
+        self.assertGreater(stats.seconds[SearchActivity.EVALUATION], 0)
+        with self.assertRaises(ValueError):
+            stats.time(SearchActivity.APPLY, int, 'a')
+        self.assertGreater(stats.seconds[SearchActivity.APPLY], 0)
+        self.assertEqual(0, stats.seconds[SearchActivity.COPY])
+
+    def test_to_dict(self):
+        """
+        Purpose: Test converting stats to a dictionary with plain keys
+        Signature: Void -> Void
+        """
+        stats = SearchStats()
+        stats.record_node(1)
+        stats.record_expansion(5)
+        stats.cutoffs = 2
+        result = stats.to_dict()
+        self.assertEqual(1, result['nodes'])
+        self.assertEqual(2, result['cutoffs'])
+        self.assertEqual({'5': 1}, result['branching'])
+        self.assertEqual(5, result['average_branching_factor'])
+        self.assertEqual({'move generation', 'copy', 'apply', 'evaluation'}, set(result['seconds']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+import unittest
+from Fish.Common.representations.bitboard_fish_board import BitboardFishBoardModel
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Common.representations import state_serializer
+
+
+class StateSerializerTest(unittest.TestCase):
+
+    state_json = {"players": [{"color": "white", "score": 4, "places": [[1, 0], [2, 1]]},
+                              {"color": "red", "score": 3, "places": [[0, 0], [3, 1]]}],
+                  "board": [[1, 2], [3, 4], [5, 1], [0, 2]]}
+
+    def test_serialize_state(self):
+        """
+        Purpose: Test serializing a state, with the player whose turn it is first
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_fish_rows([[1, 2], [3, 4], [5, 1], [0, 2]])
+        state = FishGameStateFactory.create_move_penguins_state(board,
+                                                                [(PlayerColor.RED, [(0, 0), (3, 3)], 3),
+                                                                 (PlayerColor.WHITE, [(1, 1), (2, 2)], 4)],
+                                                                turn=PlayerColor.WHITE,
+                                                                check_penguin_amount=False)
+        self.assertEqual(self.state_json, state_serializer.serialize_state(state))
+
+    def test_parse_state(self):
+        """
+        Purpose: Test parsing a state into the moving phase with the turn of the first player
+        Signature: Void -> Void
+        """
+        state = state_serializer.parse_state(self.state_json)
+        self.assertEqual([PlayerColor.WHITE, PlayerColor.RED], state.get_player_order())
+        self.assertEqual(PlayerColor.WHITE, state.get_current_turn())
+        self.assertEqual(GamePhase.MOVE_PENGUINS, state.get_game_phase())
+        self.assertEqual([(1, 1), (2, 2)], state.get_penguins_for_player(PlayerColor.WHITE))
+        self.assertEqual(3, state.get_fish_for_player(PlayerColor.RED))
+        self.assertEqual(self.state_json['board'], state.get_fish_rows())
+
+    def test_parse_state_bitboard(self):
+        """
+        Purpose: Test parsing a state with a bitboard
+        Signature: Void -> Void
+        """
+        state = state_serializer.parse_state(self.state_json, BitboardFishBoardModel)
+        self.assertIsInstance(state.get_board(), BitboardFishBoardModel)
+        self.assertEqual(self.state_json, state_serializer.serialize_state(state))
+
+    def test_parse_invalid_color(self):
+        """
+        Purpose: Test that parsing a state with an unknown color fails
+        Signature: Void -> Void
+        """
+        with self.assertRaises(ValueError):
+            state_serializer.parse_state({"players": [{"color": "pink", "score": 0, "places": []},
+                                                      {"color": "red", "score": 0, "places": []}],
+                                          "board": [[1]]})
+
+    def test_round_trip(self):
+        """
+        Purpose: Test that serializing and parsing random states keeps their JSON and their Zobrist hash
+        Signature: Void -> Void
+        """
+        rng = random.Random(11)
+        for _ in range(20):
+            rows, columns = rng.randint(2, 8), rng.randint(2, 8)
+            coords_to_fish = [(coord, rng.randint(0, 5)) for coord in FishBoardModel.create_coords(rows, columns)]
+            board = FishBoardModel.create_with_coords_to_fish(rows, columns, coords_to_fish)
+            tiles = [coord for coord, fish in coords_to_fish if fish]
+            rng.shuffle(tiles)
+            state = FishGameStateFactory.create_move_penguins_state(board,
+                                                                    [(PlayerColor.RED, tiles[:1], rng.randint(0, 9)),
+                                                                     (PlayerColor.BLACK, tiles[1:2], 0)],
+                                                                    turn=rng.choice([PlayerColor.RED,
+                                                                                     PlayerColor.BLACK]),
+                                                                    check_penguin_amount=False)
+            state_json = state_serializer.serialize_state(state)
+            parsed = state_serializer.parse_state(state_json)
+            self.assertEqual(state.get_zobrist_hash(), parsed.get_zobrist_hash())
+            self.assertEqual(state_json, state_serializer.serialize_state(parsed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import random
+import time
+from typing import Callable, Any, List, Tuple, Type
+
+from Fish.Admin.simulator import PairReport
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameStateFactory, FishGameState
+
+
+def create_random_move_state(rng: random.Random, rows: int, columns: int, num_players: int = 2,
+                             hole_chance: float = 0.1, board_class: Type[FishBoardModel] = FishBoardModel
+                             ) -> FishGameState:
+    """
+    Purpose: Create a state in the penguin moving phase with a random board and randomly placed penguins, where the
+             player whose turn it is can move. Every player gets the full 6 - N penguins.
+    Signature: Random Int Int Int Float Class -> FishGameState
+    :param rng: Random number generator used for the fish, holes and penguins so that benchmarks are repeatable
+    :param rows: Amount of rows on the board
+    :param columns: Amount of columns on the board
+    :param num_players: Amount of players in the game
+    :param hole_chance: Chance that any given tile is a hole
+    :param board_class: FishBoardModel or a subclass of it to create the board with
+    :return: A state in the moving phase
+    """
+    colors = FishGameStateFactory.DEFAULT_COLOR_ORDER[:num_players]
+    amount_penguins = 6 - num_players
+    while True:
+        coords = FishBoardModel.create_coords(rows, columns)
+        coords_to_fish = [(coord, 0 if rng.random() < hole_chance else rng.randint(1, 5)) for coord in coords]
+        tiles = [coord for coord, fish in coords_to_fish if fish]
+        if len(tiles) < amount_penguins * num_players:
+            continue
+        rng.shuffle(tiles)
+        board = board_class.create_with_coords_to_fish(rows, columns, coords_to_fish)
+        player_info = [(color, tiles[i * amount_penguins:(i + 1) * amount_penguins], 0)
+                       for i, color in enumerate(colors)]
+        state = FishGameStateFactory.create_move_penguins_state(board, player_info)
+        if FishGameTree(state).get_children_moves():
+            return state
+
+
+def create_random_split_state(rng: random.Random, rows: int, columns: int, num_players: int = 2,
+                              hole_chance: float = 0.15, min_moves: int = 4,
+                              board_class: Type[FishBoardModel] = FishBoardModel) -> FishGameState:
+    """
+    Purpose: Create a state late in a game where the holes have split the board so that no region holds penguins of
+             more than one player (see FishGameState.are_penguins_separated), by making random moves from random
+             states until that happens while the player whose turn it is still has enough moves
+    Signature: Random Int Int Int Float Int Class -> FishGameState
+    :param rng: Random number generator used for the states and the moves
+    :param rows: Amount of rows on the board
+    :param columns: Amount of columns on the board
+    :param num_players: Amount of players in the game
+    :param hole_chance: Chance that any given tile starts as a hole
+    :param min_moves: Least amount of moves the player whose turn it is must have in the state
+    :param board_class: FishBoardModel or a subclass of it to create the board with
+    :return: A state in the moving phase with separated penguins
+    """
+    while True:
+        state = create_random_move_state(rng, rows, columns, num_players, hole_chance, board_class)
+        while state.can_any_player_move():
+            actions = FishGameTree.find_actions_for_state(state)
+            state.apply_move(rng.choice(actions) if actions else None)
+            if state.are_penguins_separated():
+                if len(FishGameTree.find_actions_for_state(state)) >= min_moves:
+                    return state
+                break
+
+
+def time_call(func: Callable[[], Any]) -> Tuple[Any, float]:
+    """
+    Purpose: Call a function and measure how long it took
+    Signature: (Void -> X) -> (X, Float)
+    :param func: Function to call
+    :return: The result of the function and the wall time in seconds that the call took
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+PAIR_FORMAT = '{:>14} {:>14} {:>6} {:>7} {:>7} {:>7} {:>7} {:>7} {:>8} {:>8}'
+
+
+def print_pair_reports(reports: List[PairReport]) -> None:
+    """
+    Purpose: Print the reports of the batch simulator as a table, one row per pair of strategies
+    Signature: List[PairReport] -> Void
+    :param reports: The reports of Simulator.run
+    """
+    print(PAIR_FORMAT.format('first', 'second', 'games', 'wins', 'wins', 'draws', 'fish', 'fish', 'ms/move',
+                             'ms/move'))
+    for report in reports:
+        print(PAIR_FORMAT.format(report.first, report.second, report.games,
+                                 '{:.1%}'.format(report.first_win_rate), '{:.1%}'.format(report.second_win_rate),
+                                 report.draws, '{:.1f}'.format(report.first_fish), '{:.1f}'.format(report.second_fish),
+                                 '{:.2f}'.format(report.first_move_time * 1000),
+                                 '{:.2f}'.format(report.second_move_time * 1000)))
@@ -0,0 +1,95 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.bitboard_fish_board import BitboardFishBoardModel
+from Fish.Other.benchmarks.benchmark_util import create_random_move_state, time_call
+
+"""
+Benchmark of the dictionary board (FishBoardModel) against the bitboard (BitboardFishBoardModel). For each board size
+it times finding the straight lines from every coordinate of a random board with holes, finding the positions
+reachable from every coordinate past the holes and penguins (the moves of a penguin on that coordinate), and finding
+every move of the player whose turn it is in a random state that uses each board, and checks that both boards give the
+same results.
+
+Run from anywhere with: python3 board_benchmark.py [--repeat N]
+"""
+
+ROW_FORMAT = '{:>7} {:>12} {:>10} {:>10} {:>8} {:>6}'
+
+
+def time_straight_lines(board, repeat):
+    """
+    Purpose: Find the straight lines from every coordinate of a board a number of times
+    Signature: FishBoardModel Int -> ([Dict[String, [Coordinate]]], Float)
+    """
+    def find_lines():
+        lines = []
+        for _ in range(repeat):
+            lines = [board.find_straight_line_positions(*coord) for coord in board.get_tile_coords()]
+        return lines
+    return time_call(find_lines)
+
+
+def time_reachable_positions(state, repeat):
+    """
+    Purpose: Find the positions reachable from every coordinate of the board of a state a number of times, where the
+             penguins of the state stop the lines
+    Signature: FishGameState Int -> ([[Coordinate]], Float)
+    """
+    board = state.get_board()
+    penguins = {penguin for color in state.get_player_order() for penguin in state.get_penguins_for_player(color)}
+
+    def find_positions():
+        positions = []
+        for _ in range(repeat):
+            positions = [board.find_reachable_positions(*coord, penguins) for coord in board.get_tile_coords()]
+        return positions
+    return time_call(find_positions)
+
+
+def time_move_generation(state, repeat):
+    """
+    Purpose: Find the moves of the player whose turn it is in a state a number of times
+    Signature: FishGameState Int -> ([Action], Float)
+    """
+    def find_moves():
+        moves = []
+        for _ in range(repeat):
+            moves = FishGameTree.find_actions_for_state(state)
+        return moves
+    return time_call(find_moves)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the dictionary board against the bitboard')
+    parser.add_argument('--repeat', type=int, default=50, help='times each operation is repeated per board')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(ROW_FORMAT.format('board', 'operation', 'dict secs', 'bit secs', 'speedup', 'same'))
+    for rows, columns in [(5, 5), (8, 8), (12, 12), (16, 16)]:
+        # the same seed gives the same tiles and penguins on both boards
+        state = create_random_move_state(random.Random(args.seed), rows, columns)
+        bit_state = create_random_move_state(random.Random(args.seed), rows, columns,
+                                             board_class=BitboardFishBoardModel)
+        size = '{}x{}'.format(rows, columns)
+        comparisons = [
+            ('lines', time_straight_lines(state.get_board(), args.repeat),
+             time_straight_lines(bit_state.get_board(), args.repeat)),
+            ('reachable', time_reachable_positions(state, args.repeat),
+             time_reachable_positions(bit_state, args.repeat)),
+            ('moves', time_move_generation(state, args.repeat),
+             time_move_generation(bit_state, args.repeat)),
+        ]
+        for operation, (dict_result, dict_seconds), (bit_result, bit_seconds) in comparisons:
+            print(ROW_FORMAT.format(size, operation, '{:.3f}'.format(dict_seconds), '{:.3f}'.format(bit_seconds),
+                                    '{:.1f}x'.format(dict_seconds / bit_seconds), str(dict_result == bit_result)))
+
+
+if __name__ == '__main__':
+    main()
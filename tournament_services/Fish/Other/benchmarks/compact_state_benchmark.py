@@ -0,0 +1,138 @@
+import argparse
+import copy
+import os
+import pickle
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.compact_game_state import CompactFishState
+from Fish.Other.benchmarks.benchmark_util import create_random_move_state, time_call
+
+"""
+Benchmark of CompactFishState against FishGameState. For each board size it keeps a number of states of a random game
+in memory, as copies of the FishGameState and as CompactFishStates reached with apply_move, and reports the bytes
+allocated per state. It then reports the pickled size of a state in both representations and the time to pickle and
+unpickle it a number of times, which is what sending a state to a worker process costs, and checks that both give
+back the same state.
+
+Run from anywhere with: python3 compact_state_benchmark.py [--states N] [--repeat N]
+"""
+
+ROW_FORMAT = '{:>7} {:>8} {:>12} {:>12} {:>12} {:>6}'
+
+"""
+Marks the place in a list of actions where a random game ended and the next one starts again from the first state
+"""
+RESTART = 'restart'
+
+
+def measure_memory(make_states):
+    """
+    Purpose: Measure the bytes allocated per state by a function that creates a list of states
+    Signature: (Void -> [Any]) -> Float
+    """
+    tracemalloc.start()
+    states = make_states()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(states)
+
+
+def walk_game(state, rng, amount):
+    """
+    Purpose: Make random moves from a state, starting over from the state when the game ends, and collect the
+             actions of the moves. The state is put back the way it was at the end.
+    Signature: FishGameState Random Int -> [Maybe[Action] or RESTART]
+    """
+    actions = []
+    record_stack = []
+    while len(actions) < amount:
+        if not state.can_any_player_move():
+            while record_stack:
+                state.undo_move(record_stack.pop())
+            actions.append(RESTART)
+            continue
+        moves = FishGameTree.find_actions_for_state(state)
+        action = rng.choice(moves) if moves else None
+        record_stack.append(state.apply_move(action))
+        actions.append(action)
+    while record_stack:
+        state.undo_move(record_stack.pop())
+    return actions
+
+
+def keep_states(state, actions):
+    """
+    Purpose: Keep a copy of the state after every action
+    Signature: FishGameState [Maybe[Action] or RESTART] -> [FishGameState]
+    """
+    states = []
+    current = copy.deepcopy(state)
+    for action in actions:
+        if action == RESTART:
+            current = copy.deepcopy(state)
+        else:
+            current.apply_move(action)
+        states.append(copy.deepcopy(current))
+    return states
+
+
+def keep_compact_states(state, actions):
+    """
+    Purpose: Keep the compact state after every action
+    Signature: FishGameState [Maybe[Action] or RESTART] -> [CompactFishState]
+    """
+    root = CompactFishState.from_state(state)
+    states = []
+    current = root
+    for action in actions:
+        current = root if action == RESTART else current.apply_move(action)
+        states.append(current)
+    return states
+
+
+def time_pickle(state, repeat):
+    """
+    Purpose: Pickle and unpickle a state a number of times
+    Signature: Any Int -> ((Int, Any), Float)
+    """
+    def round_trip():
+        data, loaded = b'', None
+        for _ in range(repeat):
+            data = pickle.dumps(state)
+            loaded = pickle.loads(data)
+        return len(data), loaded
+    return time_call(round_trip)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compact game states against game states')
+    parser.add_argument('--states', type=int, default=2000, help='states kept in memory per board size')
+    parser.add_argument('--repeat', type=int, default=1000, help='times a state is pickled and unpickled')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(ROW_FORMAT.format('board', 'state', 'bytes/state', 'pickle bytes', 'pickle secs', 'same'))
+    for rows, columns in [(5, 5), (8, 8), (12, 12)]:
+        rng = random.Random(args.seed)
+        state = create_random_move_state(rng, rows, columns)
+        actions = walk_game(state, rng, args.states)
+        compact = CompactFishState.from_state(state)
+        size = '{}x{}'.format(rows, columns)
+        for name, make_states, pickled, same in [
+                ('full', lambda: keep_states(state, actions), state,
+                 lambda loaded: loaded.get_zobrist_hash() == state.get_zobrist_hash()),
+                ('compact', lambda: keep_compact_states(state, actions), compact,
+                 lambda loaded: loaded.to_state().get_zobrist_hash() == state.get_zobrist_hash())]:
+            bytes_per_state = measure_memory(make_states)
+            (pickle_bytes, loaded), seconds = time_pickle(pickled, args.repeat)
+            print(ROW_FORMAT.format(size, name, '{:.0f}'.format(bytes_per_state), pickle_bytes,
+                                    '{:.3f}'.format(seconds), str(same(loaded))))
+
+
+if __name__ == '__main__':
+    main()
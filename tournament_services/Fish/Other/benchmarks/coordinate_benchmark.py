@@ -0,0 +1,97 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.types import Coordinate
+from Fish.Other.benchmarks.benchmark_util import time_call
+
+"""
+Micro-benchmark of checking coordinates on a FishBoardModel. It times finding the straight lines from every coordinate
+of random 10x10 boards, and sorting the coordinates row by row, on the board as it is and on a board that checks
+coordinates against the list of coordinates and sorts on every call like FishBoardModel used to.
+
+Run from anywhere with: python3 coordinate_benchmark.py [--boards N] [--repeat N]
+"""
+
+ROW_FORMAT = '{:>16} {:>10} {:>10} {:>8} {:>6}'
+
+
+class ListCheckedFishBoardModel(FishBoardModel):
+    """
+    A FishBoardModel that checks whether coordinates are on the board by searching its list of coordinates and sorts
+    its coordinates on every call, which is how FishBoardModel worked before it kept a set and a sorted list
+    """
+
+    def _check_xy_position(self, coordinate: Coordinate, inside_board=True) -> None:
+        if coordinate not in self.coords and inside_board:
+            raise ValueError('column, row must be inside of the board coordinates')
+
+    def get_coords_sorted_by_row(self):
+        return self.sort_coords_by_row(self.coords)
+
+
+def create_boards(board_class, seed, amount, rows, columns):
+    """
+    Purpose: Create random boards with holes, where the same seed gives the same boards for any board class
+    Signature: Class Int Int Int Int -> [FishBoardModel]
+    """
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(amount):
+        coords_to_fish = [(coord, 0 if rng.random() < 0.1 else rng.randint(1, 5))
+                          for coord in FishBoardModel.create_coords(rows, columns)]
+        boards.append(board_class.create_with_coords_to_fish(rows, columns, coords_to_fish))
+    return boards
+
+
+def time_straight_lines(boards, repeat):
+    """
+    Purpose: Find the straight lines from every coordinate of some boards a number of times
+    Signature: [FishBoardModel] Int -> ([Dict[String, [Coordinate]]], Float)
+    """
+    def find_lines():
+        lines = []
+        for _ in range(repeat):
+            lines = [board.find_straight_line_positions(*coord) for board in boards for coord in board.coords]
+        return lines
+    return time_call(find_lines)
+
+
+def time_sorted_coords(boards, repeat):
+    """
+    Purpose: Get the coordinates of some boards sorted row by row a number of times
+    Signature: [FishBoardModel] Int -> ([[Coordinate]], Float)
+    """
+    def sort_coords():
+        sorted_coords = []
+        for _ in range(repeat):
+            sorted_coords = [board.get_coords_sorted_by_row() for board in boards]
+        return sorted_coords
+    return time_call(sort_coords)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark checking coordinates on 10x10 boards')
+    parser.add_argument('--boards', type=int, default=10, help='random boards to time')
+    parser.add_argument('--repeat', type=int, default=10, help='times each operation is repeated per board')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    boards = create_boards(FishBoardModel, args.seed, args.boards, 10, 10)
+    list_boards = create_boards(ListCheckedFishBoardModel, args.seed, args.boards, 10, 10)
+    print(ROW_FORMAT.format('operation', 'list secs', 'set secs', 'speedup', 'same'))
+    comparisons = [
+        ('straight lines', time_straight_lines(list_boards, args.repeat), time_straight_lines(boards, args.repeat)),
+        ('sorted coords', time_sorted_coords(list_boards, args.repeat), time_sorted_coords(boards, args.repeat)),
+    ]
+    for operation, (list_result, list_seconds), (set_result, set_seconds) in comparisons:
+        print(ROW_FORMAT.format(operation, '{:.4f}'.format(list_seconds), '{:.4f}'.format(set_seconds),
+                                '{:.1f}x'.format(list_seconds / set_seconds), str(list_result == set_result)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Admin.simulator import Simulator
+from Fish.Common.representations.bitboard_fish_board import BitboardFishBoardModel
+from Fish.Other.benchmarks.benchmark_util import create_random_split_state, print_pair_reports, time_call
+from Fish.Other.benchmarks.search_benchmark import NodeCounter
+from Fish.Player.endgame_solver import FishEndgameSolver
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.transposition_table import TranspositionTable
+
+"""
+Benchmark of the endgame solver (see FishEndgameSolver). First it searches random late positions, where holes have split
+the board between the players, to the end of the game with alpha-beta and a transposition table, with and without the
+solver, and reports the nodes visited and the wall time and whether both searches found the same move. Then it plays
+games in the batch simulator between alpha-beta searches of the same depth with and without the solver, which shows
+what checking every node for a split board costs over a whole game and how often it pays off.
+
+Run from anywhere with: python3 endgame_benchmark.py [--positions N] [--games N] [--depth N]
+"""
+
+ROW_FORMAT = '{:>6} {:>10} {:>10} {:>10} {:>6}'
+
+"""
+Turns looked ahead from the late positions, which is enough to reach the end of the game in every one of them
+"""
+END_DEPTH = 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the endgame solver in searches and in games')
+    parser.add_argument('--positions', type=int, default=5, help='random late positions per board size')
+    parser.add_argument('--games', type=int, default=20, help='games played with and without the solver')
+    parser.add_argument('--depth', type=int, default=3, help='look-ahead turns of the strategies in the games')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(ROW_FORMAT.format('board', 'search', 'nodes', 'seconds', 'same'))
+    for rows, columns in [(4, 5), (5, 5)]:
+        rng = random.Random(args.seed)
+        states = [create_random_split_state(rng, rows, columns, board_class=BitboardFishBoardModel)
+                  for _ in range(args.positions)]
+        plain_actions = None
+        for name, solver in [('ab+tt', None), ('ab+tt+end', FishEndgameSolver())]:
+            actions = []
+            with NodeCounter() as counter:
+                for state in states:
+                    strategy = FishBasicStrategy(END_DEPTH, use_alpha_beta=True,
+                                                 transposition_table=TranspositionTable(), endgame_solver=solver)
+                    action, seconds = time_call(lambda: strategy.find_next_move(state))
+                    actions.append((action, seconds))
+            same = '-' if plain_actions is None else str([a for a, _ in actions] == plain_actions)
+            plain_actions = plain_actions or [action for action, _ in actions]
+            print(ROW_FORMAT.format('{}x{}'.format(rows, columns), name, counter.count,
+                                    '{:.3f}'.format(sum(seconds for _, seconds in actions)), same))
+
+    strategies = {
+        'ab-{}'.format(args.depth): FishBasicStrategy(args.depth, use_alpha_beta=True),
+        'ab-{}+end'.format(args.depth): FishBasicStrategy(args.depth, use_alpha_beta=True,
+                                                          endgame_solver=FishEndgameSolver()),
+    }
+    simulator = Simulator(ExecutionMode.SEQUENTIAL, rows=5, columns=5, holes=5)
+    reports, seconds = time_call(lambda: simulator.run(strategies, args.games, args.seed))
+    print()
+    print_pair_reports(reports)
+    print('{} games in {:.1f} seconds'.format(sum(report.games for report in reports), seconds))
+
+
+if __name__ == '__main__':
+    main()
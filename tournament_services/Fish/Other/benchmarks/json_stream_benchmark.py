@@ -0,0 +1,85 @@
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Other.benchmarks.benchmark_util import create_random_move_state, time_call
+from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
+from Fish.Remote.json_stream import JSONStreamDecoder
+
+"""
+Benchmark of JSONStreamDecoder on the messages of the remote protocol. For each board size it builds a stream of
+take-turn messages with a random state, each followed by a short playing-with message, and decodes it in reads of
+a fixed size, as a socket would return it. It reports the size of a take-turn message (a single read of 2048 bytes,
+like the client used to do, cuts off anything larger), the messages and megabytes decoded per second, and the same
+for a decoder that joins the reads into one string and slices decoded values off its front with raw_decode, like
+parse_json_objects does.
+
+Run from anywhere with: python3 json_stream_benchmark.py [--messages N] [--chunk-size BYTES]
+"""
+
+ROW_FORMAT = '{:>6} {:>10} {:>8} {:>10} {:>8} {:>10} {:>8} {:>6}'
+
+
+def decode_stream(data, chunk_size):
+    """
+    Purpose: Decode a stream with JSONStreamDecoder in reads of a fixed size
+    Signature: Bytes Int -> [Any]
+    """
+    decoder = JSONStreamDecoder()
+    values = []
+    for i in range(0, len(data), chunk_size):
+        decoder.feed(data[i:i + chunk_size])
+        while decoder.has_value():
+            values.append(decoder.next_value())
+    return values
+
+
+def decode_stream_by_slicing(data, chunk_size):
+    """
+    Purpose: Decode a stream by joining the reads into one string and slicing every decoded value off its front
+    Signature: Bytes Int -> [Any]
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    values = []
+    for i in range(0, len(data), chunk_size):
+        buffer += data[i:i + chunk_size].decode('utf-8')
+        while buffer:
+            try:
+                value, index = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                break
+            values.append(value)
+            buffer = buffer[index:].lstrip()
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark decoding streams of remote protocol messages')
+    parser.add_argument('--messages', type=int, default=1000, help='take-turn messages per stream')
+    parser.add_argument('--chunk-size', type=int, default=4096, help='bytes returned by each read')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(ROW_FORMAT.format('board', 'msg bytes', 'msgs', 'msgs/s', 'MB/s', 'slice/s', 'MB/s', 'same'))
+    for size in [5, 10, 20, 40]:
+        state = create_random_move_state(rng, size, size, num_players=4)
+        take_turn = json.dumps(["take-turn", [THHelper.convert_state_to_json(state), []]])
+        playing_with = json.dumps(["playing-with", ["white", "brown", "black"]])
+        data = ((take_turn + playing_with) * args.messages).encode('utf-8')
+        values, seconds = time_call(lambda: decode_stream(data, args.chunk_size))
+        sliced_values, sliced_seconds = time_call(lambda: decode_stream_by_slicing(data, args.chunk_size))
+        megabytes = len(data) / 2 ** 20
+        print(ROW_FORMAT.format('{}x{}'.format(size, size), len(take_turn), len(values),
+                                '{:.0f}'.format(len(values) / seconds), '{:.1f}'.format(megabytes / seconds),
+                                '{:.0f}'.format(len(sliced_values) / sliced_seconds),
+                                '{:.1f}'.format(megabytes / sliced_seconds), str(values == sliced_values)))
+
+
+if __name__ == '__main__':
+    main()
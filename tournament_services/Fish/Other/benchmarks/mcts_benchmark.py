@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Admin.simulator import Simulator
+from Fish.Other.benchmarks.benchmark_util import print_pair_reports, time_call
+from Fish.Player.mcts_strategy import FishMCTSStrategy
+from Fish.Player.rollout_policy import RolloutPolicy
+from Fish.Player.strategy import FishBasicStrategy
+
+"""
+Benchmark of the Monte Carlo tree search strategy (see FishMCTSStrategy) against FishBasicStrategy, played in the batch
+simulator. Every MCTS strategy runs a fixed amount of playouts per move, so that the results do not depend on the
+machine, with random and with greedy rollouts. The table shows the win rates, average fish and milliseconds per move of
+every pair of strategies.
+
+Run from anywhere with: python3 mcts_benchmark.py [--games N] [--playouts N] [--size N] [--workers N]
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the MCTS strategy against the maximin strategy')
+    parser.add_argument('--games', type=int, default=40, help='games played by every pair of strategies')
+    parser.add_argument('--playouts', type=int, default=200, help='playouts of the MCTS strategies per move')
+    parser.add_argument('--size', type=int, default=6, help='rows and columns of the boards')
+    parser.add_argument('--holes', type=int, default=3, help='random holes on every board')
+    parser.add_argument('--workers', type=int, default=None, help='processes, default of the pool if unset')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    strategies = {
+        'maximin-1': FishBasicStrategy(1),
+        'alpha-beta-2': FishBasicStrategy(2, use_alpha_beta=True),
+        'mcts-random': FishMCTSStrategy(playouts=args.playouts, seed=args.seed),
+        'mcts-greedy': FishMCTSStrategy(playouts=args.playouts, rollout_policy=RolloutPolicy.GREEDY, seed=args.seed),
+    }
+    simulator = Simulator(ExecutionMode.PROCESS, max_workers=args.workers, rows=args.size, columns=args.size,
+                          holes=args.holes)
+    reports, seconds = time_call(lambda: simulator.run(strategies, args.games, args.seed))
+    print_pair_reports(reports)
+    print('{} games in {:.1f} seconds'.format(sum(report.games for report in reports), seconds))
+
+
+if __name__ == '__main__':
+    main()
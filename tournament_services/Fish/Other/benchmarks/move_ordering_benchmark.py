@@ -0,0 +1,69 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Other.benchmarks.benchmark_util import create_random_move_state
+from Fish.Other.benchmarks.search_benchmark import run_search
+from Fish.Player.move_ordering import FishOnDestinationOrdering, KillerMoveOrdering, HistoryOrdering, \
+    create_default_move_ordering
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.transposition_table import TranspositionTable
+
+"""
+Benchmark of the move orderings of the alpha-beta search of FishBasicStrategy. For each look-ahead depth it reports the
+amount of nodes visited and the wall time needed to find moves on random boards with every ordering, with and without
+a transposition table, and checks that every ordering picks the same actions as the search without an ordering. One
+strategy is used for all positions of a depth, so that killer moves and history carry over between moves like they do
+in a game.
+
+Run from anywhere with: python3 move_ordering_benchmark.py [--positions N] [--max-depth N]
+"""
+
+ROW_FORMAT = '{:>6} {:>10} {:>6} {:>10} {:>10} {:>6}'
+
+"""
+The orderings that are benchmarked, as pairs of a name and a function creating a new ordering or None
+"""
+ORDERINGS = [
+    ('none', lambda: None),
+    ('fish', FishOnDestinationOrdering),
+    ('killer', KillerMoveOrdering),
+    ('history', HistoryOrdering),
+    ('default', create_default_move_ordering),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the move orderings of the alpha-beta search')
+    parser.add_argument('--positions', type=int, default=5, help='random positions per depth')
+    parser.add_argument('--rows', type=int, default=5)
+    parser.add_argument('--columns', type=int, default=5)
+    parser.add_argument('--max-depth', type=int, default=3, help='deepest look-ahead in turns')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    states = [create_random_move_state(rng, args.rows, args.columns) for _ in range(args.positions)]
+    print(ROW_FORMAT.format('depth', 'ordering', 'tt', 'nodes', 'seconds', 'same'))
+    for depth in range(1, args.max_depth + 1):
+        for use_table in [False, True]:
+            expected_actions = None
+            for name, create_ordering in ORDERINGS:
+                table = TranspositionTable() if use_table else None
+                strategy = FishBasicStrategy(depth, use_alpha_beta=True, transposition_table=table,
+                                             move_ordering=create_ordering())
+                results = [run_search(strategy, state) for state in states]
+                actions = [action for action, _, _ in results]
+                if expected_actions is None:
+                    expected_actions = actions
+                print(ROW_FORMAT.format(depth, name, 'yes' if use_table else 'no',
+                                        sum(nodes for _, nodes, _ in results),
+                                        '{:.3f}'.format(sum(seconds for _, _, seconds in results)),
+                                        str(actions == expected_actions)))
+
+
+if __name__ == '__main__':
+    main()
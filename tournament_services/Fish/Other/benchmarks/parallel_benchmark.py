@@ -0,0 +1,53 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Other.benchmarks.benchmark_util import create_random_move_state, time_call
+from Fish.Player.parallel_strategy import FishRootParallelStrategy
+from Fish.Player.strategy import FishBasicStrategy
+
+"""
+Benchmark of the root-parallel search of FishRootParallelStrategy. For each amount of workers it reports the wall time
+needed to find moves on random boards and the speedup compared to the sequential FishBasicStrategy with the same
+search, and checks that the moves are the same. The worker processes are started before timing, as a strategy keeps
+them between moves.
+
+Run from anywhere with: python3 parallel_benchmark.py [--positions N] [--depth N] [--workers N [N ...]]
+"""
+
+ROW_FORMAT = '{:>8} {:>8} {:>10} {:>8} {:>6}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the root-parallel search of our strategy')
+    parser.add_argument('--positions', type=int, default=3, help='random positions to find moves for')
+    parser.add_argument('--rows', type=int, default=5)
+    parser.add_argument('--columns', type=int, default=5)
+    parser.add_argument('--depth', type=int, default=2, help='look-ahead in turns')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count()],
+                        help='amounts of worker processes to time')
+    parser.add_argument('--alpha-beta', action='store_true', help='search with alpha-beta instead of maximin')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    states = [create_random_move_state(rng, args.rows, args.columns) for _ in range(args.positions)]
+    sequential = FishBasicStrategy(args.depth, use_alpha_beta=args.alpha_beta)
+    expected_actions, sequential_seconds = time_call(lambda: [sequential.find_next_move(state) for state in states])
+
+    print('{} cpus'.format(os.cpu_count()))
+    print(ROW_FORMAT.format('workers', 'search', 'seconds', 'speedup', 'same'))
+    print(ROW_FORMAT.format('-', 'serial', '{:.3f}'.format(sequential_seconds), '1.0x', 'True'))
+    for workers in sorted(set(args.workers)):
+        with FishRootParallelStrategy(args.depth, workers=workers, use_alpha_beta=args.alpha_beta) as strategy:
+            strategy.find_next_move(states[0])
+            actions, seconds = time_call(lambda: [strategy.find_next_move(state) for state in states])
+        print(ROW_FORMAT.format(workers, 'parallel', '{:.3f}'.format(seconds),
+                                '{:.1f}x'.format(sequential_seconds / seconds), str(actions == expected_actions)))
+
+
+if __name__ == '__main__':
+    main()
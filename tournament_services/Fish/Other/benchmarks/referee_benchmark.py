@@ -0,0 +1,89 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Admin.referee import Referee
+from Fish.Other.benchmarks.benchmark_util import time_call
+from Fish.Player.player import BasicPlayer
+
+"""
+Benchmark of the turns per second a referee runs when it gives players a copy of the state on every turn and when it
+gives players that accept one a read-only view of the state (see FishGameStateView). It plays whole games on several
+board sizes with cheap players that make the first move they find, where copying the state is most of the work of a
+turn, and with BasicPlayer, and checks that both ways give the same winners and final state.
+
+Run from anywhere with: python3 referee_benchmark.py [--games N] [--players N]
+"""
+
+ROW_FORMAT = '{:>6} {:>6} {:>6} {:>11} {:>11} {:>8} {:>6}'
+
+
+class CountingPlayer(BasicPlayer):
+    """
+    A BasicPlayer that counts its turns, and with first_move makes the first move it finds instead of searching
+    """
+
+    def __init__(self, first_move: bool):
+        super().__init__()
+        self.first_move = first_move
+        self.turns = 0
+
+    def player_place_penguin(self, state):
+        self.turns += 1
+        return super().player_place_penguin(state)
+
+    def player_move_penguin(self, state):
+        self.turns += 1
+        if not self.first_move:
+            return super().player_move_penguin(state)
+        for penguin in state.get_penguins_for_player(state.get_current_turn()):
+            moves = state.find_valid_moves_from_pos(penguin)
+            if moves:
+                return penguin, moves[0]
+
+
+def run_games(size, args, first_move, state_views):
+    """
+    Purpose: Run the same games with a referee that does or does not give state views
+    Signature: Int Namespace Bool Bool -> ([(List[PlayerColor], ZobristHash)], Int, Float)
+    :return: The winners and final Zobrist hash of every game, the amount of turns and the seconds they took
+    """
+    results = []
+    turns = 0
+    seconds = 0.0
+    for game in range(args.games):
+        # the referee makes a random board, so the same seed gives both ways the same games
+        random.seed(args.seed + game)
+        players = [CountingPlayer(first_move) for _ in range(args.players)]
+        referee = Referee(state_views=state_views)
+        _, game_seconds = time_call(lambda: referee.initialize_and_run_game(
+            size, size, [(player, age) for age, player in enumerate(players)]))
+        results.append((referee.winners, referee.current_game_state.get_zobrist_hash()))
+        turns += sum(player.turns for player in players)
+        seconds += game_seconds
+    return results, turns, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark referee turns with state copies and state views')
+    parser.add_argument('--games', type=int, default=2, help='games played on each board')
+    parser.add_argument('--players', type=int, default=4, help='players in each game')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(ROW_FORMAT.format('player', 'board', 'turns', 'copy t/s', 'view t/s', 'speedup', 'same'))
+    for name, first_move in [('first', True), ('basic', False)]:
+        for size in [5, 10, 20]:
+            copy_results, turns, copy_seconds = run_games(size, args, first_move, False)
+            view_results, _, view_seconds = run_games(size, args, first_move, True)
+            print(ROW_FORMAT.format(name, '{}x{}'.format(size, size), turns,
+                                    '{:.0f}'.format(turns / copy_seconds), '{:.0f}'.format(turns / view_seconds),
+                                    '{:.1f}x'.format(copy_seconds / view_seconds),
+                                    str(copy_results == view_results)))
+
+
+if __name__ == '__main__':
+    main()
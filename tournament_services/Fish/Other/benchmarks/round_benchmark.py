@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Admin.round_executor import RoundExecutor
+from Fish.Player.player import BasicPlayer
+
+"""
+Benchmark of running the games of a tournament round with each ExecutionMode of RoundExecutor. For each mode it
+reports the wall time of the round against the summed time of its games (their ratio is how many games ran at once
+on average; with threads the games also slow each other down, so the summed game time grows), the speedup of the round
+compared to running the games one after another, and checks that every table has the same winners in every mode.
+
+Run from anywhere with: python3 round_benchmark.py [--tables N] [--depth N] [--workers N]
+"""
+
+ROW_FORMAT = '{:>11} {:>7} {:>10} {:>10} {:>8} {:>8} {:>6}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark running the games of a round concurrently')
+    parser.add_argument('--tables', type=int, default=8, help='games in the round')
+    parser.add_argument('--depth', type=int, default=1, help='look-ahead in turns of the players')
+    parser.add_argument('--workers', type=int, default=None, help='threads or processes, default of the pool if unset')
+    args = parser.parse_args()
+
+    allocations = [[(BasicPlayer(args.depth), table * 4 + i) for i in range(4)] for table in range(args.tables)]
+    print('{} cpus'.format(os.cpu_count()))
+    print(ROW_FORMAT.format('mode', 'games', 'wall secs', 'game secs', 'overlap', 'speedup', 'same'))
+    expected_winners = None
+    sequential_seconds = None
+    for mode in ExecutionMode:
+        executor = RoundExecutor(mode, max_workers=args.workers)
+        rounds = executor.run_round(allocations)
+        winners = {table: [referee.players[color] for color in referee.winners] for table, referee in rounds.items()}
+        if expected_winners is None:
+            expected_winners = winners
+        report = executor.reports[-1]
+        if sequential_seconds is None:
+            sequential_seconds = report.wall_time
+        print(ROW_FORMAT.format(mode.value, report.games - len(report.failures),
+                                '{:.3f}'.format(report.wall_time), '{:.3f}'.format(report.game_time),
+                                '{:.1f}x'.format(report.game_time / report.wall_time),
+                                '{:.1f}x'.format(sequential_seconds / report.wall_time),
+                                str(winners == expected_winners)))
+
+
+if __name__ == '__main__':
+    main()
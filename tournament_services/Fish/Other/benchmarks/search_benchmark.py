@@ -0,0 +1,114 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Other.benchmarks.benchmark_util import create_random_move_state, time_call
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.transposition_table import TranspositionTable
+
+"""
+Benchmark of the searches of FishBasicStrategy: plain maximin, alpha-beta, and alpha-beta with a transposition table.
+For each board size and look-ahead depth it reports the amount of game tree nodes visited and the wall time needed to
+find a move, and checks that every search picks the same action as maximin. Searches that took longer than the budget
+at one depth are skipped at the deeper depths.
+
+Run from anywhere with: python3 search_benchmark.py [--positions N] [--budget SECONDS]
+"""
+
+ROW_FORMAT = '{:>6} {:>6} {:>10} {:>10} {:>10} {:>6} {:>9}'
+
+"""
+The searches that are benchmarked, as pairs of a name and a function from a look-ahead depth to a new strategy
+"""
+SEARCHES = [
+    ('maximin', lambda depth: FishBasicStrategy(depth)),
+    ('ab', lambda depth: FishBasicStrategy(depth, use_alpha_beta=True)),
+    ('ab+tt', lambda depth: FishBasicStrategy(depth, use_alpha_beta=True, transposition_table=TranspositionTable())),
+]
+
+
+class NodeCounter(object):
+    """
+    Context manager that counts how many nodes of the game tree are visited while it is active. The maximin search
+    visits a node by creating a FishGameTree for it, while the alpha-beta search visits a node by applying its move
+    to a state in place.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._original_init = FishGameTree.__init__
+        self._original_apply_move = FishGameState.apply_move
+
+    def __enter__(self):
+        counter = self
+        original_init = self._original_init
+        original_apply_move = self._original_apply_move
+
+        def counting_init(tree, *args, **kwargs):
+            counter.count += 1
+            original_init(tree, *args, **kwargs)
+
+        def counting_apply_move(state, *args, **kwargs):
+            counter.count += 1
+            return original_apply_move(state, *args, **kwargs)
+
+        FishGameTree.__init__ = counting_init
+        FishGameState.apply_move = counting_apply_move
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        FishGameTree.__init__ = self._original_init
+        FishGameState.apply_move = self._original_apply_move
+
+
+def run_search(strategy, state):
+    """
+    Purpose: Find a move with a strategy, counting the nodes visited and the time taken
+    Signature: FishBasicStrategy FishGameState -> (Action, Int, Float)
+    """
+    with NodeCounter() as counter:
+        action, seconds = time_call(lambda: strategy.find_next_move(state))
+    return action, counter.count, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the maximin and alpha-beta searches of our strategy')
+    parser.add_argument('--positions', type=int, default=3, help='random positions per board size')
+    parser.add_argument('--budget', type=float, default=30.0,
+                        help='seconds a search may take before deeper depths of that search are skipped')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(ROW_FORMAT.format('board', 'depth', 'search', 'nodes', 'seconds', 'same', 'tt hits'))
+    for rows, columns in [(5, 5), (8, 8)]:
+        rng = random.Random(args.seed)
+        states = [create_random_move_state(rng, rows, columns) for _ in range(args.positions)]
+        skipped = set()
+        for depth in range(1, 5):
+            maximin_actions = None
+            for name, create_strategy in SEARCHES:
+                if name in skipped:
+                    continue
+                strategy = create_strategy(depth)
+                results = [run_search(strategy, state) for state in states]
+                actions = [action for action, _, _ in results]
+                nodes = sum(nodes for _, nodes, _ in results)
+                seconds = sum(seconds for _, _, seconds in results)
+                if name == 'maximin':
+                    maximin_actions = actions
+                same = '-' if maximin_actions is None else str(actions == maximin_actions)
+                table = strategy.transposition_table
+                hit_rate = '-' if table is None else '{:.1%}'.format(table.hit_rate())
+                print(ROW_FORMAT.format('{}x{}'.format(rows, columns), depth, name, nodes,
+                                        '{:.3f}'.format(seconds), same, hit_rate))
+                if seconds > args.budget:
+                    skipped.add(name)
+
+
+if __name__ == '__main__':
+    main()
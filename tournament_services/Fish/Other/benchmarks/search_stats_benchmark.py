@@ -0,0 +1,77 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Common.search_activity import SearchActivity
+from Fish.Other.benchmarks.benchmark_util import create_random_move_state, time_call
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.transposition_table import TranspositionTable
+
+"""
+Benchmark of the search stats of FishBasicStrategy (see SearchStats). For the maximin search, alpha-beta and alpha-beta
+with a transposition table it finds moves in random positions with and without collecting stats, and reports the wall
+time of both, how much of the time with stats was spent on each SearchActivity, the nodes, cutoffs and average
+branching factor of the searches, and whether both found the same moves.
+
+Run from anywhere with: python3 search_stats_benchmark.py [--positions N] [--depth N] [--size N]
+"""
+
+ROW_FORMAT = '{:>8} {:>9} {:>9} {:>8} {:>8} {:>8} {:>8} {:>8} {:>8} {:>6} {:>6}'
+
+"""
+The searches that are benchmarked, as pairs of a name and a function from a look-ahead depth and whether to collect
+stats to a new strategy
+"""
+SEARCHES = [
+    ('maximin', lambda depth, stats: FishBasicStrategy(depth, collect_stats=stats)),
+    ('ab', lambda depth, stats: FishBasicStrategy(depth, use_alpha_beta=True, collect_stats=stats)),
+    ('ab+tt', lambda depth, stats: FishBasicStrategy(depth, use_alpha_beta=True,
+                                                     transposition_table=TranspositionTable(), collect_stats=stats)),
+]
+
+
+def find_moves(strategy, states):
+    """
+    Purpose: Find a move in every state with a strategy, collecting the stats of every search if it has any
+    Signature: FishBasicStrategy [FishGameState] -> ([Action], [SearchStats])
+    """
+    actions = []
+    all_stats = []
+    for state in states:
+        actions.append(strategy.find_next_move(state))
+        if strategy.last_stats is not None:
+            all_stats.append(strategy.last_stats)
+    return actions, all_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark collecting the stats of the searches of our strategy')
+    parser.add_argument('--positions', type=int, default=3, help='random positions to find moves in')
+    parser.add_argument('--depth', type=int, default=2, help='look-ahead turns of the searches')
+    parser.add_argument('--size', type=int, default=5, help='rows and columns of the random boards')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    states = [create_random_move_state(rng, args.size, args.size) for _ in range(args.positions)]
+    print(ROW_FORMAT.format('search', 'off secs', 'on secs', 'movegen', 'copy', 'apply', 'eval',
+                            'nodes', 'cutoffs', 'branch', 'same'))
+    for name, create_strategy in SEARCHES:
+        (actions, _), off_seconds = time_call(lambda: find_moves(create_strategy(args.depth, False), states))
+        (stats_actions, all_stats), on_seconds = time_call(lambda: find_moves(create_strategy(args.depth, True),
+                                                                              states))
+        total = sum(stats.total_seconds for stats in all_stats)
+        shares = ['{:.0%}'.format(sum(stats.seconds[activity] for stats in all_stats) / total)
+                  for activity in SearchActivity]
+        expanded = sum(stats.expanded for stats in all_stats)
+        branching = sum(stats.get_average_branching_factor() * stats.expanded for stats in all_stats) / expanded
+        print(ROW_FORMAT.format(name, '{:.3f}'.format(off_seconds), '{:.3f}'.format(on_seconds), *shares,
+                                sum(stats.nodes for stats in all_stats), sum(stats.cutoffs for stats in all_stats),
+                                '{:.1f}'.format(branching), str(actions == stats_actions)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Common.representations import state_serializer
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Other.benchmarks.benchmark_util import create_random_move_state, time_call
+from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
+
+"""
+Benchmark of state_serializer against the conversions TestHarnessTransformationHelper used before it, which copied the
+board to serialize it and checked every coordinate while parsing. It round trips the states and boards of the JSON
+fixtures in tournament_services/*/Tests, and random states of larger boards like a server sends, and reports the
+microseconds per serialize and parse of each and whether both give the same JSON and the same Zobrist hash.
+
+Run from anywhere with: python3 serializer_benchmark.py [--repeat N]
+"""
+
+ROW_FORMAT = '{:>10} {:>6} {:>10} {:>10} {:>8} {:>10} {:>10} {:>8} {:>6}'
+FIXTURES = os.path.join(os.path.dirname(__file__), '..', '..', '..', '*', 'Tests', '*.json')
+
+
+def old_parse_board(board_json):
+    """
+    Purpose: Parse a board the way TestHarnessTransformationHelper used to
+    Signature: BoardJSON -> FishBoardModel
+    """
+    coords_to_holes = []
+    for i, row in enumerate(board_json):
+        for j, val in enumerate(row):
+            x_coord = 2 * j if i % 2 == 0 else 1 + 2 * j
+            coords_to_holes.append(((x_coord, i), val))
+    amount_cols = max([len(row) for row in board_json])
+    return FishBoardModel.create_with_coords_to_fish(len(board_json), amount_cols, coords_to_holes)
+
+
+def old_serialize_board(board):
+    """
+    Purpose: Serialize a board the way TestHarnessTransformationHelper used to
+    Signature: FishBoardModel -> BoardJSON
+    """
+    overall_board = []
+    current_row = []
+    current_row_y = 0
+    for x, y in board.get_coords_sorted_by_row():
+        if y != current_row_y:
+            overall_board.append(current_row)
+            current_row = []
+            current_row_y = y
+        tile = board.get_tile_at_coord(x, y)
+        current_row.append(tile.num_fish if tile else 0)
+    overall_board.append(current_row)
+    return overall_board
+
+
+def old_parse_state(state_json):
+    """
+    Purpose: Parse a state the way TestHarnessTransformationHelper used to
+    Signature: StateJSON -> FishGameState
+    """
+    board = old_parse_board(state_json['board'])
+    player_info = THHelper.create_player_info_list(state_json['players'])
+    return FishGameStateFactory.create_move_penguins_state(board, player_info, check_penguin_amount=False)
+
+
+def old_serialize_state(state):
+    """
+    Purpose: Serialize a state the way TestHarnessTransformationHelper used to
+    Signature: FishGameState -> StateJSON
+    """
+    board = old_serialize_board(state.get_board())
+    order = state.get_player_order()
+    turn_index = order.index(state.get_current_turn())
+    players = [{
+        "color": color.value,
+        "score": state.get_fish_for_player(color),
+        "places": [THHelper.convert_back_to_posn(x, y) for x, y in state.get_penguins_for_player(color)]
+    } for color in order[turn_index:] + order[:turn_index]]
+    return {"players": players, "board": board}
+
+
+def find_fixtures(value, states, boards):
+    """
+    Purpose: Collect the states and boards anywhere in a decoded JSON fixture
+    Signature: Any [StateJSON] [BoardJSON] -> Void
+    """
+    if isinstance(value, dict):
+        if 'players' in value and 'board' in value:
+            states.append(value)
+        elif 'board' in value:
+            boards.append(value['board'])
+        for child in value.values():
+            find_fixtures(child, states, boards)
+    elif isinstance(value, list):
+        for child in value:
+            find_fixtures(child, states, boards)
+
+
+def time_each(func, values, repeat):
+    """
+    Purpose: Call a function on every value a number of times
+    Signature: (X -> Y) [X] Int -> ([Y], Float)
+    :return: The results of the last calls and the microseconds per call
+    """
+    results, seconds = time_call(lambda: [[func(value) for value in values] for _ in range(repeat)][-1])
+    return results, seconds / (repeat * len(values)) * 10 ** 6
+
+
+def report(name, kind, values, repeat):
+    """
+    Purpose: Round trip states or boards with the old conversions and with state_serializer and print a row
+    Signature: String String [Any] Int -> Void
+    """
+    if kind == 'state':
+        old_parse, new_parse = old_parse_state, state_serializer.parse_state
+        old_serialize, new_serialize = old_serialize_state, state_serializer.serialize_state
+        same_value = lambda old, new: old.get_zobrist_hash() == new.get_zobrist_hash()
+    else:
+        old_parse, new_parse = old_parse_board, state_serializer.parse_board
+        old_serialize, new_serialize = old_serialize_board, state_serializer.serialize_board
+        same_value = lambda old, new: old.get_fish_rows() == new.get_fish_rows()
+    old_parsed, old_parse_us = time_each(old_parse, values, repeat)
+    new_parsed, new_parse_us = time_each(new_parse, values, repeat)
+    old_json, old_serialize_us = time_each(old_serialize, old_parsed, repeat)
+    new_json, new_serialize_us = time_each(new_serialize, new_parsed, repeat)
+    same = old_json == new_json and all(same_value(old, new) for old, new in zip(old_parsed, new_parsed))
+    print(ROW_FORMAT.format(name, len(values), '{:.1f}'.format(old_parse_us), '{:.1f}'.format(new_parse_us),
+                            '{:.1f}x'.format(old_parse_us / new_parse_us), '{:.1f}'.format(old_serialize_us),
+                            '{:.1f}'.format(new_serialize_us), '{:.1f}x'.format(old_serialize_us / new_serialize_us),
+                            str(same)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark serializing and parsing states')
+    parser.add_argument('--repeat', type=int, default=200, help='round trips of every fixture')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    states, boards = [], []
+    for path in sorted(glob.glob(FIXTURES)):
+        with open(path) as fixture:
+            find_fixtures(json.load(fixture), states, boards)
+
+    rng = random.Random(args.seed)
+    print(ROW_FORMAT.format('input', 'count', 'parse us', 'new us', 'speedup', 'write us', 'new us', 'speedup',
+                            'same'))
+    report('boards', 'board', boards, args.repeat)
+    report('states', 'state', states, args.repeat)
+    for size in [10, 20, 40]:
+        random_states = [THHelper.convert_state_to_json(create_random_move_state(rng, size, size, num_players=4))
+                         for _ in range(5)]
+        report('{}x{}'.format(size, size), 'state', random_states, max(1, args.repeat // size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Remote.async_server import AsyncTCPServer
+from Fish.Remote.client import TCPClient
+
+"""
+Benchmark of AsyncTCPServer with many simultaneous clients on this machine. It signs up the clients, runs a tournament
+with them and reports how long sign-up and the tournament took. Each client plays in its own thread with a very short
+time budget per move, so the time is mostly spent in the server and the network.
+
+Run from anywhere with: python3 server_benchmark.py [--clients N] [--move-budget SECONDS]
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the asyncio tournament server with many clients')
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--move-budget', type=float, default=0.01, help='seconds each client searches per move')
+    args = parser.parse_args()
+
+    server = AsyncTCPServer('127.0.0.1', 0, max_clients=args.clients, signup_timeout=60)
+    result = {}
+    server_thread = threading.Thread(target=lambda: result.update(value=server.run()))
+    start = time.perf_counter()
+    server_thread.start()
+    server.listening.wait()
+    clients = [TCPClient('127.0.0.1', server.port, 'p{}'.format(i), move_time_budget=args.move_budget)
+               for i in range(args.clients)]
+    client_threads = [threading.Thread(target=client.play_tournament, daemon=True) for client in clients]
+    for thread in client_threads:
+        thread.start()
+    while len(server.clients) < args.clients and server_thread.is_alive():
+        time.sleep(0.01)
+    signed_up = time.perf_counter()
+    server_thread.join()
+    finished = time.perf_counter()
+    for client in clients:
+        client.sock.close()
+
+    print('clients          {}'.format(len(server.clients)))
+    print('sign-up secs     {:.3f}'.format(signed_up - start))
+    print('tournament secs  {:.3f}'.format(finished - signed_up))
+    print('rounds           {}'.format(server.tournament_manager.round if server.tournament_manager else 0))
+    print('winners, cheaters {}'.format(result.get('value')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Admin.referee import Referee
+from Fish.Admin.simulator import Simulator
+from Fish.Other.benchmarks.benchmark_util import print_pair_reports, time_call
+from Fish.Player.player import BasicPlayer
+from Fish.Player.strategy import FishBasicStrategy
+
+"""
+Benchmark of the batch simulator (see Simulator). It first compares the games per second of whole games between two
+alpha-beta players run by a Referee with BasicPlayers against the same games played by the simulator one after another
+and in processes. It then plays every pair of a few strategies and reports their win rates, average fish and
+milliseconds per move, which is what the simulator is for.
+
+Run from anywhere with: python3 simulation_benchmark.py [--games N] [--workers N] [--size N] [--holes N]
+"""
+
+SPEED_FORMAT = '{:>20} {:>7} {:>8} {:>9}'
+
+
+def run_referee_games(games, size, seed):
+    """
+    Purpose: Run games between two alpha-beta players with a referee
+    Signature: Int Int Int -> Void
+    """
+    random.seed(seed)
+    for _ in range(games):
+        players = [BasicPlayer(), BasicPlayer()]
+        for player in players:
+            player.strategy = FishBasicStrategy(1, use_alpha_beta=True)
+        Referee().initialize_and_run_game(size, size, [(player, age) for age, player in enumerate(players)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the batch simulator and evaluate strategies')
+    parser.add_argument('--games', type=int, default=1000, help='games played by every pair of strategies')
+    parser.add_argument('--workers', type=int, default=None, help='processes, default of the pool if unset')
+    parser.add_argument('--size', type=int, default=5, help='rows and columns of the boards')
+    parser.add_argument('--holes', type=int, default=2, help='random holes on every board')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print('{} cpus'.format(os.cpu_count()))
+    print(SPEED_FORMAT.format('driver', 'games', 'seconds', 'games/s'))
+    speed_games = max(2, args.games // 10)
+    _, seconds = time_call(lambda: run_referee_games(speed_games, args.size, args.seed))
+    print(SPEED_FORMAT.format('referee', speed_games, '{:.2f}'.format(seconds), '{:.0f}'.format(speed_games / seconds)))
+    alpha_beta = {'a': FishBasicStrategy(1, use_alpha_beta=True), 'b': FishBasicStrategy(1, use_alpha_beta=True)}
+    for mode in [ExecutionMode.SEQUENTIAL, ExecutionMode.PROCESS]:
+        simulator = Simulator(mode, max_workers=args.workers, rows=args.size, columns=args.size, holes=args.holes)
+        reports, seconds = time_call(lambda: simulator.run(alpha_beta, speed_games, args.seed))
+        print(SPEED_FORMAT.format('simulator ' + mode.value, reports[0].games, '{:.2f}'.format(seconds),
+                                  '{:.0f}'.format(reports[0].games / seconds)))
+
+    strategies = {
+        'maximin-1': FishBasicStrategy(1),
+        'alpha-beta-1': FishBasicStrategy(1, use_alpha_beta=True),
+        'alpha-beta-2': FishBasicStrategy(2, use_alpha_beta=True),
+    }
+    simulator = Simulator(ExecutionMode.PROCESS, max_workers=args.workers, rows=args.size, columns=args.size,
+                          holes=args.holes)
+    reports, seconds = time_call(lambda: simulator.run(strategies, args.games, args.seed))
+    print()
+    print_pair_reports(reports)
+    games = sum(report.games for report in reports)
+    print('{} games in {:.1f} seconds ({:.0f} games/s)'.format(games, seconds, games / seconds))
+
+
+if __name__ == '__main__':
+    main()
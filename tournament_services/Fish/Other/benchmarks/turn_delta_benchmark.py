@@ -0,0 +1,80 @@
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Fish.Other.benchmarks.benchmark_util import create_random_move_state
+from Fish.Remote.turn_session import TurnSession
+
+"""
+Benchmark of delta encoded take-turn messages (see TurnSession). For each board size it plays a game with random
+moves, creating the take-turn message of every turn both with the whole state and with only the actions since the
+last turn of the player, and reports the bytes sent per turn and the time per turn a client spends decoding the
+message and restoring the state from it. It also checks that the client restores the state of the game every time.
+
+Run from anywhere with: python3 turn_delta_benchmark.py [--turns N] [--players N]
+"""
+
+ROW_FORMAT = '{:>6} {:>6} {:>11} {:>11} {:>10} {:>10} {:>8} {:>6}'
+
+
+def restore_message(session, message, color):
+    """
+    Purpose: Decode a take-turn message like a client would and restore its state, timing both
+    Signature: TurnSession String PlayerColor -> (FishGameState, Float)
+    """
+    start = time.perf_counter()
+    state = session.restore(json.loads(message)[1], color)
+    return state, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark delta encoded take-turn messages')
+    parser.add_argument('--turns', type=int, default=200, help='most turns played on each board')
+    parser.add_argument('--players', type=int, default=4, help='players in each game')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(ROW_FORMAT.format('board', 'turns', 'full bytes', 'delta bytes', 'full us', 'delta us', 'speedup', 'same'))
+    for size in [5, 10, 20, 40]:
+        state = create_random_move_state(rng, size, size, num_players=args.players)
+        colors = state.get_player_order()
+        sessions = {mode: ({color: TurnSession() for color in colors}, {color: TurnSession() for color in colors})
+                    for mode in ['full', 'delta']}
+        sent = {'full': 0, 'delta': 0}
+        seconds = {'full': 0.0, 'delta': 0.0}
+        same = True
+        turns = 0
+        while turns < args.turns and state.can_any_player_move():
+            color = state.get_current_turn()
+            moves = [(penguin, to_pos) for penguin in state.get_penguins_for_player(color)
+                     for to_pos in state.find_valid_moves_from_pos(penguin)]
+            if not moves:
+                state.increase_turn()
+                continue
+            action = rng.choice(moves)
+            for mode, (proxy_sessions, client_sessions) in sessions.items():
+                message = json.dumps(proxy_sessions[color].create_message(copy.deepcopy(state), color, mode == 'delta'))
+                client_state, restore_seconds = restore_message(client_sessions[color], message, color)
+                sent[mode] += len(message)
+                seconds[mode] += restore_seconds
+                same = same and client_state.get_zobrist_hash() == state.get_zobrist_hash()
+                client_sessions[color].record_action(client_state, color, action)
+                proxy_sessions[color].record_action(copy.deepcopy(state), color, action)
+            state.move_penguin(color, *action)
+            turns += 1
+        print(ROW_FORMAT.format('{}x{}'.format(size, size), turns,
+                                '{:.0f}'.format(sent['full'] / turns), '{:.0f}'.format(sent['delta'] / turns),
+                                '{:.0f}'.format(seconds['full'] / turns * 10 ** 6),
+                                '{:.0f}'.format(seconds['delta'] / turns * 10 ** 6),
+                                '{:.1f}x'.format(seconds['full'] / seconds['delta']), str(same)))
+
+
+if __name__ == '__main__':
+    main()
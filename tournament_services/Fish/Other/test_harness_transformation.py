@@ -2,8 +2,8 @@ import fileinput
 
 from Fish.Common.representations.enumerations.directions_enum import HexDirection
 from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
-from Fish.Common.representations.fish_board import FishBoardModel
-from Fish.Common.representations.game_state import FishGameStateFactory, FishGameState
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations import state_serializer
 
 
 class TestHarnessTransformationHelper(object):
@@ -32,16 +32,7 @@ class TestHarnessTransformationHelper(object):
         :param board_json: Parsed JSON array representation of a Fish game board
         :return: An instance of our board model
         """
-        coords_to_holes = []
-        for i, row in enumerate(board_json):
-            for j, val in enumerate(row):
-                y_coord = i
-                x_coord = 2 * j if i % 2 == 0 else 1 + 2 * j
-                coords_to_holes.append(((x_coord, y_coord), val))
-        amount_rows = len(board_json)
-        amount_cols = max([len(row) for row in board_json])
-        board = FishBoardModel.create_with_coords_to_fish(amount_rows, amount_cols, coords_to_holes)
-        return board
+        return state_serializer.parse_board(board_json)
 
     @staticmethod
     def convert_board_to_json(board):
@@ -50,22 +41,7 @@ class TestHarnessTransformationHelper(object):
         Signature: FishBoardModel -> Board
         :param board: Our internal representation of a board
         """
-        overall_board = []
-        current_row = []
-        current_row_y = 0
-        for x, y in board.get_coords_sorted_by_row():
-            if y != current_row_y:
-                overall_board.append(current_row)
-                current_row = []
-                current_row_y = y
-            tile = board.get_tile_at_coord(x, y)
-            if tile:
-                num_fish = tile.num_fish
-            else:
-                num_fish = 0
-            current_row.append(num_fish)
-        overall_board.append(current_row)
-        return overall_board
+        return state_serializer.serialize_board(board)
 
     @staticmethod
     def convert_to_double_height(row_pos, column_pos):
@@ -116,23 +92,17 @@ class TestHarnessTransformationHelper(object):
         :param state_json: Object of players as specified containing ordering and player information
         :return: Our internal representation of a game state_json
         """
-        board = TestHarnessTransformationHelper.parse_board(state_json['board'])
-        player_info_list = TestHarnessTransformationHelper.create_player_info_list(state_json['players'])
-        game_state = FishGameStateFactory.create_move_penguins_state(board, player_info_list,
-                                                                     check_penguin_amount=False)
-        return game_state
+        return state_serializer.parse_state(state_json)
 
     @staticmethod
     def convert_state_to_json(state: FishGameState):
-        board = TestHarnessTransformationHelper.convert_board_to_json(state.get_board())
-        player_order = state.get_player_order()
-        current_player_index = player_order.index(state.get_current_turn())
-        players = [{
-            "color": color.value,
-            "score": state.get_fish_for_player(color),
-            "places": [TestHarnessTransformationHelper.convert_back_to_posn(coordinate[0], coordinate[1]) for coordinate in state.get_penguins_for_player(color)]
-        } for color in player_order[current_player_index:] + player_order[:current_player_index]]
-        return {"players": players, "board": board}
+        """
+        Purpose: Convert our state representation to the JSON representation, with the players in the order they play
+                 starting with the player whose turn it is
+        Signature: FishGameState -> State
+        :param state: Our internal representation of a game state
+        """
+        return state_serializer.serialize_state(state)
 
     @staticmethod
     def create_player_info_list(players_list):
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class BoundType(Enum):
+    """
+    This is an enumeration noting how a value stored from an alpha-beta search relates to the real maximin value of
+    a node. An EXACT value is the maximin value itself. A LOWER bound means the search stopped early because the
+    maximin value is at least the stored value, and an UPPER bound means the maximin value is at most the stored value.
+    """
+    EXACT = 'exact'
+    LOWER = 'lower'
+    UPPER = 'upper'
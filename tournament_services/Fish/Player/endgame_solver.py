@@ -0,0 +1,146 @@
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from Fish.Common.representations.enumerations.directions_enum import HexDirection
+from Fish.Common.representations.enumerations.game_phase import GamePhase
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.types import Coordinate
+
+"""
+A RegionKey is (FrozenSet[(Coordinate, Int)], (Coordinate, ...))
+INTERPRETATION: A region owned by one player, as the coordinates and amounts of fish of its tiles (including the tiles
+under the penguins) and the sorted positions of the penguins of the player in it. Two regions with the same key have the
+same amount of fish left to collect, wherever they are found.
+"""
+RegionKey = Tuple[FrozenSet[Tuple[Coordinate, int]], Tuple[Coordinate, ...]]
+
+_DIRECTIONS: List[Tuple[int, int]] = [tuple(direction.value) for direction in HexDirection]
+
+
+class FishEndgameSolver(object):
+    """
+    A FishEndgameSolver is {
+    max_region_tiles: Integer,
+    max_entries: Integer,
+    region_values: Dictionary[RegionKey, Integer],
+    solved_states: Integer
+    }
+    INTERP: Finds the exact final scores of a game in the penguin moving phase once the holes have split the board into
+    regions (see FishBoardModel.find_regions) that each hold the penguins of at most one player. A penguin can never
+    leave its region, so then no player can get in the way of another: every player keeps moving until all of their
+    penguins are stuck, as the game only ends once nobody can move, and collects the most fish their penguins can
+    collect in each of their regions no matter in which order the turns come.
+
+    The most fish in a region is found by trying every move of the penguins in it (the longest path over the fish of
+    the tiles they leave), remembering the value of every region reached along the way in region_values so that
+    regions reached again, through other orders of moves or from later states of the same game, are not solved again.
+    Regions with more than max_region_tiles tiles are not solved, as the amount of them grows exponentially with the
+    size of the region. region_values is emptied once it holds max_entries regions, where an entry takes about 700
+    bytes, so the default keeps the table at a few dozen megabytes. solved_states counts the states that could be
+    solved.
+
+    Solving a large region can take seconds, so a search with a time budget can pass its budget check to solve and
+    solve_region, which is called for every region that is not in the table yet and stops the solver by raising. The
+    regions solved before it stopped are kept.
+    """
+
+    def __init__(self, max_region_tiles: int = 14, max_entries: int = 50000):
+        """
+        Purpose: Initialize a solver with an empty table of region values
+        Signature: Int Int -> FishEndgameSolver
+        :param max_region_tiles: Size of the largest region with penguins that is solved
+        :param max_entries: Amount of region values kept before the table is emptied
+        """
+        if max_region_tiles <= 0:
+            raise ValueError('Max region tiles must be > 0')
+        if max_entries <= 0:
+            raise ValueError('Max entries must be > 0')
+        self.max_region_tiles = max_region_tiles
+        self.max_entries = max_entries
+        self.region_values: Dict[RegionKey, int] = dict()
+        self.solved_states = 0
+
+    def solve(self, state: FishGameState,
+              check_budget: Optional[Callable[[], None]] = None) -> Optional[Dict[PlayerColor, int]]:
+        """
+        Purpose: Find the amount of fish every player will have at the end of the game if they all play their best,
+                 if the board is split into regions that each hold the penguins of at most one player
+        Signature: FishGameState Maybe[(Void -> Void)] -> Maybe[Dictionary[PlayerColor, Int]]
+        :param state: The state to solve, which is not changed
+        :param check_budget: Called before solving every region that is not in the table, to stop the solver by
+                             raising an error
+        :return: The final amount of fish of every player in the game, or None if a region holds penguins of several
+                 players or is too large to solve, or the penguins are still being placed
+        """
+        if state.get_game_phase() == GamePhase.PLACE_PENGUINS or not state.are_penguins_separated():
+            return None
+        penguin_colors = {penguin_pos: color for color in state.get_player_order()
+                          for penguin_pos in state.get_penguins_for_player(color)}
+        regions = []
+        for region in state.find_regions():
+            owners = {penguin_colors[coord] for coord in region if coord in penguin_colors}
+            if not owners:
+                continue
+            if len(region) > self.max_region_tiles:
+                return None
+            regions.append((owners.pop(), region))
+
+        final_fish = {color: state.get_fish_for_player(color) for color in state.get_player_order()}
+        for color, region in regions:
+            tiles = {coord: state.get_fish_at_pos(coord) for coord in region}
+            penguins = [coord for coord in region if coord in penguin_colors]
+            final_fish[color] += self.solve_region(tiles, penguins, check_budget)
+        self.solved_states += 1
+        return final_fish
+
+    def solve_region(self, tiles: Dict[Coordinate, int], penguins: Iterable[Coordinate],
+                     check_budget: Optional[Callable[[], None]] = None) -> int:
+        """
+        Purpose: Find the most fish the penguins of one player can collect in a region no other penguin can reach
+        Signature: Dictionary[Coordinate, Int] [Coordinate] Maybe[(Void -> Void)] -> Int
+        :param tiles: The amount of fish on every tile of the region, including the tiles under the penguins
+        :param penguins: Positions of the penguins in the region
+        :param check_budget: Called before solving every region that is not in the table, to stop the solver by
+                             raising an error
+        :return: The most fish the penguins can collect together
+        """
+        return self._find_region_value(frozenset(tiles.items()), frozenset(tiles), tiles, tuple(sorted(penguins)),
+                                       check_budget)
+
+    def _find_region_value(self, tile_items: FrozenSet[Tuple[Coordinate, int]], coords: FrozenSet[Coordinate],
+                           fish: Dict[Coordinate, int], penguins: Tuple[Coordinate, ...],
+                           check_budget: Optional[Callable[[], None]]) -> int:
+        """
+        Purpose: Find the most fish that penguins can collect on the remaining tiles of a region by trying every move
+                 of every penguin, where moving off a tile collects its fish and turns it into a hole
+        Signature: FrozenSet[(Coordinate, Int)] FrozenSet[Coordinate] Dictionary[Coordinate, Int] (Coordinate, ...)
+                   Maybe[(Void -> Void)] -> Int
+        :param tile_items: The remaining tiles of the region with their amount of fish, part of the key of the region
+        :param coords: The coordinates of the remaining tiles
+        :param fish: The amount of fish on every tile the region started with
+        :param penguins: Sorted positions of the penguins
+        :param check_budget: Called before solving the region if it is not in the table
+        :return: The most fish the penguins can collect
+        """
+        key = (tile_items, penguins)
+        value = self.region_values.get(key)
+        if value is not None:
+            return value
+        if check_budget is not None:
+            check_budget()
+        value = 0
+        for index, (x, y) in enumerate(penguins):
+            others = penguins[:index] + penguins[index + 1:]
+            remaining_items = tile_items - {((x, y), fish[(x, y)])}
+            remaining_coords = coords - {(x, y)}
+            for dx, dy in _DIRECTIONS:
+                to_pos = (x + dx, y + dy)
+                while to_pos in remaining_coords and to_pos not in others:
+                    moved = tuple(sorted(others + (to_pos,)))
+                    value = max(value, fish[(x, y)] + self._find_region_value(
+                        remaining_items, remaining_coords, fish, moved, check_budget))
+                    to_pos = (to_pos[0] + dx, to_pos[1] + dy)
+        if len(self.region_values) >= self.max_entries:
+            self.region_values.clear()
+        self.region_values[key] = value
+        return value
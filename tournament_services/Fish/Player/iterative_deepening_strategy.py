@@ -0,0 +1,120 @@
+import time
+from typing import Optional, List
+
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.types import Action
+from Fish.Player.endgame_solver import FishEndgameSolver
+from Fish.Player.move_ordering import MoveOrdering
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.transposition_table import TranspositionTable
+
+
+class SearchTimeoutError(Exception):
+    """
+    Error raised inside of a search when the time a strategy was given to find a move has run out. The search that
+    was running when it is raised is thrown away.
+    """
+    pass
+
+
+class FishIterativeDeepeningStrategy(FishBasicStrategy):
+    """
+    This is a strategy that finds moves with a limited amount of wall-clock time instead of a fixed amount of turns
+    to look ahead. It places penguins the same way as FishBasicStrategy.
+
+    For moving a penguin, find_next_move runs the alpha-beta search of FishBasicStrategy one ply deeper at a time, where
+    a ply is a single turn of a single player. Every search first follows the principal variation (line of best play)
+    found by the search one ply shallower, which makes the alpha-beta search prune more of the tree. Once the time
+    budget runs out the search that is running is thrown away and the best action of the deepest search that finished
+    is returned. The search at a depth of 1 ply always finishes, so there is always an action to return.
+
+    Searching stops before the time budget runs out if the max depth is reached or if a search reached the end of the
+    game everywhere, as searching any deeper would give the same action.
+    """
+
+    def __init__(self, time_budget: float, max_depth: Optional[int] = None,
+                 transposition_table: Optional[TranspositionTable] = None,
+                 move_ordering: Optional[MoveOrdering] = None,
+                 endgame_solver: Optional[FishEndgameSolver] = None, collect_stats: bool = False):
+        """
+        Purpose: Initialize a strategy that searches for as long as its time budget allows
+        Signature: Number Maybe[Int] Maybe[TranspositionTable] Maybe[MoveOrdering] Maybe[FishEndgameSolver] Bool
+                   -> FishIterativeDeepeningStrategy
+        :param time_budget: Amount of seconds the strategy can take to find a move
+        :param max_depth: Max amount of plies to search, or None to search as deep as the time budget allows
+        :param transposition_table: Table of search results shared by the searches at every depth, see
+                                    FishBasicStrategy
+        :param move_ordering: Heuristics ordering the actions of the searches at every depth, see FishBasicStrategy.
+                              Killer moves and history learned at one depth carry over to the next.
+        :param endgame_solver: Solver for positions where the board is split between the players, see
+                               FishBasicStrategy. The regions it solves at one depth are not solved again at the next.
+        :param collect_stats: Whether to record the stats of the searches for every move in last_stats, see
+                              FishBasicStrategy. The stats of a move add up the searches at every depth, including
+                              the one that ran out of time.
+        """
+        super().__init__(1, use_alpha_beta=True, transposition_table=transposition_table,
+                         move_ordering=move_ordering, endgame_solver=endgame_solver, collect_stats=collect_stats)
+        if time_budget <= 0:
+            raise ValueError('Time budget must be > 0')
+        if max_depth is not None and max_depth <= 0:
+            raise ValueError('Max depth must be > 0')
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        # deepest amount of plies fully searched when finding the last move
+        self.last_completed_depth = 0
+        self._deadline: Optional[float] = None
+
+    def find_next_move(self, state: FishGameState) -> Action:
+        """
+        Purpose: Find the best move for the player whose turn it is in the current state, searching one ply deeper
+                 at a time until the time budget runs out. Like FishBasicStrategy, this assumes the player whose
+                 turn it is can move.
+        Signature: FishGameState -> Action
+        :param state: The state for which we are looking for a move
+        :return: The best action found by the deepest search that finished in time
+        """
+        deadline = time.perf_counter() + self.time_budget
+        self._start_stats()
+        game_tree = FishGameTree(state=state, stats=self._stats)
+        best_action = None
+        principal_variation: List[Optional[Action]] = []
+        self.last_completed_depth = 0
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+        if self.move_ordering is not None:
+            self.move_ordering.new_search()
+        # solving the root fills the table of the solver with every region below it, so the first search, which
+        # has no deadline, only looks up its regions. A root that cannot be solved in time is searched without it.
+        self._deadline = deadline
+        try:
+            self._start_endgame(state)
+        except SearchTimeoutError:
+            self._solve_endgame = False
+        finally:
+            self._deadline = None
+        depth = 1
+        while self.max_depth is None or depth <= self.max_depth:
+            self._reached_depth_limit = False
+            # The first search has no deadline so that there is always an action to return
+            self._deadline = deadline if depth > 1 else None
+            try:
+                best_action, principal_variation = self._find_best_action(game_tree, depth - 1, principal_variation)
+            except SearchTimeoutError:
+                break
+            finally:
+                self._deadline = None
+            self.last_completed_depth = depth
+            if not self._reached_depth_limit or time.perf_counter() >= deadline:
+                break
+            depth += 1
+        self._finish_stats(self.last_completed_depth)
+        return best_action
+
+    def _check_search_budget(self) -> None:
+        """
+        Purpose: Stop the running search by raising an error once the deadline for finding a move has passed
+        Signature: Void -> Void
+        """
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchTimeoutError
@@ -0,0 +1,297 @@
+import copy
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.compact_game_state import CompactFishState
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.move_record import MoveRecord
+from Fish.Common.representations.types import Action, Coordinate
+from Fish.Player.rollout_policy import RolloutPolicy
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.strategy_interface import StrategyInterface
+
+"""
+A RootStatistics is a Dictionary[Maybe[Action], (Int, Number)]
+INTERP: The amount of times each child of the root was visited by a Monte Carlo tree search and the summed reward of
+the player who made the move to that child over those visits.
+"""
+RootStatistics = Dict[Optional[Action], Tuple[int, float]]
+
+
+class _SearchNode(object):
+    """
+    A _SearchNode is {
+    action: Maybe[Action]
+    color: Maybe[PlayerColor]
+    parent: Maybe[_SearchNode]
+    children: [_SearchNode]
+    untried_actions: [Maybe[Action]]
+    visits: Int
+    reward: Number
+    }
+    INTERP: A node of the tree built by a Monte Carlo tree search, reached from its parent by the action of the player
+    of the given color (None for a skipped turn). The actions of the node that have no child yet are untried, and a
+    node without children or untried actions is the end of the game. Reward is the sum of the rewards of the player
+    who made the action over the playouts through this node, so reward / visits is how good the action was for them.
+    The root has no action, color or parent.
+    """
+    __slots__ = ('action', 'color', 'parent', 'children', 'untried_actions', 'visits', 'reward')
+
+    def __init__(self, action: Optional[Action], color: Optional[PlayerColor], parent: Optional['_SearchNode'],
+                 untried_actions: List[Optional[Action]]):
+        self.action = action
+        self.color = color
+        self.parent = parent
+        self.children: List[_SearchNode] = []
+        self.untried_actions = untried_actions
+        self.visits = 0
+        self.reward = 0.0
+
+
+def _search_in_worker(strategy: 'FishMCTSStrategy', compact_state: CompactFishState, time_budget: Optional[float],
+                      playouts: Optional[int], seed: int) -> RootStatistics:
+    """
+    Purpose: Run an independent search from the root state in a worker process
+    Signature: FishMCTSStrategy CompactFishState Maybe[Number] Maybe[Int] Int -> RootStatistics
+    :param strategy: Strategy whose settings are used for the search
+    :param compact_state: The root state, which is converted back into a FishGameState in the worker
+    :param time_budget: Seconds the search may take, or None to only stop after the playouts
+    :param playouts: Amount of playouts to run, or None to only stop when the time runs out
+    :param seed: Seed of the random number generator of the search
+    """
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    return strategy._search(compact_state.to_state(), deadline, playouts, random.Random(seed))
+
+
+class FishMCTSStrategy(StrategyInterface):
+    """
+    This is a strategy that finds moves with a Monte Carlo tree search instead of a maximin search, so that it can
+    make use of any amount of time on boards too large to search to the end of the game. It places penguins the same
+    way as FishBasicStrategy.
+
+    Every playout walks down the tree from the root, picking the child with the highest UCT value (how good its
+    action was for the player who made it so far, plus a bonus for children that were visited less), adds a child for
+    one untried action, plays the rest of the game out with the rollout policy (see RolloutPolicy) and adds the result
+    for each player to the nodes it went through. The result is 1 for the player with the most fish, split evenly
+    between players who tie, and 0 for the others. The search makes and takes back the moves of the playouts on one
+    copy of the state (see FishGameState.apply_move), so a playout does not copy any state.
+
+    The search stops after the playout budget or the time budget, whichever comes first, but always runs at least one
+    playout. The most visited child of the root is the move, with ties broken like FishBasicStrategy.
+
+    With more than one worker, each worker process runs its own search from the root with its share of the budget
+    (root parallelization) and the visits and rewards of the children of the root are added up. The root state is sent
+    to the workers as a CompactFishState. The processes are started on the first move and kept until close is called,
+    which can also be done by using the strategy as a context manager.
+    """
+
+    def __init__(self, time_budget: Optional[float] = None, playouts: Optional[int] = None,
+                 rollout_policy: RolloutPolicy = RolloutPolicy.RANDOM, exploration: float = math.sqrt(2),
+                 rollout_depth: Optional[int] = None, workers: int = 1, seed: Optional[int] = None):
+        """
+        Purpose: Initialize a strategy that searches with a Monte Carlo tree search
+        Signature: Maybe[Number] Maybe[Int] RolloutPolicy Number Maybe[Int] Int Maybe[Int] -> FishMCTSStrategy
+        :param time_budget: Amount of seconds the strategy can take to find a move, or None for no time limit
+        :param playouts: Amount of playouts to run for every move, or None for as many as the time budget allows.
+                         At least one of the budgets must be given.
+        :param rollout_policy: How the rest of the game is played out from a new node
+        :param exploration: Weight of the bonus of children that were visited less in the UCT value, higher values
+                            look at more actions and lower values look deeper at the best actions so far
+        :param rollout_depth: Max amount of moves of a rollout, after which the player with the most fish so far wins,
+                              or None to play the game to the end. Limiting it keeps playouts short on large boards.
+        :param workers: Amount of processes to search with, 1 searches in this process
+        :param seed: Seed of the random number generator of the searches, or None for a random seed
+        """
+        if time_budget is None and playouts is None:
+            raise ValueError('Need a time budget or a playout budget')
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError('Time budget must be > 0')
+        if playouts is not None and playouts <= 0:
+            raise ValueError('Playouts must be > 0')
+        if rollout_depth is not None and rollout_depth < 0:
+            raise ValueError('Rollout depth must be >= 0')
+        if workers <= 0:
+            raise ValueError('Amount of workers must be > 0')
+        self.time_budget = time_budget
+        self.playouts = playouts
+        self.rollout_policy = rollout_policy
+        self.exploration = exploration
+        self.rollout_depth = rollout_depth
+        self.workers = workers
+        self.rng = random.Random(seed)
+        # playouts run in total to find the last move
+        self.last_playouts = 0
+        self._placement_strategy = FishBasicStrategy(1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __getstate__(self) -> Dict:
+        """
+        Purpose: Get the state to pickle, leaving out the worker processes, so that the strategy can be sent to the
+                 worker processes and to other processes such as those of the batch simulator
+        Signature: Void -> Dict
+        """
+        state = dict(self.__dict__)
+        state['_executor'] = None
+        return state
+
+    def find_next_placement(self, state: FishGameState) -> Coordinate:
+        return self._placement_strategy.find_next_placement(state)
+
+    def accepts_state_view(self) -> bool:
+        # the search copies the state it is given, or sends a compact copy of it to the workers
+        return True
+
+    def find_next_move(self, state: FishGameState) -> Action:
+        """
+        Purpose: Find the best move for the player whose turn it is within the budgets. Like FishBasicStrategy, this
+                 assumes the player whose turn it is can move.
+        Signature: FishGameState -> Action
+        :param state: The state for which we are looking for a move, which is not changed
+        :return: The most visited action from the root
+        """
+        actions = FishGameTree.find_actions_for_state(state)
+        if len(actions) == 1:
+            self.last_playouts = 0
+            return actions[0]
+        if self.workers == 1:
+            deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+            statistics = self._search(copy.deepcopy(state), deadline, self.playouts, self.rng)
+        else:
+            statistics = self._search_in_workers(state)
+        self.last_playouts = sum(visits for visits, _ in statistics.values())
+        most_visits = max(visits for visits, _ in statistics.values())
+        best_actions = [action for action, (visits, _) in statistics.items() if visits == most_visits]
+        if len(best_actions) == 1:
+            return best_actions[0]
+        return FishBasicStrategy._break_ties(best_actions)
+
+    def _search_in_workers(self, state: FishGameState) -> RootStatistics:
+        """
+        Purpose: Run a search from the root in every worker process, splitting the playouts between them, and add up
+                 the statistics of the children of the root
+        Signature: FishGameState -> RootStatistics
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        compact_state = CompactFishState.from_state(state)
+        futures = []
+        for worker in range(self.workers):
+            playouts = None
+            if self.playouts is not None:
+                playouts = self.playouts // self.workers + (1 if worker < self.playouts % self.workers else 0)
+                if playouts == 0:
+                    continue
+            futures.append(self._executor.submit(_search_in_worker, self, compact_state, self.time_budget, playouts,
+                                                 self.rng.getrandbits(32)))
+        statistics: RootStatistics = dict()
+        for future in futures:
+            for action, (visits, reward) in future.result().items():
+                total_visits, total_reward = statistics.get(action, (0, 0.0))
+                statistics[action] = total_visits + visits, total_reward + reward
+        return statistics
+
+    def _search(self, state: FishGameState, deadline: Optional[float], playouts: Optional[int],
+                rng: random.Random) -> RootStatistics:
+        """
+        Purpose: Run playouts from a state until either budget runs out, and collect the statistics of the children
+                 of the root
+        Signature: FishGameState Maybe[Number] Maybe[Int] Random -> RootStatistics
+        :param state: The root state, which is changed during the search and put back the way it was at the end
+        :param deadline: Value of time.perf_counter at which to stop, or None for no time limit
+        :param playouts: Amount of playouts to run, or None for no limit
+        :param rng: Random number generator for the expansions and rollouts
+        """
+        root = _SearchNode(None, None, None, self._find_node_actions(state))
+        done = 0
+        while done == 0 or ((playouts is None or done < playouts)
+                            and (deadline is None or time.perf_counter() < deadline)):
+            node = root
+            records: List[MoveRecord] = []
+            while not node.untried_actions and node.children:
+                node = self._select_child(node)
+                records.append(state.apply_move(node.action))
+            if node.untried_actions:
+                action = node.untried_actions.pop(rng.randrange(len(node.untried_actions)))
+                color = state.get_current_turn()
+                records.append(state.apply_move(action))
+                child = _SearchNode(action, color, node, self._find_node_actions(state))
+                node.children.append(child)
+                node = child
+            rewards = self._rollout(state, rng, records)
+            for record in reversed(records):
+                state.undo_move(record)
+            while node is not None:
+                node.visits += 1
+                if node.color is not None:
+                    node.reward += rewards[node.color]
+                node = node.parent
+            done += 1
+        return {child.action: (child.visits, child.reward) for child in root.children}
+
+    def _select_child(self, node: _SearchNode) -> _SearchNode:
+        """
+        Purpose: Pick the child of a fully expanded node with the highest UCT value
+        Signature: _SearchNode -> _SearchNode
+        """
+        log_visits = math.log(node.visits)
+        return max(node.children, key=lambda child: child.reward / child.visits
+                   + self.exploration * math.sqrt(log_visits / child.visits))
+
+    @staticmethod
+    def _find_node_actions(state: FishGameState) -> List[Optional[Action]]:
+        """
+        Purpose: Find the actions of the node of a state, where a player who cannot move has their turn skipped
+        Signature: FishGameState -> [Maybe[Action]]
+        :return: The actions of the player whose turn it is, [None] if they have to skip their turn or an empty list
+                 at the end of the game
+        """
+        if not state.can_any_player_move():
+            return []
+        return FishGameTree.find_actions_for_state(state) or [None]
+
+    def _rollout(self, state: FishGameState, rng: random.Random,
+                 records: List[MoveRecord]) -> Dict[PlayerColor, float]:
+        """
+        Purpose: Play the game out from a state with the rollout policy and find the reward of every player
+        Signature: FishGameState Random [MoveRecord] -> Dict[PlayerColor, Number]
+        :param state: The state to play out, which is changed in place
+        :param rng: Random number generator for the moves
+        :param records: Records of the moves made on the state so far, which the moves of the rollout are added to
+        :return: 1 for the player with the most fish, split between players who tie, and 0 for everyone else
+        """
+        moves = 0
+        while (self.rollout_depth is None or moves < self.rollout_depth) and state.can_any_player_move():
+            actions = FishGameTree.find_actions_for_state(state)
+            action = None
+            if actions and self.rollout_policy == RolloutPolicy.GREEDY:
+                most_fish = max(state.get_fish_at_pos(to_pos) for _, to_pos in actions)
+                action = rng.choice([(from_pos, to_pos) for from_pos, to_pos in actions
+                                     if state.get_fish_at_pos(to_pos) == most_fish])
+            elif actions:
+                action = rng.choice(actions)
+            records.append(state.apply_move(action))
+            moves += 1
+        fish = {color: state.get_fish_for_player(color) for color in state.get_player_order()}
+        most_fish = max(fish.values())
+        winners = [color for color, amount in fish.items() if amount == most_fish]
+        return {color: 1 / len(winners) if color in winners else 0.0 for color in fish}
+
+    def close(self) -> None:
+        """
+        Purpose: Stop the worker processes. The strategy starts them again if it is asked for another move.
+        Signature: Void -> Void
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'FishMCTSStrategy':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,203 @@
+from typing import Dict, List, Tuple
+
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.types import Action
+
+
+class MoveOrdering(object):
+    """
+    This is a class representing an interface for ordering the actions the alpha-beta search of FishBasicStrategy
+    visits at a node. Alpha-beta prunes the most when the best action of a node is searched first, so an ordering
+    puts the actions that are likely to be best in front. The order never changes the action a search finds, only how
+    many nodes it visits to find it.
+
+    An ordering scores actions (a higher score is searched earlier, equal scores keep the order the actions were
+    generated in) and can learn from the search: record_cutoff is called whenever an action made the search prune
+    the rest of the actions of a node. The ply of a node is how many moves it is below the root of the search.
+
+    The principal variation of an earlier search and the best action stored in a transposition table are always
+    searched first by the strategy itself, before the actions ordered by the move ordering.
+    """
+
+    def new_search(self) -> None:
+        """
+        Purpose: Note that a search for a new move is starting
+        Signature: Void -> Void
+        """
+        pass
+
+    def score_action(self, state: FishGameState, action: Action, ply: int) -> float:
+        """
+        Purpose: Score how likely an action is to be the best action of a node
+        Signature: FishGameState Action Int -> Number
+        :param state: The state of the node, with the turn of the player taking the action
+        :param action: An action that can be taken in the state
+        :param ply: How many moves the node is below the root of the search
+        :return: The score of the action, where actions with higher scores are searched earlier
+        """
+        raise NotImplemented
+
+    def record_cutoff(self, action: Action, ply: int, depth: int) -> None:
+        """
+        Purpose: Learn that an action was good enough to prune the rest of the actions of a node
+        Signature: Action Int Int -> Void
+        :param action: The action that caused the cutoff
+        :param ply: How many moves the node is below the root of the search
+        :param depth: How many plies were searched below the node
+        """
+        pass
+
+    def order_actions(self, state: FishGameState, actions: List[Action], ply: int) -> List[Action]:
+        """
+        Purpose: Order the actions of a node by their scores, highest first
+        Signature: FishGameState [Action] Int -> [Action]
+        :param state: The state of the node
+        :param actions: The actions that can be taken in the state, in the order they were generated
+        :param ply: How many moves the node is below the root of the search
+        :return: The actions ordered by their scores, keeping the generated order between equal scores
+        """
+        return sorted(actions, key=lambda action: self.score_action(state, action, ply), reverse=True)
+
+
+class FishOnDestinationOrdering(MoveOrdering):
+    """
+    Orders actions by the amount of fish on the tile they move to, which the moving player collects when that penguin
+    moves again. All actions of a penguin collect the same fish from the tile it leaves, so the destination is what
+    sets them apart.
+    """
+
+    def score_action(self, state: FishGameState, action: Action, ply: int) -> float:
+        """
+        Purpose: Score an action by the fish on the tile it moves to
+        Signature: FishGameState Action Int -> Number
+        """
+        _, to_pos = action
+        return state.get_fish_at_pos(to_pos)
+
+
+class KillerMoveOrdering(MoveOrdering):
+    """
+    Orders the killer moves of a ply first: the last actions that caused a cutoff at that ply elsewhere in the search.
+    Nodes at the same ply often share the same good action, for example taking the same tile away from an opponent.
+    """
+
+    def __init__(self, killers_per_ply: int = 2):
+        """
+        Purpose: Initialize a killer move ordering
+        Signature: Int -> KillerMoveOrdering
+        :param killers_per_ply: Amount of killer moves remembered for every ply, the most recent one scoring highest
+        """
+        if killers_per_ply <= 0:
+            raise ValueError('Killers per ply must be > 0')
+        self.killers_per_ply = killers_per_ply
+        self._killers: Dict[int, List[Action]] = dict()
+
+    def new_search(self) -> None:
+        """
+        Purpose: Forget the killer moves of the last search, as the plies of a new search are different nodes
+        Signature: Void -> Void
+        """
+        self._killers.clear()
+
+    def score_action(self, state: FishGameState, action: Action, ply: int) -> float:
+        """
+        Purpose: Score killer moves of the ply above all other actions, more recent killers higher
+        Signature: FishGameState Action Int -> Number
+        """
+        killers = self._killers.get(ply, [])
+        if action in killers:
+            return len(killers) - killers.index(action)
+        return 0
+
+    def record_cutoff(self, action: Action, ply: int, depth: int) -> None:
+        """
+        Purpose: Make an action the most recent killer move of its ply
+        Signature: Action Int Int -> Void
+        """
+        killers = self._killers.setdefault(ply, [])
+        if action in killers:
+            killers.remove(action)
+        killers.insert(0, action)
+        del killers[self.killers_per_ply:]
+
+
+class HistoryOrdering(MoveOrdering):
+    """
+    Orders actions by how often they caused cutoffs anywhere in the search (the history heuristic). Cutoffs found
+    with a deeper search below them count for more, as they saved more work. The scores are halved at the start of
+    every search, so that they follow how the game changes.
+    """
+
+    def __init__(self):
+        """
+        Purpose: Initialize a history ordering without any history
+        Signature: Void -> HistoryOrdering
+        """
+        self._history: Dict[Action, float] = dict()
+
+    def new_search(self) -> None:
+        """
+        Purpose: Age the history so that recent cutoffs count more than old ones
+        Signature: Void -> Void
+        """
+        self._history = {action: score / 2 for action, score in self._history.items() if score >= 1}
+
+    def score_action(self, state: FishGameState, action: Action, ply: int) -> float:
+        """
+        Purpose: Score an action by its history
+        Signature: FishGameState Action Int -> Number
+        """
+        return self._history.get(action, 0)
+
+    def record_cutoff(self, action: Action, ply: int, depth: int) -> None:
+        """
+        Purpose: Add to the history of an action that caused a cutoff
+        Signature: Action Int Int -> Void
+        """
+        self._history[action] = self._history.get(action, 0) + depth * depth
+
+
+class CombinedMoveOrdering(MoveOrdering):
+    """
+    Orders actions by several orderings at once: actions are ordered by the first ordering, ties between them by the
+    second ordering, and so on.
+    """
+
+    def __init__(self, *orderings: MoveOrdering):
+        """
+        Purpose: Combine orderings, the first one deciding the order the most
+        Signature: MoveOrdering... -> CombinedMoveOrdering
+        """
+        self.orderings = orderings
+
+    def new_search(self) -> None:
+        """
+        Purpose: Tell every ordering that a new search is starting
+        Signature: Void -> Void
+        """
+        for ordering in self.orderings:
+            ordering.new_search()
+
+    def score_action(self, state: FishGameState, action: Action, ply: int) -> Tuple[float, ...]:
+        """
+        Purpose: Score an action by the scores of every ordering, which compare in order
+        Signature: FishGameState Action Int -> (Number, ...)
+        """
+        return tuple(ordering.score_action(state, action, ply) for ordering in self.orderings)
+
+    def record_cutoff(self, action: Action, ply: int, depth: int) -> None:
+        """
+        Purpose: Tell every ordering about a cutoff
+        Signature: Action Int Int -> Void
+        """
+        for ordering in self.orderings:
+            ordering.record_cutoff(action, ply, depth)
+
+
+def create_default_move_ordering() -> MoveOrdering:
+    """
+    Purpose: Create the move ordering we use by default: killer moves first, then by history and then by the fish on
+             the destination tile
+    Signature: Void -> MoveOrdering
+    """
+    return CombinedMoveOrdering(KillerMoveOrdering(), HistoryOrdering(), FishOnDestinationOrdering())
@@ -0,0 +1,129 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.compact_game_state import CompactFishState
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.types import Action
+from Fish.Player.move_ordering import MoveOrdering
+from Fish.Player.strategy import FishBasicStrategy
+
+
+def _find_root_child_value(strategy: FishBasicStrategy, compact_state: CompactFishState, action: Action,
+                           depth: int) -> Tuple[Action, float]:
+    """
+    Purpose: Find the maximin value of the child of a root state reached by an action, in a worker process
+    Signature: FishBasicStrategy CompactFishState Action Int -> (Action, Number)
+    :param strategy: Strategy whose search is used, without a transposition table
+    :param compact_state: The root state, which is converted back into a FishGameState in the worker
+    :param action: The action leading from the root to the child
+    :param depth: How many nodes down from the child we have to go before evaluating a node
+    :return: The action and the exact maximin value of its child
+    """
+    state = compact_state.to_state()
+    color = state.get_current_turn()
+    if strategy.use_alpha_beta:
+        # there is no alpha from the other children in a worker, so the child is searched with a full window
+        strategy._root_depth = depth
+        state.apply_move(action)
+        value, _ = strategy._find_alpha_beta_value(state, False, depth, color, float("-inf"), float("inf"))
+    else:
+        value = FishBasicStrategy._find_maximin_value(FishGameTree(state).validate_and_compute_node(action),
+                                                      False, depth, color)
+    return action, value
+
+
+class FishRootParallelStrategy(FishBasicStrategy):
+    """
+    This is a strategy that finds the same moves as FishBasicStrategy, but searches the children of the root of the
+    game tree in parallel. Every child is an independent subtree, so each one is searched in a process of a
+    ProcessPoolExecutor and the best children are compared afterwards with the same tiebreaker. It places penguins the
+    same way as FishBasicStrategy.
+
+    The workers are sent the root state as a CompactFishState, which pickles to a fraction of the size of a
+    FishGameState, and the action of their child, so sending them is cheap compared to searching a subtree.
+
+    With alpha-beta, every child is searched with a full window as the values of the other children are not known in
+    the worker, so the workers visit more nodes in total than a sequential alpha-beta search. The processes are
+    started on the first move and kept until close is called, which can also be done by using the strategy as a
+    context manager.
+    """
+
+    def __init__(self, look_ahead_turns: int, workers: Optional[int] = None, use_alpha_beta: bool = False,
+                 move_ordering: Optional[MoveOrdering] = None):
+        """
+        Purpose: Initialize a strategy that searches the children of the root in parallel
+        Signature: Int Maybe[Int] Bool Maybe[MoveOrdering] -> FishRootParallelStrategy
+        :param look_ahead_turns: The amount of turns we want to look ahead for a certain player
+        :param workers: Amount of processes to search with, or None for the amount of processors of the machine
+        :param use_alpha_beta: Whether the workers search with alpha-beta pruning, see FishBasicStrategy
+        :param move_ordering: Move ordering copied to the workers for alpha-beta, see FishBasicStrategy. What a worker
+                              learns about the moves of its child is not sent back.
+        """
+        super().__init__(look_ahead_turns, use_alpha_beta=use_alpha_beta, move_ordering=move_ordering)
+        if workers is not None and workers <= 0:
+            raise ValueError('Amount of workers must be > 0')
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def find_next_move(self, state: FishGameState) -> Action:
+        """
+        Purpose: Find the best move for the player whose turn it is, like FishBasicStrategy, by searching the child of
+                 every action in a worker process. Like FishBasicStrategy, this assumes the player whose turn it is can
+                 move.
+        Signature: FishGameState -> Action
+        :param state: The state for which we are looking for a move
+        :return: The best action according to the maximin algorithm, after breaking ties
+        """
+        actions = FishGameTree(state=state).get_children_moves()
+        if len(actions) == 1:
+            return actions[0]
+        depth = (self.look_ahead_turns - 1) * len(state.get_player_order())
+        worker_strategy = FishBasicStrategy(self.look_ahead_turns, use_alpha_beta=self.use_alpha_beta,
+                                            move_ordering=self.move_ordering)
+        if self.move_ordering is not None:
+            self.move_ordering.new_search()
+        executor = self._get_executor()
+        compact_state = CompactFishState.from_state(state)
+        futures = [executor.submit(_find_root_child_value, worker_strategy, compact_state, action, depth)
+                   for action in actions]
+        values = dict(future.result() for future in futures)
+        max_value = max(values.values())
+        best_actions = [action for action in actions if values[action] == max_value]
+        if len(best_actions) == 1:
+            return best_actions[0]
+        return FishBasicStrategy._break_ties(best_actions)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Purpose: Get the pool of worker processes, starting it if it was not started yet
+        Signature: Void -> ProcessPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Purpose: Stop the worker processes. The strategy starts them again if it is asked for another move.
+        Signature: Void -> Void
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self) -> Dict:
+        """
+        Purpose: Get the state to copy or pickle, leaving out the worker processes, so that the strategy can be copied
+                 by the batch simulator after it started them
+        Signature: Void -> Dict
+        """
+        state = dict(self.__dict__)
+        state['_executor'] = None
+        return state
+
+    def __enter__(self) -> 'FishRootParallelStrategy':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
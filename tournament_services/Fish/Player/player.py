@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from Fish.Common.representations.types import Action
 from Fish.Common.player_interface import PlayerInterface
@@ -6,6 +6,7 @@ from Fish.Common.representations.enumerations.player_color_enum import PlayerCol
 from Fish.Common.representations.game_state import FishGameState
 from Fish.Common.representations.types import Coordinate
 from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.strategy_interface import StrategyInterface
 
 
 class BasicPlayer(PlayerInterface):
@@ -15,18 +16,19 @@ class BasicPlayer(PlayerInterface):
     algorithm that we have defined. This class basically just reuses that strategy to be able
     to execute moves.
     """
-    def __init__(self, depth=1, name=None):
+    def __init__(self, depth=1, name=None, strategy: Optional[StrategyInterface] = None):
         """
         Purpose: Initialize basic parameters of this player. such as Color, other players color,
         winners and the strategy. Note that for now, we are doing the maximin at a depth of 1
         in order to run quick games, but may switch to using different depths in the future.
         This component may need to encode other things such as a players age in the future, but
         we are not sure of that yet, so we are leaving it out of the implementation for now.
+        A different strategy (such as FishMCTSStrategy) can be given to use instead of the maximin of the given depth.
         """
         self.color = None
         self.other_colors = []
         self.winners = []
-        self.strategy = FishBasicStrategy(depth)
+        self.strategy = strategy if strategy is not None else FishBasicStrategy(depth)
         self.name = name
         self.started = False
         self.finished = False
@@ -43,6 +45,10 @@ class BasicPlayer(PlayerInterface):
         action = self.strategy.find_next_move(state)
         return action
 
+    def accepts_state_view(self) -> bool:
+        # only strategies that never change the state they are given can be given a view of it
+        return self.strategy.accepts_state_view()
+
     def show_other_players_colors(self, colors: List[PlayerColor]) -> bool:
         self.other_colors = colors
         return True
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class RolloutPolicy(Enum):
+    """
+    This is an enumeration noting how the Monte Carlo tree search plays out a game from a node to find out how good
+    the node is. RANDOM makes a random move for every player, and GREEDY makes the move that lands on the tile with
+    the most fish (choosing randomly between equally good moves), which plays more like a real player but takes longer
+    per move.
+    """
+    RANDOM = 'random'
+    GREEDY = 'greedy'
@@ -1,11 +1,20 @@
-from typing import List
+import time
+from typing import List, Optional, Tuple
 
 from Fish.Common.representations.types import Action
 from Fish.Common.game_tree import FishGameTree
 from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
 from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.move_record import MoveRecord
 from Fish.Common.representations.types import Coordinate
+from Fish.Common.representations.zobrist import maximizing_player_key
+from Fish.Common.search_activity import SearchActivity
+from Fish.Common.search_stats import SearchStats
+from Fish.Player.bound_type import BoundType
+from Fish.Player.endgame_solver import FishEndgameSolver
+from Fish.Player.move_ordering import MoveOrdering
 from Fish.Player.strategy_interface import StrategyInterface
+from Fish.Player.transposition_table import TranspositionTable
 
 
 class FishBasicStrategy(StrategyInterface):
@@ -21,15 +30,54 @@ class FishBasicStrategy(StrategyInterface):
     to another coordinate.
 
     Together, using these two methods a Fish player could play a whole entire game.
+
+    A strategy created with collect_stats records what its search did to find each move in a SearchStats, which is
+    kept in last_stats until the next move. Without it the search does not count or time anything.
     """
 
-    def __init__(self, look_ahead_turns: int):
+    def __init__(self, look_ahead_turns: int, use_alpha_beta: bool = False,
+                 transposition_table: Optional[TranspositionTable] = None,
+                 move_ordering: Optional[MoveOrdering] = None,
+                 endgame_solver: Optional[FishEndgameSolver] = None, collect_stats: bool = False):
         """
-        Purpose:
-        Signature: -> FishStrategy
+        Purpose: Initialize a strategy that looks a certain amount of turns ahead when moving
+        Signature: Int Bool Maybe[TranspositionTable] Maybe[MoveOrdering] Maybe[FishEndgameSolver] Bool
+                   -> FishStrategy
         :param look_ahead_turns: The amount of turns we want to look ahead for a certain player
+        :param use_alpha_beta: Whether to search the game tree with alpha-beta pruning instead of plain maximin.
+                               Both searches produce the same action, alpha-beta just skips subtrees that
+                               cannot change the result.
+        :param transposition_table: Table the alpha-beta search stores its results in and looks them up from, so
+                                    that states reached through different orders of moves are only searched once.
+                                    The table can be kept between moves. Not used by the maximin search.
+        :param move_ordering: Heuristics that order the actions of every node of the alpha-beta search so that it
+                              prunes more, see MoveOrdering. Without one the actions are searched in the order they
+                              are generated. Not used by the maximin search, which visits every action anyway.
+        :param endgame_solver: Solver that scores the nodes of the alpha-beta search exactly, as deep as the end of
+                               the game, instead of searching them, when the holes have already split the board of the
+                               root into regions that each belong to one player and the solver can solve it. A split
+                               board stays split, so then every node can be solved and all values are final scores.
+                               Below a root that is not split every node is searched, as the final scores of the nodes
+                               that became split could not be compared with the scores at the depth limit of the
+                               others. Not used by the maximin search.
+        :param collect_stats: Whether to record the stats of the search for every move in last_stats
         """
         self.look_ahead_turns = look_ahead_turns
+        self.use_alpha_beta = use_alpha_beta
+        self.transposition_table = transposition_table
+        self.move_ordering = move_ordering
+        self.endgame_solver = endgame_solver
+        self.collect_stats = collect_stats
+        self.last_stats: Optional[SearchStats] = None
+        # stats of the running search, None when the strategy does not collect stats
+        self._stats: Optional[SearchStats] = None
+        self._stats_start = 0.0
+        # depth the running search was started with at the root, used to find the ply of a node from its depth
+        self._root_depth = 0
+        # set by the alpha-beta search when it stops at a node because of the depth rather than the end of the game
+        self._reached_depth_limit = False
+        # whether the running search scores its nodes with the endgame solver, see _start_endgame
+        self._solve_endgame = False
 
     def find_next_move(self, state: FishGameState) -> Action:
         """
@@ -52,27 +100,105 @@ class FishBasicStrategy(StrategyInterface):
         :return: The action representing a from and to position that is the player best
                  move according to the maximin algorithm
         """
-        game_tree = FishGameTree(state=state)
+        self._start_stats()
+        game_tree = FishGameTree(state=state, stats=self._stats)
+        # we have already gone one turn down, so
+        # depth is amount of players there are * the number of turns - 1
+        depth = (self.look_ahead_turns - 1) * len(state.get_player_order())
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+        if self.move_ordering is not None:
+            self.move_ordering.new_search()
+        self._start_endgame(state)
+        best_action, _ = self._find_best_action(game_tree, depth)
+        self._finish_stats(depth + 1)
+        return best_action
+
+    def _start_stats(self) -> None:
+        """
+        Purpose: Start new stats for the search for a move, if the strategy collects stats
+        Signature: Void -> Void
+        """
+        if self.collect_stats:
+            self._stats = SearchStats()
+            self._stats_start = time.perf_counter()
+
+    def _start_endgame(self, state: FishGameState) -> None:
+        """
+        Purpose: Decide whether the search for a move scores its nodes with the endgame solver, which it does when the
+                 root state can be solved
+        Signature: FishGameState -> Void
+        :param state: The root state of the search
+        """
+        self._solve_endgame = (self.endgame_solver is not None
+                               and self.endgame_solver.solve(state, self._check_search_budget) is not None)
+
+    def _finish_stats(self, completed_depth: int) -> None:
+        """
+        Purpose: Finish the stats of the search for a move and keep them in last_stats
+        Signature: Int -> Void
+        :param completed_depth: How many plies below the root the search that found the move looked
+        """
+        stats = self._stats
+        if stats is not None:
+            stats.completed_depth = completed_depth
+            stats.total_seconds = time.perf_counter() - self._stats_start
+            self.last_stats = stats
+            self._stats = None
+
+    def _find_best_action(self, game_tree: FishGameTree, depth: int,
+                          principal_variation: List[Optional[Action]] = None) -> Tuple[Action, List[Optional[Action]]]:
+        """
+        Purpose: Find the best action from the root of a game tree by finding the maximin value of each of its children
+                 to a certain depth and breaking ties between the best children
+        Signature: FishGameTree Int [Maybe[Action]] -> (Action, [Maybe[Action]])
+        :param game_tree: The tree for the state we are looking for a move in
+        :param depth: How many nodes down from the children of the root we have to go before evaluating a node
+        :param principal_variation: The line of best play found by an earlier search, which is searched first so
+                                    that the alpha-beta search can prune more. Not used by the maximin search.
+        :return: The best action and the principal variation (line of best play, where None stands for a skipped
+                 turn) starting with that action. The principal variation is empty for the maximin search.
+        """
         max_value = float("-inf")
-        best_children = []
-        for child in game_tree.generate_direct_children():
-            # we have already gone one turn down, so
-            # depth is amount of players there are * the number of turns - 1
-            depth = (self.look_ahead_turns - 1) * len(state.get_player_order())
-            minimax_value = FishBasicStrategy._find_maximin_value(child, False,
-                                                                  depth,
-                                                                  game_tree.get_turn_color())
+        best_actions = []
+        best_lines = {}
+        color = game_tree.get_turn_color()
+        first_action = principal_variation[0] if principal_variation else None
+        # the alpha-beta search makes and takes back moves on one copy of the state instead of copying it per node
+        state = game_tree.get_state() if self.use_alpha_beta else None
+        self._root_depth = depth
+        stats = self._stats
+        if stats is not None:
+            stats.record_node(0)
+            stats.record_expansion(len(game_tree.get_children_moves()))
+        for action in self._order_actions(state, game_tree.get_children_moves(), 0, first_action):
+            if self.use_alpha_beta:
+                record = self._apply_move(state, action)
+                try:
+                    # Fish amounts are integers, so searching with alpha one below the best value so far still
+                    # returns the exact value of every child that ties it, which keeps the tiebreaker the same
+                    minimax_value, line = self._find_alpha_beta_value(
+                        state, False, depth, color, max_value - 1, float("inf"),
+                        self._follow_principal_variation(action, principal_variation))
+                finally:
+                    self._undo_move(state, record)
+            else:
+                minimax_value = FishBasicStrategy._find_maximin_value(game_tree.validate_and_compute_node(action),
+                                                                      False, depth, color)
+                line = []
             if minimax_value > max_value:
-                best_children = [child]
+                best_actions = [action]
                 max_value = minimax_value
+                best_lines = {action: line}
             elif minimax_value == max_value:
-                best_children.append(child)
-        if len(best_children) == 1:
-            best_action = best_children[0].parent_action
+                best_actions.append(action)
+                best_lines[action] = line
+        if len(best_actions) == 1:
+            best_action = best_actions[0]
         else:
-            best_action = FishBasicStrategy._break_ties([tree.get_parent_action() for tree in best_children])
-        return best_action
-
+            best_action = FishBasicStrategy._break_ties(best_actions)
+        best_line = [best_action] + best_lines[best_action] if self.use_alpha_beta else []
+        return best_action, best_line
 
     @staticmethod
     def _break_ties(best_actions: List[Action]) -> Action:
@@ -111,10 +237,20 @@ class FishBasicStrategy(StrategyInterface):
         :return: Returns an integer representing the maximum value that a player is guaranteed to get
                  from that position in the tree
         """
+        stats = tree.stats
+        if stats is not None:
+            stats.record_node(tree.depth)
         # if we have gone N turns or hit an end game state
         if depth == 0 or tree.is_end_game_state():
-            return tree.get_state().get_fish_for_player(maximizing_player_color)
+            # the state is only read here, so there is no need for the copy that get_state makes
+            if stats is None:
+                return tree.state.get_fish_for_player(maximizing_player_color)
+            stats.leaves += 1
+            return stats.time(SearchActivity.EVALUATION, tree.state.get_fish_for_player, maximizing_player_color)
 
+        if stats is not None:
+            # a player who cannot move has their turn skipped, which is the only child of their node
+            stats.record_expansion(len(tree.get_children_moves()) or 1)
         if maximizing_player:
             compare_val = float("-inf")
             compare_func = max
@@ -129,10 +265,204 @@ class FishBasicStrategy(StrategyInterface):
             ))
         return compare_val
 
+    def _find_alpha_beta_value(self, state: FishGameState, maximizing_player: bool, depth: int,
+                               maximizing_player_color: PlayerColor, alpha: float, beta: float,
+                               principal_variation: List[Optional[Action]] = None
+                               ) -> Tuple[float, List[Optional[Action]]]:
+        """
+        Purpose: Find the maximin value for a certain state to a certain depth like _find_maximin_value, but
+                 stop expanding the children of a node once it is known that the node cannot change the value
+                 of its parent (alpha-beta pruning). If the real value of the state is between alpha and beta the
+                 exact value is returned, if it is <= alpha then some value <= alpha is returned and if it is
+                 >= beta then some value >= beta is returned.
+
+                 Instead of creating a FishGameTree with a copy of the state for every node, the children of a node
+                 are visited by making their move on the state with apply_move and taking it back with undo_move,
+                 so the state is the same as it was passed in once this returns.
+        Signature: FishGameState Bool Int PlayerColor Number Number [Maybe[Action]] -> (Number, [Maybe[Action]])
+        :param state: The state which we are searching for the best moves on for a certain player
+        :param maximizing_player: Whether it is the maximizing players turn
+        :param depth: How many nodes down in the tree we have to go before returning the value
+        :param maximizing_player_color: The color of the player who is trying to maximize their value
+        :param alpha: The value the maximizing player is already guaranteed to get higher up in the tree
+        :param beta: The value the minimizing players can already hold the maximizing player to higher up in the tree
+        :param principal_variation: Line of best play from this node found by an earlier search, searched first
+        :return: The maximin value of the state, or a bound on it if it falls outside of alpha and beta, and the line
+                 of play below this node that leads to that value
+        """
+        self._check_search_budget()
+        # a node at this depth is this many moves below the root, whose children are searched at the root depth
+        ply = self._root_depth - depth + 1
+        stats = self._stats
+        if stats is not None:
+            stats.record_node(ply)
+        if self._solve_endgame:
+            if stats is None:
+                final_fish = self.endgame_solver.solve(state, self._check_search_budget)
+            else:
+                final_fish = stats.time(SearchActivity.EVALUATION, self.endgame_solver.solve, state,
+                                        self._check_search_budget)
+            if final_fish is not None:
+                if stats is not None:
+                    stats.solved += 1
+                return final_fish[maximizing_player_color], []
+        if depth == 0:
+            if state.can_any_player_move():
+                self._reached_depth_limit = True
+            return self._evaluate_leaf(state, maximizing_player_color), []
+        if stats is None:
+            moves = FishGameTree.find_actions_for_state(state)
+        else:
+            moves = stats.time(SearchActivity.MOVE_GENERATION, FishGameTree.find_actions_for_state, state)
+        if not moves and not state.can_any_player_move():
+            return self._evaluate_leaf(state, maximizing_player_color), []
+
+        first_action = principal_variation[0] if principal_variation else None
+        table = self.transposition_table
+        if table is not None:
+            key = state.get_zobrist_hash() ^ maximizing_player_key(maximizing_player_color)
+            entry = table.probe(key)
+            if entry is not None:
+                # leaves are scored by the fish collected so far, so a value searched to another depth is on another
+                # scale and is only used to order the moves, unless it holds for any depth
+                if entry.depth in (depth, TranspositionTable.COMPLETE_DEPTH) and (
+                        entry.bound == BoundType.EXACT
+                        or entry.bound == BoundType.LOWER and entry.value >= beta
+                        or entry.bound == BoundType.UPPER and entry.value <= alpha):
+                    table.record_cutoff()
+                    if stats is not None:
+                        stats.table_cutoffs += 1
+                    if entry.depth != TranspositionTable.COMPLETE_DEPTH:
+                        self._reached_depth_limit = True
+                    return entry.value, []
+                if first_action is None:
+                    first_action = entry.best_action
+            original_alpha, original_beta = alpha, beta
+            # note whether this subtree stops anywhere because of the depth, as a result that only stops at the end
+            # of the game holds for any depth
+            reached_depth_limit_above = self._reached_depth_limit
+            self._reached_depth_limit = False
+
+        value = float("-inf") if maximizing_player else float("inf")
+        best_line = []
+        # a player who cannot move has their turn skipped, which is the only child of their node
+        actions = moves or [None]
+        if stats is not None:
+            stats.record_expansion(len(actions))
+        for action in self._order_actions(state, actions, ply, first_action):
+            record = self._apply_move(state, action)
+            try:
+                child_value, child_line = self._find_alpha_beta_value(
+                    state, state.get_current_turn() == maximizing_player_color, depth - 1, maximizing_player_color,
+                    alpha, beta, self._follow_principal_variation(action, principal_variation))
+            finally:
+                self._undo_move(state, record)
+            if maximizing_player and child_value > value or not maximizing_player and child_value < value:
+                value = child_value
+                best_line = [action] + child_line
+            if maximizing_player:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                if stats is not None:
+                    stats.cutoffs += 1
+                if self.move_ordering is not None and action is not None:
+                    self.move_ordering.record_cutoff(action, ply, depth)
+                break
+
+        if table is not None:
+            if value <= original_alpha:
+                bound = BoundType.UPPER
+            elif value >= original_beta:
+                bound = BoundType.LOWER
+            else:
+                bound = BoundType.EXACT
+            stored_depth = depth if self._reached_depth_limit else TranspositionTable.COMPLETE_DEPTH
+            table.store(key, stored_depth, value, bound, best_line[0] if best_line else None)
+            self._reached_depth_limit = self._reached_depth_limit or reached_depth_limit_above
+        return value, best_line
+
+    def _evaluate_leaf(self, state: FishGameState, maximizing_player_color: PlayerColor) -> int:
+        """
+        Purpose: Score a leaf of the alpha-beta search as the fish of the maximizing player, counting it in the stats
+        Signature: FishGameState PlayerColor -> Int
+        """
+        stats = self._stats
+        if stats is None:
+            return state.get_fish_for_player(maximizing_player_color)
+        stats.leaves += 1
+        return stats.time(SearchActivity.EVALUATION, state.get_fish_for_player, maximizing_player_color)
+
+    def _apply_move(self, state: FishGameState, action: Optional[Action]) -> MoveRecord:
+        """
+        Purpose: Make a move on the state of the alpha-beta search, timing it in the stats
+        Signature: FishGameState Maybe[Action] -> MoveRecord
+        """
+        if self._stats is None:
+            return state.apply_move(action)
+        return self._stats.time(SearchActivity.APPLY, state.apply_move, action)
+
+    def _undo_move(self, state: FishGameState, record: MoveRecord) -> None:
+        """
+        Purpose: Take back a move made with _apply_move, timing it in the stats
+        Signature: FishGameState MoveRecord -> Void
+        """
+        if self._stats is None:
+            state.undo_move(record)
+        else:
+            self._stats.time(SearchActivity.APPLY, state.undo_move, record)
+
+    def _check_search_budget(self) -> None:
+        """
+        Purpose: Hook called at every node of the alpha-beta search so that strategies with a limited amount of
+                 time can stop searching. The basic strategy always searches to its full depth.
+        Signature: Void -> Void
+        """
+        pass
+
+    def _order_actions(self, state: Optional[FishGameState], actions: List[Optional[Action]], ply: int,
+                       first_action: Optional[Action] = None) -> List[Optional[Action]]:
+        """
+        Purpose: Order the actions of a node so that an action that is likely to be best (such as the first action
+                 of a principal variation) is searched first, if that action can be taken from the node, followed by
+                 the other actions in the order of the move ordering of the alpha-beta search, if there is one
+        Signature: Maybe[FishGameState] [Maybe[Action]] Int Maybe[Action] -> [Maybe[Action]]
+        :param state: The state of the node, or None for the maximin search which does not order actions
+        :param actions: The actions that can be taken from a node, in the order they were found
+        :param ply: How many moves the node is below the root of the search
+        :param first_action: Action that should be searched first
+        :return: The actions with the first action moved to the front
+        """
+        if self.move_ordering is not None and state is not None and len(actions) > 1:
+            actions = self.move_ordering.order_actions(state, actions, ply)
+        if first_action is not None and first_action in actions:
+            return [first_action] + [action for action in actions if action != first_action]
+        return actions
+
+    @staticmethod
+    def _follow_principal_variation(action: Optional[Action],
+                                    principal_variation: List[Optional[Action]] = None) -> List[Optional[Action]]:
+        """
+        Purpose: Find the part of a principal variation that continues below the child reached by an action, if the
+                 principal variation goes through that child
+        Signature: Maybe[Action] [Maybe[Action]] -> [Maybe[Action]]
+        :param action: Action taken from the node the principal variation starts from, or None for a skipped turn
+        :param principal_variation: Line of best play from the node the action is taken from
+        :return: The rest of the principal variation below the child, or an empty list if it does not go through it
+        """
+        if principal_variation and principal_variation[0] == action:
+            return principal_variation[1:]
+        return []
+
+    def accepts_state_view(self) -> bool:
+        # the searches copy the state they are given before making any moves on it
+        return True
+
     def find_next_placement(self, state: FishGameState) -> Coordinate:
         """
         Purpose: To find the next valid coordinate where a player can place a penguin, going left to right on the board
-        rows
+        rows and skipping holes
         Signature: FishGameState -> Coordinate
         :param state: The current state of the game
         :return: Coordinate representing a position where a penguin can be placed
@@ -140,7 +470,7 @@ class FishBasicStrategy(StrategyInterface):
         board = state.get_board()
         sorted_coords = board.get_coords_sorted_by_row()
         for coord in sorted_coords:
-            if not FishBasicStrategy._any_player_has_penguin(state, coord):
+            if board.get_tile_at_coord(*coord) and not FishBasicStrategy._any_player_has_penguin(state, coord):
                 return coord
         raise ValueError("Board cannot accommodate all penguins.")
 
@@ -153,11 +483,6 @@ class FishBasicStrategy(StrategyInterface):
         :param coord: A valid coordinate on the board in the state
         :return: Boolean representing if any of the players have a penguin in the given coord
         """
-        for player in state.get_player_order():
-            penguins = state.get_penguins_for_player(player)
-            if penguins:
-                if coord in penguins:
-                    return True
-        return False
+        return state.get_penguin_color_at_pos(coord) is not None
 
 
@@ -24,3 +24,12 @@ class StrategyInterface(object):
         """
         raise NotImplemented
 
+    def accepts_state_view(self) -> bool:
+        """
+        Purpose: Tell a player whether this strategy can be given a read-only view of the state of the game (see
+                 FishGameStateView) instead of a copy, which it can if it never changes or keeps the state it is
+                 given. Strategies may change the state they are given unless they opt in by returning True.
+        Signature: Void -> Bool
+        """
+        return False
+
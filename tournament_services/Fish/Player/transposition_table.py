@@ -0,0 +1,136 @@
+from typing import List, Optional, NamedTuple, Dict
+
+from Fish.Common.representations.types import Action
+from Fish.Common.representations.zobrist import ZobristHash
+from Fish.Player.bound_type import BoundType
+
+
+class TranspositionEntry(NamedTuple):
+    """
+    A TranspositionEntry is a result stored by an alpha-beta search for a node in the game tree.
+    key is the Zobrist hash the node was stored under, depth is how many plies below the node were searched to find
+    value, bound notes whether value is the exact maximin value of the node or a lower or upper bound on it,
+    best_action is the action that led to the value (None if it was a skipped turn or the node was a leaf) and
+    generation is the search that stored the entry.
+    """
+    key: ZobristHash
+    depth: float
+    value: float
+    bound: BoundType
+    best_action: Optional[Action]
+    generation: int
+
+
+class TranspositionTable(object):
+    """
+    This is a bounded table of results from alpha-beta searches, keyed by the Zobrist hash of the state of a node.
+    Different orders of moves often lead to the same state, so a search can reuse the result it stored for a state
+    instead of searching it again.
+
+    The table has a fixed amount of slots and every key maps to exactly one slot. When two keys map to the same slot
+    the entry that is kept is chosen by depth: an entry is replaced by an entry that was searched at least as deep, or
+    by any entry once it was stored by an earlier search (an earlier generation). Deeper entries save more work when
+    they are reused, while entries from earlier searches are less likely to be reached again.
+
+    The table counts how it is used, so that its savings can be seen:
+    - probes: amount of lookups
+    - hits: amount of lookups that found an entry for the key
+    - cutoffs: amount of hits whose value was used instead of searching the node
+    - stores: amount of entries stored
+    - overwrites: amount of stored entries that replaced an entry for a different key
+    - rejections: amount of entries that were not stored to keep a deeper entry
+    """
+
+    # Depth stored for results that reached the end of the game everywhere below a node, which hold for any depth
+    COMPLETE_DEPTH = float('inf')
+
+    def __init__(self, capacity: int = 2 ** 16):
+        """
+        Purpose: Initialize an empty transposition table
+        Signature: Int -> TranspositionTable
+        :param capacity: Max amount of entries the table can hold
+        """
+        if capacity <= 0:
+            raise ValueError('Capacity must be > 0')
+        self.capacity = capacity
+        self._slots: List[Optional[TranspositionEntry]] = [None] * capacity
+        self._generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+        self.overwrites = 0
+        self.rejections = 0
+
+    def new_search(self) -> None:
+        """
+        Purpose: Note that a new search is starting, so that entries from earlier searches can be replaced
+        Signature: Void -> Void
+        """
+        self._generation += 1
+
+    def probe(self, key: ZobristHash) -> Optional[TranspositionEntry]:
+        """
+        Purpose: Look up the entry stored for a key
+        Signature: ZobristHash -> Maybe[TranspositionEntry]
+        :param key: Key to look up
+        :return: The entry for the key or None if there is no entry for it
+        """
+        self.probes += 1
+        entry = self._slots[key % self.capacity]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def record_cutoff(self) -> None:
+        """
+        Purpose: Note that a search used the value of an entry instead of searching a node
+        Signature: Void -> Void
+        """
+        self.cutoffs += 1
+
+    def store(self, key: ZobristHash, depth: float, value: float, bound: BoundType,
+              best_action: Optional[Action]) -> None:
+        """
+        Purpose: Store the result of searching a node, unless it would replace a deeper entry from this search
+        Signature: ZobristHash Number Number BoundType Maybe[Action] -> Void
+        :param key: Key of the state of the node
+        :param depth: How many plies below the node were searched
+        :param value: Value found for the node
+        :param bound: How the value relates to the maximin value of the node
+        :param best_action: Action that led to the value
+        """
+        index = key % self.capacity
+        entry = self._slots[index]
+        if entry is not None and entry.generation == self._generation and entry.depth > depth:
+            self.rejections += 1
+            return
+        if entry is not None and entry.key != key:
+            self.overwrites += 1
+        self.stores += 1
+        self._slots[index] = TranspositionEntry(key, depth, value, bound, best_action, self._generation)
+
+    def hit_rate(self) -> float:
+        """
+        Purpose: Get the fraction of lookups that found an entry
+        Signature: Void -> Float
+        """
+        return self.hits / self.probes if self.probes else 0.0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Purpose: Get the counters of how this table has been used
+        Signature: Void -> Dict[String, Number]
+        :return: Dictionary from the name of each counter to its value, plus the hit rate
+        """
+        return {'probes': self.probes, 'hits': self.hits, 'cutoffs': self.cutoffs, 'stores': self.stores,
+                'overwrites': self.overwrites, 'rejections': self.rejections, 'hit_rate': self.hit_rate()}
+
+    def clear(self) -> None:
+        """
+        Purpose: Remove all entries and reset the counters
+        Signature: Void -> Void
+        """
+        self._slots = [None] * self.capacity
+        self.probes = self.hits = self.cutoffs = self.stores = self.overwrites = self.rejections = 0
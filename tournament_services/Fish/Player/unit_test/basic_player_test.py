@@ -9,7 +9,9 @@ from Fish.Common.representations.enumerations.player_color_enum import PlayerCol
 from Fish.Common.representations.fish_board import FishBoardModel
 from Fish.Common.representations.game_state import FishGameStateFactory
 from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
+from Fish.Player.mcts_strategy import FishMCTSStrategy
 from Fish.Player.player import BasicPlayer
+from Fish.Player.strategy_interface import StrategyInterface
 
 class BasicPlayerTest(unittest.TestCase):
     """Test player implementation for our basic player"""
@@ -60,6 +62,14 @@ class BasicPlayerTest(unittest.TestCase):
         player.show_other_players_colors([PlayerColor.RED, PlayerColor.WHITE])
         self.assertEqual([PlayerColor.RED, PlayerColor.WHITE], player.other_colors)
 
+    def test_accepts_state_view(self):
+        """
+        Test that a player only accepts state views if its strategy does, which strategies have to opt in to
+        """
+        self.assertTrue(BasicPlayer().accepts_state_view())
+        self.assertTrue(BasicPlayer(strategy=FishMCTSStrategy(playouts=1)).accepts_state_view())
+        self.assertFalse(BasicPlayer(strategy=StrategyInterface()).accepts_state_view())
+
     def test_show_winners(self):
         """
         Test being informed of winners
@@ -0,0 +1,171 @@
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+import unittest
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.bitboard_fish_board import BitboardFishBoardModel
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Common.representations.game_state_view import FishGameStateView
+from Fish.Player.endgame_solver import FishEndgameSolver
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.unit_test import strategy_test
+
+
+class EndgameSolverTest(unittest.TestCase):
+
+    def test_solve_region_line(self):
+        """
+        Purpose: Test that a penguin in a line of tiles collects the fish of every tile but the one it ends on, in the
+                 order that leaves the tile with the least fish for last
+        Signature: Void -> Void
+        """
+        solver = FishEndgameSolver()
+        self.assertEqual(4, solver.solve_region({(0, 0): 1, (0, 2): 2, (0, 4): 3}, [(0, 0)]))
+        self.assertEqual(5, solver.solve_region({(0, 0): 1, (0, 2): 2, (0, 4): 3}, [(0, 4)]))
+        self.assertEqual(0, solver.solve_region({(0, 0): 4}, [(0, 0)]))
+
+    def test_solve_region_penguins_block(self):
+        """
+        Purpose: Test that penguins of the same player in a region stop each other's moves
+        Signature: Void -> Void
+        """
+        solver = FishEndgameSolver()
+        # once one penguin moves to the middle of the line neither penguin can move again
+        self.assertEqual(1, solver.solve_region({(0, 0): 1, (0, 2): 5, (0, 4): 1}, [(0, 0), (0, 4)]))
+        self.assertEqual(0, solver.solve_region({(0, 0): 1, (0, 2): 5}, [(0, 0), (0, 2)]))
+
+    def test_solve(self):
+        """
+        Purpose: Test solving a state whose board is split between the players by a column of holes
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_coords_to_fish(3, 3, [
+            ((0, 0), 1), ((1, 1), 2), ((0, 2), 3), ((4, 0), 4), ((5, 1), 5), ((4, 2), 1)])
+        state = FishGameStateFactory.create_move_penguins_state(
+            board, [(PlayerColor.RED, [(0, 0)], 2), (PlayerColor.WHITE, [(5, 1)], 0)], check_penguin_amount=False)
+        solver = FishEndgameSolver()
+        # red goes (0, 0) -> (0, 2) -> (1, 1), white goes (5, 1) -> (4, 0) -> (4, 2)
+        self.assertEqual({PlayerColor.RED: 6, PlayerColor.WHITE: 9}, solver.solve(state))
+        self.assertEqual({PlayerColor.RED: 6, PlayerColor.WHITE: 9}, solver.solve(FishGameStateView(state)))
+        self.assertEqual(2, solver.solved_states)
+
+    def test_cannot_solve(self):
+        """
+        Purpose: Test that states with penguins of several players in a region, with regions that are too large or
+                 in the placing phase are not solved
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(3, 3, 2)
+        players = [(PlayerColor.RED, [(0, 0)], 0), (PlayerColor.WHITE, [(5, 1)], 0)]
+        solver = FishEndgameSolver()
+        state = FishGameStateFactory.create_move_penguins_state(board, players, check_penguin_amount=False)
+        self.assertIsNone(solver.solve(state))
+        self.assertIsNone(solver.solve(FishGameStateFactory.create_place_penguins_state(
+            board, [(PlayerColor.RED, [(0, 0)]), (PlayerColor.WHITE, [])])))
+        board = FishBoardModel.create_with_holes(3, 3, {(2, 0), (3, 1), (2, 2)}, 0)
+        state = FishGameStateFactory.create_move_penguins_state(board, players, check_penguin_amount=False)
+        self.assertIsNotNone(solver.solve(state))
+        self.assertIsNone(FishEndgameSolver(max_region_tiles=2).solve(state))
+        self.assertEqual(1, solver.solved_states)
+
+    def test_solve_matches_search(self):
+        """
+        Purpose: Test that the solver finds the same final amounts of fish as an alpha-beta search to the end of the
+                 game on random split states
+        Signature: Void -> Void
+        """
+        rng = random.Random(2)
+        solver = FishEndgameSolver()
+        for _ in range(4):
+            state = strategy_test.StrategyTest.create_random_split_state(rng, 4, 5, 2, 3, BitboardFishBoardModel)
+            final_fish = solver.solve(state)
+            for color in state.get_player_order():
+                search = FishBasicStrategy(1, use_alpha_beta=True)
+                value, _ = search._find_alpha_beta_value(state, color == state.get_current_turn(), 100, color,
+                                                         float('-inf'), float('inf'))
+                self.assertEqual(value, final_fish[color])
+
+    def test_strategy_with_solver(self):
+        """
+        Purpose: Test that a strategy with the solver finds the same move as a search to the end of the game, which
+                 it finds without going further than the first move
+        Signature: Void -> Void
+        """
+        rng = random.Random(5)
+        for _ in range(4):
+            state = strategy_test.StrategyTest.create_random_split_state(rng, 4, 5, 2, 3, BitboardFishBoardModel)
+            state_hash = state.get_zobrist_hash()
+            strategy = FishBasicStrategy(2, use_alpha_beta=True, endgame_solver=FishEndgameSolver())
+            self.assertEqual(FishBasicStrategy(50, use_alpha_beta=True).find_next_move(state),
+                             strategy.find_next_move(state))
+            self.assertEqual(state_hash, state.get_zobrist_hash())
+
+    def test_check_budget(self):
+        """
+        Purpose: Test that the budget check stops the solver, which keeps the regions it solved before it stopped and
+                 only checks the budget for regions that are not in the table
+        Signature: Void -> Void
+        """
+        tiles = {(x, y): 1 + (x + y) % 3 for y in range(4) for x in range(y % 2, 6, 2)}
+        checks = []
+
+        def check_budget():
+            checks.append(None)
+            if len(checks) > 20:
+                raise TimeoutError
+
+        solver = FishEndgameSolver()
+        with self.assertRaises(TimeoutError):
+            solver.solve_region(tiles, [(0, 0), (5, 3)], check_budget)
+        self.assertGreater(len(solver.region_values), 0)
+        self.assertLess(len(solver.region_values), 20)
+        expected = FishEndgameSolver().solve_region(tiles, [(0, 0), (5, 3)])
+        self.assertEqual(expected, solver.solve_region(tiles, [(0, 0), (5, 3)]))
+        checks.clear()
+        self.assertEqual(expected, solver.solve_region(tiles, [(0, 0), (5, 3)], check_budget))
+        self.assertEqual([], checks)
+
+    def test_solver_needs_split_root(self):
+        """
+        Purpose: Test that a search from a root whose board is not split does not use the solver, even for the nodes
+                 below it whose board is split, and finds the same move as a search without it
+        Signature: Void -> Void
+        """
+        # a state where one of the eight moves of the player whose turn it is splits the board
+        state = strategy_test.StrategyTest.create_random_move_state(random.Random(58), 4, 5, 2)
+        self.assertFalse(state.are_penguins_separated())
+        split_moves = 0
+        for action in FishGameTree.find_actions_for_state(state):
+            record = state.apply_move(action)
+            split_moves += state.are_penguins_separated()
+            state.undo_move(record)
+        self.assertEqual(1, split_moves)
+        solver = FishEndgameSolver()
+        strategy = FishBasicStrategy(2, use_alpha_beta=True, endgame_solver=solver)
+        self.assertEqual(FishBasicStrategy(2, use_alpha_beta=True).find_next_move(state),
+                         strategy.find_next_move(state))
+        self.assertEqual(0, solver.solved_states)
+
+    def test_max_entries(self):
+        """
+        Purpose: Test that the table of region values is emptied once it is full, and that solvers need valid limits
+        Signature: Void -> Void
+        """
+        solver = FishEndgameSolver(max_entries=2)
+        self.assertEqual(4, solver.solve_region({(0, 0): 1, (0, 2): 2, (0, 4): 3}, [(0, 0)]))
+        self.assertLessEqual(len(solver.region_values), 2)
+        self.assertEqual(2, solver.solve_region({(0, 0): 1, (0, 2): 2, (0, 4): 3}, [(0, 2)]))
+        self.assertLessEqual(len(solver.region_values), 2)
+        with self.assertRaises(ValueError):
+            FishEndgameSolver(max_region_tiles=0)
+        with self.assertRaises(ValueError):
+            FishEndgameSolver(max_entries=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
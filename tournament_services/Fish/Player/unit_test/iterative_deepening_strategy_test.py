@@ -0,0 +1,152 @@
+import random
+import time
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Player.endgame_solver import FishEndgameSolver
+from Fish.Player.iterative_deepening_strategy import FishIterativeDeepeningStrategy
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.transposition_table import TranspositionTable
+from Fish.Player.unit_test import strategy_test
+
+
+class IterativeDeepeningStrategyTest(unittest.TestCase):
+
+    @staticmethod
+    def create_contrived_state():
+        """
+        Purpose: Create the state from the basic maximin strategy test, where looking further ahead changes the move
+        Signature: Void -> FishGameState
+        """
+        coords_to_fish = [((0, 0), 1), ((2, 0), 1),
+                          ((1, 1), 1), ((3, 1), 1),
+                          ((0, 2), 2), ((2, 2), 3),
+                          ((1, 3), 1), ((3, 3), 1)]
+        test_board = FishBoardModel.create_with_coords_to_fish(4, 2, coords_to_fish)
+        return FishGameStateFactory.create_move_penguins_state(test_board,
+                                                               [(PlayerColor.RED, [(0, 0)], 0),
+                                                                (PlayerColor.BLACK, [(3, 1)], 0)],
+                                                               check_penguin_amount=False,
+                                                               turn=PlayerColor.BLACK)
+
+    def test_invalid_budget(self):
+        """
+        Purpose: Test that the strategy needs a positive time budget and max depth
+        Signature: Void -> Void
+        """
+        with self.assertRaises(ValueError):
+            FishIterativeDeepeningStrategy(0)
+        with self.assertRaises(ValueError):
+            FishIterativeDeepeningStrategy(1, max_depth=0)
+
+    def test_same_as_basic_strategy(self):
+        """
+        Purpose: Test that searching to the amount of plies of a basic strategy finds the same move as that strategy
+        Signature: Void -> Void
+        """
+        test_state = IterativeDeepeningStrategyTest.create_contrived_state()
+        strategy = FishIterativeDeepeningStrategy(60, max_depth=1)
+        self.assertEqual(((3, 1), (2, 0)), strategy.find_next_move(test_state))
+        self.assertEqual(1, strategy.last_completed_depth)
+        # two turns ahead for 2 players is 3 plies
+        strategy = FishIterativeDeepeningStrategy(60, max_depth=3)
+        self.assertEqual(((3, 1), (2, 2)), strategy.find_next_move(test_state))
+
+    def test_same_as_basic_strategy_random_boards(self):
+        """
+        Purpose: Test that the strategy finds the same moves as a basic strategy on random boards
+        Signature: Void -> Void
+        """
+        rng = random.Random(4500)
+        for _ in range(5):
+            coords = FishBoardModel.create_coords(4, 4)
+            coords_to_fish = [(coord, rng.choice([0, 1, 2, 3, 4, 5])) for coord in coords]
+            tiles = [coord for coord, fish in coords_to_fish if fish]
+            rng.shuffle(tiles)
+            board = FishBoardModel.create_with_coords_to_fish(4, 4, coords_to_fish)
+            test_state = FishGameStateFactory.create_move_penguins_state(
+                board, [(PlayerColor.RED, tiles[:2], 0), (PlayerColor.WHITE, tiles[2:4], 0)],
+                check_penguin_amount=False)
+            if not FishGameTree(test_state).get_children_moves():
+                continue
+            self.assertEqual(FishBasicStrategy(2).find_next_move(test_state),
+                             FishIterativeDeepeningStrategy(60, max_depth=3).find_next_move(test_state))
+
+    def test_same_with_transposition_table(self):
+        """
+        Purpose: Test that sharing a transposition table between the searches at each depth finds the same move
+        Signature: Void -> Void
+        """
+        test_state = IterativeDeepeningStrategyTest.create_contrived_state()
+        table = TranspositionTable()
+        strategy = FishIterativeDeepeningStrategy(60, max_depth=3, transposition_table=table)
+        self.assertEqual(((3, 1), (2, 2)), strategy.find_next_move(test_state))
+        strategy = FishIterativeDeepeningStrategy(60, transposition_table=table)
+        self.assertEqual(FishBasicStrategy(30).find_next_move(test_state), strategy.find_next_move(test_state))
+        self.assertGreater(table.hits, 0)
+
+    def test_stops_at_end_of_game(self):
+        """
+        Purpose: Test that the strategy stops deepening once the whole game has been searched
+        Signature: Void -> Void
+        """
+        test_state = IterativeDeepeningStrategyTest.create_contrived_state()
+        strategy = FishIterativeDeepeningStrategy(60)
+        self.assertEqual(FishBasicStrategy(30).find_next_move(test_state), strategy.find_next_move(test_state))
+        self.assertLessEqual(strategy.last_completed_depth, 10)
+
+    def test_stops_at_split_board(self):
+        """
+        Purpose: Test that with an endgame solver the strategy stops after the first search from a split root, as
+                 the children of the root are solved and their values hold for any depth
+        Signature: Void -> Void
+        """
+        rng = random.Random(1)
+        for _ in range(3):
+            test_state = strategy_test.StrategyTest.create_random_split_state(rng, 4, 5, 2, 3)
+            strategy = FishIterativeDeepeningStrategy(60, endgame_solver=FishEndgameSolver())
+            self.assertEqual(FishBasicStrategy(50, use_alpha_beta=True).find_next_move(test_state),
+                             strategy.find_next_move(test_state))
+            self.assertEqual(1, strategy.last_completed_depth)
+
+    def test_search_stats(self):
+        """
+        Purpose: Test that the stats of a move add up the searches at every depth
+        Signature: Void -> Void
+        """
+        test_state = IterativeDeepeningStrategyTest.create_contrived_state()
+        strategy = FishIterativeDeepeningStrategy(60, max_depth=3, collect_stats=True)
+        strategy.find_next_move(test_state)
+        deepest = FishBasicStrategy(2, use_alpha_beta=True, collect_stats=True)
+        deepest.find_next_move(test_state)
+        self.assertEqual(3, strategy.last_stats.completed_depth)
+        self.assertEqual(deepest.last_stats.max_ply, strategy.last_stats.max_ply)
+        self.assertGreater(strategy.last_stats.nodes, deepest.last_stats.nodes)
+        self.assertIsNone(FishIterativeDeepeningStrategy(60, max_depth=3).last_stats)
+
+    def test_time_budget(self):
+        """
+        Purpose: Test that the strategy returns a valid move within its budget on a board too large to search fully
+        Signature: Void -> Void
+        """
+        board = FishBoardModel.create_with_same_fish_amount(8, 8, 2)
+        test_state = FishGameStateFactory.create_move_penguins_state(
+            board, [(PlayerColor.RED, [(0, 0), (2, 0), (4, 0), (6, 0)], 0),
+                    (PlayerColor.WHITE, [(1, 7), (3, 7), (5, 7), (7, 7)], 0)])
+        strategy = FishIterativeDeepeningStrategy(0.5)
+        start = time.perf_counter()
+        action = strategy.find_next_move(test_state)
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertIn(action, FishGameTree(test_state).get_children_moves())
+        self.assertGreaterEqual(strategy.last_completed_depth, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import pickle
+import random
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+import unittest
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.game_state_view import FishGameStateView
+from Fish.Player.mcts_strategy import FishMCTSStrategy
+from Fish.Player.player import BasicPlayer
+from Fish.Player.rollout_policy import RolloutPolicy
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.unit_test import strategy_test
+
+
+class MCTSStrategyTest(unittest.TestCase):
+
+    @staticmethod
+    def create_state(seed=3, size=5):
+        """
+        Purpose: Create a random state in the penguin moving phase with 2 players of 4 penguins, where the player
+                 whose turn it is can move
+        Signature: Int Int -> FishGameState
+        """
+        rng = random.Random(seed)
+        state = strategy_test.StrategyTest.create_random_move_state(rng, size, size, 2, 4)
+        while not FishGameTree(state).get_children_moves():
+            state = strategy_test.StrategyTest.create_random_move_state(rng, size, size, 2, 4)
+        return state
+
+    def test_valid_move_and_budget(self):
+        """
+        Purpose: Test that the strategy runs its playouts and returns a valid move without changing the state
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        state_hash = state.get_zobrist_hash()
+        for policy in RolloutPolicy:
+            strategy = FishMCTSStrategy(playouts=200, rollout_policy=policy, seed=1)
+            action = strategy.find_next_move(state)
+            self.assertIn(action, FishGameTree.find_actions_for_state(state))
+            self.assertEqual(200, strategy.last_playouts)
+            self.assertEqual(state_hash, state.get_zobrist_hash())
+
+    def test_same_seed_same_move(self):
+        """
+        Purpose: Test that strategies with the same seed find the same move, also on a state view
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        first = FishMCTSStrategy(playouts=150, seed=5).find_next_move(state)
+        self.assertEqual(first, FishMCTSStrategy(playouts=150, seed=5).find_next_move(FishGameStateView(state)))
+
+    def test_time_budget(self):
+        """
+        Purpose: Test that the strategy stops searching once its time budget runs out
+        Signature: Void -> Void
+        """
+        state = self.create_state(size=8)
+        strategy = FishMCTSStrategy(time_budget=0.2, seed=1)
+        start = time.perf_counter()
+        strategy.find_next_move(state)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertGreater(strategy.last_playouts, 0)
+
+    def test_finds_best_move(self):
+        """
+        Purpose: Test that with enough playouts the strategy finds the move of an alpha-beta search to the end of the
+                 game, on small boards where that move is clearly better than the others
+        Signature: Void -> Void
+        """
+        for seed in [0, 13, 21]:
+            state = self.create_state(seed, 4)
+            best_action = FishBasicStrategy(8, use_alpha_beta=True).find_next_move(state)
+            self.assertEqual(best_action, FishMCTSStrategy(playouts=400, seed=seed).find_next_move(state))
+
+    def test_workers(self):
+        """
+        Purpose: Test that searching in worker processes splits the playouts and returns a valid move
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        with FishMCTSStrategy(playouts=101, workers=2, seed=1) as strategy:
+            action = strategy.find_next_move(state)
+            self.assertIn(action, FishGameTree.find_actions_for_state(state))
+            self.assertEqual(101, strategy.last_playouts)
+            # the worker processes are not pickled with the strategy
+            self.assertIsNone(pickle.loads(pickle.dumps(strategy))._executor)
+
+    def test_rollout_depth(self):
+        """
+        Purpose: Test that rollouts can be cut off, down to evaluating new nodes without a rollout
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        for depth in [0, 3]:
+            action = FishMCTSStrategy(playouts=50, rollout_depth=depth, seed=1).find_next_move(state)
+            self.assertIn(action, FishGameTree.find_actions_for_state(state))
+
+    def test_player_with_strategy(self):
+        """
+        Purpose: Test that a player can be configured to use the strategy
+        Signature: Void -> Void
+        """
+        state = self.create_state()
+        player = BasicPlayer(strategy=FishMCTSStrategy(playouts=20, seed=1))
+        self.assertIn(player.player_move_penguin(state), FishGameTree.find_actions_for_state(state))
+
+    def test_invalid_budgets(self):
+        """
+        Purpose: Test that a strategy needs a valid budget
+        Signature: Void -> Void
+        """
+        with self.assertRaises(ValueError):
+            FishMCTSStrategy()
+        with self.assertRaises(ValueError):
+            FishMCTSStrategy(time_budget=0)
+        with self.assertRaises(ValueError):
+            FishMCTSStrategy(playouts=10, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
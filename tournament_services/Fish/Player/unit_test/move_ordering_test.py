@@ -0,0 +1,127 @@
+import random
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Common.game_tree import FishGameTree
+from Fish.Player.iterative_deepening_strategy import FishIterativeDeepeningStrategy
+from Fish.Player.move_ordering import FishOnDestinationOrdering, KillerMoveOrdering, HistoryOrdering, \
+    CombinedMoveOrdering, create_default_move_ordering
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.transposition_table import TranspositionTable
+from Fish.Player.unit_test import strategy_test
+
+
+class MoveOrderingTest(unittest.TestCase):
+
+    def setUp(self):
+        coords_to_fish = [((0, 0), 1), ((2, 0), 1),
+                          ((1, 1), 1), ((3, 1), 1),
+                          ((0, 2), 2), ((2, 2), 3),
+                          ((1, 3), 1), ((3, 3), 1)]
+        test_board = FishBoardModel.create_with_coords_to_fish(4, 2, coords_to_fish)
+        self.test_state = FishGameStateFactory.create_move_penguins_state(test_board,
+                                                                          [(PlayerColor.RED, [(0, 0)], 0),
+                                                                           (PlayerColor.BLACK, [(3, 1)], 0)],
+                                                                          check_penguin_amount=False,
+                                                                          turn=PlayerColor.BLACK)
+
+    def test_fish_on_destination(self):
+        """
+        Purpose: Test that actions moving to tiles with more fish are ordered first, keeping the generated order
+                 between actions moving to tiles with the same amount of fish
+        Signature: Void -> Void
+        """
+        actions = FishGameTree.find_actions_for_state(self.test_state)
+        ordered = FishOnDestinationOrdering().order_actions(self.test_state, actions, 1)
+        self.assertEqual(((3, 1), (2, 2)), ordered[0])
+        self.assertEqual(sorted(actions), sorted(ordered))
+        self.assertEqual([action for action in actions if action != ((3, 1), (2, 2))], ordered[1:])
+
+    def test_killer_moves(self):
+        """
+        Purpose: Test that the most recent killer moves of a ply are ordered first and only at that ply
+        Signature: Void -> Void
+        """
+        with self.assertRaises(ValueError):
+            KillerMoveOrdering(0)
+        ordering = KillerMoveOrdering(2)
+        actions = FishGameTree.find_actions_for_state(self.test_state)
+        ordering.record_cutoff(actions[-1], 2, 1)
+        ordering.record_cutoff(actions[-2], 2, 1)
+        ordering.record_cutoff(actions[-3], 2, 1)
+        self.assertEqual([actions[-3], actions[-2]] + actions[:-3] + [actions[-1]],
+                         ordering.order_actions(self.test_state, actions, 2))
+        self.assertEqual(actions, ordering.order_actions(self.test_state, actions, 1))
+        ordering.new_search()
+        self.assertEqual(actions, ordering.order_actions(self.test_state, actions, 2))
+
+    def test_history(self):
+        """
+        Purpose: Test that actions are ordered by the depth of their cutoffs at any ply, and that history ages
+        Signature: Void -> Void
+        """
+        ordering = HistoryOrdering()
+        actions = FishGameTree.find_actions_for_state(self.test_state)
+        ordering.record_cutoff(actions[-1], 1, 1)
+        ordering.record_cutoff(actions[-2], 3, 2)
+        self.assertEqual([actions[-2], actions[-1]] + actions[:-2],
+                         ordering.order_actions(self.test_state, actions, 5))
+        ordering.new_search()
+        self.assertEqual(2, ordering.score_action(self.test_state, actions[-2], 1))
+        ordering.new_search()
+        ordering.new_search()
+        self.assertEqual(0, ordering.score_action(self.test_state, actions[-1], 1))
+
+    def test_combined(self):
+        """
+        Purpose: Test that later orderings only break ties between actions the earlier orderings score the same
+        Signature: Void -> Void
+        """
+        killers = KillerMoveOrdering()
+        ordering = CombinedMoveOrdering(killers, FishOnDestinationOrdering())
+        actions = FishGameTree.find_actions_for_state(self.test_state)
+        ordering.record_cutoff(actions[-1], 1, 1)
+        ordered = ordering.order_actions(self.test_state, actions, 1)
+        self.assertEqual([actions[-1], ((3, 1), (2, 2))], ordered[:2])
+        ordering.new_search()
+        self.assertEqual(((3, 1), (2, 2)), ordering.order_actions(self.test_state, actions, 1)[0])
+
+    def test_same_as_maximin(self):
+        """
+        Purpose: Test that the alpha-beta search finds the same moves as the maximin search with every ordering,
+                 kept between moves, with and without a transposition table
+        Signature: Void -> Void
+        """
+        rng = random.Random(4502)
+        orderings = [FishOnDestinationOrdering(), KillerMoveOrdering(), HistoryOrdering(),
+                     create_default_move_ordering()]
+        for _ in range(5):
+            test_state = strategy_test.StrategyTest.create_random_move_state(rng, 4, 4, 2)
+            while not FishGameTree(test_state).get_children_moves():
+                test_state = strategy_test.StrategyTest.create_random_move_state(rng, 4, 4, 2)
+            for depth in range(1, 4):
+                expected = FishBasicStrategy(depth).find_next_move(test_state)
+                for ordering in orderings:
+                    self.assertEqual(expected, FishBasicStrategy(depth, use_alpha_beta=True,
+                                                                 move_ordering=ordering).find_next_move(test_state))
+                self.assertEqual(expected, FishBasicStrategy(depth, use_alpha_beta=True,
+                                                             transposition_table=TranspositionTable(),
+                                                             move_ordering=orderings[-1]).find_next_move(test_state))
+
+    def test_iterative_deepening(self):
+        """
+        Purpose: Test that the iterative deepening strategy finds the same move with a move ordering
+        Signature: Void -> Void
+        """
+        strategy = FishIterativeDeepeningStrategy(60, max_depth=3, move_ordering=create_default_move_ordering())
+        self.assertEqual(((3, 1), (2, 2)), strategy.find_next_move(self.test_state))
+
+
+if __name__ == '__main__':
+    unittest.main()
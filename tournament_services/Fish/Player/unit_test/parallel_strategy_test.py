@@ -0,0 +1,65 @@
+import random
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Common.game_tree import FishGameTree
+from Fish.Player.move_ordering import create_default_move_ordering
+from Fish.Player.parallel_strategy import FishRootParallelStrategy
+from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.unit_test import strategy_test
+
+
+class ParallelStrategyTest(unittest.TestCase):
+
+    def test_invalid_workers(self):
+        """
+        Purpose: Test that a parallel strategy needs at least one worker
+        Signature: Void -> Void
+        """
+        with self.assertRaises(ValueError):
+            FishRootParallelStrategy(1, workers=0)
+
+    def test_tie_breaker(self):
+        """
+        Purpose: Test that ties between children searched by different workers are broken like FishBasicStrategy
+        Signature: Void -> Void
+        """
+        test_board = FishBoardModel.create_with_same_fish_amount(3, 3, 3)
+        test_state = FishGameStateFactory.create_move_penguins_state(test_board,
+                                                                     [(PlayerColor.RED, [(0, 0), (2, 0), (4, 0)], 0),
+                                                                      (PlayerColor.BLACK, [(1, 1), (3, 1), (5, 1)], 0)],
+                                                                     check_penguin_amount=False,
+                                                                     turn=PlayerColor.BLACK)
+        with FishRootParallelStrategy(1, workers=2) as strategy:
+            self.assertEqual(((1, 1), (0, 2)), strategy.find_next_move(test_state))
+
+    def test_same_as_sequential(self):
+        """
+        Purpose: Test that the parallel maximin and alpha-beta searches find the same moves as the sequential maximin
+                 search on random boards, reusing the same worker processes between moves
+        Signature: Void -> Void
+        """
+        rng = random.Random(4503)
+        with FishRootParallelStrategy(1, workers=2) as maximin, \
+                FishRootParallelStrategy(1, workers=2, use_alpha_beta=True,
+                                         move_ordering=create_default_move_ordering()) as alpha_beta:
+            for _ in range(4):
+                test_state = strategy_test.StrategyTest.create_random_move_state(rng, 4, 4, 2)
+                while not FishGameTree(test_state).get_children_moves():
+                    test_state = strategy_test.StrategyTest.create_random_move_state(rng, 4, 4, 2)
+                for depth in range(1, 3):
+                    maximin.look_ahead_turns = depth
+                    alpha_beta.look_ahead_turns = depth
+                    expected = FishBasicStrategy(depth).find_next_move(test_state)
+                    self.assertEqual(expected, maximin.find_next_move(test_state))
+                    self.assertEqual(expected, alpha_beta.find_next_move(test_state))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import json
+import random
 import unittest
 import sys
 import os
@@ -7,7 +9,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
 from Fish.Common.representations.fish_board import FishBoardModel
 from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.search_activity import SearchActivity
 from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.transposition_table import TranspositionTable
 from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
 
 
@@ -41,6 +46,20 @@ class StrategyTest(unittest.TestCase):
         coord = FishBasicStrategy(1).find_next_placement(test_state)
         self.assertEqual((4, 0), coord)
 
+    def test_next_placement_skips_holes(self):
+        """
+        Purpose: Tests that the next placement strategy does not place a penguin on a hole
+        Signature: Void -> Void
+        """
+        test_board = FishBoardModel.create_with_same_fish_amount(4, 3, 3)
+        test_board.remove_tile(4, 0)
+        test_state = FishGameStateFactory.create_move_penguins_state(test_board,
+                                                                     [(PlayerColor.RED, [(0, 0), (2, 0)], 0),
+                                                                      (PlayerColor.BLACK, [], 0)],
+                                                                     check_penguin_amount=False)
+        coord = FishBasicStrategy(1).find_next_placement(test_state)
+        self.assertEqual((1, 1), coord)
+
     def test_invalid_next_placement(self):
         """
         Purpose: Tests if the next placement strategy raises an error on an filled board
@@ -147,6 +166,175 @@ class StrategyTest(unittest.TestCase):
         best_move = FishBasicStrategy(3).find_next_move(test_state)
         self.assertEqual(((2,0), (1, 1)), best_move)
 
+    def test_alpha_beta_same_as_maximin(self):
+        """
+        Purpose: Test that the alpha-beta search picks the same moves as the maximin search on the positions above
+        Signature: Void -> Void
+        """
+        coords_to_fish = [((0, 0), 1), ((2, 0), 1),
+                          ((1, 1), 1), ((3, 1), 1),
+                          ((0, 2), 2), ((2, 2), 3),
+                          ((1, 3), 1), ((3, 3), 1)]
+        test_board = FishBoardModel.create_with_coords_to_fish(4, 2, coords_to_fish)
+        test_state = FishGameStateFactory.create_move_penguins_state(test_board,
+                                                                     [(PlayerColor.RED, [(0, 0)], 0),
+                                                                      (PlayerColor.BLACK, [(3, 1)], 0)],
+                                                                     check_penguin_amount=False,
+                                                                     turn=PlayerColor.BLACK)
+        for depth in range(1, 4):
+            self.assertEqual(FishBasicStrategy(depth).find_next_move(test_state),
+                             FishBasicStrategy(depth, use_alpha_beta=True).find_next_move(test_state))
+        self.assertEqual(((3, 1), (2, 2)), FishBasicStrategy(2, use_alpha_beta=True).find_next_move(test_state))
+
+        test_board = FishBoardModel.create_with_same_fish_amount(3, 3, 3)
+        test_state = FishGameStateFactory.create_move_penguins_state(test_board,
+                                                                     [(PlayerColor.RED, [(0, 2)], 0),
+                                                                      (PlayerColor.BLACK, [(2, 0), (2, 2), (3, 1)], 0)],
+                                                                     check_penguin_amount=False,
+                                                                     turn=PlayerColor.BLACK)
+        self.assertEqual(((2, 0), (1, 1)), FishBasicStrategy(3, use_alpha_beta=True).find_next_move(test_state))
+
+    def test_alpha_beta_same_as_maximin_random_boards(self):
+        """
+        Purpose: Test that the alpha-beta search picks the same moves as the maximin search on random boards with
+                 holes, where there are many ties to break and many subtrees to prune
+        Signature: Void -> Void
+        """
+        rng = random.Random(4500)
+        for _ in range(6):
+            test_state = StrategyTest.create_random_move_state(rng, 4, 4, 3)
+            while not FishGameTree(test_state).get_children_moves():
+                test_state = StrategyTest.create_random_move_state(rng, 4, 4, 3)
+            for depth in range(1, 3):
+                self.assertEqual(FishBasicStrategy(depth).find_next_move(test_state),
+                                 FishBasicStrategy(depth, use_alpha_beta=True).find_next_move(test_state))
+
+    def test_transposition_table_same_as_maximin(self):
+        """
+        Purpose: Test that the alpha-beta search finds the same moves as the maximin search when it reuses results
+                 from a transposition table, both within a search and between moves
+        Signature: Void -> Void
+        """
+        rng = random.Random(4501)
+        table = TranspositionTable(2 ** 12)
+        strategy = FishBasicStrategy(2, use_alpha_beta=True, transposition_table=table)
+        for _ in range(6):
+            test_state = StrategyTest.create_random_move_state(rng, 4, 4, 2)
+            while not FishGameTree(test_state).get_children_moves():
+                test_state = StrategyTest.create_random_move_state(rng, 4, 4, 2)
+            for depth in range(1, 4):
+                strategy.look_ahead_turns = depth
+                self.assertEqual(FishBasicStrategy(depth).find_next_move(test_state),
+                                 strategy.find_next_move(test_state))
+        self.assertGreater(table.hits, 0)
+        self.assertGreater(table.cutoffs, 0)
+
+    def test_transposition_table_shallower_search(self):
+        """
+        Purpose: Test that results stored by a deeper search are not used as the values of a shallower search with the
+                 same table, such as the search for the next move of a player after both players moved with a smaller
+                 budget, as their leaves were scored more moves later
+        Signature: Void -> Void
+        """
+        rng = random.Random(4503)
+        for _ in range(4):
+            test_state = StrategyTest.create_random_move_state(rng, 4, 4, 2)
+            while not FishGameTree(test_state).get_children_moves():
+                test_state = StrategyTest.create_random_move_state(rng, 4, 4, 2)
+            table = TranspositionTable(2 ** 12)
+            action = FishBasicStrategy(4, use_alpha_beta=True, transposition_table=table).find_next_move(test_state)
+            tree = FishGameTree(FishGameTree(test_state).validate_and_apply_action(action))
+            for opponent_action in tree.get_children_moves():
+                next_state = tree.validate_and_apply_action(opponent_action)
+                if FishGameTree(next_state).get_children_moves():
+                    strategy = FishBasicStrategy(2, use_alpha_beta=True, transposition_table=table)
+                    self.assertEqual(FishBasicStrategy(2).find_next_move(next_state),
+                                     strategy.find_next_move(next_state))
+
+    def test_search_stats(self):
+        """
+        Purpose: Test that strategies only collect stats when asked to, and that the stats of every search account for
+                 all of its nodes
+        Signature: Void -> Void
+        """
+        rng = random.Random(4502)
+        test_state = StrategyTest.create_random_move_state(rng, 4, 4, 2)
+        while not FishGameTree(test_state).get_children_moves():
+            test_state = StrategyTest.create_random_move_state(rng, 4, 4, 2)
+        strategy = FishBasicStrategy(2)
+        strategy.find_next_move(test_state)
+        self.assertIsNone(strategy.last_stats)
+
+        maximin = FishBasicStrategy(2, collect_stats=True)
+        alpha_beta = FishBasicStrategy(2, use_alpha_beta=True, transposition_table=TranspositionTable(),
+                                       collect_stats=True)
+        self.assertEqual(maximin.find_next_move(test_state), alpha_beta.find_next_move(test_state))
+        for stats in [maximin.last_stats, alpha_beta.last_stats]:
+            self.assertEqual(stats.nodes, stats.expanded + stats.leaves + stats.table_cutoffs + stats.solved)
+            self.assertEqual(stats.expanded, sum(stats.branching.values()))
+            self.assertEqual(3, stats.completed_depth)
+            self.assertLessEqual(stats.max_ply, 3)
+            self.assertGreater(stats.seconds[SearchActivity.MOVE_GENERATION], 0)
+            self.assertGreater(stats.seconds[SearchActivity.APPLY], 0)
+            self.assertGreaterEqual(stats.total_seconds, sum(stats.seconds.values()))
+            self.assertEqual(stats.nodes, json.loads(json.dumps(stats.to_dict()))['nodes'])
+        self.assertGreater(maximin.last_stats.seconds[SearchActivity.COPY], 0)
+        self.assertEqual(0, alpha_beta.last_stats.seconds[SearchActivity.COPY])
+        self.assertEqual(0, maximin.last_stats.cutoffs)
+        self.assertLess(alpha_beta.last_stats.nodes, maximin.last_stats.nodes)
+
+        first_stats = alpha_beta.last_stats
+        alpha_beta.find_next_move(test_state)
+        self.assertIsNot(first_stats, alpha_beta.last_stats)
+        self.assertGreater(alpha_beta.last_stats.table_cutoffs, 0)
+
+    @staticmethod
+    def create_random_move_state(rng, rows, columns, num_players, num_penguins=2, board_class=FishBoardModel):
+        """
+        Purpose: Create a state in the moving phase with a random board and randomly placed penguins
+        Signature: Random Int Int Int Int Class -> FishGameState
+        :param rng: Random number generator used to pick fish, holes and penguin placements
+        :param rows: Amount of rows on the board
+        :param columns: Amount of columns on the board
+        :param num_players: Amount of players in the game
+        :param num_penguins: Amount of penguins of every player
+        :param board_class: FishBoardModel or a subclass of it to create the board with
+        """
+        coords = FishBoardModel.create_coords(rows, columns)
+        coords_to_fish = [(coord, rng.choice([0, 1, 2, 3, 4, 5])) for coord in coords]
+        board = board_class.create_with_coords_to_fish(rows, columns, coords_to_fish)
+        tiles = [coord for coord, fish in coords_to_fish if fish]
+        rng.shuffle(tiles)
+        colors = FishGameStateFactory.DEFAULT_COLOR_ORDER[:num_players]
+        penguins = [tiles[i::num_players][:num_penguins] for i in range(num_players)]
+        return FishGameStateFactory.create_move_penguins_state(board, [(color, penguins[i], 0)
+                                                                       for i, color in enumerate(colors)],
+                                                               check_penguin_amount=False)
+
+    @staticmethod
+    def create_random_split_state(rng, rows, columns, num_players, min_moves, board_class=FishBoardModel):
+        """
+        Purpose: Create a state late in a game where the holes have split the board so that no region holds penguins
+                 of more than one player (see FishGameState.are_penguins_separated), by making random moves from
+                 random states until that happens while the player whose turn it is still has enough moves
+        Signature: Random Int Int Int Int Class -> FishGameState
+        :param rng: Random number generator used for the states and the moves
+        :param rows: Amount of rows on the board
+        :param columns: Amount of columns on the board
+        :param num_players: Amount of players in the game
+        :param min_moves: Least amount of moves the player whose turn it is must have in the state
+        :param board_class: FishBoardModel or a subclass of it to create the board with
+        """
+        while True:
+            state = StrategyTest.create_random_move_state(rng, rows, columns, num_players, board_class=board_class)
+            while state.can_any_player_move():
+                actions = FishGameTree.find_actions_for_state(state)
+                state.apply_move(rng.choice(actions) if actions else None)
+                if state.are_penguins_separated():
+                    if len(FishGameTree.find_actions_for_state(state)) >= min_moves:
+                        return state
+                    break
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+from Fish.Player.bound_type import BoundType
+from Fish.Player.transposition_table import TranspositionTable
+
+
+class TranspositionTableTest(unittest.TestCase):
+
+    def test_invalid_capacity(self):
+        """
+        Purpose: Test that a table needs room for at least one entry
+        Signature: Void -> Void
+        """
+        with self.assertRaises(ValueError):
+            TranspositionTable(0)
+
+    def test_store_and_probe(self):
+        """
+        Purpose: Test that a stored entry can be looked up by its key and other keys are not found
+        Signature: Void -> Void
+        """
+        table = TranspositionTable(8)
+        table.store(3, 2, 7, BoundType.EXACT, ((0, 0), (1, 1)))
+        entry = table.probe(3)
+        self.assertEqual((3, 2, 7, BoundType.EXACT, ((0, 0), (1, 1))), entry[:5])
+        # same slot, different key
+        self.assertIsNone(table.probe(11))
+        self.assertIsNone(table.probe(4))
+        self.assertEqual(3, table.probes)
+        self.assertEqual(1, table.hits)
+        self.assertAlmostEqual(1 / 3, table.hit_rate())
+
+    def test_depth_preferred_replacement(self):
+        """
+        Purpose: Test that an entry is only replaced in the same search by an entry searched at least as deep
+        Signature: Void -> Void
+        """
+        table = TranspositionTable(8)
+        table.new_search()
+        table.store(3, 4, 7, BoundType.EXACT, None)
+        table.store(11, 2, 5, BoundType.LOWER, None)
+        self.assertEqual(1, table.rejections)
+        self.assertIsNotNone(table.probe(3))
+        self.assertIsNone(table.probe(11))
+        table.store(11, 4, 5, BoundType.LOWER, None)
+        self.assertEqual(1, table.overwrites)
+        self.assertIsNone(table.probe(3))
+        self.assertEqual(5, table.probe(11).value)
+
+    def test_replacement_in_new_search(self):
+        """
+        Purpose: Test that an entry from an earlier search is replaced even by a shallower entry
+        Signature: Void -> Void
+        """
+        table = TranspositionTable(8)
+        table.store(3, 6, 7, BoundType.EXACT, None)
+        table.new_search()
+        table.store(11, 1, 5, BoundType.UPPER, None)
+        self.assertIsNone(table.probe(3))
+        self.assertEqual(BoundType.UPPER, table.probe(11).bound)
+
+    def test_clear(self):
+        """
+        Purpose: Test that clearing a table removes its entries and resets its counters
+        Signature: Void -> Void
+        """
+        table = TranspositionTable(8)
+        table.store(3, 6, 7, BoundType.EXACT, None)
+        table.probe(3)
+        table.record_cutoff()
+        table.clear()
+        self.assertIsNone(table.probe(3))
+        self.assertEqual({'probes': 1, 'hits': 0, 'cutoffs': 0, 'stores': 0, 'overwrites': 0, 'rejections': 0,
+                          'hit_rate': 0.0}, table.get_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import asyncio
+import json
+from typing import Any, List, Union
+
+from Fish.Common.player_interface import PlayerInterface
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.types import Coordinate, Action
+from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
+from Fish.Remote.json_stream import JSONStreamDecoder, read_json_async
+from Fish.Remote.turn_session import TurnSession, RESYNC
+
+
+class AsyncPlayerProxy(PlayerInterface):
+    """
+    Player proxy component like PlayerProxy, which communicates with its client through asyncio streams instead of a
+    blocking socket. All proxies of a server share one event loop, which does the waiting on every client at once, so
+    a server can hold hundreds of clients without a thread per client.
+
+    The manager and referee are not asynchronous, so the methods of the player interface are called from the threads
+    the games run in (see RoundExecutor) and block only that thread: each call schedules the exchange of messages on
+    the event loop and waits for its result. They must not be called from the thread running the event loop.
+
+    Every call has its own timeout. Once a call times out or the connection fails the proxy is disconnected, as a late
+    response would otherwise be taken as the response to the next call, and every later call fails at once.
+
+    As with PlayerProxy, take-turn messages can leave out the state with delta turns (see TurnSession).
+    """
+
+    # Seconds a client has to respond to a single call
+    CALL_TIMEOUT = 10
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, decoder: JSONStreamDecoder,
+                 name: str, loop: asyncio.AbstractEventLoop, call_timeout: float = CALL_TIMEOUT,
+                 delta_turns: bool = False):
+        """
+        Initializes an AsyncPlayerProxy for a client that has signed up with a name
+        @param reader: The stream to receive responses from the client on
+        @param writer: The stream to send messages to the client on
+        @param decoder: The decoder the name of the client was read with, see create_decoder
+        @param name: The name the client signed up with
+        @param loop: The event loop the streams belong to
+        @param call_timeout: The amount of seconds the client has to respond to each call
+        @param delta_turns: Whether take-turn messages leave out the state when the client already knows it
+        """
+        self.color = None
+        self.other_colors = []
+        self.winners = []
+        self.name = name
+        self.reader = reader
+        self.writer = writer
+        self.decoder = decoder
+        self.loop = loop
+        self.call_timeout = call_timeout
+        self.delta_turns = delta_turns
+        self.turn_session = TurnSession()
+        self.connected = True
+
+    @staticmethod
+    def create_decoder() -> JSONStreamDecoder:
+        """
+        Creates a decoder for the responses of a client, which acknowledge messages with void either as a bare word
+        or as a JSON string
+        """
+        return JSONStreamDecoder(literals={'void': 'void'})
+
+    async def call(self, message: list) -> Any:
+        """
+        Sends a message to the client and waits for its response, disconnecting the client if sending the message
+        and receiving the response together take longer than the call timeout, or the connection fails
+        @param message: The JSON message to send, in one of the Method Call Formats
+        @return: The JSON value the client responded with, or None if there was no response
+        """
+        if not self.connected:
+            return None
+        try:
+            return await asyncio.wait_for(self._exchange(message), self.call_timeout)
+        except (asyncio.TimeoutError, ConnectionError, ValueError):
+            self.close()
+            return None
+
+    async def _exchange(self, message: list) -> Any:
+        """
+        Sends a message to the client and reads its response, without a timeout
+        @param message: The JSON message to send
+        @return: The JSON value the client responded with
+        """
+        self.writer.write(json.dumps(message).encode('utf-8'))
+        await self.writer.drain()
+        return await read_json_async(self.reader, self.decoder)
+
+    def _call_from_game(self, message: list) -> Any:
+        """
+        Makes a call to the client on the event loop from the thread of a game and waits for the response
+        @param message: The JSON message to send
+        @return: The JSON value the client responded with, or None if there was no response
+        """
+        return asyncio.run_coroutine_threadsafe(self.call(message), self.loop).result()
+
+    def _call_expecting_void(self, message: list) -> bool:
+        """
+        Makes a call to the client that the client has to acknowledge with "void"
+        @param message: The JSON message to send
+        @return: True if the client responded correctly, False otherwise.
+        """
+        return self._call_from_game(message) == "void"
+
+    def close(self) -> None:
+        """
+        Disconnects the client. Must be called on the event loop.
+        """
+        self.connected = False
+        self.writer.close()
+
+    def start(self) -> bool:
+        """
+        Informs this proxy's client that the tournament is starting
+        @return: True if the client responded correctly, False otherwise.
+        """
+        return self._call_expecting_void(["start", [True]])
+
+    def end(self, is_winner: bool) -> bool:
+        """
+        Informs this proxy's client that the tournament has ended and whether or not the client won the tournament
+        @param is_winner: True if this proxy's client won the tournament, False otherwise
+        @return: True if the client responded correctly, False otherwise.
+        """
+        return self._call_expecting_void(["end", [is_winner]])
+
+    def assign_color(self, color: PlayerColor) -> bool:
+        """
+        Informs this proxy's client that they are playing in a game of Fish as the given color
+        @param color: The color that this proxy's client is playing as in the game
+        @return: True if the client responded correctly, False otherwise.
+        """
+        self.color = color
+        self.turn_session.reset()
+        return self._call_expecting_void(["playing-as", [color.value]])
+
+    def show_other_players_colors(self, colors: List[PlayerColor]) -> bool:
+        """
+        Informs this proxy's client of the colors of the other players in its game of Fish
+        @param colors: The colors that the other clients in the game are playing as
+        @return: True if the client responded correctly, False otherwise.
+        """
+        self.other_colors = colors
+        return self._call_expecting_void(["playing-with", [color.value for color in colors]])
+
+    def player_place_penguin(self, state: FishGameState) -> Union[Coordinate, bool]:
+        """
+        Sends the current state of the game to this proxy's client and waits on the position to place its penguin at
+        @param state: the current state of the game
+        @return: False if the client does not respond in time, otherwise the Coordinate that the client returned
+        """
+        coordinate = self._call_from_game(["setup", [THHelper.convert_state_to_json(state)]])
+        if coordinate is None:
+            return False
+        return THHelper.convert_to_double_height(coordinate[0], coordinate[1])
+
+    def player_move_penguin(self, state: FishGameState) -> Union[Action, bool]:
+        """
+        Sends the current state of the game (or the actions since the last turn of the client, with delta turns) to
+        this proxy's client and waits on the action it takes. A client that responds with "resync" is sent the whole
+        state.
+        @param state: the current state of the game
+        @return: False if the client does not respond in time, otherwise the Action that the client returned
+        """
+        message = self.turn_session.create_message(state, state.get_current_turn(), self.delta_turns)
+        action = self._call_from_game(message)
+        if action == RESYNC:
+            action = self._call_from_game(TurnSession.create_full_message(state, message[1][1]))
+        if action is None:
+            return False
+        from_coord = THHelper.convert_to_double_height(action[0][0], action[0][1])
+        to_coord = THHelper.convert_to_double_height(action[1][0], action[1][1])
+        self.turn_session.record_action(state, state.get_current_turn(), (from_coord, to_coord))
+        return from_coord, to_coord
+
+    def inform_of_winners(self, winners: List[PlayerColor]) -> bool:
+        """
+        Function called by referee to inform internal players of the winners of a single game of Fish. This is not
+        an interaction of the remote protocol, so the client is not told.
+        @param winners: The players who won the game of Fish
+        @return: True to indicate that the client would've responded correctly
+        """
+        self.winners = winners
+        return True
+
+    def receive_message(self, message: str, message_id: int) -> bool:
+        return True
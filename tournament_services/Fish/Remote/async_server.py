@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from typing import List, Optional
+
+from Fish.Admin.execution_mode import ExecutionMode
+from Fish.Admin.manager import Manager
+from Fish.Admin.round_executor import RoundExecutor
+from Fish.Remote.async_player_proxy import AsyncPlayerProxy
+from Fish.Remote.json_stream import read_json_async
+
+
+class AsyncTCPServer:
+    """
+    Represents the Fish tournament server like TCPServer, but built on asyncio so that one process can hold hundreds
+    of clients. Clients sign up concurrently: every connection reads its name on its own, so a client that is slow to
+    send its name does not hold up the others. Once sign-up ends, the tournament manager runs in a worker thread and
+    the games of each round run concurrently in threads (see RoundExecutor), while the event loop does the waiting on
+    the clients of every game through AsyncPlayerProxy components. A slow client therefore only stalls its own game,
+    and only for the timeout of a single call.
+    """
+
+    # Seconds the server waits for clients to sign up in each attempt
+    SIGNUP_TIMEOUT = 30
+    # Seconds a client has to send its name after connecting
+    NAME_TIMEOUT = 10
+
+    def __init__(self, host: str, port: int, min_clients: int = 5, max_clients: int = 10,
+                 signup_timeout: float = SIGNUP_TIMEOUT, signup_attempts: int = 2,
+                 call_timeout: float = AsyncPlayerProxy.CALL_TIMEOUT, round_executor: Optional[RoundExecutor] = None,
+                 delta_turns: bool = False):
+        """
+        Initializes an AsyncTCPServer that will listen on the given host and port once it is run
+        @param host: The host IP address to listen on
+        @param port: The port number to listen on, or 0 for any free port (see self.port once listening)
+        @param min_clients: The least amount of clients needed to run a tournament
+        @param max_clients: The amount of clients after which sign-up ends early
+        @param signup_timeout: The amount of seconds each sign-up attempt lasts
+        @param signup_attempts: How many times the server waits for clients while fewer than min_clients signed up
+        @param call_timeout: The amount of seconds a client has to respond to each call
+        @param round_executor: Runs the games of each round, by default concurrently with one thread per game
+        @param delta_turns: Whether take-turn messages leave out the state when the client already knows it, see
+                            TurnSession
+        """
+        if min_clients < 2 or max_clients < min_clients:
+            raise ValueError('Need 2 <= min clients <= max clients')
+        self.host = host
+        self.port = port
+        self.min_clients = min_clients
+        self.max_clients = max_clients
+        self.signup_timeout = signup_timeout
+        self.signup_attempts = signup_attempts
+        self.call_timeout = call_timeout
+        self.round_executor = round_executor if round_executor is not None \
+            else RoundExecutor(ExecutionMode.THREAD, max_workers=max_clients)
+        self.delta_turns = delta_turns
+        self.tournament_manager = None
+        self.clients: List[AsyncPlayerProxy] = []
+        # set once the server is listening, which other threads can wait on before connecting
+        self.listening = threading.Event()
+        self._signup_open = False
+        self._enough_clients: Optional[asyncio.Event] = None
+
+    def run(self) -> Optional[List[int]]:
+        """
+        Runs sign-up and then the tournament on a new event loop
+        @return: A List of the format [int, int], where the first element is the number of players that won the
+                 tournament and the second element is the number of players that failed or cheated during the
+                 tournament, or None if not enough clients signed up
+        """
+        return asyncio.run(self.serve())
+
+    async def serve(self) -> Optional[List[int]]:
+        """
+        Lets clients sign up and then runs a tournament with them, see run
+        """
+        self._enough_clients = asyncio.Event()
+        self._signup_open = True
+        server = await asyncio.start_server(self._sign_up, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        self.listening.set()
+        try:
+            for _ in range(self.signup_attempts):
+                try:
+                    await asyncio.wait_for(self._enough_clients.wait(), self.signup_timeout)
+                except asyncio.TimeoutError:
+                    pass
+                if len(self.clients) >= self.min_clients:
+                    break
+        finally:
+            self._signup_open = False
+            # stop accepting connections, the streams of the clients stay open
+            server.close()
+
+        try:
+            if len(self.clients) < self.min_clients:
+                return None
+            self.tournament_manager = Manager(list(zip(self.clients, [i for i in range(len(self.clients))])),
+                                              self.round_executor)
+            # the manager blocks on the proxies, which need the event loop to keep running
+            await asyncio.get_running_loop().run_in_executor(None, self.tournament_manager.run_tournament)
+            return [len(self.tournament_manager.player_pool), len(self.tournament_manager.cheaters)]
+        finally:
+            for client in self.clients:
+                client.close()
+
+    async def _sign_up(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Reads the name of a client that connected and signs it up if the name is valid and sign-up is still open
+        @param reader: The stream to receive from the client on
+        @param writer: The stream to send to the client on
+        """
+        decoder = AsyncPlayerProxy.create_decoder()
+        try:
+            name = await asyncio.wait_for(read_json_async(reader, decoder), self.NAME_TIMEOUT)
+        except (asyncio.TimeoutError, ConnectionError, ValueError):
+            writer.close()
+            return
+        if not isinstance(name, str) or not 0 < len(name) <= 12 or not self._signup_open \
+                or len(self.clients) >= self.max_clients:
+            writer.close()
+            return
+        self.clients.append(AsyncPlayerProxy(reader, writer, decoder, name, asyncio.get_running_loop(),
+                                             self.call_timeout, self.delta_turns))
+        if len(self.clients) >= self.max_clients:
+            self._enough_clients.set()
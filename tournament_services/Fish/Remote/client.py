@@ -1,11 +1,17 @@
 import socket
 import sys
 import json
-from typing import List, Union
+from typing import List, Optional, Union
 
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
 from Fish.Common.representations.game_state import FishGameState
-from Fish.Player.strategy import FishBasicStrategy
+from Fish.Player.iterative_deepening_strategy import FishIterativeDeepeningStrategy
+from Fish.Player.move_ordering import create_default_move_ordering
+from Fish.Player.strategy_interface import StrategyInterface
+from Fish.Player.transposition_table import TranspositionTable
 from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
+from Fish.Remote.json_stream import JSONStreamDecoder, read_json
+from Fish.Remote.turn_session import TurnSession, RESYNC
 
 
 class TCPClient:
@@ -14,13 +20,21 @@ class TCPClient:
     JSON representations of its intents to the server in response to queries for placements or movements.
     """
 
-    def __init__(self, host: str, port: int, name: str):
+    # Seconds the strategy may spend finding a move. The server waits 10 seconds for a response, the rest of that
+    # time is left for parsing the state and for the network.
+    MOVE_TIME_BUDGET = 8
+
+    def __init__(self, host: str, port: int, name: str, move_time_budget: float = MOVE_TIME_BUDGET,
+                 strategy: Optional[StrategyInterface] = None):
         """
         Initializes a TCPClient instance and connects to the specified host on the given port using a socket, then sends
         the given name over the socket.
         @param host: The host IP address to connect to
         @param port: The number of the port to use for the connection
         @param name: The name to send via the socket created
+        @param move_time_budget: The amount of seconds the strategy may spend finding a move
+        @param strategy: The strategy to play with, such as a FishMCTSStrategy with a time budget below the time the
+                         server waits for a move. Searches as deep as move_time_budget allows if not given.
         """
         self.host = host
         self.port = port
@@ -28,10 +42,19 @@ class TCPClient:
         self.sock.settimeout(10) # conservative estimate based off 1 second interactions with 4 players
         self.sock.connect((host, port))
         self.sock.sendall(json.dumps(name).encode('utf-8'))
+        # messages can be split over several reads or arrive together, the decoder keeps what was read between them
+        self.decoder = JSONStreamDecoder()
+        # our color and the state of the current game as of our last move, for take-turn messages that only contain
+        # the actions taken since then
+        self.color = None
+        self.turn_session = TurnSession()
 
-        # The present implementation for the strategy component takes too long to compute moves for a depth of
-        # 2 to be possible given the specified timeouts
-        self.strategy = FishBasicStrategy(1)
+        # A fixed look ahead would either waste the time the server gives us or go over it, so the default strategy
+        # searches as deep as it can within the time budget
+        if strategy is None:
+            strategy = FishIterativeDeepeningStrategy(move_time_budget, transposition_table=TranspositionTable(),
+                                                      move_ordering=create_default_move_ordering())
+        self.strategy = strategy
 
     def play_tournament(self) -> None:
         """
@@ -42,15 +65,15 @@ class TCPClient:
             - playing-as: client is being informed that it is playing a Fish game as the given color
             - playing-with: client is being informed how many other players it is playing a Fish game with
             - setup: client is being asked to submit a position for penguin placement
-            - take-turn: client is being asked to sumbit an action for penguin movement
+            - take-turn: client is being asked to sumbit an action for penguin movement, given either the state or
+                         (when the server uses delta turns) only the actions since its last turn
             - end: client is being informed that the tournament has ended
         """
         while True:
             try:
-                message = self.sock.recv(2048).decode('utf-8')
-                if message == "":
-                    break
-                received = json.loads(message)
+                received = read_json(self.sock, self.decoder)
+            except ConnectionError:
+                break
             except socket.timeout:
                 sys.stderr.write("Server timeout")
                 sys.exit(1)
@@ -70,7 +93,11 @@ class TCPClient:
                 elif function == "setup":
                     self.setup(THHelper.create_state(received[1][0]))
                 elif function == "take-turn":
-                    self.take_turn(THHelper.create_state(received[1][0]), received[1][1])
+                    state = self.turn_session.restore(received[1], self.color)
+                    if state is None:
+                        self.sock.sendall(json.dumps(RESYNC).encode("utf-8"))
+                    else:
+                        self.take_turn(state, received[1][1])
                 elif function == "end":
                     self.end(received[1][0])
                 else:
@@ -98,6 +125,8 @@ class TCPClient:
         @param color: The color that this client is playing as in the game
         @return: None
         """
+        self.color = PlayerColor(color)
+        self.turn_session.reset()
         self.sock.sendall("void".encode("utf-8"))
 
     def playing_with(self, colors: List[str]) -> None:
@@ -129,7 +158,5 @@ class TCPClient:
         @return: None
         """
         action = self.strategy.find_next_move(state)
-        from_position = THHelper.convert_back_to_posn(action[0][0], action[0][1])
-        to_position = THHelper.convert_back_to_posn(action[1][0], action[1][1])
-        action = [from_position, to_position]
-        self.sock.sendall(json.dumps(action).encode("utf-8"))
+        self.sock.sendall(json.dumps(THHelper.convert_action_to_json_rep(action)).encode("utf-8"))
+        self.turn_session.record_action(state, state.get_current_turn(), action)
@@ -0,0 +1,164 @@
+import asyncio
+import codecs
+import json
+import re
+import socket
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+# Whitespace JSON allows between values
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Characters that can never be part of a number or a literal such as true, so a value cut off inside of a number or
+# literal never has one of these after the position its parsing failed at
+_TOKEN_END = re.compile(r'[ \t\n\r,:\[\]{}"]')
+
+
+class JSONStreamDecoder(object):
+    """
+    Splits a stream of bytes into the JSON values sent on it, as the remote protocol sends its messages one after
+    another without anything between them. A single read from a socket can return part of a message (large states are
+    split) or several messages at once (small messages are coalesced), so the bytes of every read are fed to the
+    decoder and the values are taken out once they are complete.
+
+    Values are parsed with json.JSONDecoder.raw_decode, like parse_json_objects does for the test harness, starting
+    at an offset into a buffer that is reused between reads instead of slicing off every value. A value is incomplete
+    rather than malformed when the parse fails inside of a string or in the middle of a number or literal at the end of
+    the buffer. A number at the very end of the buffer is not taken out until more bytes arrive, as they may continue
+    it.
+
+    Some protocols acknowledge messages with bare words that are not JSON, like void, which can be given as literals.
+    """
+
+    # Bytes a single value may take before the stream is considered malformed
+    MAX_BUFFER_SIZE = 2 ** 22
+
+    def __init__(self, literals: Optional[Dict[str, Any]] = None, max_buffer_size: int = MAX_BUFFER_SIZE):
+        """
+        Initializes a decoder with an empty buffer
+        @param literals: Bare words allowed between the JSON values, mapped to the values they decode to
+        @param max_buffer_size: Characters of undecoded input that are kept before the stream is considered malformed
+        """
+        self._decoder = json.JSONDecoder()
+        self._bytes_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._offset = 0
+        self._values: Deque[Any] = deque()
+        self.literals = literals or dict()
+        self.max_buffer_size = max_buffer_size
+
+    def feed(self, data: bytes) -> None:
+        """
+        Adds bytes read from the stream and decodes every value they complete
+        @param data: The bytes read, which may end in the middle of a character, a value or several values
+        @raise json.JSONDecodeError: If the stream is not well-formed JSON
+        """
+        text = self._bytes_decoder.decode(data)
+        if self._offset:
+            # the buffer is reused, dropping the values that were already decoded from it only once per read
+            self._buffer = self._buffer[self._offset:]
+            self._offset = 0
+        self._buffer += text
+        self._decode_values()
+        if len(self._buffer) - self._offset > self.max_buffer_size:
+            raise json.JSONDecodeError('Value exceeds {} characters'.format(self.max_buffer_size), self._buffer,
+                                       self._offset)
+
+    def has_value(self) -> bool:
+        """
+        @return: Whether a complete value has been decoded and not been taken out yet
+        """
+        return bool(self._values)
+
+    def next_value(self) -> Any:
+        """
+        Takes out the oldest complete value
+        @return: The value
+        @raise IndexError: If there is no complete value
+        """
+        return self._values.popleft()
+
+    def _decode_values(self) -> None:
+        """
+        Decodes every complete value in the buffer after the offset, moving the offset past them
+        """
+        buffer = self._buffer
+        end = len(buffer)
+        index = _WHITESPACE.match(buffer, self._offset).end()
+        while index < end:
+            literal = self._match_literal(buffer, index)
+            if literal is not None:
+                word, value = literal
+                self._values.append(value)
+                index = _WHITESPACE.match(buffer, index + len(word)).end()
+                continue
+            try:
+                value, value_end = self._decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError as e:
+                if self._is_incomplete(buffer, e):
+                    break
+                raise
+            if value_end == end and isinstance(value, (int, float)) and not isinstance(value, bool):
+                break
+            self._values.append(value)
+            index = _WHITESPACE.match(buffer, value_end).end()
+        self._offset = index
+
+    def _match_literal(self, buffer: str, index: int) -> Optional[tuple]:
+        """
+        Finds a literal word starting at an index of the buffer
+        @return: The word and its value, or None if no literal starts there
+        """
+        for word, value in self.literals.items():
+            if buffer.startswith(word, index):
+                return word, value
+        return None
+
+    def _is_incomplete(self, buffer: str, error: json.JSONDecodeError) -> bool:
+        """
+        Decides whether a failed parse failed because the value is not complete yet rather than malformed
+        @param buffer: The buffer that was parsed
+        @param error: The error of the parse
+        @return: True if more input could still make the value well-formed
+        """
+        rest = buffer[error.pos:]
+        if error.msg.startswith('Unterminated string'):
+            return True
+        if error.msg.startswith('Invalid \\uXXXX escape'):
+            return '"' not in rest
+        if any(word.startswith(rest) for word in self.literals):
+            return True
+        return _TOKEN_END.search(rest) is None
+
+
+def read_json(sock: socket.socket, decoder: JSONStreamDecoder, chunk_size: int = 65536) -> Any:
+    """
+    Reads the next JSON value from a blocking socket, reading as many times as it takes to complete it
+    @param sock: The socket to read from, whose timeout applies to every read
+    @param decoder: The decoder of the socket, which keeps what was read after the value for the next call
+    @param chunk_size: The most bytes to read at once
+    @return: The value
+    @raise ConnectionError: If the connection is closed before the value is complete
+    """
+    while not decoder.has_value():
+        data = sock.recv(chunk_size)
+        if not data:
+            raise ConnectionError('Connection closed')
+        decoder.feed(data)
+    return decoder.next_value()
+
+
+async def read_json_async(reader: asyncio.StreamReader, decoder: JSONStreamDecoder, chunk_size: int = 65536) -> Any:
+    """
+    Reads the next JSON value from an asyncio stream, like read_json
+    @param reader: The stream to read from
+    @param decoder: The decoder of the stream
+    @param chunk_size: The most bytes to read at once
+    @return: The value
+    @raise ConnectionError: If the connection is closed before the value is complete
+    """
+    while not decoder.has_value():
+        data = await reader.read(chunk_size)
+        if not data:
+            raise ConnectionError('Connection closed')
+        decoder.feed(data)
+    return decoder.next_value()
@@ -7,6 +7,8 @@ from Fish.Common.representations.enumerations.player_color_enum import PlayerCol
 from Fish.Common.representations.game_state import FishGameState
 from Fish.Common.representations.types import Coordinate, Action
 from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
+from Fish.Remote.json_stream import JSONStreamDecoder, read_json
+from Fish.Remote.turn_session import TurnSession, RESYNC
 
 
 class PlayerProxy(PlayerInterface):
@@ -17,27 +19,37 @@ class PlayerProxy(PlayerInterface):
     the manager and referee by sending a message of the format specified above to the client via the socket given on
     initialization and waiting on the client's response, then using the response to respond to the manager or referee
     in the internal player format.
+
+    Responses are read with a JSONStreamDecoder, so a response split over several reads or sent together with the next
+    one is read correctly. Clients acknowledge messages with void, either as a bare word or as a JSON string.
+
+    Take-turn messages contain the actions taken since the last turn of the client as previous moves. With delta
+    turns they leave out the state whenever the client can rebuild it from those actions (see TurnSession).
     """
 
-    def __init__(self, sock: socket):
+    def __init__(self, sock: socket, delta_turns: bool = False):
         """
         Initializes a PlayerProxy instance with the given client socket for communicating with the client associated
         with this proxy
         @param sock: The socket connection for this PlayerProxy to send and receive information with the client
+        @param delta_turns: Whether take-turn messages leave out the state when the client already knows it
         """
         self.color = None
         self.other_colors = []
         self.winners = []
         self.sock = sock
         self.sock.settimeout(10)
+        self.delta_turns = delta_turns
+        self.turn_session = TurnSession()
+        self.decoder = JSONStreamDecoder(literals={'void': 'void'})
         try:
-            self.name = sock.recv(1024).decode('utf-8')
-        except socket.timeout:
+            self.name = read_json(sock, self.decoder)
+        except (socket.timeout, ConnectionError, ValueError):
             self.name = None
             self.sock.close()
             return
 
-        if not len(self.name) > 0 or not len(self.name) <= 12:
+        if not isinstance(self.name, str) or not len(self.name) > 0 or not len(self.name) <= 12:
             self.name = None
             self.sock.close()
             return
@@ -51,12 +63,8 @@ class PlayerProxy(PlayerInterface):
         message = json.dumps(["start", [True]]).encode('utf-8')
         self.sock.sendall(message)
         try:
-            response = self.sock.recv(1084).decode('utf-8')
-            if response == "void":
-                return True
-            else:
-                return False
-        except socket.timeout:
+            return read_json(self.sock, self.decoder) == "void"
+        except (socket.timeout, ConnectionError, ValueError):
             return False
 
     def end(self, is_winner: bool) -> bool:
@@ -69,12 +77,8 @@ class PlayerProxy(PlayerInterface):
         message = json.dumps(["end", [is_winner]]).encode('utf-8')
         self.sock.sendall(message)
         try:
-            response = self.sock.recv(1084).decode('utf-8')
-            if response == "void":
-                return True
-            else:
-                return False
-        except socket.timeout:
+            return read_json(self.sock, self.decoder) == "void"
+        except (socket.timeout, ConnectionError, ValueError):
             return False
 
     def assign_color(self, color: PlayerColor) -> bool:
@@ -85,15 +89,12 @@ class PlayerProxy(PlayerInterface):
         @return: True if the client responded correctly, False otherwise.
         """
         self.color = color
+        self.turn_session.reset()
         message = json.dumps(["playing-as", [color.value]]).encode('utf-8')
         self.sock.sendall(message)
         try:
-            response = self.sock.recv(1084).decode('utf-8')
-            if response == "void":
-                return True
-            else:
-                return False
-        except socket.timeout:
+            return read_json(self.sock, self.decoder) == "void"
+        except (socket.timeout, ConnectionError, ValueError):
             return False
 
     def player_place_penguin(self, state: FishGameState) -> Union[Coordinate, bool]:
@@ -109,7 +110,7 @@ class PlayerProxy(PlayerInterface):
         message = json.dumps(["setup", [state_json]]).encode('utf-8')
         self.sock.sendall(message)
         try:
-            coordinate = json.loads(self.sock.recv(1084).decode('utf-8'))
+            coordinate = read_json(self.sock, self.decoder)
             coordinate = THHelper.convert_to_double_height(coordinate[0], coordinate[1])
         except socket.timeout:
             return False
@@ -117,24 +118,29 @@ class PlayerProxy(PlayerInterface):
 
     def player_move_penguin(self, state: FishGameState) -> Union[Action, bool]:
         """
-        Given the current state of the game, constructs a JSON representation of the game state and sends that to this
-        PlayerProxy's associated client and waits on a response in the form of a JSON list of two lists each containing
-        two ints representing the position to move this client's penguin from and the position to move this client's
-        penguin to
+        Given the current state of the game, constructs a JSON representation of the game state (or of the actions
+        since the last turn of the client, with delta turns) and sends that to this PlayerProxy's associated client and
+        waits on a response in the form of a JSON list of two lists each containing two ints representing the position
+        to move this client's penguin from and the position to move this client's penguin to. A client that responds
+        with "resync" is sent the whole state.
         @param state: the current state of the game
         @return: False if self.sock times out waiting on a response from the client, otherwise the Acton that the client
         returned
         """
-        state_json = THHelper.convert_state_to_json(state)
-        message = json.dumps(["take-turn", [state_json, []]]).encode('utf-8')
-        self.sock.sendall(message)
+        message = self.turn_session.create_message(state, state.get_current_turn(), self.delta_turns)
+        self.sock.sendall(json.dumps(message).encode('utf-8'))
         try:
-            action = json.loads(self.sock.recv(1084).decode('utf-8'))
+            action = read_json(self.sock, self.decoder)
+            if action == RESYNC:
+                message = TurnSession.create_full_message(state, message[1][1])
+                self.sock.sendall(json.dumps(message).encode('utf-8'))
+                action = read_json(self.sock, self.decoder)
             from_coord = THHelper.convert_to_double_height(action[0][0], action[0][1])
             to_coord = THHelper.convert_to_double_height(action[1][0], action[1][1])
             action = (from_coord, to_coord)
         except socket.timeout:
             return False
+        self.turn_session.record_action(state, state.get_current_turn(), action)
         return action
 
     def show_other_players_colors(self, colors: List[PlayerColor]):
@@ -148,12 +154,8 @@ class PlayerProxy(PlayerInterface):
         message = json.dumps(["playing-with", [color.value for color in colors]]).encode('utf-8')
         self.sock.sendall(message)
         try:
-            response = self.sock.recv(1084).decode('utf-8')
-            if response == "void":
-                return True
-            else:
-                return False
-        except socket.timeout:
+            return read_json(self.sock, self.decoder) == "void"
+        except (socket.timeout, ConnectionError, ValueError):
             return False
 
     def inform_of_winners(self, winners: List[PlayerColor]) -> bool:
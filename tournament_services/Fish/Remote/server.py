@@ -1,9 +1,10 @@
 import socket
 import datetime
 import json
-from typing import List
+from typing import List, Optional
 from Fish.Remote.player_proxy import PlayerProxy
 from Fish.Admin.manager import Manager
+from Fish.Admin.round_executor import RoundExecutor
 
 
 class TCPServer:
@@ -14,16 +15,22 @@ class TCPServer:
     associated client.
     """
 
-    def __init__(self, host, port):
+    def __init__(self, host, port, round_executor: Optional[RoundExecutor] = None, delta_turns: bool = False):
         """
         Initializes a TCPServer instance with the given host and port number for creating a socket via self.configure_server()
         @param host: The host IP address to connect to
         @param port: The port number to use for connection
+        @param round_executor: Runs the games of each tournament round, for example concurrently in threads so that
+                               games wait on their clients at the same time. Games run one after another by default.
+        @param delta_turns: Whether take-turn messages leave out the state when the client already knows it, see
+                            TurnSession
         """
         self.host = host            # Host address
         self.port = port            # Host port
         self.sock = None            # Connection socket
         self.tournament_manager = None
+        self.round_executor = round_executor
+        self.delta_turns = delta_turns
         self.clients = []
 
     def configure_server(self) -> None:
@@ -54,7 +61,7 @@ class TCPServer:
 
             while len(self.clients) < 10:
                 client_sock, client_address = self.sock.accept()
-                player_client = PlayerProxy(client_sock)
+                player_client = PlayerProxy(client_sock, self.delta_turns)
                 if player_client.name:
                     self.clients.append(player_client)
 
@@ -62,7 +69,8 @@ class TCPServer:
             if len(self.clients) < 5 and not last_try:
                 self.wait_for_client(True)
             elif len(self.clients) >= 5:
-                self.tournament_manager = Manager(list(zip(self.clients, [i for i in range(len(self.clients))])))
+                self.tournament_manager = Manager(list(zip(self.clients, [i for i in range(len(self.clients))])),
+                                              self.round_executor)
 
         except KeyboardInterrupt:
             self.shutdown_server()
@@ -70,7 +78,8 @@ class TCPServer:
         if len(self.clients) < 5 and not last_try:
             self.wait_for_client(True)
         elif len(self.clients) >= 5:
-            self.tournament_manager = Manager(list(zip(self.clients, [i for i in range(len(self.clients))])))
+            self.tournament_manager = Manager(list(zip(self.clients, [i for i in range(len(self.clients))])),
+                                              self.round_executor)
 
         if self.tournament_manager:
             return self.run_tournament()
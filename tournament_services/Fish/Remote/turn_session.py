@@ -0,0 +1,160 @@
+from typing import List, Optional
+
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.game_state import FishGameState
+from Fish.Common.representations.game_state_error import PenguinMovementError
+from Fish.Common.representations.types import Action
+from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
+
+# The response of a client that cannot follow a delta encoded take-turn message and needs the whole state instead
+RESYNC = "resync"
+
+
+def find_actions_since(previous_state: FishGameState, state: FishGameState,
+                       color: PlayerColor) -> Optional[List[Action]]:
+    """
+    Finds the actions the other players took between two turns of a player from where their penguins moved. The
+    actions are not checked against the states, see apply_actions for that.
+    @param previous_state: The state right after the last action of the player of the given color
+    @param state: The state at the current turn of the player of the given color
+    @param color: The color of the player
+    @return: The actions in the order they were taken, or None if the change between the states is not one action
+             per player, for example because a player was kicked in between
+    """
+    order = previous_state.get_player_order()
+    if order != state.get_player_order() or color not in order:
+        return None
+    start = order.index(color)
+    actions = []
+    for other in order[start + 1:] + order[:start]:
+        before = set(previous_state.get_penguins_for_player(other))
+        after = set(state.get_penguins_for_player(other))
+        moved_from, moved_to = before - after, after - before
+        if not moved_from and not moved_to:
+            continue
+        if len(moved_from) != 1 or len(moved_to) != 1:
+            return None
+        actions.append((moved_from.pop(), moved_to.pop()))
+    if set(previous_state.get_penguins_for_player(color)) != set(state.get_penguins_for_player(color)):
+        return None
+    return actions
+
+
+def apply_actions(state: FishGameState, actions: List[Action], color: PlayerColor) -> None:
+    """
+    Applies the actions of other players to a state, each on behalf of the player whose penguin it moves, and then
+    gives the turn to the player of the given color
+    @param state: The state to apply the actions to, which is modified
+    @param actions: The actions to apply in order
+    @param color: The color of the player whose turn it is after the actions
+    @raise PenguinMovementError: If an action is not valid in the state it is applied to
+    @raise ValueError: If a player is not in the game
+    """
+    for from_pos, to_pos in actions:
+        mover = state.get_penguin_color_at_pos(from_pos)
+        if mover is None:
+            raise PenguinMovementError('No penguin to move at {}'.format(from_pos))
+        state.set_turn(mover)
+        state.move_penguin(mover, from_pos, to_pos)
+    state.set_turn(color)
+
+
+class TurnSession(object):
+    """
+    Remembers the state of a game as one player last saw it, right after its own action, so that each take-turn
+    message only needs the actions the other players took since then. The player proxy of the server and the client
+    each keep a TurnSession for the game being played.
+
+    A delta encoded take-turn message is ["take-turn", [null, actions, hash]]: the state is left out, the actions
+    are in the format of the previous moves of a full message and the hash is the Zobrist hash of the state after
+    them (see zobrist.py), which is the same on both ends as its keys do not depend on the process. A client that has
+    no state for the game or ends up with a different hash responds with "resync", after which the proxy sends the
+    full state.
+    """
+
+    def __init__(self):
+        """
+        Initializes a TurnSession without a known state
+        """
+        self.state: Optional[FishGameState] = None
+
+    def reset(self) -> None:
+        """
+        Forgets the known state, for example when a new game starts
+        """
+        self.state = None
+
+    def create_message(self, state: FishGameState, color: PlayerColor, delta: bool) -> list:
+        """
+        Creates the take-turn message for the player of the given color
+        @param state: The state at the turn of the player
+        @param color: The color of the player
+        @param delta: Whether to leave out the state when the actions since the last turn are known
+        @return: The take-turn message
+        """
+        actions = find_actions_since(self.state, state, color) if self.state is not None else None
+        if actions is not None:
+            # the known state is replaced after the turn, so it can be checked against the state by changing it
+            try:
+                apply_actions(self.state, actions, color)
+            except (PenguinMovementError, ValueError):
+                actions = None
+            if self.state.get_zobrist_hash() != state.get_zobrist_hash():
+                actions = None
+        self.state = None
+        previous_moves = [THHelper.convert_action_to_json_rep(action) for action in actions or []]
+        if delta and actions is not None:
+            return ["take-turn", [None, previous_moves, state.get_zobrist_hash()]]
+        return self.create_full_message(state, previous_moves)
+
+    @staticmethod
+    def create_full_message(state: FishGameState, previous_moves: list) -> list:
+        """
+        Creates a take-turn message containing the whole state, for example to resync a client
+        @param state: The state at the turn of the player
+        @param previous_moves: The JSON actions taken since the last turn of the player, or [] if they are not known
+        @return: The take-turn message
+        """
+        return ["take-turn", [THHelper.convert_state_to_json(state), previous_moves]]
+
+    def restore(self, arguments: list, color: PlayerColor) -> Optional[FishGameState]:
+        """
+        Finds the state a take-turn message is about, from the message alone if it contains the whole state or from
+        the known state and the actions in the message otherwise
+        @param arguments: The arguments of the take-turn message
+        @param color: The color of the player taking the turn
+        @return: The state, which must not be modified before it is passed to record_action, or None if it cannot be
+                 restored and a resync is needed
+        """
+        state_json = arguments[0]
+        if state_json is not None:
+            self.state = THHelper.create_state(state_json)
+            return self.state
+        if self.state is None or len(arguments) < 3:
+            return None
+        try:
+            actions = [(THHelper.convert_to_double_height(*from_posn), THHelper.convert_to_double_height(*to_posn))
+                       for from_posn, to_posn in arguments[1]]
+            apply_actions(self.state, actions, color)
+        except (PenguinMovementError, ValueError, TypeError):
+            self.state = None
+            return None
+        if self.state.get_zobrist_hash() != arguments[2]:
+            self.state = None
+            return None
+        return self.state
+
+    def record_action(self, state: FishGameState, color: PlayerColor, action: Action) -> None:
+        """
+        Remembers the state after the player took an action in it
+        @param state: The state the player took the action in, which is kept and modified
+        @param color: The color of the player
+        @param action: The action the player took
+        """
+        try:
+            state.set_turn(color)
+            state.move_penguin(color, *action)
+        except (PenguinMovementError, ValueError, TypeError):
+            self.state = None
+            return
+        self.state = state
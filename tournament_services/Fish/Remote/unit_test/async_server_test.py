@@ -0,0 +1,138 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+import asyncio
+import json
+import socket
+import threading
+import unittest
+from unittest.mock import MagicMock
+from Fish.Remote.async_player_proxy import AsyncPlayerProxy
+from Fish.Remote.async_server import AsyncTCPServer
+from Fish.Player.mcts_strategy import FishMCTSStrategy
+from Fish.Remote.client import TCPClient
+
+
+class AsyncServerTest(unittest.TestCase):
+
+    @staticmethod
+    def start_server(server):
+        """
+        Runs a server in a thread, keeping its result, and waits until it is listening
+        Signature: AsyncTCPServer -> (Thread, Dict)
+        """
+        result = {}
+        thread = threading.Thread(target=lambda: result.update(value=server.run()), daemon=True)
+        thread.start()
+        server.listening.wait(5)
+        return thread, result
+
+    def start_client(self, port, name, strategy=None):
+        """
+        Connects a client that searches for a very short time per move, or with the given strategy, and plays the
+        tournament in a thread
+        Signature: Int String Maybe[StrategyInterface] -> Thread
+        """
+        client = TCPClient('127.0.0.1', port, name, move_time_budget=0.05, strategy=strategy)
+        self.addCleanup(client.sock.close)
+        thread = threading.Thread(target=client.play_tournament, daemon=True)
+        thread.start()
+        return thread
+
+    def test_invalid_client_amounts(self):
+        with self.assertRaises(ValueError):
+            AsyncTCPServer('127.0.0.1', 0, min_clients=1)
+        with self.assertRaises(ValueError):
+            AsyncTCPServer('127.0.0.1', 0, min_clients=5, max_clients=4)
+
+    def test_run_tournament(self):
+        server = AsyncTCPServer('127.0.0.1', 0, max_clients=5, signup_timeout=10)
+        server_thread, result = AsyncServerTest.start_server(server)
+        clients = [self.start_client(server.port, 'player{}'.format(i)) for i in range(5)]
+        server_thread.join(60)
+        self.assertFalse(server_thread.is_alive())
+        winners, cheaters = result['value']
+        self.assertGreaterEqual(winners, 1)
+        self.assertEqual(0, cheaters)
+        for client in clients:
+            client.join(5)
+            self.assertFalse(client.is_alive())
+
+    def test_run_tournament_with_delta_turns(self):
+        server = AsyncTCPServer('127.0.0.1', 0, max_clients=5, signup_timeout=10, delta_turns=True)
+        server_thread, result = AsyncServerTest.start_server(server)
+        clients = [self.start_client(server.port, 'player{}'.format(i)) for i in range(5)]
+        server_thread.join(60)
+        self.assertFalse(server_thread.is_alive())
+        winners, cheaters = result['value']
+        self.assertGreaterEqual(winners, 1)
+        self.assertEqual(0, cheaters)
+        for client in clients:
+            client.join(5)
+            self.assertFalse(client.is_alive())
+
+    def test_run_tournament_with_mcts_clients(self):
+        server = AsyncTCPServer('127.0.0.1', 0, max_clients=5, signup_timeout=10)
+        server_thread, result = AsyncServerTest.start_server(server)
+        clients = [self.start_client(server.port, 'player{}'.format(i),
+                                     FishMCTSStrategy(time_budget=0.05, playouts=50, seed=i) if i % 2 else None)
+                   for i in range(5)]
+        server_thread.join(60)
+        self.assertFalse(server_thread.is_alive())
+        winners, cheaters = result['value']
+        self.assertGreaterEqual(winners, 1)
+        self.assertEqual(0, cheaters)
+        for client in clients:
+            client.join(5)
+            self.assertFalse(client.is_alive())
+
+    def test_signup_rejects_invalid_names(self):
+        server = AsyncTCPServer('127.0.0.1', 0, min_clients=2, max_clients=2, signup_timeout=0.5, signup_attempts=1)
+        server_thread, result = AsyncServerTest.start_server(server)
+        bad_client = socket.create_connection(('127.0.0.1', server.port))
+        bad_client.sendall(json.dumps('a name that is too long').encode('utf-8'))
+        self.start_client(server.port, 'player')
+        server_thread.join(10)
+        self.assertIsNone(result['value'])
+        self.assertEqual(1, len(server.clients))
+        bad_client.close()
+
+    def test_silent_client_times_out(self):
+        server = AsyncTCPServer('127.0.0.1', 0, max_clients=5, signup_timeout=10, call_timeout=0.5)
+        server_thread, result = AsyncServerTest.start_server(server)
+        silent_client = socket.create_connection(('127.0.0.1', server.port))
+        silent_client.sendall(json.dumps('silent').encode('utf-8'))
+        for i in range(4):
+            self.start_client(server.port, 'player{}'.format(i))
+        server_thread.join(60)
+        self.assertFalse(server_thread.is_alive())
+        winners, cheaters = result['value']
+        self.assertGreaterEqual(winners, 1)
+        self.assertEqual(1, cheaters)
+        silent_client.close()
+
+    def test_call_timeout_covers_whole_call(self):
+        async def slow_drain():
+            await asyncio.sleep(0.3)
+
+        async def slow_read(chunk_size):
+            await asyncio.sleep(0.3)
+            return b'"void"'
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        writer = MagicMock()
+        writer.drain = slow_drain
+        reader = MagicMock()
+        reader.read = slow_read
+        proxy = AsyncPlayerProxy(reader, writer, AsyncPlayerProxy.create_decoder(), 'slow', loop, call_timeout=0.5)
+        # sending and responding each take less than the timeout, but together they take more
+        self.assertIsNone(loop.run_until_complete(proxy.call(["start", [True]])))
+        self.assertFalse(proxy.connected)
+        writer.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+import json
+import socket
+import unittest
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
+from Fish.Remote.json_stream import JSONStreamDecoder, read_json
+from Fish.Remote.player_proxy import PlayerProxy
+
+
+class JSONStreamTest(unittest.TestCase):
+
+    MESSAGES = [["take-turn", [{"board": [[1, 2], [0, 5]], "scale": 1.5e3, "done": False, "none": None}, []]],
+                "void", ["playing-with", ["white", "brown"]], "café", 42]
+
+    @staticmethod
+    def decode_in_chunks(data, size, literals=None):
+        """
+        Feeds bytes to a decoder a number of bytes at a time and collects every value it completes
+        Signature: Bytes Int Maybe[Dict[String, Any]] -> List[Any]
+        """
+        decoder = JSONStreamDecoder(literals)
+        values = []
+        for i in range(0, len(data), size):
+            decoder.feed(data[i:i + size])
+            while decoder.has_value():
+                values.append(decoder.next_value())
+        return values
+
+    def test_partial_and_coalesced(self):
+        data = ''.join(json.dumps(message) for message in JSONStreamTest.MESSAGES).encode('utf-8') + b' '
+        for size in [1, 2, 3, 5, 8, 64, len(data)]:
+            self.assertEqual(JSONStreamTest.MESSAGES, JSONStreamTest.decode_in_chunks(data, size))
+
+    def test_number_at_end_waits(self):
+        decoder = JSONStreamDecoder()
+        decoder.feed(b'12')
+        self.assertFalse(decoder.has_value())
+        decoder.feed(b'3 ')
+        self.assertEqual(123, decoder.next_value())
+
+    def test_literals(self):
+        data = b'void["end", [true]]"void"void'
+        for size in [1, 3, len(data)]:
+            self.assertEqual(["void", ["end", [True]], "void", "void"],
+                             JSONStreamTest.decode_in_chunks(data, size, {'void': 'void'}))
+
+    def test_malformed(self):
+        with self.assertRaises(json.JSONDecodeError):
+            JSONStreamDecoder().feed(b'[1, ]')
+        with self.assertRaises(json.JSONDecodeError):
+            JSONStreamDecoder().feed(b'void ')
+        decoder = JSONStreamDecoder(max_buffer_size=8)
+        decoder.feed(b'"12345')
+        with self.assertRaises(json.JSONDecodeError):
+            decoder.feed(b'67890')
+
+    def test_read_json(self):
+        server_sock, client_sock = socket.socketpair()
+        self.addCleanup(server_sock.close)
+        self.addCleanup(client_sock.close)
+        decoder = JSONStreamDecoder()
+        client_sock.sendall(b'["start", [tr')
+        client_sock.sendall(b'ue]]["end", [false]]')
+        self.assertEqual(["start", [True]], read_json(server_sock, decoder, chunk_size=4))
+        self.assertEqual(["end", [False]], read_json(server_sock, decoder, chunk_size=4))
+        client_sock.close()
+        with self.assertRaises(ConnectionError):
+            read_json(server_sock, decoder)
+
+    def test_player_proxy(self):
+        """
+        Tests that a player proxy reads a name and responses that are split over several reads or coalesced
+        """
+        server_sock, client_sock = socket.socketpair()
+        self.addCleanup(server_sock.close)
+        self.addCleanup(client_sock.close)
+        client_sock.sendall(b'"pla')
+        client_sock.sendall(b'yer"void"void"')
+        proxy = PlayerProxy(server_sock)
+        self.assertEqual('player', proxy.name)
+        self.assertTrue(proxy.start())
+        self.assertTrue(proxy.assign_color(PlayerColor.RED))
+        state = FishGameStateFactory.create_game_state_with_num_fish(8, 8, 3, [PlayerColor.RED, PlayerColor.WHITE])
+        client_sock.sendall(b'[1, ')
+        client_sock.sendall(b'2]')
+        self.assertEqual(THHelper.convert_to_double_height(1, 2), proxy.player_place_penguin(state))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+
+import copy
+import json
+import random
+import socket
+import unittest
+from Fish.Common.game_tree import FishGameTree
+from Fish.Common.representations.enumerations.player_color_enum import PlayerColor
+from Fish.Common.representations.fish_board import FishBoardModel
+from Fish.Common.representations.game_state import FishGameStateFactory
+from Fish.Other.test_harness_transformation import TestHarnessTransformationHelper as THHelper
+from Fish.Player.unit_test import strategy_test
+from Fish.Remote.json_stream import JSONStreamDecoder, read_json
+from Fish.Remote.player_proxy import PlayerProxy
+from Fish.Remote.turn_session import TurnSession, find_actions_since, RESYNC
+
+
+class TurnSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        board = FishBoardModel.create_with_same_fish_amount(4, 3, 2)
+        self.state = FishGameStateFactory.create_move_penguins_state(board,
+                                                                     [(PlayerColor.RED, [(0, 0)], 0),
+                                                                      (PlayerColor.WHITE, [(1, 1)], 0),
+                                                                      (PlayerColor.BROWN, [(4, 2)], 0)],
+                                                                     check_penguin_amount=False)
+
+    def play_turns_of_others(self):
+        """
+        Moves the penguins of the white and brown players, after the red player moved (0, 0) to (0, 2)
+        """
+        self.state.move_penguin(PlayerColor.RED, (0, 0), (0, 2))
+        self.state.move_penguin(PlayerColor.WHITE, (1, 1), (3, 3))
+        self.state.move_penguin(PlayerColor.BROWN, (4, 2), (4, 0))
+
+    def test_find_actions_since(self):
+        previous_state = copy.deepcopy(self.state)
+        previous_state.move_penguin(PlayerColor.RED, (0, 0), (0, 2))
+        self.play_turns_of_others()
+        self.assertEqual([((1, 1), (3, 3)), ((4, 2), (4, 0))],
+                         find_actions_since(previous_state, self.state, PlayerColor.RED))
+
+    def test_find_actions_since_kicked_player(self):
+        previous_state = copy.deepcopy(self.state)
+        previous_state.move_penguin(PlayerColor.RED, (0, 0), (0, 2))
+        self.play_turns_of_others()
+        self.state.remove_color_from_game(PlayerColor.WHITE)
+        self.assertIsNone(find_actions_since(previous_state, self.state, PlayerColor.RED))
+
+    def test_full_message_with_previous_moves(self):
+        session = TurnSession()
+        first = session.create_message(copy.deepcopy(self.state), PlayerColor.RED, False)
+        self.assertEqual(["take-turn", [THHelper.convert_state_to_json(self.state), []]], first)
+        session.record_action(copy.deepcopy(self.state), PlayerColor.RED, ((0, 0), (0, 2)))
+        self.play_turns_of_others()
+        second = session.create_message(copy.deepcopy(self.state), PlayerColor.RED, False)
+        self.assertEqual(["take-turn", [THHelper.convert_state_to_json(self.state),
+                                        [[[1, 0], [3, 1]], [[2, 2], [0, 2]]]]], second)
+
+    def test_delta_message(self):
+        session = TurnSession()
+        session.record_action(copy.deepcopy(self.state), PlayerColor.RED, ((0, 0), (0, 2)))
+        self.play_turns_of_others()
+        message = session.create_message(copy.deepcopy(self.state), PlayerColor.RED, True)
+        self.assertEqual(["take-turn", [None, [[[1, 0], [3, 1]], [[2, 2], [0, 2]]], self.state.get_zobrist_hash()]],
+                         message)
+
+    def test_delta_message_falls_back_to_full_state(self):
+        session = TurnSession()
+        session.record_action(copy.deepcopy(self.state), PlayerColor.RED, ((0, 0), (0, 2)))
+        self.play_turns_of_others()
+        self.state.remove_color_from_game(PlayerColor.WHITE)
+        message = session.create_message(copy.deepcopy(self.state), PlayerColor.RED, True)
+        self.assertEqual(["take-turn", [THHelper.convert_state_to_json(self.state), []]], message)
+
+    def test_restore_without_state(self):
+        self.assertIsNone(TurnSession().restore([None, [], 0], PlayerColor.RED))
+
+    def test_restore_mismatched_hash(self):
+        session = TurnSession()
+        session.restore([THHelper.convert_state_to_json(self.state), []], PlayerColor.RED)
+        session.record_action(session.state, PlayerColor.RED, ((0, 0), (0, 2)))
+        self.assertIsNone(session.restore([None, [[[1, 0], [3, 1]], [[2, 2], [0, 2]]], 1], PlayerColor.RED))
+        self.assertIsNone(session.state)
+
+    def test_restore_invalid_action(self):
+        session = TurnSession()
+        session.restore([THHelper.convert_state_to_json(self.state), []], PlayerColor.RED)
+        session.record_action(session.state, PlayerColor.RED, ((0, 0), (0, 2)))
+        self.assertIsNone(session.restore([None, [[[1, 0], [0, 0]], [[2, 2], [0, 2]]], 1], PlayerColor.RED))
+
+    def test_random_games(self):
+        """
+        Plays random games, with a session for every player on each end, and checks that the state every client
+        restores has the same hash as the state of the game, and that delta messages are sent after the first turn
+        """
+        rng = random.Random(31)
+        for _ in range(5):
+            state = strategy_test.StrategyTest.create_random_move_state(rng, 5, 4, 3)
+            proxy_sessions = {color: TurnSession() for color in state.get_player_order()}
+            client_sessions = {color: TurnSession() for color in state.get_player_order()}
+            delta_messages = 0
+            while state.can_any_player_move():
+                color = state.get_current_turn()
+                moves = FishGameTree(state).get_children_moves()
+                if not moves:
+                    state.increase_turn()
+                    continue
+                message = proxy_sessions[color].create_message(copy.deepcopy(state), color, True)
+                message = json.loads(json.dumps(message))
+                delta_messages += message[1][0] is None
+                client_state = client_sessions[color].restore(message[1], color)
+                self.assertEqual(state.get_zobrist_hash(), client_state.get_zobrist_hash())
+                action = rng.choice(moves)
+                client_sessions[color].record_action(client_state, color, action)
+                proxy_sessions[color].record_action(copy.deepcopy(state), color, action)
+                state.move_penguin(color, *action)
+            self.assertGreater(delta_messages, 0)
+
+    def test_proxy_resync(self):
+        server_sock, client_sock = socket.socketpair()
+        self.addCleanup(server_sock.close)
+        self.addCleanup(client_sock.close)
+        client_sock.sendall(b'"name"')
+        proxy = PlayerProxy(server_sock, delta_turns=True)
+        first_state_json = THHelper.convert_state_to_json(self.state)
+        client_sock.sendall(json.dumps([[0, 0], [2, 0]]).encode('utf-8') + json.dumps(RESYNC).encode('utf-8') +
+                            json.dumps([[2, 0], [3, 0]]).encode('utf-8'))
+        self.assertEqual(((0, 0), (0, 2)), proxy.player_move_penguin(copy.deepcopy(self.state)))
+        self.play_turns_of_others()
+        self.assertEqual(((0, 2), (1, 3)), proxy.player_move_penguin(copy.deepcopy(self.state)))
+
+        decoder = JSONStreamDecoder()
+        self.assertEqual(["take-turn", [first_state_json, []]], read_json(client_sock, decoder))
+        delta = read_json(client_sock, decoder)
+        self.assertIsNone(delta[1][0])
+        self.assertEqual(["take-turn", [THHelper.convert_state_to_json(self.state), delta[1][1]]],
+                         read_json(client_sock, decoder))
+
+
+if __name__ == '__main__':
+    unittest.main()